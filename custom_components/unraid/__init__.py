@@ -18,6 +18,7 @@ PLATFORMS = [
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.BUTTON,
+    Platform.IMAGE,
 ]
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -33,6 +34,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     from homeassistant.exceptions import ConfigEntryNotReady
 
     # Import local modules lazily
+    from .const import CONF_PERSISTENT_SHELL, DEFAULT_PERSISTENT_SHELL
     from .coordinator import UnraidDataUpdateCoordinator
     from .unraid import UnraidAPI
     from .api.logging_helper import LogManager
@@ -44,15 +46,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Using modern runtime_data approach - no need for hass.data setup
 
+    coordinator = None
     try:
         # Extract configuration
         host = entry.data[CONF_HOST]
         username = entry.data[CONF_USERNAME]
         password = entry.data[CONF_PASSWORD]
         port = entry.data.get(CONF_PORT, 22)
+        persistent_shell = entry.options.get(
+            CONF_PERSISTENT_SHELL, DEFAULT_PERSISTENT_SHELL
+        )
 
         # Create API client
-        api = UnraidAPI(host, username, password, port)
+        api = UnraidAPI(host, username, password, port, persistent_shell=persistent_shell)
 
         # Create coordinator
         coordinator = UnraidDataUpdateCoordinator(hass, api, entry)
@@ -78,6 +84,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Set up services
         await services.async_setup_services(hass)
 
+        # Start streaming server events if enabled, once everything else is set up
+        coordinator.async_start_event_watcher()
+
         # Register update listener for options
         entry.async_on_unload(entry.add_update_listener(update_listener))
 
@@ -85,6 +94,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     except Exception as err:
         _LOGGER.error("Failed to set up Unraid integration: %s", err)
+        # Release background tasks and connections started so far
+        if coordinator is not None:
+            await coordinator.async_stop()
         raise ConfigEntryNotReady from err
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -100,6 +112,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a config entry."""
+    from .docker_icons import DockerIconCache
+    from .host_facts import HostFactsStore
+
+    await HostFactsStore(hass, entry.entry_id).async_remove()
+    await DockerIconCache(hass, None, entry.entry_id).async_remove()
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     # Reload the integration
@@ -3,14 +3,22 @@ from .disk_operations import DiskOperationsMixin
 from .docker_operations import DockerOperationsMixin
 from .vm_operations import VMOperationsMixin
 from .system_operations import SystemOperationsMixin
-from .network_operations import NetworkOperationsMixin, NetworkRateSmoothingMixin
+from .network_operations import NetworkOperationsMixin
 from .ups_operations import UPSOperationsMixin
 from .userscript_operations import UserScriptOperationsMixin
+from .snapshot_operations import SnapshotOperationsMixin, split_sections
 from .smart_operations import SmartDataManager
 from .disk_state import DiskStateManager, DiskState
 from .usb_detection import USBFlashDriveDetector, USBDeviceInfo
 from .disk_utils import is_valid_disk_name
 from .disk_mapping import get_unraid_disk_mapping, get_disk_info
+from .emhttp_state import EmhttpState, parse_emhttp_ini, read_emhttp_state
+from .zfs_state import ZFSState, parse_zfs_state, read_zfs_state
+from .disk_io import DiskIOTracker, parse_diskstats
+from .cpu_stats import CPUStatsTracker, CPUUsage, parse_proc_stat
+from .network_stats import NetworkStatsTracker, parse_proc_net_dev
+from .vm_stats import VMStatsTracker, parse_domstats
+from .sync_progress import SyncProgressTracker, SyncProgress, parse_sync_counters
 from .connection_manager import ConnectionManager, SSHConnection, ConnectionState, ConnectionMetrics
 
 __all__ = [
@@ -19,9 +27,10 @@ __all__ = [
     "VMOperationsMixin",
     "SystemOperationsMixin",
     "NetworkOperationsMixin",
-    "NetworkRateSmoothingMixin",
     "UPSOperationsMixin",
     "UserScriptOperationsMixin",
+    "SnapshotOperationsMixin",
+    "split_sections",
     "SmartDataManager",
     "DiskStateManager",
     "DiskState",
@@ -30,6 +39,24 @@ __all__ = [
     "is_valid_disk_name",
     "get_unraid_disk_mapping",
     "get_disk_info",
+    "EmhttpState",
+    "parse_emhttp_ini",
+    "read_emhttp_state",
+    "ZFSState",
+    "parse_zfs_state",
+    "read_zfs_state",
+    "DiskIOTracker",
+    "parse_diskstats",
+    "CPUStatsTracker",
+    "CPUUsage",
+    "parse_proc_stat",
+    "NetworkStatsTracker",
+    "parse_proc_net_dev",
+    "VMStatsTracker",
+    "parse_domstats",
+    "SyncProgressTracker",
+    "SyncProgress",
+    "parse_sync_counters",
     "ConnectionManager",
     "SSHConnection",
     "ConnectionState",
@@ -2,14 +2,27 @@
 from __future__ import annotations
 
 import logging
+import asyncio
+import heapq
 import time
-from typing import Any, Dict, Optional, Callable
-from datetime import datetime, timedelta
+from itertools import count, islice
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Tuple
 from enum import Enum
 from collections import OrderedDict
+from collections.abc import Mapping
 
 _LOGGER = logging.getLogger(__name__)
 
+# Containers larger than this are sized from a sample of their elements
+SIZE_SAMPLE_COUNT = 8
+
+# Nesting below this depth is counted with a flat estimate
+SIZE_MAX_DEPTH = 4
+
+# Flat estimate for objects the estimator doesn't look into
+OPAQUE_OBJECT_SIZE = 512
+
+
 class CacheItemPriority(Enum):
     """Priority levels for cache items."""
     LOW = 1      # Rarely changed data (e.g., disk mapping)
@@ -17,8 +30,57 @@ class CacheItemPriority(Enum):
     HIGH = 3     # Frequently changing data (e.g., CPU usage)
     CRITICAL = 4 # Always fresh data (e.g., array status)
 
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """Estimate the memory size of a value in bytes.
+
+    Only up to SIZE_SAMPLE_COUNT elements of each container are measured and
+    the result is scaled to the container length, so the cost is bounded
+    regardless of how large a payload is.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (int, float, bool, type(None))):
+        return 8
+    if depth >= SIZE_MAX_DEPTH:
+        return OPAQUE_OBJECT_SIZE
+
+    if isinstance(value, Mapping):
+        length = len(value)
+        if not length:
+            return 0
+        sample = sum(
+            estimate_size(k, depth + 1) + estimate_size(v, depth + 1)
+            for k, v in islice(value.items(), SIZE_SAMPLE_COUNT)
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        length = len(value)
+        if not length:
+            return 0
+        sample = sum(estimate_size(v, depth + 1) for v in islice(value, SIZE_SAMPLE_COUNT))
+    else:
+        # Conservative estimate for complex objects
+        return OPAQUE_OBJECT_SIZE
+
+    return sample * length // min(length, SIZE_SAMPLE_COUNT)
+
+
+def _key_prefix(key: str) -> str:
+    """Return the statistics group of a cache key (keys look like "type:host[:id]")."""
+    return key.split(":", 1)[0]
+
+
 class CacheItem:
-    """A cached item with metadata."""
+    """A cached item with metadata.
+
+    Times are time.monotonic() values so wall clock changes can't expire or
+    revive items.
+    """
+
+    __slots__ = (
+        "key", "value", "ttl", "priority", "stale_ttl", "refresh",
+        "created_at", "last_accessed", "access_count", "estimated_size", "sequence",
+    )
 
     def __init__(
         self,
@@ -26,57 +88,65 @@ class CacheItem:
         value: Any,
         ttl: int,
         priority: CacheItemPriority,
-        size: int = 0
+        size: int = 0,
+        stale_ttl: int = 0,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None,
+        now: Optional[float] = None,
+        sequence: int = 0
     ) -> None:
         """Initialize a cache item."""
         self.key = key
         self.value = value
         self.ttl = ttl
         self.priority = priority
-        self.created_at = datetime.now()
-        self.last_accessed = datetime.now()
+        self.stale_ttl = stale_ttl
+        self.refresh = refresh
+        self.created_at = time.monotonic() if now is None else now
+        self.last_accessed = self.created_at
         self.access_count = 0
-        self.estimated_size = size or self._estimate_size(value)
+        self.estimated_size = size or estimate_size(value)
+        self.sequence = sequence
 
-    def access(self) -> None:
+    @property
+    def expires_at(self) -> float:
+        """Return when the item stops being fresh."""
+        return self.created_at + self.ttl
+
+    @property
+    def servable_until(self) -> float:
+        """Return when the item can no longer be served, even stale."""
+        return self.created_at + self.ttl + self.stale_ttl
+
+    def access(self, now: Optional[float] = None) -> None:
         """Record an access to this cache item."""
-        self.last_accessed = datetime.now()
+        self.last_accessed = time.monotonic() if now is None else now
         self.access_count += 1
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if the cache item has expired."""
-        return (datetime.now() - self.created_at).total_seconds() > self.ttl
+        return (time.monotonic() if now is None else now) > self.expires_at
+
+    def is_servable(self, now: Optional[float] = None) -> bool:
+        """Check if the item can still be served, fresh or within its stale window."""
+        return (time.monotonic() if now is None else now) <= self.servable_until
 
     def time_to_expiry(self) -> float:
         """Get the time remaining until expiry in seconds."""
-        expiry_time = self.created_at + timedelta(seconds=self.ttl)
-        return max(0, (expiry_time - datetime.now()).total_seconds())
-
-    def _estimate_size(self, value: Any) -> int:
-        """Estimate the memory size of a value in bytes."""
-        try:
-            # Use a rough estimation based on object type
-            if isinstance(value, (str, bytes, bytearray)):
-                return len(value)
-            elif isinstance(value, (int, float, bool, type(None))):
-                return 8
-            elif isinstance(value, dict):
-                return sum(
-                    self._estimate_size(k) + self._estimate_size(v)
-                    for k, v in value.items()
-                )
-            elif isinstance(value, (list, tuple, set)):
-                return sum(self._estimate_size(v) for v in value)
-            else:
-                # Conservative estimate for complex objects
-                return 512
-        except Exception:
-            # Default fallback
-            return 1024
+        return max(0.0, self.expires_at - time.monotonic())
 
 
 class CacheManager:
-    """Memory cache manager with TTL, size limits, and priority-based eviction."""
+    """Memory cache manager with TTL, size limits, and priority-based eviction.
+
+    Expiry is tracked in a min-heap ordered by the time each item stops being
+    servable, so purging only touches items that actually ran out. Each
+    priority level keeps its keys in least recently used order; eviction
+    drops the least recently used items of the lowest priority first.
+
+    Items stored with a refresh coroutine and a stale_ttl follow
+    stale-while-revalidate semantics: once expired they are still served for
+    stale_ttl seconds while a single background task fetches a new value.
+    """
 
     def __init__(
         self,
@@ -84,13 +154,26 @@ class CacheManager:
         cleanup_interval: int = 300 # 5 minutes
     ) -> None:
         """Initialize the cache manager."""
-        self._cache: Dict[str, CacheItem] = OrderedDict()
+        self._cache: Dict[str, CacheItem] = {}
+        self._lru: Dict[CacheItemPriority, OrderedDict[str, None]] = {
+            priority: OrderedDict() for priority in CacheItemPriority
+        }
+        # (servable_until, sequence, key); entries of replaced items are skipped
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._sequence = count()
         self._max_size_bytes = max_size_bytes
         self._cleanup_interval = cleanup_interval
         self._current_size_bytes = 0
-        self._last_cleanup = datetime.now()
+        self._last_cleanup = time.monotonic()
         self._hit_count = 0
         self._miss_count = 0
+        self._stale_hit_count = 0
+        self._eviction_count = 0
+        self._expired_count = 0
+        self._refresh_count = 0
+        self._refresh_error_count = 0
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._prefix_stats: Dict[str, Dict[str, int]] = {}
 
         # TTL defaults for different priority levels
         self._default_ttls = {
@@ -112,45 +195,150 @@ class CacheManager:
         value: Any,
         ttl: Optional[int] = None,
         priority: CacheItemPriority = CacheItemPriority.MEDIUM,
-        size: int = 0
+        size: int = 0,
+        stale_ttl: int = 0,
+        refresh: Optional[Callable[[], Awaitable[Any]]] = None
     ) -> None:
-        """Set a value in the cache."""
+        """Set a value in the cache.
+
+        With a refresh coroutine, the value stays servable for stale_ttl seconds
+        after it expires while refresh is run in the background to replace it.
+        """
         if ttl is None:
             ttl = self._default_ttls[priority]
 
-        # Create cache item
-        cache_item = CacheItem(key, value, ttl, priority, size)
+        now = time.monotonic()
 
         # If item already exists, adjust size accounting
         if key in self._cache:
-            self._current_size_bytes -= self._cache[key].estimated_size
+            self._remove_item(key)
 
-        # Add item and update size
+        cache_item = CacheItem(
+            key, value, ttl, priority, size, stale_ttl, refresh,
+            now=now, sequence=next(self._sequence)
+        )
         self._cache[key] = cache_item
+        self._lru[priority][key] = None
         self._current_size_bytes += cache_item.estimated_size
+        heapq.heappush(
+            self._expiry_heap,
+            (cache_item.servable_until, cache_item.sequence, key)
+        )
 
         # Check if cleanup is needed
-        self._check_cleanup()
+        self._check_cleanup(now)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the cache."""
-        if key in self._cache:
-            item = self._cache[key]
-
-            if item.is_expired():
-                # Remove expired item
-                self._remove_item(key)
-                self._miss_count += 1
-                return default
+        item = self._cache.get(key)
+        stats = self._stats_for(key)
+
+        if item is not None:
+            now = time.monotonic()
+
+            if item.is_expired(now):
+                if not item.is_servable(now):
+                    # Remove expired item
+                    self._remove_item(key)
+                    self._expired_count += 1
+                    stats["expirations"] += 1
+                    self._miss_count += 1
+                    stats["misses"] += 1
+                    return default
+
+                # Serve the stale value while it is refreshed in the background
+                self._schedule_refresh(key, item)
+                self._stale_hit_count += 1
+                stats["stale_hits"] += 1
 
             # Update access info
-            item.access()
+            item.access(now)
+            self._lru[item.priority].move_to_end(key)
             self._hit_count += 1
+            stats["hits"] += 1
             return item.value
 
         self._miss_count += 1
+        stats["misses"] += 1
         return default
 
+    def revalidate(self, key: str) -> bool:
+        """Refresh an item in the background even if it is still fresh.
+
+        Returns True if a refresh is running for the key.
+        """
+        item = self._cache.get(key)
+        if item is None:
+            return False
+        return self._schedule_refresh(key, item)
+
+    def is_refreshing(self, key: str) -> bool:
+        """Check if a background refresh is running for the key."""
+        return key in self._refresh_tasks
+
+    async def async_cancel_refreshes(self) -> None:
+        """Cancel all background refreshes and wait for them to finish."""
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresh_tasks.clear()
+
+    def _schedule_refresh(self, key: str, item: CacheItem) -> bool:
+        """Start a background refresh for an item unless one is already running."""
+        if item.refresh is None:
+            return False
+        if key in self._refresh_tasks:
+            return True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called outside the event loop, the value is simply served stale
+            return False
+
+        task = loop.create_task(self._async_refresh(key, item))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda finished: self._refresh_finished(key, finished))
+        return True
+
+    def _refresh_finished(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished refresh task."""
+        if self._refresh_tasks.get(key) is task:
+            del self._refresh_tasks[key]
+
+    async def _async_refresh(self, key: str, item: CacheItem) -> None:
+        """Run an item's refresh coroutine and store the result."""
+        assert item.refresh is not None
+        try:
+            value = await item.refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            # Keep serving the stale value until it runs out of grace
+            self._refresh_error_count += 1
+            _LOGGER.debug("Background refresh of cache key %s failed: %s", key, err)
+            return
+
+        self._refresh_count += 1
+        if value is None:
+            return
+
+        # A fresh value stored while refreshing wins over this one
+        current = self._cache.get(key)
+        if current is not None and current is not item and not current.is_expired():
+            return
+
+        self.set(
+            key,
+            value,
+            item.ttl,
+            item.priority,
+            stale_ttl=item.stale_ttl,
+            refresh=item.refresh
+        )
+
     def get_with_fallback(self, key: str, fallback_func: Callable[[], Any], ttl: Optional[int] = None,
                          priority: CacheItemPriority = CacheItemPriority.MEDIUM) -> Any:
         """Get a value from cache or compute using fallback function."""
@@ -177,31 +365,48 @@ class CacheManager:
 
     def invalidate_by_prefix(self, prefix: str) -> int:
         """Invalidate all cache items with keys starting with the prefix."""
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
+        keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
         for key in keys_to_remove:
             self._remove_item(key)
         return len(keys_to_remove)
 
     def clear(self) -> None:
         """Clear all items from the cache."""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
         self._cache.clear()
+        for keys in self._lru.values():
+            keys.clear()
+        self._expiry_heap.clear()
         self._current_size_bytes = 0
         _LOGGER.debug("Cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         # Count items by priority
-        priority_counts = {}
-        for priority in CacheItemPriority:
-            priority_counts[priority.name] = len([
-                item for item in self._cache.values()
-                if item.priority == priority
-            ])
+        priority_counts = {
+            priority.name: len(self._lru[priority]) for priority in CacheItemPriority
+        }
 
         # Calculate hit rate
         total_requests = self._hit_count + self._miss_count
         hit_rate = (self._hit_count / total_requests) * 100 if total_requests > 0 else 0
 
+        item_counts: Dict[str, int] = {}
+        for key in self._cache:
+            prefix = _key_prefix(key)
+            item_counts[prefix] = item_counts.get(prefix, 0) + 1
+
+        prefixes: Dict[str, Dict[str, Any]] = {}
+        for prefix, stats in sorted(self._prefix_stats.items()):
+            requests = stats["hits"] + stats["misses"]
+            prefixes[prefix] = {
+                "item_count": item_counts.get(prefix, 0),
+                **stats,
+                "hit_rate_percent": round(stats["hits"] / requests * 100, 2) if requests else 0,
+            }
+
         return {
             "item_count": len(self._cache),
             "current_size_mb": round(self._current_size_bytes / 1024 / 1024, 2),
@@ -210,59 +415,112 @@ class CacheManager:
             "hit_count": self._hit_count,
             "miss_count": self._miss_count,
             "hit_rate_percent": round(hit_rate, 2),
-            "items_by_priority": priority_counts
+            "stale_hit_count": self._stale_hit_count,
+            "eviction_count": self._eviction_count,
+            "expired_count": self._expired_count,
+            "refresh_count": self._refresh_count,
+            "refresh_error_count": self._refresh_error_count,
+            "refreshes_in_progress": len(self._refresh_tasks),
+            "items_by_priority": priority_counts,
+            "prefixes": prefixes
         }
 
-    def _remove_item(self, key: str) -> None:
-        """Remove an item from the cache."""
-        if key in self._cache:
-            item = self._cache[key]
-            self._current_size_bytes -= item.estimated_size
-            del self._cache[key]
-
-    def _check_cleanup(self) -> None:
-        """Check if cleanup is needed and perform if necessary."""
-        # Check time-based cleanup
-        time_for_cleanup = (
-            (datetime.now() - self._last_cleanup).total_seconds() > self._cleanup_interval
-        )
-
-        # Check size-based cleanup (at 75% capacity)
-        size_threshold = self._max_size_bytes * 0.75
-        size_cleanup_needed = self._current_size_bytes > size_threshold
+    def _stats_for(self, key: str) -> Dict[str, int]:
+        """Return the statistics counters of a key's prefix."""
+        prefix = _key_prefix(key)
+        stats = self._prefix_stats.get(prefix)
+        if stats is None:
+            stats = self._prefix_stats[prefix] = {
+                "hits": 0,
+                "misses": 0,
+                "stale_hits": 0,
+                "evictions": 0,
+                "expirations": 0,
+            }
+        return stats
 
-        if time_for_cleanup or size_cleanup_needed:
-            self._cleanup()
+    def _remove_item(self, key: str) -> None:
+        """Remove an item from the cache.
 
-    def _cleanup(self) -> None:
+        Its heap entry stays behind and is skipped when it comes up.
+        """
+        item = self._cache.pop(key, None)
+        if item is not None:
+            self._current_size_bytes -= item.estimated_size
+            self._lru[item.priority].pop(key, None)
+
+    def _purge_expired(self, now: float) -> int:
+        """Remove items that can no longer be served, soonest expiry first."""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, sequence, key = heapq.heappop(heap)
+            item = self._cache.get(key)
+            if item is None or item.sequence != sequence:
+                # Entry of a replaced or deleted item
+                continue
+            self._remove_item(key)
+            self._expired_count += 1
+            self._stats_for(key)["expirations"] += 1
+            removed += 1
+
+        # Replaced items leave entries behind; rebuild once they dominate
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (item.servable_until, item.sequence, key)
+                for key, item in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        return removed
+
+    def _evict(self, target_bytes: int) -> int:
+        """Evict least recently used items, lowest priority first, down to target_bytes."""
+        evicted = 0
+        for priority in CacheItemPriority:
+            keys = self._lru[priority]
+            while keys and self._current_size_bytes > target_bytes:
+                key, _ = keys.popitem(last=False)
+                item = self._cache.pop(key)
+                self._current_size_bytes -= item.estimated_size
+                self._eviction_count += 1
+                self._stats_for(key)["evictions"] += 1
+                evicted += 1
+            if self._current_size_bytes <= target_bytes:
+                break
+        return evicted
+
+    def _check_cleanup(self, now: Optional[float] = None) -> None:
+        """Drop expired items and run a full cleanup when over the size limit or due."""
+        now = time.monotonic() if now is None else now
+
+        if (
+            self._current_size_bytes > self._max_size_bytes
+            or now - self._last_cleanup > self._cleanup_interval
+        ):
+            self._cleanup(now)
+        else:
+            # Expiry is cheap with the heap, so it runs on every write
+            self._purge_expired(now)
+
+    def _cleanup(self, now: Optional[float] = None) -> None:
         """Clean up expired items and evict if needed."""
-        start_time = time.time()
+        start_time = time.monotonic()
+        now = start_time if now is None else now
         initial_count = len(self._cache)
         initial_size = self._current_size_bytes
 
-        # First remove expired items
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
-            self._remove_item(key)
+        # First remove expired items (stale items are kept while servable)
+        self._purge_expired(now)
 
         # If still over limit, evict by priority and last access
         if self._current_size_bytes > self._max_size_bytes:
-            # Sort items by priority (low first) and then by last access (oldest first)
-            items_for_eviction = sorted(
-                self._cache.items(),
-                key=lambda x: (x[1].priority.value, x[1].last_accessed)
-            )
-
-            # Evict until under limit
-            for key, _ in items_for_eviction:
-                if self._current_size_bytes <= self._max_size_bytes * 0.7:  # 70% target
-                    break
-                self._remove_item(key)
+            self._evict(int(self._max_size_bytes * 0.7))  # 70% target
 
-        self._last_cleanup = datetime.now()
+        self._last_cleanup = now
 
         # Log cleanup results
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         items_removed = initial_count - len(self._cache)
         bytes_freed = initial_size - self._current_size_bytes
         mb_freed = bytes_freed / 1024 / 1024
@@ -275,4 +533,4 @@ class CacheManager:
             self._current_size_bytes / 1024 / 1024,
             self._max_size_bytes / 1024 / 1024,
             elapsed
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,166 @@
+"""Discovery of the tools and services available on an Unraid server."""
+from __future__ import annotations
+
+import logging
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, FrozenSet, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands whose presence decides which collection paths are used
+CAPABILITY_TOOLS = (
+    "apcaccess", "docker", "intel_gpu_top", "inotifywait", "nvme",
+    "sensors", "smartctl", "virsh", "zfs", "zpool",
+)
+
+# Services whose running state gates commands. The rc.d status check is
+# authoritative; the process and socket check covers non-standard setups.
+CAPABILITY_SERVICES = {
+    "docker": (
+        "/etc/rc.d/rc.docker status 2>/dev/null | grep -q 'is currently running' || "
+        "{ pgrep -x dockerd >/dev/null 2>&1 && [ -S /var/run/docker.sock ]; }"
+    ),
+    "libvirt": (
+        "/etc/rc.d/rc.libvirt status 2>/dev/null | grep -q 'is currently running' || "
+        "{ pgrep -x libvirtd >/dev/null 2>&1 && [ -S /var/run/libvirt/libvirt-sock ]; }"
+    ),
+    "apcupsd": "pgrep -x apcupsd >/dev/null 2>&1",
+}
+
+# Tools only change with a reboot or a plugin install; service state changes
+# whenever the user starts or stops Docker, VMs or the UPS daemon
+SERVICE_STATE_TTL = 60.0
+
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+
+def _build_services_probe() -> str:
+    """Build the script reporting the boot id and running services."""
+    parts = [f"echo \"boot_id $(cat {BOOT_ID_PATH} 2>/dev/null)\"; "]
+    for name, check in CAPABILITY_SERVICES.items():
+        parts.append(f"if {check}; then echo 'service {name}'; fi; ")
+    parts.append("true")
+    return "".join(parts)
+
+
+def _build_full_probe() -> str:
+    """Build the script reporting tools as well as services."""
+    tools = " ".join(CAPABILITY_TOOLS)
+    return (
+        f"for tool in {tools}; do "
+        "command -v \"$tool\" >/dev/null 2>&1 && echo \"tool $tool\"; "
+        "done; "
+        f"{_build_services_probe()}"
+    )
+
+
+SERVICES_PROBE_COMMAND = _build_services_probe()
+FULL_PROBE_COMMAND = _build_full_probe()
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """Tools and running services found on the server."""
+    boot_id: str = ""
+    tools: FrozenSet[str] = field(default_factory=frozenset)
+    services: FrozenSet[str] = field(default_factory=frozenset)
+
+    def has_tool(self, name: str) -> bool:
+        """Check if a command is installed."""
+        return name in self.tools
+
+    def service_running(self, name: str) -> bool:
+        """Check if a service was running when last probed."""
+        return name in self.services
+
+
+def parse_probe_output(output: str) -> Capabilities:
+    """Parse the output of FULL_PROBE_COMMAND or SERVICES_PROBE_COMMAND."""
+    boot_id = ""
+    tools = set()
+    services = set()
+    for line in output.splitlines():
+        kind, _, value = line.strip().partition(" ")
+        if kind == "boot_id":
+            boot_id = value.strip()
+        elif kind == "tool" and value:
+            tools.add(value)
+        elif kind == "service" and value:
+            services.add(value)
+    return Capabilities(boot_id=boot_id, tools=frozenset(tools), services=frozenset(services))
+
+
+class CapabilityRegistry:
+    """Probes once which tools and services a server has and remembers it.
+
+    Tools are probed on first use and again only after invalidate() (called
+    when the API disconnects) or when the server's boot id changes. Service
+    state is re-probed, along with the boot id, at most every
+    SERVICE_STATE_TTL seconds. Every probe is a single command.
+    """
+
+    def __init__(self, execute_command: Callable[[str], Awaitable[Any]]) -> None:
+        """Initialize the registry."""
+        self._execute_command = execute_command
+        self._capabilities: Optional[Capabilities] = None
+        self._services_checked = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def current(self) -> Optional[Capabilities]:
+        """Return the last probe result without probing."""
+        return self._capabilities
+
+    def invalidate(self) -> None:
+        """Forget everything so the next lookup probes again."""
+        self._capabilities = None
+        self._services_checked = 0.0
+
+    async def async_get(self) -> Capabilities:
+        """Return current capabilities, probing what is missing or stale."""
+        if (
+            self._capabilities is not None
+            and time.monotonic() - self._services_checked < SERVICE_STATE_TTL
+        ):
+            return self._capabilities
+
+        async with self._lock:
+            now = time.monotonic()
+            if self._capabilities is None:
+                self._capabilities = await self._async_probe(FULL_PROBE_COMMAND)
+                self._services_checked = now
+            elif now - self._services_checked >= SERVICE_STATE_TTL:
+                services = await self._async_probe(SERVICES_PROBE_COMMAND)
+                if services.boot_id and services.boot_id != self._capabilities.boot_id:
+                    _LOGGER.debug("Server rebooted, probing capabilities again")
+                    self._capabilities = await self._async_probe(FULL_PROBE_COMMAND)
+                else:
+                    self._capabilities = Capabilities(
+                        boot_id=self._capabilities.boot_id,
+                        tools=self._capabilities.tools,
+                        services=services.services,
+                    )
+                self._services_checked = now
+
+            return self._capabilities
+
+    async def has_tool(self, name: str) -> bool:
+        """Check if a command is installed on the server."""
+        return (await self.async_get()).has_tool(name)
+
+    async def service_running(self, name: str) -> bool:
+        """Check if a service is running on the server."""
+        return (await self.async_get()).service_running(name)
+
+    async def _async_probe(self, command: str) -> Capabilities:
+        """Run a probe script and parse its output."""
+        result = await self._execute_command(command)
+        capabilities = parse_probe_output(result.stdout or "")
+        _LOGGER.debug(
+            "Server capabilities: tools=%s services=%s",
+            ", ".join(sorted(capabilities.tools)) or "none",
+            ", ".join(sorted(capabilities.services)) or "none",
+        )
+        return capabilities
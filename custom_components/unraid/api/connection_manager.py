@@ -3,16 +3,51 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import re
+import secrets
+import shlex
 import time
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 import asyncssh  # type: ignore
 
+from .remote_shell import RemoteShell, RemoteShellError
+
 _LOGGER = logging.getLogger(__name__)
 
+# Commands that only read state and can safely share a single execution.
+# Matched against the start of each command of a list (cmd; cmd && cmd).
+COALESCE_COMMAND_PREFIXES = (
+    "mdcmd status",
+    "cat ",
+    "df ",
+    "findmnt ",
+    "lsblk ",
+    "uname ",
+    "zpool list",
+    "zpool status",
+    "smartctl -n standby",
+    "virsh list",
+    "docker ps",
+    "ls ",
+)
+# Read commands that must match exactly ("hostname foo" sets the name)
+COALESCE_EXACT_COMMANDS = ("hostname",)
+# Filters allowed after a pipe
+COALESCE_FILTER_COMMANDS = ("grep", "awk", "head", "tail", "sort", "uniq", "tr", "wc", "cut")
+COALESCE_LIST_OPERATORS = (";", "&&", "||")
+# Redirects to /dev/null that don't change what a command does
+COALESCE_SAFE_REDIRECTS = re.compile(r"\d?>\s*/dev/null|\d?>&\d")
+# Output redirection, command substitution and background jobs could turn an
+# otherwise read-only command into one with side effects
+COALESCE_UNSAFE_PATTERN = re.compile(r">|`|\$\(|(?<!&)&(?!&)")
+# Live counters whose readings feed rate calculations; concurrent callers may
+# share one execution, but a finished result is never reused
+COALESCE_NO_REUSE_PREFIXES = ("cat /proc/", "cat /sys/")
+
 
 class UnraidConnectionError(Exception):
     """Base class for Unraid connection errors."""
@@ -30,6 +65,42 @@ class CommandError(UnraidConnectionError):
         super().__init__(message)
         self.exit_code = exit_code
 
+@dataclass
+class CommandResult:
+    """Result of a command executed in a batch or persistent shell.
+
+    Mirrors the attributes of asyncssh.SSHCompletedProcess used by callers.
+    """
+    command: str
+    exit_status: int
+    stdout: str
+    stderr: str
+
+    @property
+    def returncode(self) -> int:
+        """Alias of exit_status for SSHCompletedProcess compatibility."""
+        return self.exit_status
+
+    @property
+    def args(self) -> str:
+        """Command that produced this result."""
+        return self.command
+
+    @property
+    def exit_signal(self) -> None:
+        """Batched commands never report a signal."""
+        return None
+
+
+@dataclass
+class _PendingCommand:
+    """A command waiting for the next batch flush."""
+    command: str
+    timeout: Optional[int]
+    max_retries: int
+    future: asyncio.Future
+
+
 class ConnectionState(Enum):
     """Connection state enum."""
     IDLE = auto()
@@ -75,7 +146,8 @@ class SSHConnection:
         host: str,
         username: str,
         password: str,
-        port: int = 22
+        port: int = 22,
+        persistent_shell: bool = False
     ) -> None:
         """Initialize the connection."""
         self.host = host
@@ -84,6 +156,8 @@ class SSHConnection:
         self.port = port
 
         self.conn: Optional[asyncssh.SSHClientConnection] = None
+        self._use_persistent_shell = persistent_shell
+        self._shell: Optional[RemoteShell] = None
         self.state = ConnectionState.DISCONNECTED
         self.metrics = ConnectionMetrics(
             created_at=datetime.now(),
@@ -118,6 +192,7 @@ class SSHConnection:
                     )
                     self.state = ConnectionState.ACTIVE
                     self.metrics.last_used = datetime.now()
+                    self._shell = None
                     _LOGGER.debug(
                         "Connected to %s (conn_id=%s)",
                         self.host,
@@ -204,6 +279,9 @@ class SSHConnection:
 
             try:
                 self.state = ConnectionState.DISCONNECTING
+                if self._shell is not None:
+                    self._shell.close()
+                    self._shell = None
                 self.conn.close()
                 await self.conn.wait_closed()
                 _LOGGER.debug(
@@ -240,7 +318,10 @@ class SSHConnection:
 
             try:
                 async with asyncio.timeout(timeout):
-                    result = await self.conn.run(command)
+                    if self._use_persistent_shell:
+                        result = await self._run_in_shell(command)
+                    else:
+                        result = await self.conn.run(command)
 
                 exec_time = time.time() - start_time
                 self.metrics.total_command_time += exec_time
@@ -303,6 +384,48 @@ class SSHConnection:
             )
             raise
 
+    async def create_process(self, command: str) -> asyncssh.SSHClientProcess:
+        """Start a long-running remote process on this connection."""
+        if self.conn is None or self.state != ConnectionState.ACTIVE:
+            await self.connect()
+        self.metrics.last_used = datetime.now()
+        return await self.conn.create_process(command)
+
+    async def open_unix_connection(
+        self,
+        path: str
+    ) -> Tuple[asyncssh.SSHReader, asyncssh.SSHWriter]:
+        """Open a byte stream to a unix socket on the remote host."""
+        if self.conn is None or self.state != ConnectionState.ACTIVE:
+            await self.connect()
+        self.metrics.last_used = datetime.now()
+        return await self.conn.open_unix_connection(path)
+
+    async def _run_in_shell(self, command: str) -> asyncssh.SSHCompletedProcess:
+        """Execute a command through the connection's persistent shell."""
+        if self._shell is None:
+            self._shell = RemoteShell(self.conn)
+
+        if not self._shell.is_open:
+            try:
+                await self._shell.start()
+            except RemoteShellError as err:
+                # Keep working with exec channels if the server refuses the shell
+                _LOGGER.warning(
+                    "Persistent shell unavailable on %s, using exec channels: %s",
+                    self.host,
+                    err
+                )
+                self._shell = None
+                self._use_persistent_shell = False
+                return await self.conn.run(command)
+
+        try:
+            exit_status, stdout, stderr = await self._shell.run(command)
+        except RemoteShellError as err:
+            raise CommandError(str(err)) from err
+        return CommandResult(command, exit_status, stdout, stderr)
+
     @property
     def is_healthy(self) -> bool:
         """Check if the connection is healthy."""
@@ -325,8 +448,13 @@ class SSHConnection:
 class ConnectionManager:
     """Manages a pool of SSH connections to Unraid servers."""
 
-    def __init__(self) -> None:
-        """Initialize the connection manager."""
+    def __init__(self, persistent_shell: bool = False) -> None:
+        """Initialize the connection manager.
+
+        With persistent_shell enabled, each pooled connection runs commands
+        through one long-lived remote shell instead of an exec channel per command.
+        """
+        self._persistent_shell = persistent_shell
         self._pool: List[SSHConnection] = []
         self._pool_size = 3  # Maximum number of concurrent connections
         self._min_idle = 1  # Minimum number of idle connections
@@ -361,6 +489,22 @@ class ConnectionManager:
         # Command batching settings
         self._command_batch_size = 5  # Maximum number of commands to batch
         self._command_batch_timeout = 0.1  # Maximum time to wait for batching in seconds
+        self._pending_batch: List[_PendingCommand] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._batch_stats = {
+            "batches": 0,
+            "batched_commands": 0,
+        }
+
+        # Single-flight settings for identical read-only commands
+        self._coalesce_window = 1.0  # Seconds a completed result stays shareable
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._recent_results: Dict[str, Tuple[float, asyncssh.SSHCompletedProcess]] = {}
+        self._coalesce_stats = {
+            "shared_inflight": 0,
+            "shared_recent": 0,
+        }
 
     async def initialize(self, host: str, username: str, password: str, port: int = 22) -> None:
         """Initialize the connection pool."""
@@ -378,13 +522,40 @@ class ConnectionManager:
             host=self.host,
             username=self.username,
             password=self.password,
-            port=self.port
+            port=self.port,
+            persistent_shell=self._persistent_shell
         )
 
         await connection.connect()
         self._pool.append(connection)
         return connection
 
+    async def create_dedicated_connection(self) -> SSHConnection:
+        """Open a connection outside the pool for long-running streams.
+
+        The caller owns the connection and must disconnect it.
+        """
+        connection = SSHConnection(
+            host=self.host,
+            username=self.username,
+            password=self.password,
+            port=self.port
+        )
+        await connection.connect()
+        return connection
+
+    async def open_unix_connection(
+        self,
+        path: str
+    ) -> Tuple[asyncssh.SSHReader, asyncssh.SSHWriter]:
+        """Open a stream to a remote unix socket on a pooled connection.
+
+        The stream is a separate channel, so it doesn't block commands on the
+        same connection. The caller must close the writer.
+        """
+        conn = await self.get_connection()
+        return await conn.open_unix_connection(path)
+
     async def _clean_pool(self) -> None:
         """Clean up expired or unhealthy connections."""
         async with self._lock:
@@ -511,7 +682,260 @@ class ConnectionManager:
             )
             return least_used
 
+    @staticmethod
+    def _is_coalescable(command: str) -> bool:
+        """Check if a command is read-only and can share an execution.
+
+        Every command of a list must be an allowed read, and every pipe stage
+        after it one of the allowed filters.
+        """
+        stripped = COALESCE_SAFE_REDIRECTS.sub("", command.strip())
+        if COALESCE_UNSAFE_PATTERN.search(stripped):
+            return False
+        try:
+            lexer = shlex.shlex(stripped, posix=True, punctuation_chars=";&|")
+            lexer.whitespace_split = True
+            tokens = list(lexer)
+        except ValueError:
+            return False
+
+        stage: List[str] = []
+        first_stage = True
+        for token in [*tokens, ";"]:
+            if token not in COALESCE_LIST_OPERATORS and token != "|":
+                stage.append(token)
+                continue
+            if not stage:
+                return False
+            if first_stage:
+                words = " ".join(stage)
+                allowed = words in COALESCE_EXACT_COMMANDS or words.startswith(COALESCE_COMMAND_PREFIXES)
+            else:
+                allowed = stage[0] in COALESCE_FILTER_COMMANDS
+            if not allowed:
+                return False
+            first_stage = token != "|"
+            stage = []
+        return True
+
+    def _prune_recent_results(self, now: float) -> None:
+        """Drop shared results that are older than the freshness window."""
+        expired = [
+            cmd for cmd, (finished, _) in self._recent_results.items()
+            if now - finished > self._coalesce_window
+        ]
+        for cmd in expired:
+            del self._recent_results[cmd]
+
     async def execute_command(
+        self,
+        command: str,
+        timeout: Optional[int] = None,
+        max_retries: int = 2,
+        coalesce: bool = False
+    ) -> asyncssh.SSHCompletedProcess:
+        """Execute a command, sharing and batching read-only commands.
+
+        With coalesce=True, concurrent callers issuing the same read-only
+        command await a single remote execution, and callers arriving within
+        the freshness window after it finished reuse its result. Distinct
+        read-only commands submitted within the batch window are merged into
+        one remote shell invocation. Only the integration's own reads opt in;
+        everything else, including user commands, goes straight to the pool.
+        """
+        if not coalesce or not self._is_coalescable(command):
+            return await self._execute_with_retry(command, timeout, max_retries)
+
+        now = time.monotonic()
+        self._prune_recent_results(now)
+
+        if (recent := self._recent_results.get(command)) is not None:
+            self._coalesce_stats["shared_recent"] += 1
+            _LOGGER.debug("Reusing result from %.2fs ago: %s", now - recent[0], command[:100])
+            return recent[1]
+
+        task = self._inflight.get(command)
+        if task is not None:
+            self._coalesce_stats["shared_inflight"] += 1
+            _LOGGER.debug("Joining in-flight execution: %s", command[:100])
+        else:
+            task = asyncio.ensure_future(
+                self._submit_to_batch(command, timeout, max_retries)
+            )
+            self._inflight[command] = task
+            task.add_done_callback(
+                lambda done, cmd=command: self._on_shared_command_done(cmd, done)
+            )
+
+        # Shield so one cancelled caller doesn't cancel the execution for the others
+        return await asyncio.shield(task)
+
+    def _on_shared_command_done(self, command: str, task: asyncio.Task) -> None:
+        """Move a finished shared execution into the recent results."""
+        if self._inflight.get(command) is task:
+            del self._inflight[command]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if command.lstrip().startswith(COALESCE_NO_REUSE_PREFIXES):
+            return
+        self._recent_results[command] = (time.monotonic(), task.result())
+
+    async def _submit_to_batch(
+        self,
+        command: str,
+        timeout: Optional[int],
+        max_retries: int
+    ) -> asyncssh.SSHCompletedProcess:
+        """Queue a read-only command for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        pending = _PendingCommand(command, timeout, max_retries, loop.create_future())
+        self._pending_batch.append(pending)
+
+        if len(self._pending_batch) >= self._command_batch_size:
+            self._start_batch_flush()
+        elif self._batch_timer is None:
+            # Alone and with no batch running, don't wait for company. Flushing
+            # on the next loop pass still picks up commands submitted together.
+            delay = self._command_batch_timeout if self._batch_tasks else 0
+            self._batch_timer = loop.call_later(delay, self._start_batch_flush)
+
+        return await pending.future
+
+    def _start_batch_flush(self) -> None:
+        """Take the pending commands and execute them in the background."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        batch, self._pending_batch = self._pending_batch, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._flush_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush_batch(self, batch: List[_PendingCommand]) -> None:
+        """Execute a batch of commands in one remote shell and resolve their futures."""
+        if len(batch) == 1:
+            await self._run_pending_individually(batch[0])
+            return
+
+        token = f"__UNRAID_BATCH_{secrets.token_hex(8)}__"
+        script = self._build_batch_script([p.command for p in batch], token)
+        timeouts = [p.timeout for p in batch if p.timeout is not None]
+
+        self._batch_stats["batches"] += 1
+        self._batch_stats["batched_commands"] += len(batch)
+        _LOGGER.debug("Executing %d commands in one batch", len(batch))
+
+        try:
+            result = await self._execute_with_retry(
+                script,
+                timeout=max(timeouts) if timeouts else None,
+                max_retries=max(p.max_retries for p in batch)
+            )
+        except Exception as err:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(err)
+            return
+
+        outputs = self._split_batch_output(result.stdout or "", token, len(batch))
+        try:
+            for pending, output in zip(batch, outputs, strict=True):
+                if pending.future.done():
+                    continue
+                if output is None:
+                    # Markers missing (e.g. the command broke the script); run it on its own
+                    _LOGGER.debug("Batch output incomplete, re-running: %s", pending.command[:100])
+                    await self._run_pending_individually(pending)
+                    continue
+                exit_status, stdout, stderr = output
+                pending.future.set_result(
+                    CommandResult(pending.command, exit_status, stdout, stderr)
+                )
+        except ValueError as err:
+            _LOGGER.error("Batch output doesn't match its %d commands: %s", len(batch), err)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(CommandError(str(err)))
+
+    async def _run_pending_individually(self, pending: _PendingCommand) -> None:
+        """Execute a queued command on its own and resolve its future."""
+        try:
+            result = await self._execute_with_retry(
+                pending.command, pending.timeout, pending.max_retries
+            )
+        except Exception as err:
+            if not pending.future.done():
+                pending.future.set_exception(err)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+    @staticmethod
+    def _build_batch_script(commands: List[str], token: str) -> str:
+        """Build a shell script running each command with delimited stdout, stderr and exit code."""
+        parts = ["exec 3>&1"]
+        for index, command in enumerate(commands):
+            marker = f"{token}:{index}"
+            parts.append(
+                f"printf '%s\\n' '{marker}:OUT'\n"
+                f"__err=$( {{ {command}\n}} 2>&1 1>&3 ); __rc=$?\n"
+                f"printf '\\n%s:%d\\n' '{marker}:ERR' \"$__rc\"\n"
+                f"printf '%s\\n' \"$__err\"\n"
+                f"printf '%s\\n' '{marker}:END'"
+            )
+        parts.append("true")
+        return "\n".join(parts)
+
+    @staticmethod
+    def _split_batch_output(
+        output: str,
+        token: str,
+        count: int
+    ) -> List[Optional[Tuple[int, str, str]]]:
+        """Split batched output into (exit_status, stdout, stderr) per command."""
+        results: List[Optional[Tuple[int, str, str]]] = []
+        position = 0
+        for index in range(count):
+            marker = f"{token}:{index}"
+            out_marker = f"{marker}:OUT\n"
+            err_marker = f"\n{marker}:ERR:"
+            end_marker = f"{marker}:END"
+
+            start = output.find(out_marker, position)
+            if start < 0:
+                results.append(None)
+                continue
+            start += len(out_marker)
+
+            err_start = output.find(err_marker, start)
+            end_start = output.find(end_marker, start)
+            if err_start < 0 or end_start < 0:
+                results.append(None)
+                continue
+
+            status_start = err_start + len(err_marker)
+            status_end = output.find("\n", status_start)
+            try:
+                exit_status = int(output[status_start:status_end])
+            except ValueError:
+                results.append(None)
+                continue
+
+            stdout = output[start:err_start]
+            stderr = output[status_end + 1:end_start]
+            if stderr.endswith("\n"):
+                stderr = stderr[:-1]
+
+            results.append((exit_status, stdout, stderr))
+            position = end_start + len(end_marker)
+
+        return results
+
+    async def _execute_with_retry(
         self,
         command: str,
         timeout: Optional[int] = None,
@@ -628,6 +1052,20 @@ class ConnectionManager:
 
     async def shutdown(self) -> None:
         """Shutdown the connection manager."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        self._recent_results.clear()
+
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        for pending in self._pending_batch:
+            pending.future.cancel()
+        self._pending_batch = []
+        for task in list(self._batch_tasks):
+            task.cancel()
+
         async with self._lock:
             for conn in self._pool:
                 await conn.disconnect()
@@ -660,5 +1098,9 @@ class ConnectionManager:
             "total_errors": total_errors,
             "error_rate": error_rate,
             "circuit_breaker_status": "open" if self._circuit_open else "closed",
-            "recent_errors": len(self._recent_errors)
+            "recent_errors": len(self._recent_errors),
+            "coalesced_inflight": self._coalesce_stats["shared_inflight"],
+            "coalesced_recent": self._coalesce_stats["shared_recent"],
+            "command_batches": self._batch_stats["batches"],
+            "batched_commands": self._batch_stats["batched_commands"],
         }
\ No newline at end of file
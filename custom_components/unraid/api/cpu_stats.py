@@ -0,0 +1,153 @@
+"""CPU accounting from /proc/stat counters."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aggregate and per-core lines only; the rest of /proc/stat isn't needed
+PROC_STAT_COMMAND = "grep '^cpu' /proc/stat"
+
+AGGREGATE_CPU = "cpu"
+
+
+@dataclass(frozen=True)
+class CPUTimes:
+    """Cumulative jiffies of one /proc/stat cpu line.
+
+    guest and guest_nice are already included in user and nice by the kernel,
+    so they are not counted again.
+    """
+    user: int = 0
+    nice: int = 0
+    system: int = 0
+    idle: int = 0
+    iowait: int = 0
+    irq: int = 0
+    softirq: int = 0
+    steal: int = 0
+
+    @property
+    def total(self) -> int:
+        """Return all accounted jiffies."""
+        return (
+            self.user + self.nice + self.system + self.idle
+            + self.iowait + self.irq + self.softirq + self.steal
+        )
+
+    @property
+    def idle_total(self) -> int:
+        """Return jiffies spent not running anything (idle and waiting for I/O)."""
+        return self.idle + self.iowait
+
+    def delta(self, previous: CPUTimes) -> Optional[CPUTimes]:
+        """Return the jiffies elapsed since previous, or None if a counter went back."""
+        values = (
+            self.user - previous.user,
+            self.nice - previous.nice,
+            self.system - previous.system,
+            self.idle - previous.idle,
+            self.iowait - previous.iowait,
+            self.irq - previous.irq,
+            self.softirq - previous.softirq,
+            self.steal - previous.steal,
+        )
+        if any(value < 0 for value in values):
+            return None
+        return CPUTimes(*values)
+
+
+@dataclass
+class CPUUsage:
+    """CPU usage percentages over a sampling interval."""
+    total: float
+    iowait: float
+    steal: float
+    irq: float
+    per_core: Dict[int, float] = field(default_factory=dict)
+    since_boot: bool = False
+
+
+def parse_proc_stat(content: str) -> Dict[str, CPUTimes]:
+    """Parse the cpu lines of /proc/stat into {name: CPUTimes}."""
+    samples: Dict[str, CPUTimes] = {}
+    for line in content.splitlines():
+        parts = line.split()
+        if len(parts) < 5 or not parts[0].startswith(AGGREGATE_CPU):
+            continue
+        try:
+            # Older kernels report fewer columns; missing ones stay zero
+            samples[parts[0]] = CPUTimes(*(int(value) for value in parts[1:9]))
+        except ValueError:
+            _LOGGER.debug("Skipping malformed /proc/stat line: %s", line)
+    return samples
+
+
+def _busy_percentage(delta: CPUTimes) -> float:
+    """Return the busy share of an interval in percent."""
+    if delta.total <= 0:
+        return 0.0
+    return round((delta.total - delta.idle_total) / delta.total * 100, 2)
+
+
+def _share(jiffies: int, delta: CPUTimes) -> float:
+    if delta.total <= 0:
+        return 0.0
+    return round(jiffies / delta.total * 100, 2)
+
+
+class CPUStatsTracker:
+    """Turns successive /proc/stat samples into usage over each interval.
+
+    The previous sample is kept per core. The first sample has nothing to
+    compare with and reports averages since boot, marked with since_boot.
+    Counters going backwards (a reboot or a core coming back online) restart
+    the affected deltas.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._previous: Dict[str, CPUTimes] = {}
+
+    def reset(self) -> None:
+        """Forget the previous sample."""
+        self._previous = {}
+
+    def update(self, content: str) -> Optional[CPUUsage]:
+        """Record a /proc/stat sample and return usage since the previous one."""
+        samples = parse_proc_stat(content)
+        current = samples.get(AGGREGATE_CPU)
+        if current is None:
+            return None
+
+        previous = self._previous
+        self._previous = samples
+
+        since_boot = False
+        delta = current.delta(previous[AGGREGATE_CPU]) if AGGREGATE_CPU in previous else None
+        if delta is None or delta.total == 0:
+            # No usable previous sample, report the average since boot
+            delta = current
+            since_boot = True
+
+        per_core: Dict[int, float] = {}
+        for name, times in samples.items():
+            if name == AGGREGATE_CPU:
+                continue
+            try:
+                core = int(name[len(AGGREGATE_CPU):])
+            except ValueError:
+                continue
+            core_delta = times.delta(previous[name]) if name in previous and not since_boot else None
+            per_core[core] = _busy_percentage(core_delta if core_delta is not None else times)
+
+        return CPUUsage(
+            total=_busy_percentage(delta),
+            iowait=_share(delta.iowait, delta),
+            steal=_share(delta.steal, delta),
+            irq=_share(delta.irq + delta.softirq, delta),
+            per_core=dict(sorted(per_core.items())),
+            since_boot=since_boot,
+        )
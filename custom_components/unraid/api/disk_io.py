@@ -0,0 +1,194 @@
+"""Disk I/O accounting from /proc/diskstats counters."""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from .network_stats import counter_delta
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kernel counters only; reading them never touches the drives
+DISKSTATS_COMMAND = "cat /proc/diskstats"
+
+# /proc/diskstats always counts 512-byte sectors, whatever the device's sector size
+SECTOR_SIZE = 512
+
+# Whole disks only; partitions, loop and md devices are left out
+_WHOLE_DISK_PATTERN = re.compile(r'^(sd[a-z]+|nvme\d+n\d+|hd[a-z]+|vd[a-z]+|xvd[a-z]+)$')
+_PARTITION_PATTERN = re.compile(r'^(nvme\d+n\d+)p\d+$|^(sd[a-z]+|hd[a-z]+|vd[a-z]+|xvd[a-z]+)\d+$')
+
+
+@dataclass(frozen=True)
+class DiskCounters:
+    """Cumulative counters of one /proc/diskstats line."""
+    reads: int = 0
+    sectors_read: int = 0
+    writes: int = 0
+    sectors_written: int = 0
+    io_ms: int = 0
+
+    @property
+    def operations(self) -> int:
+        """Return completed reads and writes."""
+        return self.reads + self.writes
+
+
+@dataclass(frozen=True)
+class DiskIORates:
+    """I/O of one device over the last sampling interval."""
+    read_rate: float = 0.0
+    write_rate: float = 0.0
+    read_iops: float = 0.0
+    write_iops: float = 0.0
+    utilization: float = 0.0
+    idle_since: Optional[datetime] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the rates as published in system_stats.disk_io."""
+        return {
+            "read_rate": self.read_rate,
+            "write_rate": self.write_rate,
+            "read_iops": self.read_iops,
+            "write_iops": self.write_iops,
+            "utilization": self.utilization,
+            "idle_since": self.idle_since.isoformat() if self.idle_since else None,
+        }
+
+
+def block_device_name(device_path: Optional[str]) -> Optional[str]:
+    """Return the whole-disk kernel name of a device path (/dev/sdb1 -> sdb)."""
+    if not device_path:
+        return None
+    name = device_path.rsplit("/", 1)[-1]
+    if match := _PARTITION_PATTERN.match(name):
+        return match.group(1) or match.group(2)
+    return name if _WHOLE_DISK_PATTERN.match(name) else None
+
+
+def parse_diskstats(content: str) -> Dict[str, DiskCounters]:
+    """Parse the whole-disk lines of /proc/diskstats into {device: DiskCounters}."""
+    counters: Dict[str, DiskCounters] = {}
+    for line in content.splitlines():
+        fields = line.split()
+        if len(fields) < 14 or not _WHOLE_DISK_PATTERN.match(fields[2]):
+            continue
+        try:
+            counters[fields[2]] = DiskCounters(
+                reads=int(fields[3]),
+                sectors_read=int(fields[5]),
+                writes=int(fields[7]),
+                sectors_written=int(fields[9]),
+                io_ms=int(fields[12]),
+            )
+        except ValueError:
+            _LOGGER.debug("Skipping malformed /proc/diskstats line: %s", line)
+    return counters
+
+
+class _DeviceHistory:
+    """Last sample of a device and when it was last seen doing I/O."""
+
+    __slots__ = ("time", "wall_time", "counters", "idle_since")
+
+    def __init__(self, now: float, wall_time: datetime, counters: DiskCounters) -> None:
+        self.time = now
+        self.wall_time = wall_time
+        self.counters = counters
+        # Unknown until a sample shows the device idle or busy
+        self.idle_since: Optional[datetime] = None
+
+
+class DiskIOTracker:
+    """Turns successive /proc/diskstats samples into per-device rates.
+
+    Besides rates, the tracker answers whether a device did any I/O since a
+    given sample, which is enough to tell that a spun down disk is still
+    spun down without asking the drive.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._devices: Dict[str, _DeviceHistory] = {}
+
+    def reset(self) -> None:
+        """Forget previous samples."""
+        self._devices = {}
+
+    def operations(self, device: str) -> Optional[int]:
+        """Return the completed operations of a device at the last sample."""
+        history = self._devices.get(device)
+        return history.counters.operations if history else None
+
+    def update(
+        self,
+        counters: Dict[str, DiskCounters],
+        now: Optional[float] = None,
+        wall_time: Optional[datetime] = None
+    ) -> Dict[str, DiskIORates]:
+        """Record a sample and return the rates of devices seen before."""
+        if now is None:
+            now = time.monotonic()
+        if wall_time is None:
+            wall_time = datetime.now(timezone.utc)
+
+        devices: Dict[str, _DeviceHistory] = {}
+        rates: Dict[str, DiskIORates] = {}
+
+        for device, sample in counters.items():
+            history = self._devices.get(device)
+            devices[device] = current = _DeviceHistory(now, wall_time, sample)
+            if history is None:
+                continue
+
+            elapsed = now - history.time
+            deltas = (
+                counter_delta(history.counters.reads, sample.reads),
+                counter_delta(history.counters.sectors_read, sample.sectors_read),
+                counter_delta(history.counters.writes, sample.writes),
+                counter_delta(history.counters.sectors_written, sample.sectors_written),
+                counter_delta(history.counters.io_ms, sample.io_ms),
+            )
+            if elapsed <= 0 or any(delta is None for delta in deltas):
+                _LOGGER.debug("Counters of %s went back, skipping rates", device)
+                continue
+            reads, sectors_read, writes, sectors_written, io_ms = deltas
+
+            if reads or writes:
+                current.idle_since = None
+            else:
+                # The last I/O happened at or before the previous sample
+                current.idle_since = history.idle_since or history.wall_time
+
+            rates[device] = DiskIORates(
+                read_rate=round(sectors_read * SECTOR_SIZE / elapsed, 1),
+                write_rate=round(sectors_written * SECTOR_SIZE / elapsed, 1),
+                read_iops=round(reads / elapsed, 2),
+                write_iops=round(writes / elapsed, 2),
+                utilization=round(min(io_ms / (elapsed * 10), 100.0), 1),
+                idle_since=current.idle_since,
+            )
+
+        self._devices = devices
+        return rates
+
+
+def disk_io_by_name(
+    disks: Iterable[Any],
+    rates: Mapping[str, DiskIORates]
+) -> Dict[str, Dict[str, Any]]:
+    """Key device rates by the array or pool disk name using them."""
+    result: Dict[str, Dict[str, Any]] = {}
+    for disk in disks:
+        if not isinstance(disk, Mapping):
+            continue
+        name = disk.get("name")
+        device = block_device_name(disk.get("device"))
+        if name and device and device in rates:
+            result[name] = rates[device].as_dict()
+    return result
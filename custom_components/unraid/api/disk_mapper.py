@@ -1,14 +1,30 @@
 """Consolidated disk mapping utilities for Unraid integration."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
-import asyncio
-from typing import Dict, Optional, Any, Callable, Awaitable, List
+from collections.abc import Mapping
+from typing import Dict, Optional, Any, Callable, Awaitable, Iterable, List
 from dataclasses import dataclass
 
+from .disk_io import block_device_name
+from .emhttp_state import EmhttpDisk, parse_emhttp_ini
+from .snapshot_operations import split_sections
+
 _LOGGER = logging.getLogger(__name__)
 
+# Both configuration files in one round trip
+DISK_CONFIG_COMMAND = (
+    "echo '===DISKS_INI==='; cat /var/local/emhttp/disks.ini 2>/dev/null; "
+    "echo '===DISK_CFG==='; cat /boot/config/disk.cfg 2>/dev/null; "
+    "true"
+)
+
+# /dev/md1, md1p1 and friends; array disk N is always md device N
+_MD_DEVICE_PATTERN = re.compile(r'^(?:/dev/)?md(\d+)(?:p\d+)?$')
+_ARRAY_DISK_PATTERN = re.compile(r'^disk(\d+)$')
+
 @dataclass
 class DiskIdentifier:
     """Class to hold disk identification information."""
@@ -20,8 +36,42 @@ class DiskIdentifier:
     spindown_delay: str = "-1"
     mount_point: Optional[str] = None
 
+    @property
+    def md_number(self) -> Optional[int]:
+        """Return the md device number of an array data disk."""
+        if match := _ARRAY_DISK_PATTERN.match(self.name):
+            return int(match.group(1))
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the entry published in disk_mappings."""
+        return {
+            "name": self.name,
+            "device": self.device or "",
+            "serial": self.serial or "",
+            "status": self.status,
+            "filesystem": self.filesystem or "",
+            "spindown_delay": self.spindown_delay,
+        }
+
+
+def disk_layout_hash(identifiers: Iterable[DiskIdentifier]) -> str:
+    """Return an md5 of the slot assignments, leaving out temperatures and counters."""
+    layout = sorted(
+        f"{disk.name}|{disk.device}|{disk.serial}|{disk.filesystem}|{disk.status}|{disk.spindown_delay}"
+        for disk in identifiers
+    )
+    return hashlib.md5("\n".join(layout).encode()).hexdigest()
+
+
 class DiskMapper:
-    """Class to handle all disk mapping operations."""
+    """Long-lived registry of the array and pool disks.
+
+    One registry is owned by the API and shared by the coordinator, entities,
+    SMART collection and USB detection. Lookups by name, device, serial and md
+    number are dictionary reads; the indexes are only rebuilt when the hash of
+    the disk layout changes.
+    """
 
     def __init__(self, execute_command: Callable[[str], Awaitable[Any]]):
         """Initialize the disk mapper.
@@ -33,90 +83,178 @@ class DiskMapper:
         self._disk_mappings: Dict[str, DiskIdentifier] = {}
         self._device_to_disk: Dict[str, str] = {}
         self._serial_to_disk: Dict[str, str] = {}
+        self._md_to_disk: Dict[int, str] = {}
+        # disk_mappings as published to entities, rebuilt with the indexes
+        self._mapping_dicts: Dict[str, Dict[str, Any]] = {}
+        self._spindown_delays: Dict[str, str] = {}
+        self._layout_hash: Optional[str] = None
         self._cache_valid = False
 
+    @property
+    def layout_hash(self) -> Optional[str]:
+        """Return the hash of the indexed layout."""
+        return self._layout_hash
+
+    def update_layout(self, identifiers: Iterable[DiskIdentifier]) -> bool:
+        """Index the given disks unless their layout is the indexed one.
+
+        Returns True when the indexes were rebuilt.
+        """
+        identifiers = list(identifiers)
+        for identifier in identifiers:
+            identifier.spindown_delay = self._spindown_delays.get(
+                identifier.name, identifier.spindown_delay
+            )
+
+        layout_hash = disk_layout_hash(identifiers)
+        if layout_hash == self._layout_hash:
+            return False
+
+        disk_mappings: Dict[str, DiskIdentifier] = {}
+        device_to_disk: Dict[str, str] = {}
+        serial_to_disk: Dict[str, str] = {}
+        md_to_disk: Dict[int, str] = {}
+
+        for identifier in identifiers:
+            disk_mappings[identifier.name] = identifier
+            if device := block_device_name(identifier.device):
+                device_to_disk[device] = identifier.name
+            if identifier.serial:
+                serial_to_disk[identifier.serial] = identifier.name
+            if (md_number := identifier.md_number) is not None:
+                md_to_disk[md_number] = identifier.name
+
+        self._disk_mappings = disk_mappings
+        self._device_to_disk = device_to_disk
+        self._serial_to_disk = serial_to_disk
+        self._md_to_disk = md_to_disk
+        self._mapping_dicts = {
+            name: identifier.as_dict() for name, identifier in disk_mappings.items()
+        }
+
+        _LOGGER.debug(
+            "Disk layout changed (%s -> %s), indexed %d disks",
+            self._layout_hash, layout_hash, len(disk_mappings)
+        )
+        self._layout_hash = layout_hash
+        return True
+
+    def update_from_emhttp(self, disks: Mapping[str, EmhttpDisk]) -> bool:
+        """Index the slots of an already parsed disks.ini."""
+        if not disks:
+            return False
+        return self.update_layout(
+            DiskIdentifier(
+                name=disk.name,
+                device=disk.device or "",
+                serial=disk.serial or "",
+                status=disk.status,
+                filesystem=disk.filesystem or "",
+            )
+            for disk in disks.values()
+        )
+
     async def refresh_mappings(self) -> Dict[str, DiskIdentifier]:
-        """Refresh disk mappings from all available sources."""
+        """Read disks.ini and disk.cfg and reindex if the layout changed."""
         try:
-            # Get all data sources in parallel
-            command_results = await asyncio.gather(
-                self._execute_command("cat /var/local/emhttp/disks.ini"),
-                self._execute_command("cat /boot/config/disk.cfg"),
-                return_exceptions=True
+            result = await self._execute_command(DISK_CONFIG_COMMAND)
+            if result.exit_status != 0:
+                _LOGGER.warning("Could not read the disk configuration (exit code %d)", result.exit_status)
+                return self._disk_mappings
+
+            sections = split_sections(result.stdout)
+
+            # Spindown delays from disk.cfg are kept for later rebuilds as well
+            disk_cfg = self._parse_disk_config(sections.get("DISK_CFG", ""))
+            self._spindown_delays = {
+                disk_name: config["spindown_delay"]
+                for disk_name, config in disk_cfg.items()
+                if "spindown_delay" in config
+            }
+
+            # disks.ini is rewritten on every emhttp poll, so its content hash
+            # rather than its mtime tells whether the layout changed
+            disks_ini_mappings = await self._parse_disks_ini(sections.get("DISKS_INI", ""))
+            self.update_layout(
+                DiskIdentifier(
+                    name=disk_name,
+                    device=disk_info.get("device", ""),
+                    serial=disk_info.get("id", ""),  # Serial is in the 'id' field
+                    status=disk_info.get("status", "unknown"),
+                    filesystem=disk_info.get("fsType", ""),
+                )
+                for disk_name, disk_info in disks_ini_mappings.items()
             )
 
-            # Clear existing mappings
-            self._disk_mappings = {}
-            self._device_to_disk = {}
-            self._serial_to_disk = {}
-
-            # Parse disks.ini first (primary source)
-            if not isinstance(command_results[0], Exception) and command_results[0].exit_status == 0:
-                disks_ini_mappings = await self._parse_disks_ini(command_results[0].stdout)
-                for disk_name, disk_info in disks_ini_mappings.items():
-                    identifier = DiskIdentifier(
-                        name=disk_name,
-                        device=disk_info.get("device", ""),
-                        serial=disk_info.get("id", ""),  # Serial is in the 'id' field
-                        status=disk_info.get("status", "unknown"),
-                        filesystem=disk_info.get("fsType", ""),
-                        spindown_delay="-1"  # Default, will be updated from disk.cfg
-                    )
-                    self._disk_mappings[disk_name] = identifier
-
-                    # Update lookup dictionaries
-                    if identifier.device:
-                        self._device_to_disk[identifier.device] = disk_name
-                    if identifier.serial:
-                        self._serial_to_disk[identifier.serial] = disk_name
-
-            # Add spindown delays from disk.cfg if needed
-            if not isinstance(command_results[1], Exception) and command_results[1].exit_status == 0:
-                disk_cfg = self._parse_disk_config(command_results[1].stdout)
-                # Update spindown delays in mappings
-                for disk_name, config in disk_cfg.items():
-                    if disk_name in self._disk_mappings:
-                        self._disk_mappings[disk_name].spindown_delay = config.get("spindown_delay", "-1")
-
             if not self._disk_mappings:
                 _LOGGER.warning("No disk mappings found from any source")
-            else:
-                _LOGGER.debug("Found disk mappings: %s", self._disk_mappings)
 
             self._cache_valid = True
             return self._disk_mappings
 
         except Exception as err:
             _LOGGER.error("Error refreshing disk mappings: %s", err)
-            self._cache_valid = False
-            return {}
+            return self._disk_mappings
+
+    def find_by_name(self, disk_name: str) -> Optional[DiskIdentifier]:
+        """Return the indexed disk with this name."""
+        return self._disk_mappings.get(disk_name)
+
+    def find_by_device(self, device: str) -> Optional[DiskIdentifier]:
+        """Return the indexed disk behind a device (sdb, /dev/sdb1 or /dev/md1p1)."""
+        if match := _MD_DEVICE_PATTERN.match(device):
+            return self.find_by_md(int(match.group(1)))
+        disk_name = self._device_to_disk.get(block_device_name(device) or "")
+        return self._disk_mappings.get(disk_name) if disk_name else None
+
+    def find_by_serial(self, serial: str) -> Optional[DiskIdentifier]:
+        """Return the indexed disk with this serial."""
+        disk_name = self._serial_to_disk.get(serial)
+        return self._disk_mappings.get(disk_name) if disk_name else None
+
+    def find_by_md(self, md_number: int) -> Optional[DiskIdentifier]:
+        """Return the array disk behind md device N."""
+        disk_name = self._md_to_disk.get(md_number)
+        return self._disk_mappings.get(disk_name) if disk_name else None
+
+    def md_device_paths(self) -> Dict[str, str]:
+        """Return the physical device path of each md device path."""
+        paths: Dict[str, str] = {}
+        for md_number, disk_name in self._md_to_disk.items():
+            if device := self._disk_mappings[disk_name].device:
+                paths[f"/dev/md{md_number}p1"] = f"/dev/{device}"
+                # Older releases mount array disks as /dev/mdN
+                paths[f"/dev/md{md_number}"] = f"/dev/{device}"
+        return paths
+
+    def as_mappings(self) -> Dict[str, Dict[str, Any]]:
+        """Return disk_mappings as published to entities.
+
+        The same dictionary is returned until the layout changes, so an
+        unchanged layout never shows up as a change between updates.
+        """
+        return self._mapping_dicts
 
     async def get_disk_identifier(self, disk_name: str) -> Optional[DiskIdentifier]:
         """Get disk identifier by name."""
         if not self._cache_valid:
             await self.refresh_mappings()
 
-        return self._disk_mappings.get(disk_name)
+        return self.find_by_name(disk_name)
 
     async def get_disk_by_device(self, device: str) -> Optional[DiskIdentifier]:
         """Get disk identifier by device path."""
         if not self._cache_valid:
             await self.refresh_mappings()
 
-        disk_name = self._device_to_disk.get(device)
-        if disk_name:
-            return self._disk_mappings.get(disk_name)
-        return None
+        return self.find_by_device(device)
 
     async def get_disk_by_serial(self, serial: str) -> Optional[DiskIdentifier]:
         """Get disk identifier by serial number."""
         if not self._cache_valid:
             await self.refresh_mappings()
 
-        disk_name = self._serial_to_disk.get(serial)
-        if disk_name:
-            return self._disk_mappings.get(disk_name)
-        return None
+        return self.find_by_serial(serial)
 
     async def get_all_disks(self) -> Dict[str, DiskIdentifier]:
         """Get all disk identifiers."""
@@ -172,6 +310,10 @@ class DiskMapper:
         if not md_num:
             return device_path
 
+        identifier = self.find_by_md(int(md_num))
+        if identifier and identifier.device:
+            return f"/dev/{identifier.device}"
+
         # Get the physical device for this md device from array information
         array_info = await self._execute_command("mdcmd status")
         if array_info.exit_status != 0:
@@ -195,41 +337,7 @@ class DiskMapper:
     async def _parse_disks_ini(self, content: str) -> Dict[str, Dict[str, Any]]:
         """Parse disks.ini content to get disk mappings and info."""
         try:
-            mapping = {}
-            current_disk = None
-            disk_data = {}
-
-            for line in content.splitlines():
-                line = line.strip()
-
-                # Skip empty lines
-                if not line:
-                    continue
-
-                # New disk section
-                if line.startswith("[") and line.endswith("]"):
-                    # Save previous disk data if exists
-                    if current_disk and disk_data:
-                        mapping[current_disk] = disk_data
-
-                    # Start new disk section
-                    current_disk = line[1:-1].strip('"')  # Remove [] and quotes
-                    disk_data = {"name": current_disk}
-                    continue
-
-                # Parse key=value pairs
-                if "=" in line and current_disk:
-                    key, value = line.split("=", 1)
-                    key = key.strip().strip('"')
-                    value = value.strip().strip('"')
-                    disk_data[key] = value
-
-            # Add last disk if exists
-            if current_disk and disk_data:
-                mapping[current_disk] = disk_data
-
-            return mapping
-
+            return parse_emhttp_ini(content)
         except Exception as err:
             _LOGGER.error("Error parsing disks.ini: %s", err)
             return {}
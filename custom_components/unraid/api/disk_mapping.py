@@ -5,6 +5,8 @@ import logging
 import re
 from typing import Dict, Optional, Any
 
+from .emhttp_state import parse_emhttp_ini
+
 # get_unraid_disk_mapping function moved from helpers.py to avoid circular imports
 
 _LOGGER = logging.getLogger(__name__)
@@ -229,39 +231,7 @@ async def parse_disks_ini(execute_command) -> Dict[str, Dict[str, Any]]:
             _LOGGER.debug("Failed to read disks.ini: exit code %d", result.exit_status)
             return {}
 
-        mapping = {}
-        current_disk = None
-        disk_data = {}
-
-        for line in result.stdout.splitlines():
-            line = line.strip()
-
-            # Skip empty lines
-            if not line:
-                continue
-
-            # New disk section
-            if line.startswith("[") and line.endswith("]"):
-                # Save previous disk data if exists
-                if current_disk and disk_data:
-                    mapping[current_disk] = disk_data
-
-                # Start new disk section
-                current_disk = line[1:-1].strip('"')  # Remove [] and quotes
-                disk_data = {"name": current_disk}
-                continue
-
-            # Parse key=value pairs
-            if "=" in line and current_disk:
-                key, value = line.split("=", 1)
-                key = key.strip().strip('"')
-                value = value.strip().strip('"')
-                disk_data[key] = value
-
-        # Add last disk if exists
-        if current_disk and disk_data:
-            mapping[current_disk] = disk_data
-
+        mapping = parse_emhttp_ini(result.stdout)
         _LOGGER.debug("Parsed disk mappings from disks.ini: %s", mapping)
         return mapping
 
@@ -4,19 +4,36 @@ from __future__ import annotations
 import asyncio
 import logging
 import aiofiles # type: ignore
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import re
+import time
 from datetime import datetime
 
+from .disk_io import DISKSTATS_COMMAND, DiskIORates, DiskIOTracker, block_device_name, parse_diskstats
 from .disk_utils import is_valid_disk_name
 from .disk_mapper import DiskMapper
 from .smart_operations import SmartDataManager
 from .disk_state import DiskState, DiskStateManager
+from .emhttp_state import EmhttpDisk, read_emhttp_state
+from .sync_progress import SYNC_PROGRESS_COMMAND, SyncProgressTracker, parse_sync_counters
+from .zfs_state import (
+    ZFS_STATE_COMMAND,
+    ARCStatsTracker,
+    ZFSState,
+    parse_zfs_sections,
+    read_zfs_state,
+)
 from .error_handling import with_error_handling, safe_parse
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long the ZFS state from the last snapshot answers pool lookups
+ZFS_STATE_MAX_AGE = 30  # seconds
+
+# Whole disks and partitions whose SMART data can be read in the bulk command
+BULK_SMART_DEVICE_PATTERN = re.compile(r'^/dev/(sd[a-z]+\d*|nvme\d+n\d+(p\d+)?)$')
+
 @dataclass
 class DiskInfo:
     """Disk information from smartctl."""
@@ -75,6 +92,9 @@ class DiskOperationsMixin:
             "UDMA_CRC_Error_Count": {"warn": 100, "crit": 200},
         }
 
+        # Disk registry shared by SMART collection, USB detection and the coordinator
+        self._disk_mapper = DiskMapper(self.execute_command)
+
         self._smart_manager = SmartDataManager(self)
         self._state_manager = DiskStateManager(self)
         # Clear any cached MD device paths to force re-resolution
@@ -86,11 +106,28 @@ class DiskOperationsMixin:
         self._last_update: Dict[str, datetime] = {}
         self._update_interval = 60  # seconds
 
+        self._disk_io = DiskIOTracker()
+        # Completed operations of each block device when it was last found in standby
+        self._standby_io_marks: Dict[str, int] = {}
+
+        # Pools, devices and scan state shared by every ZFS lookup
+        self._zfs_state: Optional[ZFSState] = None
+        self._zfs_state_time: Optional[float] = None
+        self._arc_stats = ARCStatsTracker()
+
+        # Positions of the running parity check or rebuild
+        self._sync_progress = SyncProgressTracker()
+
     @property
     def disk_operations(self) -> 'DiskOperationsMixin':
         """Return self as disk operations interface."""
         return self
 
+    @property
+    def disk_mapper(self) -> DiskMapper:
+        """Return the shared disk registry."""
+        return self._disk_mapper
+
     async def initialize(self) -> None:
         """Initialize disk operations."""
         _LOGGER.debug("Starting disk operations initialization")
@@ -114,21 +151,8 @@ class DiskOperationsMixin:
     async def get_disk_mappings(self) -> Dict[str, Dict[str, Any]]:
         """Get comprehensive disk mappings including serials."""
         async with self._disk_lock:
-            # Use the new DiskMapper class
-            disk_mapper = DiskMapper(self.execute_command)
-            disk_identifiers = await disk_mapper.refresh_mappings()
-
-            # Convert DiskIdentifier objects to dictionaries for backward compatibility
-            mappings = {}
-            for disk_name, identifier in disk_identifiers.items():
-                mappings[disk_name] = {
-                    "name": disk_name,
-                    "device": identifier.device or "",
-                    "serial": identifier.serial or "",
-                    "status": identifier.status,
-                    "filesystem": identifier.filesystem or "",
-                    "spindown_delay": identifier.spindown_delay
-                }
+            await self._disk_mapper.refresh_mappings()
+            mappings = self._disk_mapper.as_mappings()
 
             if not mappings:
                 _LOGGER.warning("No disk mappings found from any source")
@@ -140,7 +164,7 @@ class DiskOperationsMixin:
     async def _get_array_status(self) -> str:
         """Get Unraid array status using mdcmd."""
         try:
-            result = await self.execute_command("mdcmd status")
+            result = await self.execute_command("mdcmd status", coalesce=True)
             if result.exit_status != 0:
                 return "unknown"
 
@@ -173,12 +197,13 @@ class DiskOperationsMixin:
             if not disk_name:
                 return disk_info
 
-            # Get disk mappings to get serial
-            mappings = await self.get_disk_mappings()
-            if disk_name in mappings:
-                disk_info["serial"] = mappings[disk_name].get("serial")
+            # Serial and device come from the disk registry
+            identifier = await self._disk_mapper.get_disk_identifier(disk_name)
+            if identifier:
+                disk_info["serial"] = identifier.serial
                 _LOGGER.debug("Added serial for disk %s: %s",
                             disk_name, disk_info.get("serial"))
+                device = device or identifier.device
 
             # Map device name to proper device path
             if not device:
@@ -301,7 +326,7 @@ class DiskOperationsMixin:
 
         try:
             result = await self.execute_command(
-                "df -k /mnt/user | awk 'NR==2 {print $2,$3,$4}'"
+                "df -k /mnt/user | awk 'NR==2 {print $2,$3,$4}'", coalesce=True
             )
 
             if result.exit_status != 0:
@@ -343,39 +368,28 @@ class DiskOperationsMixin:
             return response
 
     async def _get_array_sync_status(self) -> Optional[Dict[str, Any]]:
-        """Get detailed array sync status asynchronously."""
+        """Get detailed array sync status with smoothed speed and ETA."""
         try:
-            result = await self.execute_command("mdcmd status")
+            result = await self.execute_command("mdcmd status", coalesce=True)
             if result.exit_status != 0:
                 return None
 
-            sync_info = {}
-            lines = result.stdout.splitlines()
-
-            # Process lines asynchronously
-            tasks = []
-            for line in lines:
-                if '=' not in line:
-                    continue
-
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                if key in ["mdResyncPos", "mdResyncSize", "mdResyncSpeed", "mdResyncCorr"]:
-                    tasks.append(self._process_sync_value(key, value))
-                elif key == "mdResyncAction":
-                    sync_info["action"] = value
-
-            # Gather all processed values
-            processed_values = await asyncio.gather(*tasks, return_exceptions=True)
-            for key, value in processed_values:
-                if not isinstance(value, Exception):
-                    sync_info[key] = value
-
-            if sync_info and sync_info.get("total_size", 0) > 0:
-                progress = (sync_info["position"] / sync_info["total_size"]) * 100
-                sync_info["progress"] = round(progress, 2)
+            values = parse_sync_counters(result.stdout)
+            sync_info: Dict[str, Any] = {}
+            if action := values.get("mdResyncAction"):
+                sync_info["action"] = action
+
+            progress = self._sync_progress.update(values)
+            if progress is not None:
+                sync_info.update({
+                    "position": progress.position,
+                    "total_size": progress.size,
+                    "progress": progress.progress,
+                    "speed": progress.speed,
+                    "eta": progress.eta,
+                })
+            if "mdResyncCorr" in values:
+                sync_info["errors"] = int(values["mdResyncCorr"] or 0)
 
             return sync_info
 
@@ -383,20 +397,6 @@ class DiskOperationsMixin:
             _LOGGER.debug("Error getting sync status: %s", err)
             return None
 
-    async def _process_sync_value(self, key: str, value: str) -> Tuple[str, Union[int, Exception]]:
-        """Process sync values asynchronously."""
-        try:
-            value_int = int(value)
-            key_map = {
-                "mdResyncPos": "position",
-                "mdResyncSize": "total_size",
-                "mdResyncSpeed": "speed",
-                "mdResyncCorr": "errors"
-            }
-            return key_map[key], value_int
-        except ValueError as err:
-            return key, err
-
     async def collect_disk_info(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """Collect information about disks using batched commands.
 
@@ -404,14 +404,25 @@ class DiskOperationsMixin:
         1. First collecting basic disk information without SMART data
         2. Only collecting SMART data for disks that are already in ACTIVE state
         3. Never waking up disks that are in STANDBY mode
+
+        Slot assignments, serials, spin state and temperatures come from the
+        emhttp state files when available, so spun down array and pool disks
+        need no per-disk probes at all.
         """
         _LOGGER.debug("Collecting disk information with standby-aware batched command")
         disks = []
 
         try:
-            # Get array status for mapping md devices to physical devices
-            array_info_result = await self.execute_command("mdcmd status")
-            array_info = array_info_result.stdout if array_info_result.exit_status == 0 else ""
+            emhttp_state = await read_emhttp_state(self.execute_command)
+            emhttp_disks = emhttp_state.disks if emhttp_state else {}
+            # Reindexes the registry only when the slot layout changed
+            self._disk_mapper.update_from_emhttp(emhttp_disks)
+
+            # Without emhttp, map md devices to physical devices using mdcmd
+            array_info = ""
+            if not emhttp_disks:
+                array_info_result = await self.execute_command("mdcmd status", coalesce=True)
+                array_info = array_info_result.stdout if array_info_result.exit_status == 0 else ""
 
             # Get all disk information in a single command, but without SMART data first
             # This prevents waking up disks in standby mode
@@ -433,13 +444,7 @@ class DiskOperationsMixin:
                 "lsblk -o NAME,SERIAL | grep -v '^NAME'; "
                 # Get all block devices with transport info for USB detection
                 "echo '===BLOCK_DEVICES==='; "
-                "lsblk -o NAME,TRAN,TYPE,SIZE,MODEL,VENDOR | grep -v '^NAME'; "
-                # Add ZFS support
-                "echo '===ZFS_POOLS==='; "
-                "if command -v zpool >/dev/null 2>&1; then zpool list -H -o name,size,alloc,free,capacity,health; else echo 'zfs_not_installed'; fi; "
-                # Get ZFS pool device mappings
-                "echo '===ZFS_DEVICES==='; "
-                "if command -v zpool >/dev/null 2>&1; then zpool status -P | grep -E '^[[:space:]]+/dev/' | awk '{print $1}'; else echo 'zfs_not_installed'; fi"
+                "lsblk -o NAME,TRAN,TYPE,SIZE,MODEL,VENDOR | grep -v '^NAME'"
             )
 
             result = await self.execute_command(cmd)
@@ -454,13 +459,10 @@ class DiskOperationsMixin:
 
                 sections = sections[1].split('===BLOCK_DEVICES===')
                 disk_serials_output = sections[0].strip()
+                block_devices_output = sections[1].strip()
 
-                sections = sections[1].split('===ZFS_POOLS===')
-                block_devices_output = sections[0].strip()
-
-                sections = sections[1].split('===ZFS_DEVICES===')
-                zfs_pools_output = sections[0].strip()
-                zfs_devices_output = sections[1].strip()
+                # Pools and their devices come from the shared ZFS state
+                zfs_state = await self.get_zfs_state()
 
                 # Parse disk serial numbers
                 device_to_serial = {}
@@ -494,14 +496,7 @@ class DiskOperationsMixin:
                         }
                         _LOGGER.debug(f"Found block device {device_name}: transport={transport}, type={device_type}")
 
-                # Parse ZFS device mappings
-                zfs_devices = set()
-                if zfs_devices_output != 'zfs_not_installed':
-                    for line in zfs_devices_output.splitlines():
-                        device_path = line.strip()
-                        if device_path.startswith('/dev/'):
-                            zfs_devices.add(device_path)
-                            _LOGGER.debug(f"Found ZFS device: {device_path}")
+                zfs_devices = set(zfs_state.devices) if zfs_state else set()
 
                 # We don't collect SMART data in the initial batch to avoid waking up disks
 
@@ -515,27 +510,13 @@ class DiskOperationsMixin:
                         mount_to_device[mount_point] = device
                         mount_to_fs_type[mount_point] = fs_type
 
-                # Parse ZFS pool information
-                zfs_pools = {}
-                if zfs_pools_output != 'zfs_not_installed':
-                    for line in zfs_pools_output.splitlines():
-                        parts = line.split('\t')
-                        if len(parts) >= 6:
-                            name, size, alloc, free, capacity, health = parts
-                            # Remove '%' from capacity
-                            capacity = capacity.rstrip('%')
-                            zfs_pools[name] = {
-                                'name': name,
-                                'size': size,
-                                'alloc': alloc,
-                                'free': free,
-                                'capacity': capacity,
-                                'health': health
-                            }
-                            _LOGGER.debug(f"Found ZFS pool: {name}")
-
-                # Parse array info to map md devices to physical devices
-                md_to_physical = {}
+                zfs_pools = {
+                    name: pool.as_dict()
+                    for name, pool in (zfs_state.pools.items() if zfs_state else ())
+                }
+
+                # md devices map to physical devices through the registry, or mdcmd without emhttp
+                md_to_physical = self._disk_mapper.md_device_paths() if emhttp_disks else {}
                 disk_name_to_md = {}
 
                 if array_info:
@@ -568,7 +549,8 @@ class DiskOperationsMixin:
                                     physical_device = f"/dev/{value}"
                                     md_to_physical[md_device] = physical_device
 
-                # No need to initialize SMART data dictionary as we'll collect it per active disk
+                # Disks whose state and SMART data are read with one bulk command
+                bulk_smart_disks: List[Tuple[Dict[str, Any], str]] = []
 
                 # Parse disk usage and create disk entries
                 for line in disk_usage_output.splitlines():
@@ -592,10 +574,6 @@ class DiskOperationsMixin:
                                 is_zfs_pool = True
                                 _LOGGER.debug(f"Detected {disk_name} as ZFS pool")
 
-                        # Get current disk state
-                        state = await self._state_manager.get_disk_state(disk_name)
-                        _LOGGER.debug("Disk %s state from DiskStateManager: %s", disk_name, state.value)
-
                         disk_info = {
                             "name": disk_name,
                             "mount_point": mount_point,
@@ -603,7 +581,7 @@ class DiskOperationsMixin:
                             "used": int(used),
                             "free": int(free),
                             "percentage": round((int(used) / int(total) * 100), 1) if int(total) > 0 else 0,
-                            "state": state.value,
+                            "state": DiskState.UNKNOWN.value,
                             "smart_data": {},  # Will be populated with SMART data
                             "smart_status": "Unknown",
                             "temperature": None,
@@ -633,6 +611,39 @@ class DiskOperationsMixin:
                                 if device_name in device_to_serial:
                                     disk_info["serial"] = device_to_serial[device_name]
 
+                        emhttp_disk = emhttp_disks.get(disk_name)
+                        if emhttp_disk and not is_zfs_pool:
+                            device_path = self._apply_emhttp_disk(disk_info, emhttp_disk)
+                            if disk_info["state"] == DiskState.STANDBY.value:
+                                # emhttp already knows the disk is spun down, leave it alone
+                                disks.append(disk_info)
+                                continue
+
+                        if (
+                            not is_zfs_pool
+                            and disk_info["state"] != DiskState.ACTIVE.value
+                            and self._is_still_in_standby(device_path)
+                        ):
+                            # No I/O since the disk was found spun down, so it still is
+                            disk_info["state"] = DiskState.STANDBY.value
+                            _LOGGER.debug("Disk %s idle since standby, skipping state probe", disk_name)
+                            disks.append(disk_info)
+                            continue
+
+                        if not is_zfs_pool and self._supports_bulk_smart(device_path, block_devices):
+                            # State and SMART data are filled in after the loop
+                            bulk_smart_disks.append((disk_info, device_path))
+                            disks.append(disk_info)
+                            continue
+
+                        # Get current disk state
+                        if disk_info["state"] == DiskState.ACTIVE.value:
+                            state = DiskState.ACTIVE
+                        else:
+                            state = await self._state_manager.get_disk_state(disk_name)
+                            _LOGGER.debug("Disk %s state from DiskStateManager: %s", disk_name, state.value)
+                        disk_info["state"] = state.value
+
                         # Only collect SMART data if disk is active to avoid waking up standby disks
                         if state == DiskState.ACTIVE and device_path:
                             # Get SMART data for this specific active disk
@@ -640,7 +651,7 @@ class DiskOperationsMixin:
                             if smart_data:
                                 disk_info.update({
                                     "smart_status": "Passed" if smart_data.get("smart_status") else "Failed",
-                                    "temperature": smart_data.get("temperature"),
+                                    "temperature": smart_data.get("temperature") or disk_info["temperature"],
                                     "power_on_hours": smart_data.get("power_on_hours"),
                                     "smart_data": smart_data
                                 })
@@ -649,6 +660,11 @@ class DiskOperationsMixin:
                     except (ValueError, IndexError) as err:
                         _LOGGER.debug("Error parsing disk line '%s': %s", line, err)
 
+                if bulk_smart_disks:
+                    await self._apply_bulk_smart_data(bulk_smart_disks)
+
+                self._update_standby_io_marks(disks)
+
                 # Add individual ZFS devices to monitoring (for USB storage drives in ZFS pools)
                 for zfs_device_path in zfs_devices:
                     # Check if this device is already being monitored
@@ -697,18 +713,13 @@ class DiskOperationsMixin:
                                 pool_percentage = 0
 
                                 # Find which ZFS pool this device belongs to
-                                device_pool_name = None
-                                for pool_name, pool_data in zfs_pools.items():
-                                    # Check if this device is part of this pool by checking ZFS device list
-                                    if zfs_device_path in zfs_devices:
-                                        # Get pool usage data
-                                        pool_total_bytes = self._parse_size_string(pool_data.get('size', '0'))
-                                        pool_used_bytes = self._parse_size_string(pool_data.get('alloc', '0'))
-                                        pool_free_bytes = self._parse_size_string(pool_data.get('free', '0'))
-                                        pool_percentage = int(pool_data.get('capacity', '0'))
-                                        device_pool_name = pool_name
-                                        _LOGGER.debug(f"USB device {device_name} is part of ZFS pool {pool_name}: {device_size_str} total, pool usage {pool_percentage}%")
-                                        break
+                                device_pool_name = zfs_state.pool_for_device(zfs_device_path) if zfs_state else None
+                                if device_pool_name in zfs_pools:
+                                    pool_data = zfs_pools[device_pool_name]
+                                    pool_used_bytes = pool_data["alloc"]
+                                    pool_free_bytes = pool_data["free"]
+                                    pool_percentage = pool_data["capacity"]
+                                    _LOGGER.debug(f"USB device {device_name} is part of ZFS pool {device_pool_name}: {device_size_str} total, pool usage {pool_percentage}%")
 
                                 # Use pool name for entity naming instead of device name for better UX
                                 entity_name = device_pool_name if device_pool_name else f"zfs_{device_name}"
@@ -754,7 +765,7 @@ class DiskOperationsMixin:
                                 _LOGGER.info(f"Added USB storage device {zfs_device_path} to monitoring as '{entity_name}' (pool: {device_pool_name})")
 
                 # Add ZFS pools information to the result
-                if zfs_pools and zfs_pools != 'zfs_not_installed':
+                if zfs_pools:
                     _LOGGER.debug(f"Adding ZFS pools information: {list(zfs_pools.keys())}")
 
                     # Check which ZFS pools already have device-level entities
@@ -770,69 +781,32 @@ class DiskOperationsMixin:
 
                     # Add pool-level entities for all ZFS pools to provide pool usage sensors
                     # Note: Binary sensor entities are consolidated, but usage sensors are valuable
-                    for pool_name in zfs_pools.keys():
+                    for pool_name, pool_data in zfs_pools.items():
                         # Always create pool entities for usage sensors, even if device-level entities exist
                         # The binary sensor consolidation happens at the entity level, not here
-                            # Get pool device information to determine if it's single or multi-device
-                            try:
-                                devices_result = await self.execute_command(f"zpool list -v {pool_name} | grep -E '^\\s+\\w+' | awk '{{print $1}}'")
-                                pool_devices = []
-                                if devices_result.exit_status == 0:
-                                    pool_devices = [dev.strip() for dev in devices_result.stdout.strip().splitlines() if dev.strip()]
-
-                                # Always create pool entities for usage sensors, but mark single-device pools
-                                # The binary sensor consolidation happens at the entity level, not here
-                                pool_type = "single-device" if len(pool_devices) <= 1 else "multi-device"
-                                _LOGGER.debug(f"Creating pool entity for {pool_type} ZFS pool '{pool_name}' ({len(pool_devices)} devices)")
-
-                                # Create pool entity for multi-device pools or pools without device entities
-                                mount_point = f"/mnt/{pool_name}"
-
-                                # Parse ZFS pool data from command output
-                                zpool_cmd = f"zpool list -H -o name,size,alloc,free,capacity,health {pool_name}"
-                                zpool_result = await self.execute_command(zpool_cmd)
-
-                                if zpool_result.exit_status == 0 and zpool_result.stdout.strip():
-                                    parts = zpool_result.stdout.strip().split('\t')
-                                    if len(parts) >= 6:
-                                        # Extract values
-                                        size_str = parts[1]
-                                        alloc_str = parts[2]
-                                        free_str = parts[3]
-                                        capacity_str = parts[4].rstrip('%')
-                                        health_str = parts[5]
-
-                                        # Parse size values
-                                        total_bytes = self._parse_size_string(size_str)
-                                        used_bytes = self._parse_size_string(alloc_str)
-                                        free_bytes = self._parse_size_string(free_str)
-
-                                        # Get current disk state - ZFS pools are always active
-                                        state = DiskState.ACTIVE
-
-                                        # Create disk info for the ZFS pool
-                                        disk_info = {
-                                            "name": pool_name,
-                                            "mount_point": mount_point,
-                                            "total": total_bytes,
-                                            "used": used_bytes,
-                                            "free": free_bytes,
-                                            "percentage": int(capacity_str),
-                                            "state": state.value,
-                                            "smart_data": {},
-                                            "smart_status": "Unknown",
-                                            "temperature": None,
-                                            "device": None,
-                                            "filesystem": "zfs",
-                                            "health": health_str,
-                                            "pool_devices": pool_devices,
-                                            "device_count": len(pool_devices)
-                                        }
-
-                                        disks.append(disk_info)
-                                        _LOGGER.info(f"Added multi-device ZFS pool {pool_name} to individual_disks ({len(pool_devices)} devices)")
-                            except (ValueError, TypeError, IndexError) as err:
-                                _LOGGER.warning(f"Error adding ZFS pool {pool_name} to individual_disks: {err}")
+                        pool_devices = pool_data["devices"]
+                        pool_type = "single-device" if len(pool_devices) <= 1 else "multi-device"
+                        _LOGGER.debug(f"Creating pool entity for {pool_type} ZFS pool '{pool_name}' ({len(pool_devices)} devices)")
+
+                        disks.append({
+                            "name": pool_name,
+                            "mount_point": f"/mnt/{pool_name}",
+                            "total": pool_data["size"],
+                            "used": pool_data["alloc"],
+                            "free": pool_data["free"],
+                            "percentage": pool_data["capacity"],
+                            # ZFS pools are always active
+                            "state": DiskState.ACTIVE.value,
+                            "smart_data": {},
+                            "smart_status": "Unknown",
+                            "temperature": None,
+                            "device": None,
+                            "filesystem": "zfs",
+                            "health": pool_data["health"],
+                            "pool_devices": pool_devices,
+                            "device_count": len(pool_devices)
+                        })
+                        _LOGGER.info(f"Added ZFS pool {pool_name} to individual_disks ({len(pool_devices)} devices)")
 
                     # Add ZFS pools to system stats
                     system_stats = {"zfs_pools": zfs_pools}
@@ -852,6 +826,171 @@ class DiskOperationsMixin:
             _LOGGER.error("Error collecting disk information with batched command: %s", err)
             return [], {}
 
+    def _apply_emhttp_disk(self, disk_info: Dict[str, Any], emhttp_disk: EmhttpDisk) -> Optional[str]:
+        """Fill in device, serial, state and temperature from the emhttp slot record.
+
+        Returns the device path to use for SMART data.
+        """
+        device_path = disk_info.get("device")
+        if not device_path or device_path.startswith("/dev/md"):
+            device_path = emhttp_disk.device_path or device_path
+            disk_info["device"] = device_path
+
+        if emhttp_disk.serial and "serial" not in disk_info:
+            disk_info["serial"] = emhttp_disk.serial
+        if emhttp_disk.filesystem and "filesystem" not in disk_info:
+            disk_info["filesystem"] = emhttp_disk.filesystem
+        if emhttp_disk.temperature is not None:
+            disk_info["temperature"] = emhttp_disk.temperature
+
+        if emhttp_disk.spundown is not None:
+            state = DiskState.STANDBY if emhttp_disk.spundown else DiskState.ACTIVE
+            disk_info["state"] = state.value
+            if device_path:
+                self._state_manager.record_state(device_path, state)
+            _LOGGER.debug("Disk %s state from emhttp: %s", disk_info["name"], state.value)
+
+        return device_path
+
+    def _build_diskstats_command(self) -> str:
+        """Build the command reading the kernel I/O counters of all block devices."""
+        return DISKSTATS_COMMAND
+
+    def _parse_diskstats_output(self, output: str) -> Dict[str, DiskIORates]:
+        """Parse /proc/diskstats into I/O rates per block device."""
+        return self._disk_io.update(parse_diskstats(output))
+
+    def _build_zfs_state_command(self) -> str:
+        """Build the command reading all ZFS pools and the ARC counters."""
+        return ZFS_STATE_COMMAND
+
+    def _process_zfs_output(self, sections: Dict[str, str]) -> Dict[str, Any]:
+        """Parse the ZFS sections of a snapshot into pools and ARC stats.
+
+        The parsed state also answers pool lookups until it gets stale.
+        """
+        zfs_state = parse_zfs_sections(sections)
+        self._set_zfs_state(zfs_state)
+        if zfs_state is None:
+            return {}
+        return {
+            "pools": {name: pool.as_dict() for name, pool in zfs_state.pools.items()},
+            "arc": self._arc_stats.update(zfs_state.arc),
+        }
+
+    def _set_zfs_state(self, zfs_state: Optional[ZFSState]) -> None:
+        """Store the ZFS state shared by pool lookups."""
+        self._zfs_state = zfs_state
+        self._zfs_state_time = time.monotonic()
+
+    async def get_zfs_state(self) -> Optional[ZFSState]:
+        """Return the state of all ZFS pools, None when ZFS isn't installed.
+
+        The state collected with the last snapshot is reused while it is
+        fresh, so per-pool lookups don't cost a round trip each.
+        """
+        if (
+            self._zfs_state_time is not None
+            and time.monotonic() - self._zfs_state_time < ZFS_STATE_MAX_AGE
+        ):
+            return self._zfs_state
+        self._set_zfs_state(await read_zfs_state(self.execute_command))
+        return self._zfs_state
+
+    @property
+    def sync_active(self) -> bool:
+        """Return whether a parity check or rebuild was running at the last sample."""
+        return self._sync_progress.active
+
+    def _update_sync_progress(self, mdcmd_values: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Feed mdcmd status values to the sync tracker and return the progress."""
+        progress = self._sync_progress.update(mdcmd_values)
+        return progress.as_dict() if progress is not None else None
+
+    async def sample_sync_progress(self) -> Optional[Dict[str, Any]]:
+        """Read only the resync counters and return the progress, None when idle."""
+        result = await self.execute_command(SYNC_PROGRESS_COMMAND)
+        return self._update_sync_progress(parse_sync_counters(result.stdout or ""))
+
+    def _is_still_in_standby(self, device_path: Optional[str]) -> bool:
+        """Check if a disk found in standby has done no I/O since, per /proc/diskstats.
+
+        Any read or write would have spun the disk up, so the state probe is
+        only needed once the operation count moves.
+        """
+        device = block_device_name(device_path)
+        if device is None or device not in self._standby_io_marks:
+            return False
+        return self._disk_io.operations(device) == self._standby_io_marks[device]
+
+    def _update_standby_io_marks(self, disks: List[Dict[str, Any]]) -> None:
+        """Remember the operation count of disks in standby for the next update."""
+        for disk in disks:
+            device = block_device_name(disk.get("device"))
+            if device is None:
+                continue
+            operations = self._disk_io.operations(device)
+            if disk.get("state") == DiskState.STANDBY.value and operations is not None:
+                self._standby_io_marks[device] = operations
+            else:
+                self._standby_io_marks.pop(device, None)
+
+    @staticmethod
+    def _supports_bulk_smart(
+        device_path: Optional[str],
+        block_devices: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        """Check if a device can be handled by the bulk SMART command.
+
+        USB devices keep using per-device detection, since flash drives don't support SMART.
+        """
+        if not device_path or not BULK_SMART_DEVICE_PATTERN.match(device_path):
+            return False
+        device_name = device_path.replace("/dev/", "")
+        base_name = re.sub(r'(nvme\d+n\d+)p\d+$|(sd[a-z]+)\d+$', lambda m: m.group(1) or m.group(2), device_name)
+        for name in (device_name, base_name):
+            if block_devices.get(name, {}).get("transport") == "usb":
+                return False
+        return True
+
+    async def _apply_bulk_smart_data(
+        self,
+        bulk_smart_disks: List[Tuple[Dict[str, Any], str]]
+    ) -> None:
+        """Fill in state and SMART data for disks using a single remote command."""
+        smart_results = await self._smart_manager.get_bulk_smart_data(
+            [device_path for _, device_path in bulk_smart_disks]
+        )
+
+        for disk_info, device_path in bulk_smart_disks:
+            smart_data = smart_results.get(device_path)
+            if not smart_data:
+                continue
+
+            if smart_data.get("state") == "error":
+                # No SMART data was read, so it says nothing about the power state
+                if disk_info["state"] not in (DiskState.ACTIVE.value, DiskState.STANDBY.value):
+                    disk_info["state"] = DiskState.UNKNOWN.value
+                _LOGGER.debug(
+                    "Bulk SMART probe failed for %s: %s",
+                    disk_info["name"],
+                    smart_data.get("error")
+                )
+                continue
+
+            state = DiskState.STANDBY if smart_data.get("state") == "standby" else DiskState.ACTIVE
+            self._state_manager.record_state(device_path, state)
+            disk_info["state"] = state.value
+            _LOGGER.debug("Disk %s state from bulk SMART probe: %s", disk_info["name"], state.value)
+
+            if state == DiskState.ACTIVE:
+                disk_info.update({
+                    "smart_status": "Failed" if smart_data.get("smart_status") == "failed" else "Passed",
+                    "temperature": smart_data.get("temperature") or disk_info["temperature"],
+                    "power_on_hours": smart_data.get("power_on_hours"),
+                    "smart_data": smart_data
+                })
+
     def _parse_size_string(self, size_str: str) -> int:
         """Parse size strings like 1.5T, 500G, etc. to bytes."""
         try:
@@ -910,7 +1049,7 @@ class DiskOperationsMixin:
                 }
 
             result = await self.execute_command(
-                "df -k /mnt/cache | awk 'NR==2 {print $2,$3,$4}'"
+                "df -k /mnt/cache | awk 'NR==2 {print $2,$3,$4}'", coalesce=True
             )
 
             if result.exit_status != 0:
@@ -960,38 +1099,19 @@ class DiskOperationsMixin:
 
     async def _get_pool_info(self, pool_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed pool information for any ZFS pool."""
-        try:
-            # Check if this is a ZFS pool
-            zfs_result = await self.execute_command(f"zpool list -H -o name,size,alloc,free,capacity,health {pool_name} 2>/dev/null")
-            if zfs_result.exit_status == 0 and zfs_result.stdout.strip():
-                # This is a ZFS pool
-                parts = zfs_result.stdout.strip().split('\t')
-                if len(parts) >= 6:
-                    # Extract only the values we need
-                    pool_name = parts[0]
-                    capacity = parts[4]
-                    health = parts[5]
-                    # Remove '%' from capacity
-                    capacity = capacity.rstrip('%')
-
-                    # Get ZFS pool devices
-                    devices_result = await self.execute_command(f"zpool list -v {pool_name} | grep -E '^\\s+\\w+' | awk '{{print $1}}'")
-                    devices = []
-                    if devices_result.exit_status == 0:
-                        devices = [f"/dev/{dev}" for dev in devices_result.stdout.strip().splitlines()]
-
-                    return {
-                        "filesystem": "zfs",
-                        "devices": devices,
-                        "total_devices": len(devices),
-                        "raid_type": "zfs",
-                        "health": health
-                    }
-            return None
-        except (OSError, ValueError) as err:
-            _LOGGER.debug(f"Error getting ZFS pool info for {pool_name}: {err}")
+        zfs_state = await self.get_zfs_state()
+        if zfs_state is None or not zfs_state.has_pool(pool_name):
             return None
 
+        pool = zfs_state.pools[pool_name]
+        return {
+            "filesystem": "zfs",
+            "devices": pool.device_paths,
+            "total_devices": len(pool.devices),
+            "raid_type": "zfs",
+            "health": pool.health
+        }
+
     async def _get_cache_pool_info(self) -> Optional[Dict[str, Any]]:
         """Get detailed cache pool information."""
         try:
@@ -37,8 +37,13 @@ class DiskStateManager:
             _LOGGER.debug("Cleared cached MD device path for %s", device)
 
     async def _get_device_path(self, device: str) -> str | None:
-        """Get actual device path from mount point."""
+        """Get actual device path from the disk registry or the mount point."""
         try:
+            # Array and pool slots are indexed by the shared registry
+            identifier = self._instance.disk_mapper.find_by_name(device)
+            if identifier and identifier.device:
+                return f"/dev/{identifier.device}"
+
             # Check cache first
             if device in self._device_paths_cache:
                 _LOGGER.debug("Using cached device path for %s: %s", device, self._device_paths_cache[device])
@@ -75,13 +80,18 @@ class DiskStateManager:
             return None
 
     async def _resolve_md_to_physical(self, md_device: str) -> str | None:
-        """Resolve MD device to underlying physical device using mdcmd status."""
+        """Resolve MD device to underlying physical device, falling back to mdcmd status."""
         try:
             # Extract MD number (e.g., md1 from /dev/md1)
             md_num = md_device.replace('/dev/md', '')
 
+            if md_num.isdigit():
+                identifier = self._instance.disk_mapper.find_by_md(int(md_num))
+                if identifier and identifier.device:
+                    return f"/dev/{identifier.device}"
+
             # Use mdcmd status to get the mapping
-            result = await self._instance.execute_command("mdcmd status")
+            result = await self._instance.execute_command("mdcmd status", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.warning("mdcmd status failed with exit code %d", result.exit_status)
                 return None
@@ -127,8 +137,8 @@ class DiskStateManager:
                 elif device == "cache" or device == "garbage":
                     # Check if this is a ZFS pool (either cache or garbage for testing)
                     pool_name = device  # Use the actual pool name
-                    zfs_result = await self._instance.execute_command(f"zpool list -H -o name {pool_name} 2>/dev/null")
-                    if zfs_result.exit_status == 0 and zfs_result.stdout.strip():
+                    zfs_state = await self._instance.get_zfs_state()
+                    if zfs_state is not None and zfs_state.has_pool(pool_name):
                         _LOGGER.debug(f"{pool_name} is a ZFS pool, setting as ACTIVE")
                         self._device_types[device] = 'zfs'
                         return DiskState.ACTIVE
@@ -269,10 +279,15 @@ class DiskStateManager:
             )
             return DiskState.UNKNOWN
 
+    def record_state(self, device_path: str, state: DiskState) -> None:
+        """Record a disk state determined elsewhere (e.g. a bulk SMART probe)."""
+        self._states[device_path] = state
+        self._last_check[device_path] = datetime.now(timezone.utc)
+
     async def update_spindown_delays(self) -> None:
         """Update disk spin-down delay settings."""
         try:
-            result = await self._instance.execute_command("cat /boot/config/disk.cfg")
+            result = await self._instance.execute_command("cat /boot/config/disk.cfg", coalesce=True)
             if result.exit_status != 0:
                 return
 
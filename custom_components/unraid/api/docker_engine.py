@@ -0,0 +1,202 @@
+"""Docker Engine API client over an SSH-forwarded unix socket."""
+from __future__ import annotations
+
+import json
+import logging
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import asyncssh # type: ignore
+
+_LOGGER = logging.getLogger(__name__)
+
+DOCKER_SOCKET_PATH = "/var/run/docker.sock"
+
+# Requests are sent unversioned so the daemon uses its own API version
+DOCKER_LIST_CONTAINERS_PATH = "/containers/json?all=1"
+DOCKER_EVENTS_PATH = "/events"
+
+# Largest response accepted from a non-streaming request
+DOCKER_MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+OpenConnection = Callable[[str], Awaitable[Tuple[Any, Any]]]
+
+
+class DockerEngineError(Exception):
+    """Error talking to the Docker Engine API."""
+
+
+def parse_container_list(items: Any) -> List[Dict[str, Any]]:
+    """Convert a /containers/json response to container records.
+
+    Records have the same fields as those parsed from `docker ps`.
+    """
+    containers: List[Dict[str, Any]] = []
+    if not isinstance(items, list):
+        return containers
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        names = item.get("Names") or []
+        if not names:
+            continue
+        containers.append({
+            "id": str(item.get("Id", ""))[:12],
+            "name": str(names[0]).lstrip("/"),
+            "state": str(item.get("State", "unknown")).lower() or "unknown",
+            "status": str(item.get("Status", "")),
+            "image": str(item.get("Image", "")),
+        })
+
+    return containers
+
+
+class DockerEngineClient:
+    """Minimal HTTP/1.1 client for the Docker Engine API.
+
+    Each request opens its own stream to the daemon's unix socket through an
+    SSH channel, so no remote process is started and no command output has to
+    be parsed.
+    """
+
+    def __init__(
+        self,
+        open_connection: OpenConnection,
+        socket_path: str = DOCKER_SOCKET_PATH
+    ) -> None:
+        """Initialize the client."""
+        self._open_connection = open_connection
+        self._socket_path = socket_path
+
+    async def list_containers(self) -> List[Dict[str, Any]]:
+        """Return all containers, running or not."""
+        return parse_container_list(await self.request_json(DOCKER_LIST_CONTAINERS_PATH))
+
+    async def request_json(self, path: str) -> Any:
+        """Send a GET request and decode its JSON body."""
+        reader, writer = await self._send_request(path)
+        try:
+            headers = await self._read_headers(reader)
+            body = bytearray()
+            async for chunk in self._iter_body(reader, headers):
+                body.extend(chunk)
+                if len(body) > DOCKER_MAX_RESPONSE_BYTES:
+                    raise DockerEngineError(f"Response to {path} is too large")
+        except (OSError, asyncio.IncompleteReadError, asyncssh.Error) as err:
+            raise DockerEngineError(f"Request to {path} failed: {err}") from err
+        finally:
+            writer.close()
+
+        try:
+            return json.loads(bytes(body))
+        except ValueError as err:
+            raise DockerEngineError(f"Invalid JSON from {path}: {err}") from err
+
+    async def stream_events(
+        self,
+        filters: Optional[Dict[str, List[str]]] = None,
+        on_subscribed: Optional[Callable[[], None]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield daemon events until the stream ends.
+
+        on_subscribed is called once the daemon has accepted the request.
+        """
+        path = DOCKER_EVENTS_PATH
+        if filters:
+            path = f"{path}?filters={quote(json.dumps(filters, separators=(',', ':')))}"
+
+        reader, writer = await self._send_request(path)
+        try:
+            headers = await self._read_headers(reader)
+            if on_subscribed is not None:
+                on_subscribed()
+            pending = b""
+            async for chunk in self._iter_body(reader, headers):
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        _LOGGER.debug("Ignoring malformed Docker event: %s", line[:200])
+                        continue
+                    if isinstance(event, dict):
+                        yield event
+        finally:
+            writer.close()
+
+    async def _send_request(self, path: str) -> Tuple[Any, Any]:
+        """Open a socket stream and write a GET request to it."""
+        try:
+            reader, writer = await self._open_connection(self._socket_path)
+        except Exception as err:
+            raise DockerEngineError(f"Cannot open {self._socket_path}: {err}") from err
+
+        writer.write(
+            f"GET {path} HTTP/1.1\r\n"
+            "Host: docker\r\n"
+            "Accept: application/json\r\n"
+            "Connection: close\r\n"
+            "\r\n".encode("ascii")
+        )
+        return reader, writer
+
+    @staticmethod
+    async def _read_headers(reader: Any) -> Dict[str, str]:
+        """Read the status line and headers, failing on error statuses."""
+        status_line = (await reader.readline()).decode("latin-1").strip()
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+            raise DockerEngineError(f"Invalid response from Docker: {status_line!r}")
+        status = int(parts[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if not line:
+                raise DockerEngineError("Connection closed while reading headers")
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if status >= 400:
+            reason = parts[2] if len(parts) > 2 else ""
+            raise DockerEngineError(f"Docker returned HTTP {status} {reason}".strip())
+        return headers
+
+    @staticmethod
+    async def _iter_body(reader: Any, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        """Yield the response body, decoding chunked transfer encoding."""
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size_line = await reader.readline()
+                if not size_line:
+                    raise DockerEngineError("Connection closed inside a chunked response")
+                try:
+                    size = int(size_line.split(b";", 1)[0].strip(), 16)
+                except ValueError as err:
+                    raise DockerEngineError(f"Invalid chunk size: {size_line!r}") from err
+                if size == 0:
+                    return
+                yield await reader.readexactly(size)
+                await reader.readexactly(2)
+
+        length = headers.get("content-length")
+        if length is not None and length.isdigit():
+            remaining = int(length)
+            while remaining > 0:
+                chunk = await reader.read(min(remaining, 65536))
+                if not chunk:
+                    raise DockerEngineError("Connection closed before the response ended")
+                remaining -= len(chunk)
+                yield chunk
+            return
+
+        while chunk := await reader.read(65536):
+            yield chunk
@@ -1,15 +1,48 @@
 """Docker operations for Unraid."""
 from __future__ import annotations
 
+import base64
+import binascii
 import logging
-from typing import Dict, List, Any
+import shlex
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
 import asyncio
 import asyncssh # type: ignore
 
+from .docker_engine import DockerEngineClient, DockerEngineError
+
 _LOGGER = logging.getLogger(__name__)
 
+DOCKER_PS_COMMAND = "docker ps -a --format '{{.ID}}|{{.Names}}|{{.Status}}|{{.Image}}'"
+
+# Seconds to use docker ps before trying the Engine API again after it failed
+DOCKER_ENGINE_RETRY_INTERVAL = 600
+
+# Where Unraid's Docker manager keeps container icons
+DOCKER_ICON_DIR = "/var/lib/docker/unraid/images"
+DOCKER_ICON_SUFFIX = "-icon.png"
+
+# Modification time and size of every icon, one "mtime size path" line each
+DOCKER_ICON_INDEX_COMMAND = (
+    f"stat -c '%Y %s %n' {DOCKER_ICON_DIR}/*{DOCKER_ICON_SUFFIX} 2>/dev/null"
+)
+
+
+def parse_docker_icon_index(output: str) -> Dict[str, str]:
+    """Map container names to icon version keys from DOCKER_ICON_INDEX_COMMAND output."""
+    index: Dict[str, str] = {}
+    for line in output.splitlines():
+        parts = line.strip().split(" ", 2)
+        if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+            continue
+        filename = parts[2].rsplit("/", 1)[-1]
+        if filename.endswith(DOCKER_ICON_SUFFIX):
+            index[filename[:-len(DOCKER_ICON_SUFFIX)]] = f"{parts[0]}-{parts[1]}"
+    return index
+
 class ContainerStates(Enum):
     """Docker container states."""
     RUNNING = 'running'
@@ -31,40 +64,34 @@ class ContainerStates(Enum):
 class DockerOperationsMixin:
     """Mixin for Docker-related operations."""
 
+    def __init__(self) -> None:
+        """Initialize Docker operations."""
+        self.docker_engine = DockerEngineClient(self.open_unix_connection)
+        self._docker_engine_retry_at = 0.0
+
     async def check_docker_running(self) -> bool:
-        """Check if Docker is running using multiple methods.
+        """Check if Docker is running.
+
+        Uses the capability registry, which checks the rc.d script and falls
+        back to the dockerd process and socket.
 
         Returns:
             bool: True if Docker service is running, False otherwise.
         """
         try:
-            # Method 1: Traditional rc.d script check
-            service_check = await self.execute_command("/etc/rc.d/rc.docker status")
-            if service_check.exit_status == 0 and "is currently running" in service_check.stdout:
-                _LOGGER.debug("Docker validated through rc.d script")
-                return True
-
-            # Method 2: Process check
-            process_check = await self.execute_command("pgrep -f dockerd")
-            if process_check.exit_status == 0:
-                # Method 3: Socket file check
-                sock_check = await self.execute_command("[ -S /var/run/docker.sock ]")
-                if sock_check.exit_status == 0:
-                    _LOGGER.debug("Docker validated through process and socket checks")
-                    return True
-
-            _LOGGER.debug(
-                "Docker service checks failed - rc.d: %s, process: %s",
-                service_check.exit_status,
-                process_check.exit_status
-            )
-            return False
+            running = await self.capabilities.service_running("docker")
+            if not running:
+                _LOGGER.debug("Docker service checks failed")
+            return running
         except Exception as err:
             _LOGGER.debug("Error checking Docker status: %s", str(err))
             return False
 
     async def get_docker_containers(self) -> List[Dict[str, Any]]:
-        """Fetch information about Docker containers using batched commands."""
+        """Fetch information about Docker containers.
+
+        Icons are not included; see get_docker_icon.
+        """
         try:
             _LOGGER.debug("Fetching Docker container information")
 
@@ -73,66 +100,105 @@ class DockerOperationsMixin:
                 _LOGGER.debug("Docker service is not running, no containers available")
                 return []
 
-            # Get container list with basic information in a single command
-            # Note: Removed RunningFor, CPU, Memory, Network I/O, and Block I/O metrics as per optimization requirements
-            result = await self.execute_command(
-                "docker ps -a --format '{{.ID}}|{{.Names}}|{{.Status}}|{{.Image}}'"
-            )
+            return await self.list_docker_containers()
+        except (asyncssh.Error, OSError) as e:
+            _LOGGER.debug("Error getting docker containers (this is normal if Docker is not configured): %s", str(e))
+            return []
 
-            if result.exit_status != 0:
-                _LOGGER.error("Failed to get container list: %s", result.stderr)
-                return []
+    async def list_docker_containers(self) -> List[Dict[str, Any]]:
+        """List containers through the Docker Engine API.
 
-            # Parse container list
-            containers = []
-            running_containers = []
-
-            for line in result.stdout.splitlines():
-                try:
-                    parts = line.split('|')
-                    if len(parts) != 4:  # Updated to match the new format (4 fields instead of 5)
-                        continue
-
-                    container_id, name, status, image = parts
-
-                    # Determine container state
-                    state = "unknown"
-                    if status.startswith("Up"):
-                        state = "running"
-                        running_containers.append(container_id)
-                    elif status.startswith("Exited"):
-                        state = "exited"
-                    elif status.startswith("Created"):
-                        state = "created"
-                    elif status.startswith("Restarting"):
-                        state = "restarting"
-
-                    # Store basic container info
-                    # Note: Removed running_for, CPU, memory, network I/O, and block I/O metrics as per optimization requirements
-                    container_info = {
-                        "id": container_id,
-                        "name": name,
-                        "state": state,
-                        "status": status,
-                        "image": image
-                    }
-
-                    # Get container icon if available
-                    icon_path = f"/var/lib/docker/unraid/images/{name}-icon.png"
-                    icon_result = await self.execute_command(
-                        f"[ -f {icon_path} ] && (base64 {icon_path}) || echo ''"
-                    )
-                    icon_data = icon_result.stdout[0] if icon_result.exit_status == 0 else ""
-                    container_info["icon"] = icon_data
-
-                    containers.append(container_info)
-                except Exception as err:
-                    _LOGGER.warning("Error parsing container line '%s': %s", line, err)
+        Falls back to `docker ps` when the daemon socket can't be reached over
+        SSH, for example when the server disallows stream forwarding.
+        """
+        if time.monotonic() >= self._docker_engine_retry_at:
+            try:
+                return await self.docker_engine.list_containers()
+            except DockerEngineError as err:
+                _LOGGER.debug("Docker Engine API unavailable, using docker ps: %s", err)
+                self._docker_engine_retry_at = time.monotonic() + DOCKER_ENGINE_RETRY_INTERVAL
 
-            return containers
-        except (asyncssh.Error, OSError) as e:
-            _LOGGER.debug("Error getting docker containers (this is normal if Docker is not configured): %s", str(e))
+        result = await self.execute_command(self._build_docker_list_command())
+        if result.exit_status != 0:
+            _LOGGER.error("Failed to get container list: %s", result.stderr)
             return []
+        return self._parse_docker_list_output(result.stdout)
+
+    async def get_docker_icon_index(self) -> Dict[str, str]:
+        """Return the version key (mtime-size) of each container icon on the server."""
+        result = await self.execute_command(DOCKER_ICON_INDEX_COMMAND)
+        return parse_docker_icon_index(result.stdout or "")
+
+    async def get_docker_icon(self, container_name: str) -> Optional[Tuple[str, bytes]]:
+        """Fetch a container icon with its version key.
+
+        Returns None when the container has no icon.
+        """
+        path = shlex.quote(f"{DOCKER_ICON_DIR}/{container_name}{DOCKER_ICON_SUFFIX}")
+        result = await self.execute_command(
+            f"stat -c '%Y-%s' {path} 2>/dev/null && base64 -w0 {path}"
+        )
+        if result.exit_status != 0:
+            return None
+
+        key, _, encoded = (result.stdout or "").strip().partition("\n")
+        try:
+            data = base64.b64decode(encoded.strip(), validate=True)
+        except (binascii.Error, ValueError) as err:
+            _LOGGER.debug("Invalid icon data for container '%s': %s", container_name, err)
+            return None
+        if not data:
+            return None
+        return key.strip(), data
+
+    def _build_docker_list_command(self) -> str:
+        """Build a command that lists containers only when Docker is running."""
+        return (
+            "if /etc/rc.d/rc.docker status 2>/dev/null | grep -q 'is currently running' || "
+            "{ pgrep -x dockerd >/dev/null 2>&1 && [ -S /var/run/docker.sock ]; }; then "
+            f"{DOCKER_PS_COMMAND}; "
+            "else echo 'docker_not_running'; fi"
+        )
+
+    def _parse_docker_list_output(self, output: str) -> List[Dict[str, Any]]:
+        """Parse `docker ps` output in ID|Names|Status|Image format."""
+        containers = []
+        if output.strip() == 'docker_not_running':
+            _LOGGER.debug("Docker service is not running, no containers available")
+            return containers
+
+        for line in output.splitlines():
+            try:
+                parts = line.split('|')
+                if len(parts) != 4:  # Updated to match the new format (4 fields instead of 5)
+                    continue
+
+                container_id, name, status, image = parts
+
+                # Determine container state
+                state = "unknown"
+                if status.startswith("Up"):
+                    state = "running"
+                elif status.startswith("Exited"):
+                    state = "exited"
+                elif status.startswith("Created"):
+                    state = "created"
+                elif status.startswith("Restarting"):
+                    state = "restarting"
+
+                # Store basic container info
+                # Note: Removed running_for, CPU, memory, network I/O, and block I/O metrics as per optimization requirements
+                containers.append({
+                    "id": container_id,
+                    "name": name,
+                    "state": state,
+                    "status": status,
+                    "image": image
+                })
+            except Exception as err:
+                _LOGGER.warning("Error parsing container line '%s': %s", line, err)
+
+        return containers
 
     async def execute_container_command(self, command: str, timeout: int = 30) -> asyncssh.SSHCompletedProcess:
         """Execute Docker container command with timeout."""
@@ -218,7 +284,7 @@ class DockerOperationsMixin:
         """Fetch Docker vDisk information from the Unraid system."""
         try:
             _LOGGER.debug("Fetching Docker vDisk usage")
-            result = await self.execute_command("df -k /var/lib/docker | awk 'NR==2 {print $2,$3,$4,$5}'")
+            result = await self.execute_command("df -k /var/lib/docker | awk 'NR==2 {print $2,$3,$4,$5}'", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.error("Docker vDisk usage command failed with exit status %d", result.exit_status)
                 return {}
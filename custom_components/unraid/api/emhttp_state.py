@@ -0,0 +1,353 @@
+"""Parser for the emhttp state files kept in /var/local/emhttp."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+from .snapshot_operations import split_sections
+
+_LOGGER = logging.getLogger(__name__)
+
+EMHTTP_STATE_DIR = "/var/local/emhttp"
+
+# Section name in the batched output -> state file
+EMHTTP_STATE_FILES = {
+    "EMHTTP_DISKS": "disks.ini",
+    "EMHTTP_VAR": "var.ini",
+    "EMHTTP_SHARES": "shares.ini",
+    "EMHTTP_NETWORK": "network.ini",
+    "EMHTTP_DEVS": "devs.ini",
+}
+
+# Key used for entries that appear before any [section] header (var.ini is flat)
+GLOBAL_SECTION = ""
+
+# Reads every state file in one round trip; missing files just leave an empty section
+EMHTTP_STATE_COMMAND = "".join(
+    f"echo '==={section}==='; cat {EMHTTP_STATE_DIR}/{filename} 2>/dev/null; "
+    for section, filename in EMHTTP_STATE_FILES.items()
+) + "true"
+
+
+def parse_emhttp_ini(content: Union[str, Iterable[str]]) -> Dict[str, Dict[str, str]]:
+    """Parse emhttp INI content into {section: {key: value}}.
+
+    emhttp writes quoted section names (``["disk1"]``) and quoted values
+    (``temp="34"``). Lines are handled one at a time so the parser can be fed
+    straight from a stream as well as from a complete string.
+    """
+    lines = content.splitlines() if isinstance(content, str) else content
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        if line[0] == "[" and line[-1] == "]":
+            name = line[1:-1].strip().strip('"')
+            current = sections.setdefault(name, {"name": name})
+            continue
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        if current is None:
+            current = sections.setdefault(GLOBAL_SECTION, {})
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        current[key.strip().strip('"')] = value
+
+    return sections
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Convert an emhttp value to int ('*' and empty mean unknown)."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _kib_to_bytes(value: Optional[str]) -> Optional[int]:
+    """Convert a KiB count from emhttp to bytes."""
+    kib = _to_int(value)
+    return kib * 1024 if kib is not None else None
+
+
+def _to_bool(value: Optional[str]) -> Optional[bool]:
+    """Convert an emhttp flag to bool."""
+    if value is None or value == "":
+        return None
+    return value.lower() in ("1", "yes", "true")
+
+
+@dataclass
+class EmhttpDisk:
+    """Array or pool slot from disks.ini."""
+    name: str
+    device: Optional[str] = None
+    serial: Optional[str] = None
+    status: str = "unknown"
+    disk_type: Optional[str] = None
+    temperature: Optional[int] = None
+    spundown: Optional[bool] = None
+    rotational: Optional[bool] = None
+    transport: Optional[str] = None
+    filesystem: Optional[str] = None
+    fs_status: Optional[str] = None
+    size: Optional[int] = None
+    fs_size: Optional[int] = None
+    fs_free: Optional[int] = None
+    fs_used: Optional[int] = None
+    num_errors: Optional[int] = None
+
+    @property
+    def device_path(self) -> Optional[str]:
+        """Return the /dev path of the assigned device."""
+        return f"/dev/{self.device}" if self.device else None
+
+    @classmethod
+    def from_section(cls, name: str, values: Dict[str, str]) -> EmhttpDisk:
+        """Create a disk record from its disks.ini section."""
+        return cls(
+            name=name,
+            device=values.get("device") or None,
+            serial=values.get("id") or None,
+            status=values.get("status") or "unknown",
+            disk_type=values.get("type") or None,
+            temperature=_to_int(values.get("temp")),
+            spundown=_to_bool(values.get("spundown")),
+            rotational=_to_bool(values.get("rotational")),
+            transport=values.get("transport") or None,
+            filesystem=values.get("fsType") or None,
+            fs_status=values.get("fsStatus") or None,
+            size=_kib_to_bytes(values.get("size")),
+            fs_size=_kib_to_bytes(values.get("fsSize")),
+            fs_free=_kib_to_bytes(values.get("fsFree")),
+            fs_used=_kib_to_bytes(values.get("fsUsed")),
+            num_errors=_to_int(values.get("numErrors")),
+        )
+
+
+@dataclass
+class EmhttpDevice:
+    """Unassigned device from devs.ini."""
+    name: str
+    device: Optional[str] = None
+    serial: Optional[str] = None
+    temperature: Optional[int] = None
+    spundown: Optional[bool] = None
+    rotational: Optional[bool] = None
+    transport: Optional[str] = None
+    size: Optional[int] = None
+
+    @classmethod
+    def from_section(cls, name: str, values: Dict[str, str]) -> EmhttpDevice:
+        """Create a device record from its devs.ini section."""
+        sectors = _to_int(values.get("sectors"))
+        sector_size = _to_int(values.get("sector_size"))
+        return cls(
+            name=name,
+            device=values.get("device") or None,
+            serial=values.get("id") or None,
+            temperature=_to_int(values.get("temp")),
+            spundown=_to_bool(values.get("spundown")),
+            rotational=_to_bool(values.get("rotational")),
+            transport=values.get("transport") or None,
+            size=sectors * sector_size if sectors is not None and sector_size else None,
+        )
+
+
+@dataclass
+class EmhttpArray:
+    """Array state from var.ini."""
+    state: str = "UNKNOWN"
+    fs_state: Optional[str] = None
+    num_disks: int = 0
+    num_disabled: int = 0
+    num_invalid: int = 0
+    num_missing: int = 0
+    synced: bool = False
+    sync_errors: int = 0
+    sync_action: Optional[str] = None
+    sync_position: int = 0
+    sync_size: int = 0
+    server_name: Optional[str] = None
+    version: Optional[str] = None
+
+    @property
+    def sync_progress(self) -> float:
+        """Return the running parity operation progress in percent."""
+        if not self.sync_position or not self.sync_size:
+            return 0.0
+        return round(self.sync_position / self.sync_size * 100, 2)
+
+    @classmethod
+    def from_section(cls, values: Dict[str, str]) -> EmhttpArray:
+        """Create the array record from var.ini."""
+        return cls(
+            state=(values.get("mdState") or "UNKNOWN").upper(),
+            fs_state=values.get("fsState") or None,
+            num_disks=_to_int(values.get("mdNumDisks")) or 0,
+            num_disabled=_to_int(values.get("mdNumDisabled")) or 0,
+            num_invalid=_to_int(values.get("mdNumInvalid")) or 0,
+            num_missing=_to_int(values.get("mdNumMissing")) or 0,
+            synced=bool(_to_int(values.get("sbSynced"))),
+            sync_errors=_to_int(values.get("sbSyncErrs")) or 0,
+            sync_action=values.get("mdResyncAction") or None,
+            sync_position=_to_int(values.get("mdResyncPos")) or 0,
+            sync_size=_to_int(values.get("mdResyncSize")) or 0,
+            server_name=values.get("NAME") or None,
+            version=values.get("version") or None,
+        )
+
+
+@dataclass
+class EmhttpShare:
+    """User share from shares.ini."""
+    name: str
+    comment: str = ""
+    free: Optional[int] = None
+    used: Optional[int] = None
+    size: Optional[int] = None
+    use_cache: Optional[str] = None
+    cache_pool: Optional[str] = None
+    include: str = ""
+    exclude: str = ""
+
+    @classmethod
+    def from_section(cls, name: str, values: Dict[str, str]) -> EmhttpShare:
+        """Create a share record from its shares.ini section."""
+        return cls(
+            name=values.get("name") or name,
+            comment=values.get("comment", ""),
+            free=_kib_to_bytes(values.get("free")),
+            used=_kib_to_bytes(values.get("used")),
+            size=_kib_to_bytes(values.get("size")),
+            use_cache=values.get("useCache") or None,
+            cache_pool=values.get("cachePool") or None,
+            include=values.get("include", ""),
+            exclude=values.get("exclude", ""),
+        )
+
+
+@dataclass
+class EmhttpInterface:
+    """Network interface from network.ini."""
+    name: str
+    ip_address: Optional[str] = None
+    netmask: Optional[str] = None
+    gateway: Optional[str] = None
+    use_dhcp: Optional[bool] = None
+    mtu: Optional[int] = None
+    bonding: Optional[bool] = None
+    bridging: Optional[bool] = None
+
+    @classmethod
+    def from_section(cls, name: str, values: Dict[str, str]) -> EmhttpInterface:
+        """Create an interface record from its network.ini section."""
+        return cls(
+            name=name,
+            ip_address=values.get("IPADDR:0") or values.get("IPADDR") or None,
+            netmask=values.get("NETMASK:0") or values.get("NETMASK") or None,
+            gateway=values.get("GATEWAY") or None,
+            use_dhcp=_to_bool(values.get("USE_DHCP:0", values.get("USE_DHCP"))),
+            mtu=_to_int(values.get("MTU")),
+            bonding=_to_bool(values.get("BONDING")),
+            bridging=_to_bool(values.get("BRIDGING")),
+        )
+
+
+@dataclass
+class EmhttpState:
+    """Typed view of the emhttp state files."""
+    disks: Dict[str, EmhttpDisk] = field(default_factory=dict)
+    array: Optional[EmhttpArray] = None
+    shares: Dict[str, EmhttpShare] = field(default_factory=dict)
+    interfaces: Dict[str, EmhttpInterface] = field(default_factory=dict)
+    devices: Dict[str, EmhttpDevice] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if none of the state files could be read."""
+        return not (self.disks or self.array or self.shares or self.interfaces or self.devices)
+
+    def get_disk_by_device(self, device: str) -> Optional[EmhttpDisk]:
+        """Find the slot a device (``sdb`` or ``/dev/sdb``) is assigned to."""
+        device = device.replace("/dev/", "")
+        for disk in self.disks.values():
+            if disk.device == device:
+                return disk
+        return None
+
+
+def parse_emhttp_state(output: str) -> EmhttpState:
+    """Parse the output of EMHTTP_STATE_COMMAND."""
+    sections = split_sections(output)
+    state = EmhttpState()
+
+    disks = parse_emhttp_ini(sections.get("EMHTTP_DISKS", ""))
+    state.disks = {
+        name: EmhttpDisk.from_section(name, values)
+        for name, values in disks.items()
+        if name != GLOBAL_SECTION
+    }
+
+    var_values = parse_emhttp_ini(sections.get("EMHTTP_VAR", "")).get(GLOBAL_SECTION)
+    if var_values:
+        state.array = EmhttpArray.from_section(var_values)
+
+    shares = parse_emhttp_ini(sections.get("EMHTTP_SHARES", ""))
+    state.shares = {
+        name: EmhttpShare.from_section(name, values)
+        for name, values in shares.items()
+        if name != GLOBAL_SECTION
+    }
+
+    interfaces = parse_emhttp_ini(sections.get("EMHTTP_NETWORK", ""))
+    state.interfaces = {
+        name: EmhttpInterface.from_section(name, values)
+        for name, values in interfaces.items()
+        if name != GLOBAL_SECTION
+    }
+
+    devices = parse_emhttp_ini(sections.get("EMHTTP_DEVS", ""))
+    state.devices = {
+        name: EmhttpDevice.from_section(name, values)
+        for name, values in devices.items()
+        if name != GLOBAL_SECTION
+    }
+
+    return state
+
+
+async def read_emhttp_state(
+    execute_command: Callable[[str], Awaitable[Any]]
+) -> Optional[EmhttpState]:
+    """Read all emhttp state files with one command.
+
+    Returns None when the files are unavailable (emhttp not running or not an
+    Unraid host), so callers can fall back to probing the system directly.
+    """
+    try:
+        result = await execute_command(EMHTTP_STATE_COMMAND)
+        state = parse_emhttp_state(result.stdout or "")
+        if state.is_empty:
+            _LOGGER.debug("emhttp state files not available")
+            return None
+
+        _LOGGER.debug(
+            "Read emhttp state: %d disks, %d shares, %d interfaces, %d unassigned devices",
+            len(state.disks), len(state.shares), len(state.interfaces), len(state.devices),
+        )
+        return state
+
+    except Exception as err:
+        _LOGGER.debug("Error reading emhttp state: %s", err)
+        return None
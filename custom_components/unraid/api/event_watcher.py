@@ -0,0 +1,268 @@
+"""Remote change notifications for Unraid."""
+from __future__ import annotations
+
+import logging
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .docker_engine import DockerEngineClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Slices of coordinator data that can be refreshed on their own
+EVENT_SLICE_ARRAY = "array"
+EVENT_SLICE_DISKS = "disks"
+EVENT_SLICE_DOCKER = "docker"
+EVENT_SLICE_VMS = "vms"
+
+# emhttp state files and the slices they describe
+EMHTTP_FILE_SLICES = {
+    "var.ini": (EVENT_SLICE_ARRAY,),
+    # Rewritten by emhttpd on every poll, so it must not trigger disk (SMART) refreshes
+    "disks.ini": (EVENT_SLICE_ARRAY,),
+    "devs.ini": (EVENT_SLICE_DISKS,),
+}
+
+# /proc/mdstat keys that describe array state (counters like rdevReads are ignored)
+MDSTAT_STATE_KEYS = (
+    "mdState", "mdResyncAction", "mdResync=", "sbSynced", "sbSyncErrs",
+    "diskState", "rdevStatus", "rdevName", "diskName",
+)
+
+# Container lifecycle events worth a refresh (exec_* and health checks are too chatty)
+DOCKER_EVENT_ACTIONS = (
+    "create", "start", "restart", "stop", "die", "kill",
+    "pause", "unpause", "destroy", "rename", "update",
+)
+
+DOCKER_EVENT_FILTERS = {"type": ["container"], "event": list(DOCKER_EVENT_ACTIONS)}
+
+_MDSTAT_PATTERN = "|".join(MDSTAT_STATE_KEYS)
+
+# Long-running script streaming one line per change. Watchers that aren't
+# available are skipped; the script ends (killing its watchers) when the SSH
+# channel closes and its stdin reaches EOF. Docker events come from the
+# Engine API instead, on a separate channel of the same connection.
+EVENT_WATCH_SCRIPT = (
+    "trap 'kill 0' EXIT; "
+    "have=''; "
+    "if command -v inotifywait >/dev/null 2>&1 && [ -d /var/local/emhttp ]; then "
+    "  inotifywait -m -q -e close_write,moved_to --format 'emhttp %f' /var/local/emhttp 2>/dev/null & "
+    "  have=\"$have emhttp\"; "
+    "fi; "
+    "if [ -r /proc/mdstat ]; then "
+    f"  ( prev=$(grep -E '^({_MDSTAT_PATTERN})' /proc/mdstat | cksum); "
+    "    while sleep 2; do "
+    f"      cur=$(grep -E '^({_MDSTAT_PATTERN})' /proc/mdstat | cksum); "
+    "      if [ \"$cur\" != \"$prev\" ]; then echo 'mdstat'; prev=$cur; fi; "
+    "    done ) & "
+    "  have=\"$have mdstat\"; "
+    "fi; "
+    "if command -v virsh >/dev/null 2>&1 && pgrep -x libvirtd >/dev/null 2>&1; then "
+    "  virsh -q event --event lifecycle --loop 2>/dev/null | "
+    "    while IFS= read -r line; do echo \"vm $line\"; done & "
+    "  have=\"$have vm\"; "
+    "fi; "
+    "if [ -z \"$have\" ]; then echo 'unsupported'; exit 0; fi; "
+    "echo \"ready$have\"; "
+    "cat >/dev/null"
+)
+
+_VIRSH_DOMAIN_PATTERN = re.compile(r"for domain '?([^':]+)'?:")
+
+# Reconnect backoff for the watcher stream
+WATCHER_RETRY_INITIAL = 5.0
+WATCHER_RETRY_MAX = 300.0
+
+
+@dataclass
+class UnraidEvent:
+    """A change notification from the Unraid server."""
+    slice: str
+    target: Optional[str] = None
+    source: str = ""
+
+
+def parse_event_line(line: str) -> List[UnraidEvent]:
+    """Translate one line of watcher output into events."""
+    line = line.strip()
+    if not line:
+        return []
+
+    kind, _, rest = line.partition(" ")
+
+    if kind == "emhttp":
+        return [
+            UnraidEvent(slice=event_slice, source=rest)
+            for event_slice in EMHTTP_FILE_SLICES.get(rest.strip(), ())
+        ]
+
+    if kind == "mdstat":
+        return [UnraidEvent(slice=EVENT_SLICE_ARRAY, source="mdstat")]
+
+    if kind == "vm":
+        match = _VIRSH_DOMAIN_PATTERN.search(rest)
+        return [UnraidEvent(
+            slice=EVENT_SLICE_VMS,
+            target=match.group(1) if match else None,
+            source=rest.rsplit(":", 1)[-1].strip()
+        )]
+
+    return []
+
+
+def parse_docker_event(message: Dict[str, Any]) -> List[UnraidEvent]:
+    """Translate a Docker Engine API event into events."""
+    if message.get("Type") != "container":
+        return []
+    action = str(message.get("Action") or message.get("status") or "")
+    if action not in DOCKER_EVENT_ACTIONS:
+        return []
+    attributes = (message.get("Actor") or {}).get("Attributes") or {}
+    return [UnraidEvent(
+        slice=EVENT_SLICE_DOCKER,
+        target=attributes.get("name") or None,
+        source=action
+    )]
+
+
+class RemoteEventWatcher:
+    """Stream change notifications from the server over a dedicated SSH connection."""
+
+    def __init__(self, api: Any, on_event: Callable[[UnraidEvent], None]) -> None:
+        """Initialize the watcher."""
+        self._api = api
+        self._on_event = on_event
+        self._task: Optional[asyncio.Task] = None
+        self._connection = None
+        self._stopping = False
+        self.capabilities: List[str] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the watcher task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start streaming events in the background."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the watcher and close its connection."""
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connection()
+
+    async def _close_connection(self) -> None:
+        """Close the dedicated connection if open."""
+        if self._connection is not None:
+            try:
+                await self._connection.disconnect()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error closing event watcher connection: %s", err)
+            self._connection = None
+
+    async def _run(self) -> None:
+        """Keep the watcher stream open, reconnecting with backoff."""
+        retry_delay = WATCHER_RETRY_INITIAL
+
+        while not self._stopping:
+            try:
+                await self._api.ensure_connection()
+                self._connection = await self._api.connection_manager.create_dedicated_connection()
+                process = await self._connection.create_process(EVENT_WATCH_SCRIPT)
+                docker_task = asyncio.ensure_future(
+                    self._follow_docker_events(DockerEngineClient(self._connection.open_unix_connection))
+                )
+
+                try:
+                    async for line in process.stdout:
+                        line = line.strip()
+                        if line == "unsupported":
+                            _LOGGER.info(
+                                "No file change watchers available on the server, "
+                                "array, disk and VM changes use polling only"
+                            )
+                            # Docker events don't need the watchers; follow them until shutdown
+                            await docker_task
+                            if not self._stopping:
+                                _LOGGER.info("Docker events unavailable too, using polling only")
+                            return
+                        if line.startswith("ready"):
+                            self.capabilities = line.split()[1:]
+                            retry_delay = WATCHER_RETRY_INITIAL
+                            _LOGGER.debug("Event watcher ready: %s", ", ".join(self.capabilities))
+                            continue
+                        for event in parse_event_line(line):
+                            self._on_event(event)
+                finally:
+                    docker_task.cancel()
+                    try:
+                        await docker_task
+                    except asyncio.CancelledError:
+                        pass
+
+                _LOGGER.debug("Event watcher stream ended")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Event watcher error: %s", err)
+            finally:
+                await self._close_connection()
+
+            if self._stopping:
+                break
+
+            _LOGGER.debug("Restarting event watcher in %.0f seconds", retry_delay)
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, WATCHER_RETRY_MAX)
+
+    async def _follow_docker_events(self, client: DockerEngineClient) -> None:
+        """Stream container events from the Docker Engine API.
+
+        The subscription is renewed with backoff when the daemon restarts or
+        the socket can't be opened. After a gap a docker refresh is requested,
+        since events sent in the meantime were missed.
+        """
+        retry_delay = WATCHER_RETRY_INITIAL
+        missed_events = False
+
+        def _subscribed() -> None:
+            nonlocal retry_delay, missed_events
+            retry_delay = WATCHER_RETRY_INITIAL
+            _LOGGER.debug("Subscribed to Docker events")
+            if missed_events:
+                missed_events = False
+                self._on_event(UnraidEvent(slice=EVENT_SLICE_DOCKER, source="resubscribed"))
+
+        while not self._stopping:
+            try:
+                if not await self._api.capabilities.has_tool("docker"):
+                    _LOGGER.debug("Docker is not installed, not watching Docker events")
+                    return
+
+                async for message in client.stream_events(DOCKER_EVENT_FILTERS, _subscribed):
+                    for event in parse_docker_event(message):
+                        self._on_event(event)
+
+                _LOGGER.debug("Docker event stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Docker event stream unavailable: %s", err)
+
+            missed_events = True
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, WATCHER_RETRY_MAX)
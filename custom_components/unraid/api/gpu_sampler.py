@@ -0,0 +1,296 @@
+"""Background Intel GPU sampling for Unraid."""
+from __future__ import annotations
+
+import logging
+import asyncio
+import json
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sampling period requested from intel_gpu_top
+INTEL_GPU_SAMPLE_INTERVAL_MS = 1000
+
+# Samples older than this are dropped from the aggregate
+INTEL_GPU_WINDOW_SECONDS = 10.0
+
+# Reconnect backoff for the sampler stream
+SAMPLER_RETRY_INITIAL = 5.0
+SAMPLER_RETRY_MAX = 300.0
+
+# Finds the Intel display controller, only when intel_gpu_top is installed
+INTEL_GPU_DEVICE_COMMAND = (
+    "if command -v intel_gpu_top >/dev/null 2>&1; then "
+    "lspci | grep -i 'vga\\|display\\|3d' | grep -i intel | head -1; "
+    "fi"
+)
+
+_MODEL_PATTERN = re.compile(r'Intel Corporation (.+?)(?:\s+\(rev|\s*$)')
+
+
+def parse_intel_gpu_model(device_info: str) -> str:
+    """Extract the GPU model from an lspci line."""
+    # Example: "00:02.0 VGA compatible controller: Intel Corporation UHD Graphics 630 (rev 02)"
+    match = _MODEL_PATTERN.search(device_info or "")
+    return f"Intel {match.group(1).strip()}" if match else "Unknown Intel GPU"
+
+
+def parse_intel_gpu_sample(gpu_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract usage, frequency, power and bandwidth from one intel_gpu_top sample."""
+    sample: Dict[str, Any] = {"engines": {}}
+
+    # Use maximum engine usage as overall GPU usage (like gpustat plugin)
+    engines = gpu_json.get('engines')
+    if isinstance(engines, dict):
+        for engine_name, engine_data in engines.items():
+            if isinstance(engine_data, dict) and 'busy' in engine_data:
+                sample["engines"][engine_name] = round(float(engine_data['busy']), 1)
+        if sample["engines"]:
+            sample["usage_percentage"] = max(sample["engines"].values())
+
+    freq_data = gpu_json.get('frequency')
+    if isinstance(freq_data, dict) and 'actual' in freq_data:
+        sample["frequency_mhz"] = int(freq_data['actual'])
+
+    # Handle both the GPU/Package and the older single value power formats
+    power_data = gpu_json.get('power')
+    if isinstance(power_data, dict):
+        for key in ('GPU', 'Package', 'value'):
+            if key in power_data:
+                sample["power_watts"] = round(float(power_data[key]), 1)
+                break
+
+    imc_data = gpu_json.get('imc-bandwidth')
+    if isinstance(imc_data, dict):
+        if 'reads' in imc_data:
+            sample["memory_bandwidth_read"] = round(float(imc_data['reads']), 2)
+        if 'writes' in imc_data:
+            sample["memory_bandwidth_write"] = round(float(imc_data['writes']), 2)
+
+    return sample
+
+
+def build_intel_gpu_stream_command(device_info: str) -> str:
+    """Build the long-running intel_gpu_top command for a detected device."""
+    pci_slot = device_info.split()[0] if device_info else ""
+    device = f" -d pci:slot=\"0000:{pci_slot}\"" if pci_slot else ""
+    return (
+        "command -v intel_gpu_top >/dev/null 2>&1 || { echo 'unsupported'; exit 0; }; "
+        f"exec intel_gpu_top -J -s {INTEL_GPU_SAMPLE_INTERVAL_MS}{device} 2>/dev/null"
+    )
+
+
+class IntelGPUStreamParser:
+    """Incrementally split intel_gpu_top -J output into JSON objects.
+
+    intel_gpu_top writes one open-ended array and older releases omit the
+    commas between samples, so the stream can't be parsed as a whole. Objects
+    are cut out by tracking brace depth (ignoring braces inside strings) and
+    decoded as soon as they are complete.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of output and return the samples it completed."""
+        samples: List[Dict[str, Any]] = []
+        for char in chunk:
+            if self._depth == 0 and char != "{":
+                # Array brackets, commas and whitespace between samples
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+
+            self._buffer.append(char)
+
+            if self._depth == 0:
+                text = "".join(self._buffer)
+                self._buffer = []
+                try:
+                    sample = json.loads(text)
+                except json.JSONDecodeError as err:
+                    _LOGGER.debug("Skipping malformed intel_gpu_top sample: %s", err)
+                    continue
+                if isinstance(sample, dict):
+                    samples.append(sample)
+
+        return samples
+
+
+class IntelGPUSampler:
+    """Stream intel_gpu_top samples over a dedicated SSH connection.
+
+    Samples are kept in a rolling window and aggregated on read, so the
+    coordinator gets current GPU usage without waiting on intel_gpu_top.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        device_info: str,
+        window: float = INTEL_GPU_WINDOW_SECONDS,
+    ) -> None:
+        """Initialize the sampler."""
+        self._api = api
+        self._device_info = device_info
+        self._window = window
+        self._samples: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._connection = None
+        self._stopping = False
+        self.model = parse_intel_gpu_model(device_info)
+        self.supported = True
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sampler task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sampler and close its connection."""
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connection()
+
+    async def _close_connection(self) -> None:
+        """Close the dedicated connection if open."""
+        if self._connection is not None:
+            try:
+                await self._connection.disconnect()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error closing GPU sampler connection: %s", err)
+            self._connection = None
+
+    def add_sample(self, gpu_json: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Add a raw intel_gpu_top sample to the window."""
+        try:
+            sample = parse_intel_gpu_sample(gpu_json)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Error processing Intel GPU sample: %s", err)
+            return
+        self._samples.append((time.monotonic() if now is None else now, sample))
+        self._prune(now)
+
+    def _prune(self, now: Optional[float] = None) -> None:
+        """Drop samples that fell out of the window."""
+        cutoff = (time.monotonic() if now is None else now) - self._window
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def get_data(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Return GPU data averaged over the window.
+
+        Usage is None until the first sample arrives or when the stream has
+        stalled for longer than the window.
+        """
+        self._prune(now)
+        samples = [sample for _, sample in self._samples]
+
+        gpu_data: Dict[str, Any] = {
+            "usage_percentage": None,
+            "model": self.model,
+            "driver_version": "Unknown",
+            "power_watts": None,
+            "frequency_mhz": None,
+            "memory_used_mb": None,
+            "memory_total_mb": None,
+            "engines": {},
+            "sample_count": len(samples),
+        }
+        if not samples:
+            return gpu_data
+
+        def average(key: str, digits: int) -> Optional[float]:
+            values = [sample[key] for sample in samples if key in sample]
+            return round(sum(values) / len(values), digits) if values else None
+
+        engine_values: Dict[str, List[float]] = {}
+        for sample in samples:
+            for engine_name, usage in sample["engines"].items():
+                engine_values.setdefault(engine_name, []).append(usage)
+        gpu_data["engines"] = {
+            engine_name: round(sum(values) / len(values), 1)
+            for engine_name, values in engine_values.items()
+        }
+        if gpu_data["engines"]:
+            gpu_data["usage_percentage"] = max(gpu_data["engines"].values())
+
+        frequency = average("frequency_mhz", 0)
+        gpu_data["frequency_mhz"] = int(frequency) if frequency is not None else None
+        gpu_data["power_watts"] = average("power_watts", 1)
+        for key in ("memory_bandwidth_read", "memory_bandwidth_write"):
+            if (value := average(key, 2)) is not None:
+                gpu_data[key] = value
+
+        return gpu_data
+
+    async def _run(self) -> None:
+        """Keep the intel_gpu_top stream open, reconnecting with backoff."""
+        retry_delay = SAMPLER_RETRY_INITIAL
+        command = build_intel_gpu_stream_command(self._device_info)
+
+        while not self._stopping:
+            try:
+                await self._api.ensure_connection()
+                self._connection = await self._api.connection_manager.create_dedicated_connection()
+                process = await self._connection.create_process(command)
+                parser = IntelGPUStreamParser()
+                _LOGGER.debug("Started Intel GPU sampler for %s", self.model)
+
+                async for line in process.stdout:
+                    if line.strip() == "unsupported":
+                        _LOGGER.info("intel_gpu_top not available, Intel GPU sampling disabled")
+                        self.supported = False
+                        return
+                    for gpu_json in parser.feed(line):
+                        self.add_sample(gpu_json)
+                        retry_delay = SAMPLER_RETRY_INITIAL
+
+                _LOGGER.debug("Intel GPU sampler stream ended")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Intel GPU sampler error: %s", err)
+            finally:
+                await self._close_connection()
+
+            if self._stopping:
+                break
+
+            _LOGGER.debug("Restarting Intel GPU sampler in %.0f seconds", retry_delay)
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, SAMPLER_RETRY_MAX)
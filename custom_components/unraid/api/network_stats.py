@@ -0,0 +1,210 @@
+"""Network interface accounting from /proc/net/dev and /sys/class/net."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTION_NET_DEV = "NET_DEV"
+SECTION_NET_SYS = "NET_SYS"
+
+# Link attributes read for every interface with a single grep
+SYS_NET_ATTRIBUTES = ("speed", "duplex", "carrier", "mtu", "operstate", "address")
+
+# Loopback, bonds, tunnels and per-container/per-VM virtual interfaces
+EXCLUDED_INTERFACE_PREFIXES = ("lo", "bond", "tun", "tap", "docker", "veth", "vnet")
+
+# -s: speed/duplex can't be read on a down link, which isn't an error here
+NETWORK_STATS_COMMAND = (
+    f"echo '==={SECTION_NET_DEV}==='; cat /proc/net/dev; "
+    f"echo '==={SECTION_NET_SYS}==='; grep -Hs . "
+    + " ".join(f"/sys/class/net/*/{name}" for name in SYS_NET_ATTRIBUTES)
+)
+
+# Samples kept per interface for peak rates (about 30 minutes at 1-minute ticks)
+RATE_WINDOW = 30
+RATE_EMA_ALPHA = 0.3
+MIN_SAMPLE_INTERVAL = 0.1
+
+_COUNTER_MODULUS = 1 << 64
+
+
+@dataclass(frozen=True)
+class InterfaceCounters:
+    """Cumulative counters of one /proc/net/dev line."""
+    rx_bytes: int = 0
+    tx_bytes: int = 0
+    rx_errors: int = 0
+    tx_errors: int = 0
+    rx_dropped: int = 0
+    tx_dropped: int = 0
+
+
+@dataclass(frozen=True)
+class InterfaceRates:
+    """Rates of one interface in bits/s."""
+    rx_rate: float = 0.0
+    tx_rate: float = 0.0
+    rx_ema: float = 0.0
+    tx_ema: float = 0.0
+    rx_peak: float = 0.0
+    tx_peak: float = 0.0
+
+
+def is_monitored_interface(name: str) -> bool:
+    """Check if an interface is reported (physical links and bridges)."""
+    return bool(name) and not name.startswith(EXCLUDED_INTERFACE_PREFIXES)
+
+
+def parse_proc_net_dev(content: str) -> Dict[str, InterfaceCounters]:
+    """Parse /proc/net/dev into {interface: InterfaceCounters}."""
+    counters: Dict[str, InterfaceCounters] = {}
+    for line in content.splitlines():
+        name, sep, values = line.partition(":")
+        if not sep:
+            # Header lines
+            continue
+        fields = values.split()
+        if len(fields) < 12:
+            continue
+        try:
+            counters[name.strip()] = InterfaceCounters(
+                rx_bytes=int(fields[0]),
+                rx_errors=int(fields[2]),
+                rx_dropped=int(fields[3]),
+                tx_bytes=int(fields[8]),
+                tx_errors=int(fields[10]),
+                tx_dropped=int(fields[11]),
+            )
+        except ValueError:
+            _LOGGER.debug("Skipping malformed /proc/net/dev line: %s", line)
+    return counters
+
+
+def parse_sys_net(content: str) -> Dict[str, Dict[str, str]]:
+    """Parse `grep -H . /sys/class/net/*/<attr>` into {interface: {attr: value}}."""
+    attributes: Dict[str, Dict[str, str]] = {}
+    for line in content.splitlines():
+        path, sep, value = line.partition(":")
+        if not sep:
+            continue
+        parts = path.split("/")
+        # ['', 'sys', 'class', 'net', '<iface>', '<attr>']
+        if len(parts) != 6:
+            continue
+        attributes.setdefault(parts[4], {})[parts[5]] = value.strip()
+    return attributes
+
+
+def counter_delta(previous: int, current: int) -> Optional[int]:
+    """Return how much a 64-bit counter advanced, or None if it was reset.
+
+    A counter that wrapped past 2**64 advances by a small amount modulo
+    2**64. One that was reset (interface recreated, driver reloaded) would
+    appear to have advanced by more than half the counter range.
+    """
+    delta = (current - previous) % _COUNTER_MODULUS
+    if delta >= _COUNTER_MODULUS // 2:
+        return None
+    return delta
+
+
+class InterfaceRateBuffer:
+    """Ring buffer of (timestamp, rx, tx) samples with their rates."""
+
+    __slots__ = ("samples", "rx_ema", "tx_ema")
+
+    def __init__(self, size: int = RATE_WINDOW) -> None:
+        """Initialize the buffer."""
+        # (timestamp, rx_bytes, tx_bytes, rx_rate, tx_rate); rates are bits/s
+        # since the previous sample, None for the first one
+        self.samples: Deque[Tuple[float, int, int, Optional[float], Optional[float]]] = deque(
+            maxlen=size
+        )
+        self.rx_ema: Optional[float] = None
+        self.tx_ema: Optional[float] = None
+
+    def add(self, now: float, rx_bytes: int, tx_bytes: int, alpha: float = RATE_EMA_ALPHA) -> None:
+        """Add a sample, updating the smoothed rates."""
+        if not self.samples:
+            self.samples.append((now, rx_bytes, tx_bytes, None, None))
+            return
+
+        last_time, last_rx, last_tx = self.samples[-1][:3]
+        elapsed = now - last_time
+        if elapsed < MIN_SAMPLE_INTERVAL:
+            return
+
+        rx_delta = counter_delta(last_rx, rx_bytes)
+        tx_delta = counter_delta(last_tx, tx_bytes)
+        if rx_delta is None or tx_delta is None:
+            _LOGGER.debug("Interface counters were reset, restarting rate window")
+            self.samples.clear()
+            self.samples.append((now, rx_bytes, tx_bytes, None, None))
+            return
+
+        rx_rate = rx_delta * 8 / elapsed
+        tx_rate = tx_delta * 8 / elapsed
+        self.samples.append((now, rx_bytes, tx_bytes, rx_rate, tx_rate))
+
+        self.rx_ema = rx_rate if self.rx_ema is None else alpha * rx_rate + (1 - alpha) * self.rx_ema
+        self.tx_ema = tx_rate if self.tx_ema is None else alpha * tx_rate + (1 - alpha) * self.tx_ema
+
+    def rates(self) -> InterfaceRates:
+        """Return the latest, smoothed and peak rates over the window."""
+        rx_peak = tx_peak = 0.0
+        for sample in self.samples:
+            if sample[3] is not None:
+                rx_peak = max(rx_peak, sample[3])
+                tx_peak = max(tx_peak, sample[4])
+
+        last = self.samples[-1] if self.samples else None
+        return InterfaceRates(
+            rx_rate=(last[3] or 0.0) if last else 0.0,
+            tx_rate=(last[4] or 0.0) if last else 0.0,
+            rx_ema=self.rx_ema or 0.0,
+            tx_ema=self.tx_ema or 0.0,
+            rx_peak=rx_peak,
+            tx_peak=tx_peak,
+        )
+
+
+class NetworkStatsTracker:
+    """Keeps a rate buffer per interface across samples.
+
+    Interfaces missing from a sample are dropped, so a recreated interface
+    starts with a fresh window.
+    """
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        """Initialize the tracker."""
+        self._window = window
+        self._buffers: Dict[str, InterfaceRateBuffer] = {}
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._buffers = {}
+
+    def update(
+        self,
+        counters: Dict[str, InterfaceCounters],
+        now: Optional[float] = None
+    ) -> Dict[str, InterfaceRates]:
+        """Record a sample of all interfaces and return their rates."""
+        if now is None:
+            now = time.monotonic()
+
+        buffers: Dict[str, InterfaceRateBuffer] = {}
+        rates: Dict[str, InterfaceRates] = {}
+        for name, sample in counters.items():
+            buffer = self._buffers.get(name) or InterfaceRateBuffer(self._window)
+            buffer.add(now, sample.rx_bytes, sample.tx_bytes)
+            buffers[name] = buffer
+            rates[name] = buffer.rates()
+
+        self._buffers = buffers
+        return rates
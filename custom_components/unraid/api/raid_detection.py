@@ -72,9 +72,17 @@ class RAIDControllerDetector:
         """Initialize RAID controller detector."""
         self.execute_command = execute_command_func
         self._detected_controllers: List[RAIDControllerInfo] = []
+        self._detection_done = False
+
+    async def detect_raid_controllers(self, force_refresh: bool = False) -> List[RAIDControllerInfo]:
+        """Detect all RAID controllers in the system.
+
+        Controllers don't change while the server is running, so the scan runs
+        once and later calls return its result unless force_refresh is set.
+        """
+        if self._detection_done and not force_refresh:
+            return list(self._detected_controllers)
 
-    async def detect_raid_controllers(self) -> List[RAIDControllerInfo]:
-        """Detect all RAID controllers in the system."""
         _LOGGER.debug("Starting RAID controller detection")
         controllers = []
 
@@ -101,6 +109,7 @@ class RAIDControllerDetector:
             controllers.extend(hba_controllers)
 
             self._detected_controllers = controllers
+            self._detection_done = True
             return controllers
 
         except Exception as err:
@@ -0,0 +1,109 @@
+"""Persistent remote shell transport for Unraid."""
+from __future__ import annotations
+
+import logging
+import asyncio
+import secrets
+from typing import Optional, Tuple
+
+import asyncssh  # type: ignore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shell started once per SSH connection; profiles are skipped to keep startup quiet
+REMOTE_SHELL_COMMAND = "exec bash --noprofile --norc"
+
+
+class RemoteShellError(Exception):
+    """Raised when the persistent shell cannot be used."""
+    pass
+
+
+class RemoteShell:
+    """A long-lived bash process executing framed commands over one channel.
+
+    Each request is written to the shell's stdin as a quoted heredoc and run
+    in a subshell, so commands cannot change the state of the shell or end it.
+    Completion is signalled by a per-request token followed by the exit code on
+    stdout and the same token on stderr. Requests on one shell are serialized.
+    """
+
+    def __init__(self, conn: asyncssh.SSHClientConnection) -> None:
+        """Initialize the shell for an open SSH connection."""
+        self._conn = conn
+        self._process: Optional[asyncssh.SSHClientProcess] = None
+        self._lock = asyncio.Lock()
+        self.command_count = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the shell process is running."""
+        return (
+            self._process is not None
+            and self._process.exit_status is None
+            and not self._process.stdin.is_closing()
+        )
+
+    async def start(self) -> None:
+        """Start the remote shell process."""
+        try:
+            self._process = await self._conn.create_process(REMOTE_SHELL_COMMAND)
+        except (asyncssh.Error, OSError) as err:
+            self._process = None
+            raise RemoteShellError(f"Unable to start remote shell: {err}") from err
+        _LOGGER.debug("Started persistent remote shell (shell_id=%s)", id(self))
+
+    def close(self) -> None:
+        """Close the remote shell process."""
+        if self._process is not None:
+            try:
+                self._process.close()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error closing remote shell: %s", err)
+            self._process = None
+
+    async def run(self, command: str) -> Tuple[int, str, str]:
+        """Run a command in the shell and return (exit_status, stdout, stderr).
+
+        If the exchange is interrupted (timeout, cancellation, lost channel) the
+        shell is closed, as its output stream can no longer be trusted.
+        """
+        async with self._lock:
+            if not self.is_open:
+                await self.start()
+
+            token = f"__UNRAID_SHELL_{secrets.token_hex(8)}__"
+            frame = (
+                f"IFS= read -r -d '' __cmd <<'{token}_CMD'\n"
+                f"{command}\n"
+                f"{token}_CMD\n"
+                f"( eval \"$__cmd\" ) </dev/null; __rc=$?\n"
+                f"printf '\\n%s:%d\\n' '{token}' \"$__rc\"\n"
+                f"printf '\\n%s\\n' '{token}' >&2\n"
+            )
+
+            try:
+                self._process.stdin.write(frame)
+                stdout, stderr = await asyncio.gather(
+                    self._process.stdout.readuntil(f"\n{token}:"),
+                    self._process.stderr.readuntil(f"\n{token}\n"),
+                )
+                status_line = await self._process.stdout.readline()
+            except BaseException:
+                self.close()
+                raise
+
+            try:
+                exit_status = int(status_line.strip())
+            except ValueError as err:
+                self.close()
+                raise RemoteShellError(
+                    f"Malformed exit status from remote shell: {status_line!r}"
+                ) from err
+
+            self.command_count += 1
+            return (
+                exit_status,
+                stdout[:-len(f"\n{token}:")],
+                stderr[:-len(f"\n{token}\n")],
+            )
@@ -6,15 +6,20 @@ import logging
 import asyncio
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from enum import IntEnum
 
 from .disk_mapper import DiskMapper
 from .error_handling import with_error_handling, safe_parse
+from .snapshot_operations import split_sections
 from .usb_detection import USBFlashDriveDetector
 
 _LOGGER = logging.getLogger(__name__)
 
+# Section name and status line prefix used by the bulk SMART command
+BULK_SMART_SECTION = "SMART"
+BULK_SMART_STATUS = "SMART_EXIT="
+
 class SmartctlExitCode(IntEnum):
     """Smartctl exit codes."""
     SUCCESS = 0
@@ -25,6 +30,10 @@ class SmartctlExitCode(IntEnum):
     SMART_READ_ERROR = 5
     SMART_PREFAIL_ERROR = 6
 
+# smartctl's exit status is a bitmask; only bits 0-1 (bad command line,
+# device open failed) mean no SMART data was read
+SMARTCTL_FATAL_BITS = 0x03
+
 class SmartDataManager:
     """Manager for SMART data operations."""
 
@@ -34,7 +43,7 @@ class SmartDataManager:
         self._cache_timeout = timedelta(minutes=5)  # Default fallback
         self._last_update: Dict[str, datetime] = {}
         self._lock = asyncio.Lock()
-        self._disk_mapper = DiskMapper(instance.execute_command)
+        self._disk_mapper: DiskMapper = instance.disk_mapper
         self._usb_detector = USBFlashDriveDetector(instance)
 
         # Granular cache timeouts for real-time monitoring
@@ -45,6 +54,11 @@ class SmartDataManager:
             "static_info": timedelta(hours=1),      # 1 hour for model, serial, etc.
         }
 
+    @property
+    def usb_detector(self) -> USBFlashDriveDetector:
+        """Return the USB device detector."""
+        return self._usb_detector
+
     def _convert_nvme_temperature(self, temp_value: Any) -> Optional[int]:
         """Convert NVMe temperature to Celsius with enhanced format detection."""
         if not temp_value:
@@ -114,8 +128,7 @@ class SmartDataManager:
             return None
 
     async def _map_logical_to_physical_device(self, device_path: str) -> str:
-        """Map logical md devices to physical devices using DiskMapper."""
-        # Use the DiskMapper to handle the mapping
+        """Map logical md devices to physical devices using the shared DiskMapper."""
         return await self._disk_mapper.map_logical_to_physical_device(device_path)
 
     @with_error_handling(fallback_return={
@@ -271,7 +284,9 @@ class SmartDataManager:
                 if not is_nvme:
                     # Standby check for SATA
                     _LOGGER.debug("Checking standby state for SATA device %s", device_path)
-                    result = await self._instance.execute_command(f"smartctl -n standby -j {device_path}")
+                    result = await self._instance.execute_command(
+                        f"smartctl -n standby -j {device_path}", coalesce=True
+                    )
 
                     _LOGGER.debug("SATA standby check for %s: exit_code=%d, stdout=%s",
                                 device_path, result.exit_status, result.stdout)
@@ -297,14 +312,14 @@ class SmartDataManager:
                     if match := re.search(r'nvme(\d+)', device_path):
                         nvme_index = match.group(1)
 
-                    # Try NVMe smart-log command first
-                    smart_cmd = f"nvme smart-log -o json /dev/nvme{nvme_index}n1"
-                    result = await self._instance.execute_command(smart_cmd)
-
-                    if result.exit_status != 0:
-                        # Fallback to smartctl if nvme command fails
+                    # Prefer nvme-cli when installed, smartctl otherwise
+                    if await self._instance.capabilities.has_tool("nvme"):
+                        smart_cmd = (
+                            f"nvme smart-log -o json /dev/nvme{nvme_index}n1 2>/dev/null || "
+                            f"smartctl -d nvme -a -j /dev/nvme{nvme_index}n1"
+                        )
+                    else:
                         smart_cmd = f"smartctl -d nvme -a -j /dev/nvme{nvme_index}n1"
-                        result = await self._instance.execute_command(smart_cmd)
                 else:
                     # Use -a instead of -A for SATA devices to get full attributes including temperature
                     smart_cmd = f"smartctl -a -j {device_path}"
@@ -322,136 +337,7 @@ class SmartDataManager:
                         )
                         _LOGGER.debug("Successfully parsed SMART data for %s", device)
 
-                        # Get SMART status and convert boolean to string
-                        smart_passed = smart_data.get("smart_status", {}).get("passed", True)
-                        smart_status = "passed" if smart_passed else "failed"
-
-                        processed_data = {
-                            "smart_status": smart_status,
-                            "temperature": None,
-                            "power_on_hours": None,
-                            "attributes": {},
-                            "device_type": "nvme" if is_nvme else "sata",
-                            "state": "active"
-                        }
-
-                        # Get temperature based on device type
-                        if is_nvme:
-                            # Enhanced NVMe temperature handling with multiple detection methods
-                            temp = None
-                            if isinstance(smart_data, dict):
-                                # Method 1: NVMe smart health information log
-                                nvme_data = smart_data.get("nvme_smart_health_information_log", {})
-                                if isinstance(nvme_data, dict):
-                                    temp = self._convert_nvme_temperature(nvme_data.get("temperature"))
-                                    if temp is not None:
-                                        _LOGGER.debug("NVMe temp from health log: %d°C", temp)
-
-                                # Method 2: Direct temperature field
-                                if temp is None and "temperature" in smart_data:
-                                    temp_data = smart_data["temperature"]
-                                    if isinstance(temp_data, dict):
-                                        # Try multiple sub-fields
-                                        for field in ["current", "value", "celsius"]:
-                                            if field in temp_data:
-                                                temp = self._convert_nvme_temperature(temp_data[field])
-                                                if temp is not None:
-                                                    _LOGGER.debug("NVMe temp from temperature.%s: %d°C", field, temp)
-                                                    break
-                                    elif isinstance(temp_data, (int, float)):
-                                        temp = self._convert_nvme_temperature(temp_data)
-                                        if temp is not None:
-                                            _LOGGER.debug("NVMe temp from direct temperature: %d°C", temp)
-
-                                # Method 3: Check for other common NVMe temperature fields
-                                if temp is None:
-                                    temp_fields = [
-                                        "composite_temperature",
-                                        "controller_temperature",
-                                        "current_temperature",
-                                        "temp",
-                                        "thermal_state"
-                                    ]
-                                    for field in temp_fields:
-                                        if field in smart_data:
-                                            temp = self._convert_nvme_temperature(smart_data[field])
-                                            if temp is not None:
-                                                _LOGGER.debug("NVMe temp from %s: %d°C", field, temp)
-                                                break
-
-                            if temp is not None:
-                                processed_data["temperature"] = int(temp)
-                                _LOGGER.debug(
-                                    "NVMe temperature for %s: %d°C",
-                                    device,
-                                    processed_data["temperature"]
-                                )
-                            else:
-                                _LOGGER.debug("No temperature data found for NVMe device %s", device)
-                        else:
-                            # Enhanced SATA SSD temperature detection
-                            temp = None
-
-                            # Try direct temperature field first
-                            if temp_data := smart_data.get("temperature"):
-                                if isinstance(temp_data, dict):
-                                    temp = temp_data.get("current")
-                                elif isinstance(temp_data, (int, float)):
-                                    temp = temp_data
-
-                                if temp is not None:
-                                    processed_data["temperature"] = int(temp)
-                                    _LOGGER.debug(
-                                        "SATA temperature for %s: %d°C (direct)",
-                                        device,
-                                        temp
-                                    )
-
-                            # If no direct temperature, search SMART attributes with enhanced patterns
-                            if temp is None:
-                                # Common temperature attribute names for SSDs and HDDs
-                                temp_attr_names = [
-                                    "Temperature_Celsius",
-                                    "Airflow_Temperature_Cel",
-                                    "Temperature_Case",
-                                    "Temperature_Internal",
-                                    "Drive_Temperature",
-                                    "Current_Temperature",
-                                    "Temperature"
-                                ]
-
-                                for attr in smart_data.get("ata_smart_attributes", {}).get("table", []):
-                                    attr_name = attr.get("name", "")
-
-                                    # Check if this is a temperature attribute
-                                    if attr_name in temp_attr_names:
-                                        # Try different value extraction methods
-                                        raw_data = attr.get("raw", {})
-
-                                        # Method 1: Direct value
-                                        if temp_val := raw_data.get("value"):
-                                            temp = temp_val
-                                        # Method 2: String parsing for complex raw values
-                                        elif raw_str := raw_data.get("string"):
-                                            # Parse strings like "45 (Min/Max 20/55)" or "45 C"
-                                            match = re.search(r'(\d+)', str(raw_str))
-                                            if match:
-                                                temp = int(match.group(1))
-                                        # Method 3: Normalized value as fallback
-                                        elif norm_val := attr.get("value"):
-                                            # Some SSDs report temperature in normalized value
-                                            if 0 <= norm_val <= 150:  # Reasonable temperature range
-                                                temp = norm_val
-
-                                        if temp is not None:
-                                            processed_data["temperature"] = int(temp)
-                                            _LOGGER.debug(
-                                                "SATA temperature for %s: %d°C (attribute: %s)",
-                                                device,
-                                                temp,
-                                                attr_name
-                                            )
-                                            break
+                        processed_data = self._process_smart_json(smart_data, device, is_nvme)
 
                         # Update cache
                         self._cache[device] = processed_data
@@ -473,36 +359,7 @@ class SmartDataManager:
                         self._last_update[device] = now
                         return error_data
 
-                # Provide more user-friendly error messages based on exit code
-                if result.exit_status == SmartctlExitCode.DEVICE_OPEN_ERROR:
-                    _LOGGER.debug(
-                        "SMART data unavailable for %s (device not accessible, may be in standby or partition)",
-                        device
-                    )
-                elif result.exit_status == SmartctlExitCode.SMART_TEST_ERROR:
-                    # Exit code 4 is common for NVME partitions that don't exist as base devices
-                    if 'nvme' in device.lower() and 'p' in device:
-                        _LOGGER.debug(
-                            "SMART data unavailable for NVME partition %s (base device may not exist)",
-                            device
-                        )
-                    else:
-                        _LOGGER.info(
-                            "SMART self-test in progress for %s, data temporarily unavailable",
-                            device
-                        )
-                elif result.exit_status == SmartctlExitCode.SMART_OR_ATA_ERROR:
-                    _LOGGER.warning(
-                        "SMART reports potential issues for %s (exit_code=%d) - check disk health",
-                        device,
-                        result.exit_status
-                    )
-                else:
-                    _LOGGER.warning(
-                        "SMART command failed for %s: exit_code=%d",
-                        device,
-                        result.exit_status
-                    )
+                self._log_smart_failure(device, result.exit_status)
                 error_data = {
                     "state": "error",
                     "error": f"Command failed: {result.exit_status}",
@@ -528,6 +385,304 @@ class SmartDataManager:
                 self._last_update[device] = now
                 return error_data
 
+    def _build_bulk_smart_command(self, device_paths: List[str]) -> str:
+        """Build one command probing standby state and dumping SMART JSON per device.
+
+        SATA devices are only read with `smartctl -a` when the standby probe
+        reports them spinning, so sleeping disks are never woken up.
+        """
+        # Skip the nvme-cli attempt when it is known to be missing
+        capabilities = self._instance.capabilities.current
+        use_nvme_cli = capabilities is None or capabilities.has_tool("nvme")
+
+        parts = []
+        for device_path in device_paths:
+            parts.append(f"echo '==={BULK_SMART_SECTION} {device_path}==='; ")
+            if "nvme" in device_path.lower():
+                nvme_cli = f"nvme smart-log -o json {device_path} 2>/dev/null || " if use_nvme_cli else ""
+                parts.append(
+                    f"{nvme_cli}"
+                    f"smartctl -d nvme -a -j {device_path} 2>/dev/null; "
+                    f"echo \"{BULK_SMART_STATUS}$?\"; "
+                )
+            else:
+                parts.append(
+                    f"smartctl -n standby -j {device_path} >/dev/null 2>&1; "
+                    f"if [ $? -eq 2 ]; then echo '{BULK_SMART_STATUS}standby'; "
+                    f"else smartctl -a -j {device_path} 2>/dev/null; "
+                    f"echo \"{BULK_SMART_STATUS}$?\"; fi; "
+                )
+        parts.append("true")
+        return "".join(parts)
+
+    def _parse_bulk_smart_section(
+        self,
+        device_path: str,
+        content: str
+    ) -> Dict[str, Any]:
+        """Parse one device's section of the bulk SMART output."""
+        is_nvme = "nvme" in device_path.lower()
+        lines = content.rstrip().splitlines()
+        status = ""
+        if lines and lines[-1].startswith(BULK_SMART_STATUS):
+            status = lines.pop()[len(BULK_SMART_STATUS):].strip()
+
+        if status == "standby":
+            _LOGGER.debug("Device %s confirmed in standby", device_path)
+            return {
+                "state": "standby",
+                "smart_status": "passed",  # Assume passed for standby disks
+                "temperature": None,
+                "device_type": "sata"
+            }
+
+        exit_status = safe_parse(int, status, default=-1)
+        if exit_status >= 0 and not exit_status & SMARTCTL_FATAL_BITS:
+            if exit_status:
+                _LOGGER.debug(
+                    "smartctl reported status bits %#x for %s", exit_status, device_path
+                )
+            smart_data = safe_parse(
+                json.loads,
+                "\n".join(lines),
+                default={},
+                error_msg=f"Failed to parse SMART JSON for {device_path}"
+            )
+            return self._process_smart_json(smart_data, device_path, is_nvme)
+
+        self._log_smart_failure(device_path, exit_status)
+        return {
+            "state": "error",
+            "error": f"Command failed: {exit_status}",
+            "temperature": None
+        }
+
+    @with_error_handling(fallback_return={})
+    async def get_bulk_smart_data(
+        self,
+        device_paths: List[str],
+        force_refresh: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get SMART data for several physical devices with a single command.
+
+        Expects resolved /dev paths of non-USB devices. Results are keyed by the
+        requested path and share the per-device cache used by get_smart_data.
+        """
+        now = datetime.now(timezone.utc)
+        results: Dict[str, Dict[str, Any]] = {}
+        to_query: Dict[str, str] = {}
+
+        for device_path in device_paths:
+            if not force_refresh and device_path in self._cache:
+                last_update = self._last_update.get(device_path)
+                if last_update and (now - last_update) < self._cache_timeout:
+                    results[device_path] = self._cache[device_path]
+                    continue
+            # SMART is read from the base NVMe namespace, not a partition
+            to_query[device_path] = re.sub(r'(nvme\d+n\d+)p\d+', r'\1', device_path)
+
+        if not to_query:
+            return results
+
+        query_paths = sorted(set(to_query.values()))
+        _LOGGER.debug("Collecting SMART data for %d devices in one command", len(query_paths))
+        result = await self._instance.execute_command(
+            self._build_bulk_smart_command(query_paths)
+        )
+        sections = split_sections(result.stdout or "")
+
+        parsed: Dict[str, Dict[str, Any]] = {}
+        for query_path in query_paths:
+            content = sections.get(f"{BULK_SMART_SECTION} {query_path}")
+            if content is None:
+                parsed[query_path] = {
+                    "state": "error",
+                    "error": "No SMART output",
+                    "temperature": None
+                }
+                continue
+            parsed[query_path] = self._parse_bulk_smart_section(query_path, content)
+
+        for device_path, query_path in to_query.items():
+            data = parsed[query_path]
+            self._cache[device_path] = data
+            self._last_update[device_path] = now
+            results[device_path] = data
+
+        return results
+
+    def _process_smart_json(
+        self,
+        smart_data: Dict[str, Any],
+        device: str,
+        is_nvme: bool
+    ) -> Dict[str, Any]:
+        """Extract status, temperature and device type from smartctl/nvme JSON."""
+        # Get SMART status and convert boolean to string
+        smart_passed = smart_data.get("smart_status", {}).get("passed", True)
+        smart_status = "passed" if smart_passed else "failed"
+
+        processed_data = {
+            "smart_status": smart_status,
+            "temperature": None,
+            "power_on_hours": None,
+            "attributes": {},
+            "device_type": "nvme" if is_nvme else "sata",
+            "state": "active"
+        }
+
+        # Get temperature based on device type
+        if is_nvme:
+            # Enhanced NVMe temperature handling with multiple detection methods
+            temp = None
+            if isinstance(smart_data, dict):
+                # Method 1: NVMe smart health information log
+                nvme_data = smart_data.get("nvme_smart_health_information_log", {})
+                if isinstance(nvme_data, dict):
+                    temp = self._convert_nvme_temperature(nvme_data.get("temperature"))
+                    if temp is not None:
+                        _LOGGER.debug("NVMe temp from health log: %d°C", temp)
+
+                # Method 2: Direct temperature field
+                if temp is None and "temperature" in smart_data:
+                    temp_data = smart_data["temperature"]
+                    if isinstance(temp_data, dict):
+                        # Try multiple sub-fields
+                        for field in ["current", "value", "celsius"]:
+                            if field in temp_data:
+                                temp = self._convert_nvme_temperature(temp_data[field])
+                                if temp is not None:
+                                    _LOGGER.debug("NVMe temp from temperature.%s: %d°C", field, temp)
+                                    break
+                    elif isinstance(temp_data, (int, float)):
+                        temp = self._convert_nvme_temperature(temp_data)
+                        if temp is not None:
+                            _LOGGER.debug("NVMe temp from direct temperature: %d°C", temp)
+
+                # Method 3: Check for other common NVMe temperature fields
+                if temp is None:
+                    temp_fields = [
+                        "composite_temperature",
+                        "controller_temperature",
+                        "current_temperature",
+                        "temp",
+                        "thermal_state"
+                    ]
+                    for field in temp_fields:
+                        if field in smart_data:
+                            temp = self._convert_nvme_temperature(smart_data[field])
+                            if temp is not None:
+                                _LOGGER.debug("NVMe temp from %s: %d°C", field, temp)
+                                break
+
+            if temp is not None:
+                processed_data["temperature"] = int(temp)
+                _LOGGER.debug(
+                    "NVMe temperature for %s: %d°C",
+                    device,
+                    processed_data["temperature"]
+                )
+            else:
+                _LOGGER.debug("No temperature data found for NVMe device %s", device)
+        else:
+            # Enhanced SATA SSD temperature detection
+            temp = None
+
+            # Try direct temperature field first
+            if temp_data := smart_data.get("temperature"):
+                if isinstance(temp_data, dict):
+                    temp = temp_data.get("current")
+                elif isinstance(temp_data, (int, float)):
+                    temp = temp_data
+
+                if temp is not None:
+                    processed_data["temperature"] = int(temp)
+                    _LOGGER.debug(
+                        "SATA temperature for %s: %d°C (direct)",
+                        device,
+                        temp
+                    )
+
+            # If no direct temperature, search SMART attributes with enhanced patterns
+            if temp is None:
+                # Common temperature attribute names for SSDs and HDDs
+                temp_attr_names = [
+                    "Temperature_Celsius",
+                    "Airflow_Temperature_Cel",
+                    "Temperature_Case",
+                    "Temperature_Internal",
+                    "Drive_Temperature",
+                    "Current_Temperature",
+                    "Temperature"
+                ]
+
+                for attr in smart_data.get("ata_smart_attributes", {}).get("table", []):
+                    attr_name = attr.get("name", "")
+
+                    # Check if this is a temperature attribute
+                    if attr_name in temp_attr_names:
+                        # Try different value extraction methods
+                        raw_data = attr.get("raw", {})
+
+                        # Method 1: Direct value
+                        if temp_val := raw_data.get("value"):
+                            temp = temp_val
+                        # Method 2: String parsing for complex raw values
+                        elif raw_str := raw_data.get("string"):
+                            # Parse strings like "45 (Min/Max 20/55)" or "45 C"
+                            match = re.search(r'(\d+)', str(raw_str))
+                            if match:
+                                temp = int(match.group(1))
+                        # Method 3: Normalized value as fallback
+                        elif norm_val := attr.get("value"):
+                            # Some SSDs report temperature in normalized value
+                            if 0 <= norm_val <= 150:  # Reasonable temperature range
+                                temp = norm_val
+
+                        if temp is not None:
+                            processed_data["temperature"] = int(temp)
+                            _LOGGER.debug(
+                                "SATA temperature for %s: %d°C (attribute: %s)",
+                                device,
+                                temp,
+                                attr_name
+                            )
+                            break
+
+        return processed_data
+
+    def _log_smart_failure(self, device: str, exit_status: int) -> None:
+        """Log a failed SMART command with a message based on its exit code."""
+        if exit_status == SmartctlExitCode.DEVICE_OPEN_ERROR:
+            _LOGGER.debug(
+                "SMART data unavailable for %s (device not accessible, may be in standby or partition)",
+                device
+            )
+        elif exit_status == SmartctlExitCode.SMART_TEST_ERROR:
+            # Exit code 4 is common for NVME partitions that don't exist as base devices
+            if 'nvme' in device.lower() and 'p' in device:
+                _LOGGER.debug(
+                    "SMART data unavailable for NVME partition %s (base device may not exist)",
+                    device
+                )
+            else:
+                _LOGGER.info(
+                    "SMART self-test in progress for %s, data temporarily unavailable",
+                    device
+                )
+        elif exit_status == SmartctlExitCode.SMART_OR_ATA_ERROR:
+            _LOGGER.warning(
+                "SMART reports potential issues for %s (exit_code=%d) - check disk health",
+                device,
+                exit_status
+            )
+        else:
+            _LOGGER.warning(
+                "SMART command failed for %s: exit_code=%d",
+                device,
+                exit_status
+            )
+
     async def get_usb_detection_stats(self) -> Dict[str, Any]:
         """Get USB detection statistics for debugging and monitoring."""
         try:
@@ -573,24 +728,15 @@ class SmartDataManager:
     async def _resolve_zfs_pool_device(self, pool_name: str) -> Optional[str]:
         """Resolve ZFS pool name to underlying physical device path."""
         try:
-            # Check if this is a ZFS pool
-            zpool_cmd = f"zpool list -H -o name {pool_name} 2>/dev/null"
-            result = await self._instance.execute_command(zpool_cmd)
-
-            if result.exit_status != 0 or not result.stdout.strip():
+            zfs_state = await self._instance.get_zfs_state()
+            if zfs_state is None or not zfs_state.has_pool(pool_name):
                 # Not a ZFS pool
                 return None
 
-            # Get the underlying devices for this ZFS pool
-            devices_cmd = f"zpool list -v -H {pool_name} | grep -E '^\\s+\\w+' | awk '{{print $1}}' | head -1"
-            devices_result = await self._instance.execute_command(devices_cmd)
-
-            if devices_result.exit_status == 0 and devices_result.stdout.strip():
-                device = devices_result.stdout.strip()
-                # Ensure device path starts with /dev/
-                if not device.startswith('/dev/'):
-                    device = f"/dev/{device}"
-
+            # First device of the pool's data vdevs
+            devices = zfs_state.pool_devices(pool_name)
+            if devices:
+                device = devices[0]
                 _LOGGER.debug("ZFS pool '%s' resolved to device '%s'", pool_name, device)
                 return device
 
@@ -0,0 +1,224 @@
+"""Single round-trip snapshot collection for Unraid."""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from .error_handling import with_error_handling
+
+_LOGGER = logging.getLogger(__name__)
+
+# Remote files read as part of the snapshot
+PARITY_HISTORY_FILE = "/boot/config/parity-checks.log"
+PARITY_CRON_FILE = "/boot/config/plugins/dynamix/parity-check.cron"
+
+# Section names emitted by the snapshot script (in addition to the system stats sections)
+SECTION_HOSTNAME = "HOSTNAME"
+SECTION_PARITY_HISTORY = "PARITY_HISTORY"
+SECTION_PARITY_LOG_STAT = "PARITY_LOG_STAT"
+SECTION_PARITY_CRON = "PARITY_CRON"
+SECTION_VMS = "VMS"
+SECTION_VM_STATS = "VM_STATS"
+SECTION_DOCKER = "DOCKER"
+SECTION_USER_SCRIPTS = "USER_SCRIPTS"
+SECTION_UPS = "UPS"
+SECTION_DISKSTATS = "DISKSTATS"
+
+# '===NAME===' or '===NAME detail===' closing a line. Output that doesn't end
+# in a newline (a raw file read, a truncated log) puts the next marker on its
+# last line, so markers are matched at the end of a line rather than alone.
+_SECTION_MARKER = re.compile(r"===([A-Z0-9_]+(?: [^=]+)?)===$")
+
+
+def split_sections(output: str) -> Dict[str, str]:
+    """Split the output of a batched command into its '===NAME===' sections."""
+    sections: Dict[str, str] = {}
+    current_section = None
+    section_content: List[str] = []
+
+    for line in output.splitlines():
+        marker = _SECTION_MARKER.search(line)
+        if marker:
+            # Text before the marker is the unterminated end of the previous section
+            if current_section and marker.start():
+                section_content.append(line[:marker.start()])
+            # Save previous section if it exists
+            if current_section:
+                sections[current_section] = '\n'.join(section_content)
+            # Start new section
+            current_section = marker.group(1).strip()
+            section_content = []
+        elif current_section:
+            section_content.append(line)
+
+    # Save the last section
+    if current_section:
+        sections[current_section] = '\n'.join(section_content)
+
+    return sections
+
+
+def _section(name: str, command: str) -> str:
+    """Wrap a command so its output is emitted under a section marker."""
+    return f"echo '==={name}==='; {{ {command}; }} 2>/dev/null; "
+
+
+def parity_history_command(position: Optional[Tuple[int, int]] = None) -> str:
+    """Build the command reading the parity log past a known (inode, size) position.
+
+    The log's inode and size come first. After that, only the bytes appended
+    since the position are sent. The whole log is sent when it was replaced or
+    truncated, and nothing at all when it didn't change.
+    """
+    log = PARITY_HISTORY_FILE
+    size = "${__parity_stat#* }"
+    if position is None:
+        read = f"head -c {size} {log}"
+    else:
+        inode, offset = position
+        read = (
+            f'if [ "${{__parity_stat% *}}" = "{inode}" ] && [ "{size}" -ge {offset} ]; then '
+            f"tail -c +{offset + 1} {log} | head -c $(( {size} - {offset} )); "
+            f"else head -c {size} {log}; fi"
+        )
+    return (
+        f"__parity_stat=$(stat -c '%i %s' {log} 2>/dev/null); "
+        + _section(SECTION_PARITY_LOG_STAT, 'echo "$__parity_stat"')
+        + _section(SECTION_PARITY_HISTORY, read)
+    )
+
+
+class SnapshotOperationsMixin:
+    """Mixin collecting everything a coordinator tick needs in one SSH command."""
+
+    def _build_snapshot_command(
+        self,
+        include_vms: bool = True,
+        include_vm_stats: bool = True,
+        include_docker: bool = True,
+        include_user_scripts: bool = True,
+        include_ups: bool = False,
+        include_network: bool = True,
+        include_parity_schedule: bool = True,
+        include_disk_io: bool = True,
+        include_zfs: bool = True,
+        parity_history_position: Optional[Tuple[int, int]] = None,
+    ) -> str:
+        """Build the remote script producing the sectioned snapshot payload."""
+        parts = [
+            _section(SECTION_HOSTNAME, "hostname -f || uname -n || echo 'unknown'"),
+            self._build_system_stats_command(),
+            "; ",
+            parity_history_command(parity_history_position),
+        ]
+
+        if include_parity_schedule:
+            parts.append(_section(SECTION_PARITY_CRON, f"cat {PARITY_CRON_FILE}"))
+        if include_vms:
+            parts.append(_section(SECTION_VMS, self._build_vm_list_command()))
+        if include_vm_stats:
+            parts.append(_section(SECTION_VM_STATS, self._build_vm_stats_command()))
+        if include_docker:
+            parts.append(_section(SECTION_DOCKER, self._build_docker_list_command()))
+        if include_user_scripts:
+            parts.append(_section(SECTION_USER_SCRIPTS, self._build_user_scripts_command()))
+        if include_ups:
+            parts.append(_section(SECTION_UPS, self._build_ups_info_command()))
+        if include_disk_io:
+            parts.append(_section(SECTION_DISKSTATS, self._build_diskstats_command()))
+        if include_zfs:
+            # The ZFS command emits its own ZPOOL_*/ZFS_ARC sections
+            parts.append(f"{self._build_zfs_state_command()}; ")
+        if include_network:
+            # The network command emits its own NET_DEV/NET_SYS sections
+            parts.append(f"{self._build_network_stats_command()}; ")
+
+        # Always finish successfully so partial output is still parsed
+        parts.append("true")
+        return "".join(parts)
+
+    @with_error_handling(fallback_return={})
+    async def collect_snapshot(
+        self,
+        include_vms: bool = True,
+        include_vm_stats: bool = True,
+        include_docker: bool = True,
+        include_user_scripts: bool = True,
+        include_ups: bool = False,
+        include_network: bool = True,
+        include_parity_schedule: bool = True,
+        include_disk_io: bool = True,
+        include_zfs: bool = True,
+        parity_history_position: Optional[Tuple[int, int]] = None,
+    ) -> Dict[str, Any]:
+        """Collect a full coordinator snapshot using a single SSH command.
+
+        Only the requested optional sections are included in the remote script.
+        Keys for sections that were not requested are omitted from the result so
+        callers can fall back to cached values. Raw file contents (parity history
+        and schedule) are returned unparsed for the coordinator to interpret; the
+        parity history holds only what was appended after parity_history_position,
+        which is returned with it.
+        """
+        cmd = self._build_snapshot_command(
+            include_vms=include_vms,
+            include_vm_stats=include_vm_stats,
+            include_docker=include_docker,
+            include_user_scripts=include_user_scripts,
+            include_ups=include_ups,
+            include_network=include_network,
+            include_parity_schedule=include_parity_schedule,
+            include_disk_io=include_disk_io,
+            include_zfs=include_zfs,
+            parity_history_position=parity_history_position,
+        )
+
+        _LOGGER.debug("Collecting coordinator snapshot with a single batched command")
+        result = await self.execute_command(cmd)
+        sections = split_sections(result.stdout or "")
+        if not sections:
+            _LOGGER.warning(
+                "Snapshot command returned no sections (exit status %s)",
+                result.exit_status,
+            )
+            return {}
+
+        snapshot: Dict[str, Any] = {}
+
+        hostname = sections.get(SECTION_HOSTNAME, "").strip()
+        if hostname and hostname != 'unknown':
+            snapshot["hostname"] = self._sanitize_hostname(hostname.splitlines()[0])
+
+        snapshot["system_stats"] = self._parse_system_stats_sections(sections)
+
+        # The system stats script already includes the raw mdcmd status output
+        if "ARRAY_STATE" in sections:
+            snapshot["mdcmd_status"] = sections["ARRAY_STATE"]
+        snapshot["parity_history"] = (
+            parity_history_position,
+            sections.get(SECTION_PARITY_LOG_STAT, ""),
+            sections.get(SECTION_PARITY_HISTORY, ""),
+        )
+
+        if SECTION_PARITY_CRON in sections:
+            snapshot["parity_cron"] = sections[SECTION_PARITY_CRON]
+        if SECTION_VMS in sections:
+            snapshot["vms"] = self._parse_vm_list_output(sections[SECTION_VMS])
+        if SECTION_VM_STATS in sections:
+            snapshot["vm_stats"] = self._parse_vm_stats_output(sections[SECTION_VM_STATS])
+        if SECTION_DOCKER in sections:
+            snapshot["docker_containers"] = self._parse_docker_list_output(sections[SECTION_DOCKER])
+        if SECTION_USER_SCRIPTS in sections:
+            snapshot["user_scripts"] = self._parse_user_scripts_output(sections[SECTION_USER_SCRIPTS])
+        if SECTION_UPS in sections:
+            snapshot["ups_info"] = self._parse_ups_info_output(sections[SECTION_UPS])
+        if SECTION_DISKSTATS in sections:
+            snapshot["disk_io"] = self._parse_diskstats_output(sections[SECTION_DISKSTATS])
+        if include_zfs:
+            snapshot["zfs"] = self._process_zfs_output(sections)
+        if include_network:
+            async with self._network_lock:
+                snapshot["network_stats"] = await self._process_network_output(sections)
+
+        return snapshot
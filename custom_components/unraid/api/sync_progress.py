@@ -0,0 +1,157 @@
+"""Parity check and rebuild progress from the md driver's resync counters."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only the resync lines, so sampling during a sync stays cheap
+SYNC_PROGRESS_COMMAND = (
+    "mdcmd status | grep -E '^mdResync(Action|Size|Pos|Dt|Db)?='"
+)
+
+# Seconds between samples while a sync is running
+SYNC_POLL_INTERVAL = 15
+
+# Positions kept for the smoothed speed, and how far back they may reach
+SYNC_SAMPLE_COUNT = 40
+SYNC_SPEED_WINDOW = 300.0
+
+# The md driver counts resync positions in 1 KiB blocks
+SYNC_BLOCK_SIZE = 1024
+
+
+def _to_int(value: Optional[str]) -> int:
+    """Convert an mdcmd value to int, 0 when missing or malformed."""
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+def parse_sync_counters(output: str) -> Dict[str, str]:
+    """Parse the resync lines of mdcmd status into {key: value}."""
+    values: Dict[str, str] = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition("=")
+        if sep and key.startswith("mdResync"):
+            values[key.strip()] = value.strip()
+    return values
+
+
+@dataclass(frozen=True)
+class SyncProgress:
+    """State of a running parity check, rebuild or clear."""
+    action: Optional[str]
+    position: int
+    size: int
+    # Bytes per second averaged over the sample window
+    speed: Optional[float] = None
+    # Bytes per second over the md driver's last interval (mdResyncDb/mdResyncDt)
+    current_speed: Optional[float] = None
+    # Seconds to completion at the smoothed speed
+    eta: Optional[int] = None
+
+    @property
+    def progress(self) -> float:
+        """Return the completed share in percent."""
+        return round(self.position / self.size * 100, 2) if self.size else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the progress as published in array_state.sync_progress."""
+        return {
+            "action": self.action,
+            "position": self.position * SYNC_BLOCK_SIZE,
+            "size": self.size * SYNC_BLOCK_SIZE,
+            "progress": self.progress,
+            "speed": self.speed,
+            "current_speed": self.current_speed,
+            "eta": self.eta,
+        }
+
+
+class SyncProgressTracker:
+    """Turns successive resync positions into a smoothed speed and ETA.
+
+    Positions go into a ring buffer. The speed is the slope over the samples
+    of the last window, so short stalls and bursts don't make the ETA jump
+    the way the md driver's own per-interval figure does.
+    """
+
+    def __init__(
+        self,
+        window: float = SYNC_SPEED_WINDOW,
+        max_samples: int = SYNC_SAMPLE_COUNT,
+    ) -> None:
+        """Initialize the tracker."""
+        self._window = window
+        self._samples: Deque[Tuple[float, int]] = deque(maxlen=max_samples)
+        self._progress: Optional[SyncProgress] = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether the last sample showed a running sync."""
+        return self._progress is not None
+
+    @property
+    def progress(self) -> Optional[SyncProgress]:
+        """Return the progress at the last sample."""
+        return self._progress
+
+    def reset(self) -> None:
+        """Forget previous samples."""
+        self._samples.clear()
+        self._progress = None
+
+    def update(self, values: Mapping[str, str], now: Optional[float] = None) -> Optional[SyncProgress]:
+        """Record the resync counters of mdcmd status, None when no sync is running."""
+        if now is None:
+            now = time.monotonic()
+
+        size = _to_int(values.get("mdResyncSize")) or _to_int(values.get("mdResync"))
+        position = _to_int(values.get("mdResyncPos"))
+        if not _to_int(values.get("mdResync")) or not size:
+            if self._progress is not None:
+                _LOGGER.debug("Sync finished at %s of %s blocks", position, size)
+            self.reset()
+            return None
+
+        if self._samples and position < self._samples[-1][1]:
+            # A new sync started since the previous sample
+            self._samples.clear()
+        self._samples.append((now, position))
+        while len(self._samples) > 2 and now - self._samples[0][0] > self._window:
+            self._samples.popleft()
+
+        speed = None
+        first_time, first_position = self._samples[0]
+        if now > first_time:
+            speed = round((position - first_position) * SYNC_BLOCK_SIZE / (now - first_time), 1)
+
+        current_speed = None
+        interval, blocks = _to_int(values.get("mdResyncDt")), _to_int(values.get("mdResyncDb"))
+        if interval > 0:
+            current_speed = round(blocks * SYNC_BLOCK_SIZE / interval, 1)
+
+        # A single sample has no slope yet; the driver's figure stands in
+        if speed is None:
+            speed = current_speed
+
+        eta = None
+        if speed:
+            eta = round((size - position) * SYNC_BLOCK_SIZE / speed)
+
+        self._progress = SyncProgress(
+            action=values.get("mdResyncAction") or None,
+            position=position,
+            size=size,
+            speed=speed,
+            current_speed=current_speed,
+            eta=eta,
+        )
+        return self._progress
@@ -13,6 +13,9 @@ import asyncssh # type: ignore
 
 from .network_operations import NetworkOperationsMixin
 from .error_handling import with_error_handling, safe_parse
+from .snapshot_operations import split_sections
+from .cpu_stats import CPUStatsTracker, PROC_STAT_COMMAND
+from .gpu_sampler import INTEL_GPU_DEVICE_COMMAND, parse_intel_gpu_model, parse_intel_gpu_sample
 from .raid_detection import RAIDControllerDetector
 from .power_monitoring import CPUPowerMonitor
 from ..utils import format_bytes, extract_fans_data
@@ -27,13 +30,42 @@ class CommandExecutor(Protocol):
     async def execute_command(
         self,
         command: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        coalesce: bool = False
     ) -> asyncssh.SSHCompletedProcess:
         """Execute a command on the remote server."""
         ...
 
 _LOGGER = logging.getLogger(__name__)
 
+# Memory breakdown commands, shared by the standalone and batched collectors
+VM_MEMORY_COMMAND = (
+    "ps aux | grep -E 'qemu.*-name' | grep -v grep | "
+    "awk '{sum += $6} END {print sum+0}'"
+)
+DOCKER_MEMORY_COMMAND = (
+    "docker stats --no-stream --format '{{.MemUsage}}' 2>/dev/null | "
+    "awk -F'/' '{print $1}' | "
+    "while read mem; do "
+    "  if echo \"$mem\" | grep -q 'GiB'; then "
+    "    echo \"$mem\" | sed 's/GiB//' | awk '{print $1 * 1024}'; "
+    "  elif echo \"$mem\" | grep -q 'MiB'; then "
+    "    echo \"$mem\" | sed 's/MiB//' | awk '{print $1}'; "
+    "  elif echo \"$mem\" | grep -q 'KiB'; then "
+    "    echo \"$mem\" | sed 's/KiB//' | awk '{print $1 / 1024}'; "
+    "  else "
+    "    echo \"$mem\" | sed 's/[^0-9.]//g'; "
+    "  fi; "
+    "done | awk '{sum += $1} END {print sum+0}'"
+)
+ZFS_ARC_COMMAND = (
+    "if [ -f /proc/spl/kstat/zfs/arcstats ]; then "
+    "  awk '/^size/ {print $3}' /proc/spl/kstat/zfs/arcstats; "
+    "else "
+    "  echo '0'; "
+    "fi"
+)
+
 @dataclass
 class ArrayState:
     """Unraid array state information."""
@@ -56,6 +88,9 @@ class SystemOperationsMixin(CommandExecutor):
         self._fan_hardware_available: Optional[bool] = None  # Cache fan hardware detection
         self._raid_detector: Optional[RAIDControllerDetector] = None
         self._power_monitor: Optional[CPUPowerMonitor] = None
+        self._cpu_tracker = CPUStatsTracker()
+        self._cpu_info_cache: Optional[Dict[str, Any]] = None
+        self._cpu_info_cache_time: Optional[datetime] = None
 
     def set_network_ops(self, network_ops: NetworkOperationsMixin) -> None:
         """Set network operations instance."""
@@ -120,6 +155,18 @@ class SystemOperationsMixin(CommandExecutor):
         self._fan_hardware_available = None
         _LOGGER.debug("Fan hardware detection cache reset")
 
+    def export_static_facts(self) -> Dict[str, Any]:
+        """Return detected hardware facts that stay valid until the server reboots."""
+        facts: Dict[str, Any] = {}
+        if self._fan_hardware_available is not None:
+            facts["fan_hardware"] = self._fan_hardware_available
+        return facts
+
+    def restore_static_facts(self, facts: Dict[str, Any]) -> None:
+        """Restore hardware facts saved by export_static_facts."""
+        if isinstance(facts.get("fan_hardware"), bool):
+            self._fan_hardware_available = facts["fan_hardware"]
+
     async def get_raid_controller_info(self) -> Dict[str, Any]:
         """
         Get RAID controller information and recommendations.
@@ -195,7 +242,7 @@ class SystemOperationsMixin(CommandExecutor):
     async def _parse_array_state(self) -> ArrayState:
         """Parse detailed array state from mdcmd output."""
         try:
-            result = await self.execute_command("mdcmd status")
+            result = await self.execute_command("mdcmd status", coalesce=True)
             if result.exit_status != 0:
                 return ArrayState(
                     state="unknown",
@@ -239,7 +286,7 @@ class SystemOperationsMixin(CommandExecutor):
     async def _get_array_status(self) -> str:
         """Get Unraid array status using mdcmd."""
         try:
-            result = await self.execute_command("mdcmd status")
+            result = await self.execute_command("mdcmd status", coalesce=True)
             if result.exit_status != 0:
                 return "unknown"
 
@@ -276,14 +323,11 @@ class SystemOperationsMixin(CommandExecutor):
                 - cpu_max_freq: Maximum CPU frequency in MHz
                 - cpu_min_freq: Minimum CPU frequency in MHz
         """
-        cache_key = "_cpu_info_cache"
-        cache_time_key = "_cpu_info_cache_time"
-
         # Check cache age - refresh every 24 hours
-        if hasattr(self, cache_key) and hasattr(self, cache_time_key):
-            cache_age = datetime.now() - getattr(self, cache_time_key)
+        if self._cpu_info_cache is not None and self._cpu_info_cache_time is not None:
+            cache_age = datetime.now() - self._cpu_info_cache_time
             if cache_age.total_seconds() < 86400:  # 24 hours
-                return getattr(self, cache_key)
+                return self._cpu_info_cache
 
         try:
             # Get detailed CPU info using lscpu -J
@@ -320,14 +364,14 @@ class SystemOperationsMixin(CommandExecutor):
                 else:
                     # Fallback 2: Count processors in /proc/cpuinfo
                     cpu_count_result = await self.execute_command(
-                        "cat /proc/cpuinfo | grep -c processor"
+                        "cat /proc/cpuinfo | grep -c processor", coalesce=True
                     )
                     if cpu_count_result.exit_status == 0:
                         cpu_info["cpu_cores"] = int(cpu_count_result.stdout.strip())
 
             # Validate architecture with fallback
             if cpu_info["cpu_arch"] == "unknown":
-                arch_result = await self.execute_command("uname -m")
+                arch_result = await self.execute_command("uname -m", coalesce=True)
                 if arch_result.exit_status == 0:
                     cpu_info["cpu_arch"] = arch_result.stdout.strip()
 
@@ -346,8 +390,8 @@ class SystemOperationsMixin(CommandExecutor):
                 _LOGGER.debug("Could not get CPU temperature: %s", err)
 
             # Cache the results with timestamp
-            setattr(self, cache_key, cpu_info)
-            setattr(self, cache_time_key, datetime.now())
+            self._cpu_info_cache = cpu_info
+            self._cpu_info_cache_time = datetime.now()
 
             return cpu_info
 
@@ -421,6 +465,8 @@ class SystemOperationsMixin(CommandExecutor):
     async def _get_cpu_usage(self) -> Optional[float]:
         """Fetch CPU usage information from the Unraid system.
 
+        Usage is computed from /proc/stat counters since the previous sample.
+
         Returns:
             Float between 0-100 representing total CPU usage percentage,
             or None if the data could not be retrieved.
@@ -428,28 +474,17 @@ class SystemOperationsMixin(CommandExecutor):
         try:
             _LOGGER.debug("Fetching CPU usage")
 
-            # Get per-CPU usage stats
-            result = await self.execute_command(
-                "top -bn1 | grep '^%Cpu' | awk '{print 100 - $8}'"
-            )
+            result = await self.execute_command(PROC_STAT_COMMAND)
 
             if result.exit_status != 0:
                 _LOGGER.error("CPU usage command failed with exit status %d", result.exit_status)
                 return None
 
-            try:
-                # Parse and validate usage percentage
-                usage = float(result.stdout.strip())
-                if 0 <= usage <= 100:
-                    return round(usage, 2)
-
-                _LOGGER.warning("CPU usage outside valid range (0-100): %f", usage)
-                return None
-
-            except ValueError as err:
-                _LOGGER.error("Failed to parse CPU usage from output '%s': %s",
-                            result.stdout.strip(), err)
+            usage = self._cpu_tracker.update(result.stdout)
+            if usage is None:
+                _LOGGER.error("Failed to parse CPU usage from output '%s'", result.stdout.strip())
                 return None
+            return usage.total
 
         except (asyncssh.Error, asyncio.TimeoutError) as err:
             _LOGGER.error("Connection error getting CPU usage: %s", err)
@@ -464,28 +499,13 @@ class SystemOperationsMixin(CommandExecutor):
             _LOGGER.debug("Fetching comprehensive memory usage information")
 
             # Get basic memory info from /proc/meminfo
-            meminfo_result = await self.execute_command("cat /proc/meminfo")
+            meminfo_result = await self.execute_command("cat /proc/meminfo", coalesce=True)
             if meminfo_result.exit_status != 0:
                 _LOGGER.error("Memory usage command failed with exit status %d", meminfo_result.exit_status)
                 return {"percentage": None}
 
-            # Parse meminfo into a dictionary
-            memory_info = {}
-            for line in meminfo_result.stdout.splitlines():
-                try:
-                    key, value = line.split(':')
-                    # Convert kB to bytes and strip 'kB'
-                    value = int(value.strip().split()[0]) * 1024
-                    memory_info[key.strip()] = value
-                except (ValueError, IndexError):
-                    continue
-
-            # Calculate basic memory values
+            memory_info = self._parse_meminfo(meminfo_result.stdout)
             total = memory_info.get('MemTotal', 0)
-            free = memory_info.get('MemFree', 0)
-            cached = memory_info.get('Cached', 0)
-            buffers = memory_info.get('Buffers', 0)
-            available = memory_info.get('MemAvailable', 0)
 
             # Validate values to prevent division by zero or negative values
             if total <= 0:
@@ -496,80 +516,116 @@ class SystemOperationsMixin(CommandExecutor):
             _LOGGER.debug("Fetching detailed memory breakdown for total memory: %s", format_bytes(total))
             memory_breakdown = await self._get_detailed_memory_breakdown(total)
 
-            # Calculate system memory (total - VMs - Docker - ZFS - free)
-            vm_memory = memory_breakdown.get('vm_memory_bytes', 0)
-            docker_memory = memory_breakdown.get('docker_memory_bytes', 0)
-            zfs_memory = memory_breakdown.get('zfs_memory_bytes', 0)
-
-            _LOGGER.debug("Memory breakdown results: VM=%s, Docker=%s, ZFS=%s",
-                         format_bytes(vm_memory), format_bytes(docker_memory), format_bytes(zfs_memory))
-
-            # Calculate used memory for percentage calculation (exclude cached/buffered memory)
-            # This follows the standard Linux memory calculation: used = total - free - cached - buffers
-            # However, we need to account for ZFS ARC being included in cached memory
-
-            # Adjust cached memory to exclude ZFS ARC (to avoid double counting)
-            cached_excluding_zfs = cached - zfs_memory
-
-            # Calculate used memory excluding cached/buffered memory
-            used = total - free - cached_excluding_zfs - buffers
-
-            # Ensure used memory is not negative (fallback to simple calculation)
-            if used < 0:
-                used = total - available if available > 0 else total - free
-
-            # System memory is the actual memory used by kernel and system processes
-            # It's calculated as: used memory minus specific allocations (VMs, Docker, ZFS)
-            system_memory = used - vm_memory - docker_memory - zfs_memory
-
-            # Ensure system memory is not negative (fallback calculation)
-            if system_memory < 0:
-                # If calculation results in negative, use a conservative estimate
-                system_memory = max(0, int(used * 0.1))  # Assume 10% of used memory for system
+            return self._build_memory_stats(memory_info, memory_breakdown)
 
+        except (asyncssh.Error, asyncio.TimeoutError, OSError, ValueError) as err:
+            _LOGGER.error("Error getting memory usage: %s", err)
+            return {"percentage": None}
 
+    def _parse_meminfo(self, output: str) -> Dict[str, int]:
+        """Parse /proc/meminfo output into a dictionary of byte values."""
+        memory_info = {}
+        for line in output.splitlines():
+            try:
+                key, value = line.split(':')
+                # Convert kB to bytes and strip 'kB'
+                value = int(value.strip().split()[0]) * 1024
+                memory_info[key.strip()] = value
+            except (ValueError, IndexError):
+                continue
+        return memory_info
 
-            # Format values for reporting with detailed breakdown
-            memory_stats = {
-                "percentage": round((used / total) * 100, 2),
-                "total": format_bytes(total),
-                "used": format_bytes(used),
-                "free": format_bytes(free),
-                "cached": format_bytes(cached_excluding_zfs),  # Show cached memory excluding ZFS ARC
-                "buffers": format_bytes(buffers),
-                "available": format_bytes(available),
-
-                # Enhanced breakdown attributes
-                "system_memory": format_bytes(system_memory),
-                "system_memory_bytes": system_memory,
-                "system_memory_percentage": round((system_memory / total) * 100, 1),
-
-                "vm_memory": memory_breakdown.get('vm_memory', 'N/A'),
-                "vm_memory_bytes": vm_memory,
-                "vm_memory_percentage": round((vm_memory / total) * 100, 1) if vm_memory > 0 else 0,
-
-                "docker_memory": memory_breakdown.get('docker_memory', 'N/A'),
-                "docker_memory_bytes": docker_memory,
-                "docker_memory_percentage": round((docker_memory / total) * 100, 1) if docker_memory > 0 else 0,
-
-                "zfs_memory": memory_breakdown.get('zfs_memory', 'N/A'),
-                "zfs_memory_bytes": zfs_memory,
-                "zfs_memory_percentage": round((zfs_memory / total) * 100, 1) if zfs_memory > 0 else 0,
-
-                "free_memory": format_bytes(free),
-                "free_memory_bytes": free,
-                "free_memory_percentage": round((free / total) * 100, 1),
-            }
+    def _build_memory_stats(
+        self,
+        memory_info: Dict[str, int],
+        memory_breakdown: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Calculate memory statistics from parsed meminfo and a memory breakdown."""
+        # Calculate basic memory values
+        total = memory_info.get('MemTotal', 0)
+        free = memory_info.get('MemFree', 0)
+        cached = memory_info.get('Cached', 0)
+        buffers = memory_info.get('Buffers', 0)
+        available = memory_info.get('MemAvailable', 0)
+
+        # Validate values to prevent division by zero or negative values
+        if total <= 0:
+            _LOGGER.error("Invalid total memory value: %d", total)
+            return {"percentage": None}
 
-            _LOGGER.debug("Enhanced memory stats calculated with breakdown")
-            return memory_stats
+        # Calculate system memory (total - VMs - Docker - ZFS - free)
+        vm_memory = memory_breakdown.get('vm_memory_bytes', 0)
+        docker_memory = memory_breakdown.get('docker_memory_bytes', 0)
+        zfs_memory = memory_breakdown.get('zfs_memory_bytes', 0)
+
+        _LOGGER.debug("Memory breakdown results: VM=%s, Docker=%s, ZFS=%s",
+                     format_bytes(vm_memory), format_bytes(docker_memory), format_bytes(zfs_memory))
+
+        # Calculate used memory for percentage calculation (exclude cached/buffered memory)
+        # This follows the standard Linux memory calculation: used = total - free - cached - buffers
+        # However, we need to account for ZFS ARC being included in cached memory
+
+        # Adjust cached memory to exclude ZFS ARC (to avoid double counting)
+        cached_excluding_zfs = cached - zfs_memory
+
+        # Calculate used memory excluding cached/buffered memory
+        used = total - free - cached_excluding_zfs - buffers
+
+        # Ensure used memory is not negative (fallback to simple calculation)
+        if used < 0:
+            used = total - available if available > 0 else total - free
+
+        # System memory is the actual memory used by kernel and system processes
+        # It's calculated as: used memory minus specific allocations (VMs, Docker, ZFS)
+        system_memory = used - vm_memory - docker_memory - zfs_memory
+
+        # Ensure system memory is not negative (fallback calculation)
+        if system_memory < 0:
+            # If calculation results in negative, use a conservative estimate
+            system_memory = max(0, int(used * 0.1))  # Assume 10% of used memory for system
+
+        # Format values for reporting with detailed breakdown
+        memory_stats = {
+            "percentage": round((used / total) * 100, 2),
+            "total": format_bytes(total),
+            "used": format_bytes(used),
+            "free": format_bytes(free),
+            "cached": format_bytes(cached_excluding_zfs),  # Show cached memory excluding ZFS ARC
+            "buffers": format_bytes(buffers),
+            "available": format_bytes(available),
+
+            # Enhanced breakdown attributes
+            "system_memory": format_bytes(system_memory),
+            "system_memory_bytes": system_memory,
+            "system_memory_percentage": round((system_memory / total) * 100, 1),
+
+            "vm_memory": memory_breakdown.get('vm_memory', 'N/A'),
+            "vm_memory_bytes": vm_memory,
+            "vm_memory_percentage": round((vm_memory / total) * 100, 1) if vm_memory > 0 else 0,
+
+            "docker_memory": memory_breakdown.get('docker_memory', 'N/A'),
+            "docker_memory_bytes": docker_memory,
+            "docker_memory_percentage": round((docker_memory / total) * 100, 1) if docker_memory > 0 else 0,
+
+            "zfs_memory": memory_breakdown.get('zfs_memory', 'N/A'),
+            "zfs_memory_bytes": zfs_memory,
+            "zfs_memory_percentage": round((zfs_memory / total) * 100, 1) if zfs_memory > 0 else 0,
+
+            "free_memory": format_bytes(free),
+            "free_memory_bytes": free,
+            "free_memory_percentage": round((free / total) * 100, 1),
+        }
 
-        except (asyncssh.Error, asyncio.TimeoutError, OSError, ValueError) as err:
-            _LOGGER.error("Error getting memory usage: %s", err)
-            return {"percentage": None}
+        _LOGGER.debug("Enhanced memory stats calculated with breakdown")
+        return memory_stats
 
-    async def _get_detailed_memory_breakdown(self, total_memory: int) -> Dict[str, Any]:
-        """Get detailed memory breakdown for VMs, Docker, and ZFS."""
+    def _build_memory_breakdown(
+        self,
+        vm_memory: int = 0,
+        docker_memory: int = 0,
+        zfs_memory: int = 0
+    ) -> Dict[str, Any]:
+        """Build the memory breakdown dictionary from byte values."""
         breakdown = {
             'vm_memory': 'N/A',
             'vm_memory_bytes': 0,
@@ -579,49 +635,45 @@ class SystemOperationsMixin(CommandExecutor):
             'zfs_memory_bytes': 0
         }
 
-        try:
-            # Get VM memory usage
-            vm_memory = await self._get_vm_memory_usage()
-            if vm_memory > 0:
-                breakdown['vm_memory'] = format_bytes(vm_memory)
-                breakdown['vm_memory_bytes'] = vm_memory
-                _LOGGER.debug("VM memory usage: %s", format_bytes(vm_memory))
-
-            # Get Docker memory usage
-            docker_memory = await self._get_docker_memory_usage()
-            if docker_memory > 0:
-                breakdown['docker_memory'] = format_bytes(docker_memory)
-                breakdown['docker_memory_bytes'] = docker_memory
-                _LOGGER.debug("Docker memory usage: %s", format_bytes(docker_memory))
-
-            # Get ZFS ARC memory usage
-            zfs_memory = await self._get_zfs_memory_usage()
-            if zfs_memory > 0:
-                breakdown['zfs_memory'] = format_bytes(zfs_memory)
-                breakdown['zfs_memory_bytes'] = zfs_memory
-                _LOGGER.debug("ZFS ARC memory usage: %s", format_bytes(zfs_memory))
+        if vm_memory > 0:
+            breakdown['vm_memory'] = format_bytes(vm_memory)
+            breakdown['vm_memory_bytes'] = vm_memory
+            _LOGGER.debug("VM memory usage: %s", format_bytes(vm_memory))
 
-        except Exception as err:
-            _LOGGER.debug("Error getting detailed memory breakdown: %s", err)
+        if docker_memory > 0:
+            breakdown['docker_memory'] = format_bytes(docker_memory)
+            breakdown['docker_memory_bytes'] = docker_memory
+            _LOGGER.debug("Docker memory usage: %s", format_bytes(docker_memory))
+
+        if zfs_memory > 0:
+            breakdown['zfs_memory'] = format_bytes(zfs_memory)
+            breakdown['zfs_memory_bytes'] = zfs_memory
+            _LOGGER.debug("ZFS ARC memory usage: %s", format_bytes(zfs_memory))
 
         return breakdown
 
+    async def _get_detailed_memory_breakdown(self, total_memory: int) -> Dict[str, Any]:
+        """Get detailed memory breakdown for VMs, Docker, and ZFS."""
+        try:
+            return self._build_memory_breakdown(
+                vm_memory=await self._get_vm_memory_usage(),
+                docker_memory=await self._get_docker_memory_usage(),
+                zfs_memory=await self._get_zfs_memory_usage(),
+            )
+        except Exception as err:
+            _LOGGER.debug("Error getting detailed memory breakdown: %s", err)
+            return self._build_memory_breakdown()
+
     async def _get_vm_memory_usage(self) -> int:
         """Get total memory used by running VMs (RSS-based like Unraid GUI)."""
         try:
             # Check if libvirt is running
-            libvirt_check = await self.execute_command("pgrep -f libvirtd")
-            if libvirt_check.exit_status != 0:
+            if not await self.capabilities.service_running("libvirt"):
                 _LOGGER.debug("Libvirt not running, no VM memory usage")
                 return 0
 
             # Get actual RSS memory usage of QEMU processes (matches Unraid GUI method)
-            vm_memory_cmd = (
-                "ps aux | grep -E 'qemu.*-name' | grep -v grep | "
-                "awk '{sum += $6} END {print sum+0}'"
-            )
-
-            result = await self.execute_command(vm_memory_cmd)
+            result = await self.execute_command(VM_MEMORY_COMMAND)
             if result.exit_status == 0 and result.stdout.strip():
                 # Convert from KB to bytes (ps aux shows RSS in KB)
                 vm_memory_kb = int(result.stdout.strip())
@@ -636,29 +688,12 @@ class SystemOperationsMixin(CommandExecutor):
         """Get total memory used by Docker containers."""
         try:
             # Check if Docker is running
-            docker_check = await self.execute_command("pgrep -f dockerd")
-            if docker_check.exit_status != 0:
+            if not await self.capabilities.service_running("docker"):
                 _LOGGER.debug("Docker not running, no container memory usage")
                 return 0
 
             # Get memory usage for all containers with improved parsing
-            docker_memory_cmd = (
-                "docker stats --no-stream --format '{{.MemUsage}}' 2>/dev/null | "
-                "awk -F'/' '{print $1}' | "
-                "while read mem; do "
-                "  if echo \"$mem\" | grep -q 'GiB'; then "
-                "    echo \"$mem\" | sed 's/GiB//' | awk '{print $1 * 1024}'; "
-                "  elif echo \"$mem\" | grep -q 'MiB'; then "
-                "    echo \"$mem\" | sed 's/MiB//' | awk '{print $1}'; "
-                "  elif echo \"$mem\" | grep -q 'KiB'; then "
-                "    echo \"$mem\" | sed 's/KiB//' | awk '{print $1 / 1024}'; "
-                "  else "
-                "    echo \"$mem\" | sed 's/[^0-9.]//g'; "
-                "  fi; "
-                "done | awk '{sum += $1} END {print sum+0}'"
-            )
-
-            result = await self.execute_command(docker_memory_cmd)
+            result = await self.execute_command(DOCKER_MEMORY_COMMAND)
             if result.exit_status == 0 and result.stdout.strip():
                 # Result is now in MiB, convert to bytes
                 memory_mib = float(result.stdout.strip())
@@ -673,21 +708,12 @@ class SystemOperationsMixin(CommandExecutor):
         """Get ZFS ARC (cache) memory usage."""
         try:
             # Check if ZFS is available
-            zfs_check = await self.execute_command("command -v zfs")
-            if zfs_check.exit_status != 0:
+            if not await self.capabilities.has_tool("zfs"):
                 _LOGGER.debug("ZFS not available, no ARC memory usage")
                 return 0
 
             # Get ZFS ARC memory usage from /proc/spl/kstat/zfs/arcstats
-            arc_cmd = (
-                "if [ -f /proc/spl/kstat/zfs/arcstats ]; then "
-                "  awk '/^size/ {print $3}' /proc/spl/kstat/zfs/arcstats; "
-                "else "
-                "  echo '0'; "
-                "fi"
-            )
-
-            result = await self.execute_command(arc_cmd)
+            result = await self.execute_command(ZFS_ARC_COMMAND)
             if result.exit_status == 0 and result.stdout.strip():
                 # ARC size is already in bytes
                 arc_size = int(result.stdout.strip())
@@ -702,7 +728,7 @@ class SystemOperationsMixin(CommandExecutor):
         """Fetch boot information from the Unraid system."""
         try:
             _LOGGER.debug("Fetching boot usage")
-            result = await self.execute_command("df -k /boot | awk 'NR==2 {print $2,$3,$4}'")
+            result = await self.execute_command("df -k /boot | awk 'NR==2 {print $2,$3,$4}'", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.error("Boot usage command failed with exit status %d", result.exit_status)
                 return {"percentage": None, "total": None, "used": None, "free": None}
@@ -755,7 +781,7 @@ class SystemOperationsMixin(CommandExecutor):
                     "status": "not_mounted"
                 }
 
-            result = await self.execute_command("df -k /mnt/cache | awk 'NR==2 {print $2,$3,$4}'")
+            result = await self.execute_command("df -k /mnt/cache | awk 'NR==2 {print $2,$3,$4}'", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.debug("Cache usage command failed, cache might not be available")
                 return {
@@ -801,7 +827,7 @@ class SystemOperationsMixin(CommandExecutor):
         """Fetch log filesystem information from the Unraid system."""
         try:
             _LOGGER.debug("Fetching log filesystem usage")
-            result = await self.execute_command("df -k /var/log | awk 'NR==2 {print $2,$3,$4,$5}'")
+            result = await self.execute_command("df -k /var/log | awk 'NR==2 {print $2,$3,$4,$5}'", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.error("Log filesystem usage command failed with exit status %d", result.exit_status)
                 return {}
@@ -933,12 +959,7 @@ class SystemOperationsMixin(CommandExecutor):
 
             # Parse device info from lspci
             if device_info and device_info != 'no_intel_gpu':
-                # Extract GPU model from lspci output
-                # Example: "00:02.0 VGA compatible controller: Intel Corporation UHD Graphics 630 (rev 02)"
-                if 'Intel Corporation' in device_info:
-                    model_match = re.search(r'Intel Corporation (.+?)(?:\s+\(rev|\s*$)', device_info)
-                    if model_match:
-                        gpu_data["model"] = f"Intel {model_match.group(1).strip()}"
+                gpu_data["model"] = parse_intel_gpu_model(device_info)
 
             # Parse intel_gpu_top JSON output
             if gpu_output and gpu_output not in ('not_available', 'command_failed', 'no_pci_device'):
@@ -981,53 +1002,10 @@ class SystemOperationsMixin(CommandExecutor):
 
                     _LOGGER.debug("Successfully parsed Intel GPU JSON data")
 
-                    # Extract overall GPU usage from engines
-                    if 'engines' in gpu_json:
-                        engines = gpu_json['engines']
-                        total_usage = 0.0
-                        engine_count = 0
-                        max_usage = 0.0
-
-                        # Parse individual engine usage
-                        for engine_name, engine_data in engines.items():
-                            if isinstance(engine_data, dict) and 'busy' in engine_data:
-                                usage = float(engine_data['busy'])
-                                gpu_data["engines"][engine_name] = round(usage, 1)
-                                total_usage += usage
-                                engine_count += 1
-                                max_usage = max(max_usage, usage)
-
-                        # Use maximum engine usage as overall GPU usage (like gpustat plugin)
-                        if engine_count > 0:
-                            gpu_data["usage_percentage"] = round(max_usage, 1)
-
-                    # Extract frequency information
-                    if 'frequency' in gpu_json:
-                        freq_data = gpu_json['frequency']
-                        if isinstance(freq_data, dict) and 'actual' in freq_data:
-                            gpu_data["frequency_mhz"] = int(freq_data['actual'])
-
-                    # Extract power information (handle both old and new formats)
-                    if 'power' in gpu_json:
-                        power_data = gpu_json['power']
-                        if isinstance(power_data, dict):
-                            # New format with GPU and Package power
-                            if 'GPU' in power_data:
-                                gpu_data["power_watts"] = round(float(power_data['GPU']), 1)
-                            elif 'Package' in power_data:
-                                gpu_data["power_watts"] = round(float(power_data['Package']), 1)
-                            # Old format with single value
-                            elif 'value' in power_data:
-                                gpu_data["power_watts"] = round(float(power_data['value']), 1)
-
-                    # Extract IMC bandwidth information
-                    if 'imc-bandwidth' in gpu_json:
-                        imc_data = gpu_json['imc-bandwidth']
-                        if isinstance(imc_data, dict):
-                            if 'reads' in imc_data:
-                                gpu_data["memory_bandwidth_read"] = round(float(imc_data['reads']), 2)
-                            if 'writes' in imc_data:
-                                gpu_data["memory_bandwidth_write"] = round(float(imc_data['writes']), 2)
+                    sample = parse_intel_gpu_sample(gpu_json)
+                    gpu_data.update(sample)
+                    if "usage_percentage" not in sample:
+                        gpu_data["usage_percentage"] = 0.0
 
                 except json.JSONDecodeError as err:
                     _LOGGER.debug("Failed to parse intel_gpu_top JSON output: %s", err)
@@ -1066,10 +1044,7 @@ class SystemOperationsMixin(CommandExecutor):
             _LOGGER.debug("Intel GPU device detected: %s", device_info)
 
             # Check if intel_gpu_top is available
-            tool_check_cmd = "command -v intel_gpu_top"
-            tool_check_result = await self.execute_command(tool_check_cmd)
-
-            if tool_check_result.exit_status != 0:
+            if not await self.capabilities.has_tool("intel_gpu_top"):
                 _LOGGER.debug("intel_gpu_top not available")
                 return None
 
@@ -1247,16 +1222,13 @@ class SystemOperationsMixin(CommandExecutor):
 
         return "UTC"  # Default to UTC
 
-    @with_error_handling(fallback_return={})
-    async def collect_system_stats(self) -> Dict[str, Any]:
-        """Collect system statistics using a single batched command."""
-        # Use a single command to collect all system statistics
-        _LOGGER.debug("Collecting system statistics with batched command")
-        cmd = (
+    def _build_system_stats_command(self) -> str:
+        """Build the batched command collecting all system statistics."""
+        return (
             "echo '===ARRAY_STATE==='; "
             "mdcmd status; "
-            "echo '===CPU_USAGE==='; "
-            "top -bn1 | grep '^%Cpu' | awk '{print 100 - $8}'; "
+            "echo '===CPU_STAT==='; "
+            f"{PROC_STAT_COMMAND}; "
             "echo '===CPU_LOAD==='; "
             "cat /proc/loadavg; "
             "echo '===CPU_INFO==='; "
@@ -1265,6 +1237,12 @@ class SystemOperationsMixin(CommandExecutor):
             "echo 'ARCH:'; uname -m; "
             "echo '===MEMORY_INFO==='; "
             "cat /proc/meminfo; "
+            "echo '===MEMORY_VM==='; "
+            f"if pgrep -x libvirtd >/dev/null 2>&1; then {VM_MEMORY_COMMAND}; else echo 0; fi; "
+            "echo '===MEMORY_DOCKER==='; "
+            f"if pgrep -x dockerd >/dev/null 2>&1; then {DOCKER_MEMORY_COMMAND}; else echo 0; fi; "
+            "echo '===MEMORY_ZFS==='; "
+            f"if command -v zfs >/dev/null 2>&1; then {ZFS_ARC_COMMAND}; else echo 0; fi; "
             "echo '===UPTIME==='; "
             "cat /proc/uptime; "
             "echo '===TEMPERATURE==='; "
@@ -1284,281 +1262,256 @@ class SystemOperationsMixin(CommandExecutor):
             "df -k /var/log | awk 'NR==2 {print $2,$3,$4,$5}'; "
             "echo '===DOCKER_VDISK==='; "
             "df -k /var/lib/docker | awk 'NR==2 {print $2,$3,$4}' 2>/dev/null || echo 'not_mounted'; "
-            "echo '===INTEL_GPU==='; "
-            "if command -v intel_gpu_top >/dev/null 2>&1; then "
-            "GPU_PCI=$(lspci | grep -i 'vga\\|display\\|3d' | grep -i intel | head -1 | cut -d' ' -f1); "
-            "if [ -n \"$GPU_PCI\" ]; then "
-            "timeout 8 intel_gpu_top -J -s 1000 -n 2 -d pci:slot=\"0000:$GPU_PCI\" 2>/dev/null || echo 'gpu_timeout'; "
-            "else echo 'no_pci_device'; fi; "
-            "else echo 'not_available'; fi; "
-            "echo '===GPU_DEVICE_INFO==='; "
-            "lspci | grep -i 'vga\\|display\\|3d' | grep -i intel || echo 'no_intel_gpu'"
+            "echo '===INTEL_GPU_DEVICE==='; "
+            f"{INTEL_GPU_DEVICE_COMMAND}"
         )
 
-        result = await self.execute_command(cmd)
+    def _parse_system_stats_sections(self, sections: Dict[str, str]) -> Dict[str, Any]:
+        """Parse the sections produced by the batched system stats command."""
+        # Parse each section
+        system_stats: Dict[str, Any] = {}
+
+        # Parse array state
+        if 'ARRAY_STATE' in sections:
+            system_stats['array_state'] = self._build_array_state_stats(sections['ARRAY_STATE'])
+
+            # Parse CPU usage from /proc/stat counters
+            if 'CPU_STAT' in sections:
+                cpu_usage = self._cpu_tracker.update(sections['CPU_STAT'])
+                if cpu_usage is not None:
+                    system_stats['cpu_usage'] = cpu_usage.total
+                    system_stats['cpu_iowait'] = cpu_usage.iowait
+                    system_stats['cpu_steal'] = cpu_usage.steal
+                    system_stats['cpu_irq'] = cpu_usage.irq
+                    system_stats['cpu_core_usage'] = cpu_usage.per_core
+                else:
+                    _LOGGER.debug("Could not parse CPU usage from output: %s", sections['CPU_STAT'])
 
-        if result.exit_status == 0:
-            # Split the output into sections
-            sections = {}
-            current_section = None
-            section_content = []
+            # Parse CPU load averages
+            if 'CPU_LOAD' in sections:
+                try:
+                    load_output = sections['CPU_LOAD'].strip()
+                    # /proc/loadavg format: "load1 load5 load15 running/total last_pid"
+                    load_parts = load_output.split()
+                    if len(load_parts) >= 3:
+                        load_1m = float(load_parts[0])
+                        load_5m = float(load_parts[1])
+                        load_15m = float(load_parts[2])
+
+                        # Validate load averages (should be non-negative)
+                        if load_1m >= 0 and load_5m >= 0 and load_15m >= 0:
+                            system_stats['cpu_load_averages'] = {
+                                'load_1m': round(load_1m, 2),
+                                'load_5m': round(load_5m, 2),
+                                'load_15m': round(load_15m, 2)
+                            }
+                            _LOGGER.debug("Parsed CPU load averages: 1m=%.2f, 5m=%.2f, 15m=%.2f",
+                                        load_1m, load_5m, load_15m)
+                        else:
+                            _LOGGER.warning("Invalid CPU load averages: 1m=%.2f, 5m=%.2f, 15m=%.2f",
+                                          load_1m, load_5m, load_15m)
+                except (ValueError, TypeError, IndexError) as err:
+                    _LOGGER.debug("Could not parse CPU load averages from output: %s, error: %s",
+                                sections['CPU_LOAD'], err)
+
+            # Parse CPU info
+            if 'CPU_INFO' in sections:
+                try:
+                    cpu_info_lines = sections['CPU_INFO'].strip().split('\n')
+                    cpu_cores: Optional[int] = None
+                    cpu_model: Optional[str] = None
+                    cpu_arch: Optional[str] = None
+
+                    for line in cpu_info_lines:
+                        line = line.strip()
+                        if line.startswith('CORES:'):
+                            continue
+                        elif line.startswith('MODEL:'):
+                            continue
+                        elif line.startswith('ARCH:'):
+                            continue
+                        elif cpu_cores is None and line.isdigit():
+                            cpu_cores = int(line)
+                        elif cpu_model is None and line and not line.isdigit():
+                            cpu_model = line
+                        elif cpu_arch is None and line and not line.isdigit() and cpu_model is not None:
+                            cpu_arch = line
+
+                    if cpu_cores:
+                        system_stats['cpu_cores'] = cpu_cores
+                    if cpu_model:
+                        system_stats['cpu_model'] = cpu_model
+                    if cpu_arch:
+                        system_stats['cpu_arch'] = cpu_arch
+
+                except (ValueError, TypeError) as err:
+                    _LOGGER.debug("Could not parse CPU info from output: %s, error: %s", sections['CPU_INFO'], err)
+
+            # Parse memory info with enhanced breakdown
+            if 'MEMORY_INFO' in sections:
+                # Build the enhanced memory usage from the breakdown sections of the same command
+                memory_breakdown = self._build_memory_breakdown(
+                    vm_memory=safe_parse(int, sections.get('MEMORY_VM', '').strip() or '0', default=0) * 1024,
+                    docker_memory=int(safe_parse(float, sections.get('MEMORY_DOCKER', '').strip() or '0', default=0.0) * 1024 * 1024),
+                    zfs_memory=safe_parse(int, sections.get('MEMORY_ZFS', '').strip() or '0', default=0),
+                )
+                system_stats['memory_usage'] = self._build_memory_stats(
+                    self._parse_meminfo(sections['MEMORY_INFO']),
+                    memory_breakdown
+                )
 
-            for line in result.stdout.splitlines():
-                if line.startswith('===') and line.endswith('==='):
-                    # Save previous section if it exists
-                    if current_section:
-                        sections[current_section] = '\n'.join(section_content)
-                    # Start new section
-                    current_section = line.strip('=').strip()
-                    section_content = []
-                elif current_section:
-                    section_content.append(line)
-
-            # Save the last section
-            if current_section and section_content:
-                sections[current_section] = '\n'.join(section_content)
-
-            # Parse each section
-            system_stats: Dict[str, Any] = {}
-
-            # Parse array state
-            if 'ARRAY_STATE' in sections:
-                array_state = self._parse_array_state_from_output(sections['ARRAY_STATE'])
-                system_stats['array_state'] = {
-                    "state": array_state.state,
-                    "num_disks": array_state.num_disks,
-                    "num_disabled": array_state.num_disabled,
-                    "num_invalid": array_state.num_invalid,
-                    "num_missing": array_state.num_missing,
-                    "synced": array_state.synced,
-                    "sync_action": array_state.sync_action,
-                    "sync_progress": array_state.sync_progress,
-                    "sync_errors": array_state.sync_errors,
-                }
+            # Parse uptime
+            if 'UPTIME' in sections:
+                try:
+                    uptime_match = re.search(r'(\d+(\.\d+)?)', sections['UPTIME'])
+                    if uptime_match:
+                        system_stats['uptime'] = float(uptime_match.group(1))
+                except (ValueError, TypeError):
+                    _LOGGER.debug("Could not parse uptime from output: %s", sections['UPTIME'])
+
+            # Parse temperature data
+            if 'TEMPERATURE' in sections:
+                sensors_dict = self._parse_sensors_output(sections['TEMPERATURE'])
+                temp_data = {'sensors': sensors_dict}
+
+                # Extract fan data using optimized detection
+                fans = self._extract_fans_data_optimized(sensors_dict)
+                if fans:
+                    temp_data['fans'] = fans
 
-                # Parse CPU usage
-                if 'CPU_USAGE' in sections:
-                    try:
-                        cpu_usage = float(sections['CPU_USAGE'].strip())
-                        if 0 <= cpu_usage <= 100:
-                            system_stats['cpu_usage'] = float(round(cpu_usage, 2))
-                    except (ValueError, TypeError):
-                        _LOGGER.debug("Could not parse CPU usage from output: %s", sections['CPU_USAGE'])
+                system_stats['temperature_data'] = temp_data
 
-                # Parse CPU load averages
-                if 'CPU_LOAD' in sections:
-                    try:
-                        load_output = sections['CPU_LOAD'].strip()
-                        # /proc/loadavg format: "load1 load5 load15 running/total last_pid"
-                        load_parts = load_output.split()
-                        if len(load_parts) >= 3:
-                            load_1m = float(load_parts[0])
-                            load_5m = float(load_parts[1])
-                            load_15m = float(load_parts[2])
-
-                            # Validate load averages (should be non-negative)
-                            if load_1m >= 0 and load_5m >= 0 and load_15m >= 0:
-                                system_stats['cpu_load_averages'] = {
-                                    'load_1m': round(load_1m, 2),
-                                    'load_5m': round(load_5m, 2),
-                                    'load_15m': round(load_15m, 2)
-                                }
-                                _LOGGER.debug("Parsed CPU load averages: 1m=%.2f, 5m=%.2f, 15m=%.2f",
-                                            load_1m, load_5m, load_15m)
-                            else:
-                                _LOGGER.warning("Invalid CPU load averages: 1m=%.2f, 5m=%.2f, 15m=%.2f",
-                                              load_1m, load_5m, load_15m)
-                    except (ValueError, TypeError, IndexError) as err:
-                        _LOGGER.debug("Could not parse CPU load averages from output: %s, error: %s",
-                                    sections['CPU_LOAD'], err)
-
-                # Parse CPU info
-                if 'CPU_INFO' in sections:
-                    try:
-                        cpu_info_lines = sections['CPU_INFO'].strip().split('\n')
-                        cpu_cores: Optional[int] = None
-                        cpu_model: Optional[str] = None
-                        cpu_arch: Optional[str] = None
-
-                        for line in cpu_info_lines:
-                            line = line.strip()
-                            if line.startswith('CORES:'):
-                                continue
-                            elif line.startswith('MODEL:'):
-                                continue
-                            elif line.startswith('ARCH:'):
-                                continue
-                            elif cpu_cores is None and line.isdigit():
-                                cpu_cores = int(line)
-                            elif cpu_model is None and line and not line.isdigit():
-                                cpu_model = line
-                            elif cpu_arch is None and line and not line.isdigit() and cpu_model is not None:
-                                cpu_arch = line
-
-                        if cpu_cores:
-                            system_stats['cpu_cores'] = cpu_cores
-                        if cpu_model:
-                            system_stats['cpu_model'] = cpu_model
-                        if cpu_arch:
-                            system_stats['cpu_arch'] = cpu_arch
-
-                    except (ValueError, TypeError) as err:
-                        _LOGGER.debug("Could not parse CPU info from output: %s, error: %s", sections['CPU_INFO'], err)
-
-                # Parse memory info with enhanced breakdown
-                if 'MEMORY_INFO' in sections:
-                    # Use the enhanced memory usage function instead of basic parsing
-                    _LOGGER.debug("Getting enhanced memory usage with detailed breakdown")
-                    system_stats['memory_usage'] = await self._get_memory_usage()
-
-                # Parse uptime
-                if 'UPTIME' in sections:
-                    try:
-                        uptime_match = re.search(r'(\d+(\.\d+)?)', sections['UPTIME'])
-                        if uptime_match:
-                            system_stats['uptime'] = float(uptime_match.group(1))
-                    except (ValueError, TypeError):
-                        _LOGGER.debug("Could not parse uptime from output: %s", sections['UPTIME'])
+            # Parse thermal zones
+            if 'THERMAL_ZONES' in sections and sections['THERMAL_ZONES'].strip():
+                thermal_zones = self._parse_thermal_zones(sections['THERMAL_ZONES'])
+                if 'temperature_data' not in system_stats:
+                    system_stats['temperature_data'] = {}
+                system_stats['temperature_data']['thermal_zones'] = thermal_zones
 
-                # Parse temperature data
-                if 'TEMPERATURE' in sections:
-                    sensors_dict = self._parse_sensors_output(sections['TEMPERATURE'])
-                    temp_data = {'sensors': sensors_dict}
+            # Parse boot usage
+            if 'BOOT_USAGE' in sections and sections['BOOT_USAGE'].strip():
+                try:
+                    total, used, free = map(int, sections['BOOT_USAGE'].strip().split())
+                    percentage = (used / total) * 100 if total > 0 else 0
+                    system_stats['boot_usage'] = {
+                        "percentage": float(round(percentage, 2)),
+                        "total": total * 1024,  # Convert to bytes
+                        "used": used * 1024,    # Convert to bytes
+                        "free": free * 1024     # Convert to bytes
+                    }
+                except (ValueError, TypeError):
+                    _LOGGER.debug("Could not parse boot usage from output: %s", sections['BOOT_USAGE'])
+
+            # Parse cache pools
+            if 'CACHE_POOLS' in sections:
+                cache_pools_output = sections['CACHE_POOLS'].strip()
+                cache_pools = {}
+
+                if cache_pools_output:
+                    for line in cache_pools_output.splitlines():
+                        line = line.strip()
+                        if not line:
+                            continue
 
-                    # Extract fan data using optimized detection
-                    fans = self._extract_fans_data_optimized(sensors_dict)
-                    if fans:
-                        temp_data['fans'] = fans
+                        try:
+                            # Format: pool_name:total:used:free:device:filesystem
+                            parts = line.split(':')
+                            if len(parts) >= 6:
+                                pool_name, total_str, used_str, free_str, device, filesystem = parts[:6]
+
+                                total = int(total_str)
+                                used = int(used_str)
+                                free = int(free_str)
+                                percentage = (used / total) * 100 if total > 0 else 0
+
+                                cache_pools[pool_name] = {
+                                    "percentage": float(round(percentage, 2)),
+                                    "total": total * 1024,  # Convert to bytes
+                                    "used": used * 1024,    # Convert to bytes
+                                    "free": free * 1024,    # Convert to bytes
+                                    "status": "mounted",
+                                    "device": device,
+                                    "filesystem": filesystem
+                                }
 
-                    system_stats['temperature_data'] = temp_data
+                                _LOGGER.debug("Detected cache pool '%s': %.1f%% used, %s filesystem",
+                                            pool_name, percentage, filesystem)
 
-                # Parse thermal zones
-                if 'THERMAL_ZONES' in sections and sections['THERMAL_ZONES'].strip():
-                    thermal_zones = self._parse_thermal_zones(sections['THERMAL_ZONES'])
-                    if 'temperature_data' not in system_stats:
-                        system_stats['temperature_data'] = {}
-                    system_stats['temperature_data']['thermal_zones'] = thermal_zones
+                        except (ValueError, TypeError, IndexError) as err:
+                            _LOGGER.debug("Could not parse cache pool line '%s': %s", line, err)
 
-                # Parse boot usage
-                if 'BOOT_USAGE' in sections and sections['BOOT_USAGE'].strip():
+                # Store all cache pools
+                system_stats['cache_pools'] = cache_pools
+
+                # For backward compatibility, also store primary cache as 'cache_usage'
+                if 'cache' in cache_pools:
+                    system_stats['cache_usage'] = cache_pools['cache']
+                elif cache_pools:
+                    # If no 'cache' pool, use the first one found for backward compatibility
+                    first_pool = next(iter(cache_pools.values()))
+                    system_stats['cache_usage'] = first_pool
+                else:
+                    # No cache pools found
+                    system_stats['cache_usage'] = {
+                        "percentage": 0,
+                        "total": 0,
+                        "used": 0,
+                        "free": 0,
+                        "status": "not_mounted"
+                    }
+
+            # Parse log filesystem usage
+            if 'LOG_USAGE' in sections and sections['LOG_USAGE'].strip():
+                try:
+                    total, used, free, percentage = sections['LOG_USAGE'].strip().split()
+                    system_stats['log_filesystem'] = {
+                        "total": int(total) * 1024,
+                        "used": int(used) * 1024,
+                        "free": int(free) * 1024,
+                        "percentage": float(percentage.strip('%'))
+                    }
+                except (ValueError, TypeError):
+                    _LOGGER.debug("Could not parse log usage from output: %s", sections['LOG_USAGE'])
+
+            # Parse docker vdisk usage
+            if 'DOCKER_VDISK' in sections:
+                docker_output = sections['DOCKER_VDISK'].strip()
+                if docker_output == 'not_mounted':
+                    system_stats['docker_vdisk'] = {
+                        "percentage": 0,
+                        "total": 0,
+                        "used": 0,
+                        "free": 0
+                    }
+                else:
                     try:
-                        total, used, free = map(int, sections['BOOT_USAGE'].strip().split())
+                        total, used, free = map(int, docker_output.split())
                         percentage = (used / total) * 100 if total > 0 else 0
-                        system_stats['boot_usage'] = {
+                        system_stats['docker_vdisk'] = {
                             "percentage": float(round(percentage, 2)),
                             "total": total * 1024,  # Convert to bytes
                             "used": used * 1024,    # Convert to bytes
                             "free": free * 1024     # Convert to bytes
                         }
                     except (ValueError, TypeError):
-                        _LOGGER.debug("Could not parse boot usage from output: %s", sections['BOOT_USAGE'])
-
-                # Parse cache pools
-                if 'CACHE_POOLS' in sections:
-                    cache_pools_output = sections['CACHE_POOLS'].strip()
-                    cache_pools = {}
-
-                    if cache_pools_output:
-                        for line in cache_pools_output.splitlines():
-                            line = line.strip()
-                            if not line:
-                                continue
-
-                            try:
-                                # Format: pool_name:total:used:free:device:filesystem
-                                parts = line.split(':')
-                                if len(parts) >= 6:
-                                    pool_name, total_str, used_str, free_str, device, filesystem = parts[:6]
-
-                                    total = int(total_str)
-                                    used = int(used_str)
-                                    free = int(free_str)
-                                    percentage = (used / total) * 100 if total > 0 else 0
-
-                                    cache_pools[pool_name] = {
-                                        "percentage": float(round(percentage, 2)),
-                                        "total": total * 1024,  # Convert to bytes
-                                        "used": used * 1024,    # Convert to bytes
-                                        "free": free * 1024,    # Convert to bytes
-                                        "status": "mounted",
-                                        "device": device,
-                                        "filesystem": filesystem
-                                    }
-
-                                    _LOGGER.debug("Detected cache pool '%s': %.1f%% used, %s filesystem",
-                                                pool_name, percentage, filesystem)
-
-                            except (ValueError, TypeError, IndexError) as err:
-                                _LOGGER.debug("Could not parse cache pool line '%s': %s", line, err)
-
-                    # Store all cache pools
-                    system_stats['cache_pools'] = cache_pools
-
-                    # For backward compatibility, also store primary cache as 'cache_usage'
-                    if 'cache' in cache_pools:
-                        system_stats['cache_usage'] = cache_pools['cache']
-                    elif cache_pools:
-                        # If no 'cache' pool, use the first one found for backward compatibility
-                        first_pool = next(iter(cache_pools.values()))
-                        system_stats['cache_usage'] = first_pool
-                    else:
-                        # No cache pools found
-                        system_stats['cache_usage'] = {
-                            "percentage": 0,
-                            "total": 0,
-                            "used": 0,
-                            "free": 0,
-                            "status": "not_mounted"
-                        }
+                        _LOGGER.debug("Could not parse docker vdisk usage from output: %s", docker_output)
 
-                # Parse log filesystem usage
-                if 'LOG_USAGE' in sections and sections['LOG_USAGE'].strip():
-                    try:
-                        total, used, free, percentage = sections['LOG_USAGE'].strip().split()
-                        system_stats['log_filesystem'] = {
-                            "total": int(total) * 1024,
-                            "used": int(used) * 1024,
-                            "free": int(free) * 1024,
-                            "percentage": float(percentage.strip('%'))
-                        }
-                    except (ValueError, TypeError):
-                        _LOGGER.debug("Could not parse log usage from output: %s", sections['LOG_USAGE'])
+            # Intel GPU usage is streamed by IntelGPUSampler; only detect the device here
+            device_info = sections.get('INTEL_GPU_DEVICE', '').strip()
+            if device_info:
+                system_stats['intel_gpu_device'] = device_info
 
-                # Parse docker vdisk usage
-                if 'DOCKER_VDISK' in sections:
-                    docker_output = sections['DOCKER_VDISK'].strip()
-                    if docker_output == 'not_mounted':
-                        system_stats['docker_vdisk'] = {
-                            "percentage": 0,
-                            "total": 0,
-                            "used": 0,
-                            "free": 0
-                        }
-                    else:
-                        try:
-                            total, used, free = map(int, docker_output.split())
-                            percentage = (used / total) * 100 if total > 0 else 0
-                            system_stats['docker_vdisk'] = {
-                                "percentage": float(round(percentage, 2)),
-                                "total": total * 1024,  # Convert to bytes
-                                "used": used * 1024,    # Convert to bytes
-                                "free": free * 1024     # Convert to bytes
-                            }
-                        except (ValueError, TypeError):
-                            _LOGGER.debug("Could not parse docker vdisk usage from output: %s", docker_output)
-
-                # Parse Intel GPU data
-                if 'INTEL_GPU' in sections and 'GPU_DEVICE_INFO' in sections:
-                    gpu_output = sections['INTEL_GPU'].strip()
-                    device_info = sections['GPU_DEVICE_INFO'].strip()
-
-                    if gpu_output not in ('not_available', 'gpu_timeout', 'no_pci_device') and device_info != 'no_intel_gpu':
-                        intel_gpu_data = self._parse_intel_gpu_data(gpu_output, device_info)
-                        if intel_gpu_data:
-                            system_stats['intel_gpu'] = intel_gpu_data
-                            _LOGGER.debug("Successfully parsed Intel GPU data from batched command: %s", intel_gpu_data.get('model', 'Unknown'))
-                    else:
-                        _LOGGER.debug("Intel GPU not available or command failed: %s", gpu_output)
+        return system_stats
+
+    @with_error_handling(fallback_return={})
+    async def collect_system_stats(self) -> Dict[str, Any]:
+        """Collect system statistics using a single batched command."""
+        # Use a single command to collect all system statistics
+        _LOGGER.debug("Collecting system statistics with batched command")
+        result = await self.execute_command(self._build_system_stats_command())
+
+        if result.exit_status == 0:
+            system_stats = self._parse_system_stats_sections(split_sections(result.stdout))
 
             # Get UPS info separately as it's not part of the batched command
             system_stats['ups_info'] = await self.get_ups_info()
@@ -1580,6 +1533,21 @@ class SystemOperationsMixin(CommandExecutor):
         _LOGGER.warning("Batched system stats command failed with exit status %d", result.exit_status)
         return {}
 
+    def _build_array_state_stats(self, output: str) -> Dict[str, Any]:
+        """Build the system_stats array state summary from mdcmd status output."""
+        array_state = self._parse_array_state_from_output(output)
+        return {
+            "state": array_state.state,
+            "num_disks": array_state.num_disks,
+            "num_disabled": array_state.num_disabled,
+            "num_invalid": array_state.num_invalid,
+            "num_missing": array_state.num_missing,
+            "synced": array_state.synced,
+            "sync_action": array_state.sync_action,
+            "sync_progress": array_state.sync_progress,
+            "sync_errors": array_state.sync_errors,
+        }
+
     def _parse_array_state_from_output(self, output: str) -> ArrayState:
         """Parse array state from mdcmd output string."""
         try:
@@ -20,8 +20,7 @@ class UPSOperationsMixin:
     async def detect_ups(self) -> bool:
         """Attempt to detect if a UPS is connected."""
         try:
-            result = await self.execute_command("which apcaccess")
-            if result.exit_status == 0:
+            if await self.capabilities.has_tool("apcaccess"):
                 # apcaccess is installed, now check if it can communicate with a UPS
                 result = await self.execute_command("apcaccess status")
                 return result.exit_status == 0
@@ -38,26 +37,13 @@ class UPSOperationsMixin:
         try:
             _LOGGER.debug("Fetching UPS info")
             # Check if apcupsd is installed and running first
-            check_result = await self.execute_command(
-                "command -v apcaccess >/dev/null 2>&1 && "
-                "pgrep apcupsd >/dev/null 2>&1 && "
-                "echo 'running'"
-            )
-
-            if check_result.exit_status == 0 and "running" in check_result.stdout:
+            if (
+                await self.capabilities.has_tool("apcaccess")
+                and await self.capabilities.service_running("apcupsd")
+            ):
                 result = await self.execute_command("apcaccess -u 2>/dev/null")
                 if result.exit_status == 0:
-                    ups_data = {}
-                    for line in result.stdout.splitlines():
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            ups_data[key.strip()] = value.strip()
-                    
-                    # Add power factor info if not present
-                    if "POWERFACTOR" not in ups_data:
-                        ups_data["POWERFACTOR"] = str(UPS_DEFAULT_POWER_FACTOR)
-                    
-                    return ups_data
+                    return self._parse_ups_info_output(result.stdout)
 
             # If not installed or not running, return empty dict without error
             return {}
@@ -68,6 +54,30 @@ class UPSOperationsMixin:
             )
             return {}
 
+    def _build_ups_info_command(self) -> str:
+        """Build a command printing apcaccess output when apcupsd is running."""
+        return (
+            "if command -v apcaccess >/dev/null 2>&1 && pgrep apcupsd >/dev/null 2>&1; then "
+            "apcaccess -u 2>/dev/null; fi"
+        )
+
+    def _parse_ups_info_output(self, output: str) -> Dict[str, Any]:
+        """Parse `apcaccess -u` output into a dictionary."""
+        ups_data = {}
+        for line in output.splitlines():
+            if ':' in line:
+                key, value = line.split(':', 1)
+                ups_data[key.strip()] = value.strip()
+
+        if not ups_data:
+            return {}
+
+        # Add power factor info if not present
+        if "POWERFACTOR" not in ups_data:
+            ups_data["POWERFACTOR"] = str(UPS_DEFAULT_POWER_FACTOR)
+
+        return ups_data
+
     def _validate_ups_metric(self, metric: str, value: str) -> Any:
         """Validate and process UPS metric values.
         
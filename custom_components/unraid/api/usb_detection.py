@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import re
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 
 _LOGGER = logging.getLogger(__name__)
@@ -205,6 +205,16 @@ class USBFlashDriveDetector:
 
     async def _detect_boot_drive(self, device_path: str) -> Optional[Dict[str, Any]]:
         """Detect if USB device is the Unraid boot drive."""
+        # Assigned devices are answered by the disk registry; disks.ini lists the boot drive as 'flash'
+        identifier = self._instance.disk_mapper.find_by_device(device_path)
+        if identifier:
+            is_boot = identifier.name == "flash"
+            return {
+                "is_boot": is_boot,
+                "mount_point": "/boot" if is_boot else f"/mnt/{identifier.name}",
+                "filesystem": identifier.filesystem or ("vfat" if is_boot else "unknown"),
+            }
+
         try:
             # Check mount points for /boot
             cmd = "mount | grep -E '/boot|UNRAID' | head -5"
@@ -358,6 +368,21 @@ class USBFlashDriveDetector:
 
         return usb_devices
 
+    def export_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the cached detection results in a JSON-serializable form."""
+        return {path: asdict(info) for path, info in self._cache.items()}
+
+    def restore_cache(self, devices: Dict[str, Dict[str, Any]]) -> None:
+        """Restore detection results saved by export_cache."""
+        now = datetime.now()
+        for path, values in devices.items():
+            try:
+                self._cache[path] = USBDeviceInfo(**values)
+            except TypeError as err:
+                _LOGGER.debug("Ignoring stored USB detection for %s: %s", path, err)
+                continue
+            self._last_update[path] = now
+
     def clear_cache(self) -> None:
         """Clear the detection cache."""
         self._cache.clear()
@@ -16,45 +16,13 @@ class UserScriptOperationsMixin:
         try:
             _LOGGER.debug("Fetching user scripts with batched command")
             # Use a single command to check if plugin is installed and get script information
-            cmd = (
-                "if [ -d /boot/config/plugins/user.scripts/scripts ]; then "
-                "  for script in $(ls -1 /boot/config/plugins/user.scripts/scripts 2>/dev/null); do "
-                "    name=$(cat /boot/config/plugins/user.scripts/scripts/$script/name 2>/dev/null || echo $script); "
-                "    desc=$(cat /boot/config/plugins/user.scripts/scripts/$script/description 2>/dev/null || echo ''); "
-                "    echo \"$script|$name|$desc\"; "
-                "  done; "
-                "else "
-                "  echo 'not_installed'; "
-                "fi"
-            )
-
-            result = await self.execute_command(cmd)
+            result = await self.execute_command(self._build_user_scripts_command())
 
-            if result.exit_status != 0 or result.stdout.strip() == 'not_installed':
+            if result.exit_status != 0:
                 _LOGGER.debug("User scripts plugin not installed")
                 return []
 
-            scripts = []
-            for line in result.stdout.splitlines():
-                if not line.strip() or '|' not in line:
-                    continue
-
-                try:
-                    parts = line.split('|')
-                    if len(parts) >= 3:
-                        script_id = parts[0].strip()
-                        name = parts[1].strip()
-                        description = parts[2].strip()
-
-                        scripts.append({
-                            "id": script_id,
-                            "name": name,
-                            "description": description
-                        })
-                except Exception as err:
-                    _LOGGER.warning("Error parsing user script line '%s': %s", line, err)
-
-            return scripts
+            return self._parse_user_scripts_output(result.stdout)
 
         except Exception as err:
             _LOGGER.debug("Error getting user scripts (plugin might not be installed): %s", str(err))
@@ -65,6 +33,48 @@ class UserScriptOperationsMixin:
                 _LOGGER.error("Fallback user scripts method also failed: %s", fallback_err)
                 return []
 
+    def _build_user_scripts_command(self) -> str:
+        """Build a command listing user scripts with their name and description."""
+        return (
+            "if [ -d /boot/config/plugins/user.scripts/scripts ]; then "
+            "  for script in $(ls -1 /boot/config/plugins/user.scripts/scripts 2>/dev/null); do "
+            "    name=$(cat /boot/config/plugins/user.scripts/scripts/$script/name 2>/dev/null || echo $script); "
+            "    desc=$(cat /boot/config/plugins/user.scripts/scripts/$script/description 2>/dev/null || echo ''); "
+            "    echo \"$script|$name|$desc\"; "
+            "  done; "
+            "else "
+            "  echo 'not_installed'; "
+            "fi"
+        )
+
+    def _parse_user_scripts_output(self, output: str) -> List[Dict[str, Any]]:
+        """Parse the output of the user scripts listing command."""
+        if output.strip() == 'not_installed':
+            _LOGGER.debug("User scripts plugin not installed")
+            return []
+
+        scripts = []
+        for line in output.splitlines():
+            if not line.strip() or '|' not in line:
+                continue
+
+            try:
+                parts = line.split('|')
+                if len(parts) >= 3:
+                    script_id = parts[0].strip()
+                    name = parts[1].strip()
+                    description = parts[2].strip()
+
+                    scripts.append({
+                        "id": script_id,
+                        "name": name,
+                        "description": description
+                    })
+            except Exception as err:
+                _LOGGER.warning("Error parsing user script line '%s': %s", line, err)
+
+        return scripts
+
     async def _get_user_scripts_original(self) -> List[Dict[str, Any]]:
         """Original implementation of user scripts collection as fallback."""
         try:
@@ -75,7 +85,7 @@ class UserScriptOperationsMixin:
 
             if check_result.exit_status == 0 and "exists" in check_result.stdout:
                 result = await self.execute_command(
-                    "ls -1 /boot/config/plugins/user.scripts/scripts 2>/dev/null"
+                    "ls -1 /boot/config/plugins/user.scripts/scripts 2>/dev/null", coalesce=True
                 )
                 if result.exit_status == 0:
                     return [{"name": script.strip()} for script in result.stdout.splitlines()]
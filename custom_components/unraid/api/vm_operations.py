@@ -2,14 +2,49 @@
 from __future__ import annotations
 
 import logging
+import posixpath
 import shlex
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 
 import asyncio
 
+from .vm_stats import (
+    VIRSH_ACTIVE_STATS_COMMAND,
+    VIRSH_DOMSTATS_COMMAND,
+    VMStatsTracker,
+    domain_state,
+    parse_domstats,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
+# Persistent domain definitions, one <name>.xml per VM
+VM_XML_DIR = "/etc/libvirt/qemu"
+VM_XML_MARKER = "@@VMXML"
+
+LINUX_NAME_TERMS = (
+    'ubuntu', 'linux', 'debian', 'centos',
+    'fedora', 'rhel', 'suse', 'arch'
+)
+
+
+def _classify_vm_os(xml_text: str, vm_name: str) -> str:
+    """Guess the OS type of a VM from its XML OS details, then from its name."""
+    xml_lower = xml_text.lower()
+    if 'windows' in xml_lower or 'win' in xml_lower:
+        return 'windows'
+    if 'linux' in xml_lower:
+        return 'linux'
+
+    name_clean = vm_name.lower().replace('-', ' ').replace('_', ' ')
+    if any(term in name_clean for term in ['windows', 'win']):
+        return 'windows'
+    if any(term in name_clean for term in LINUX_NAME_TERMS):
+        return 'linux'
+    return 'unknown'
+
+
 class VMState(Enum):
     """VM states matching Unraid/libvirt states."""
     RUNNING = 'running'
@@ -37,34 +72,26 @@ class VMState(Enum):
 class VMOperationsMixin:
     """Mixin for VM-related operations."""
 
+    def __init__(self) -> None:
+        """Initialize VM operations."""
+        self._vm_stats = VMStatsTracker()
+        # VM name -> (XML file key, OS type), reused while the file is unchanged
+        self._vm_os_types: Dict[str, Tuple[str, str]] = {}
+
     async def check_libvirt_running(self) -> bool:
-        """Check if libvirt is running using multiple methods.
+        """Check if libvirt is running.
+
+        Uses the capability registry, which checks the rc.d script and falls
+        back to the libvirtd process and socket.
 
         Returns:
             bool: True if libvirt service is running, False otherwise.
         """
         try:
-            # Method 1: Traditional rc.d script check
-            service_check = await self.execute_command("/etc/rc.d/rc.libvirt status")
-            if service_check.exit_status == 0 and "is currently running" in service_check.stdout:
-                _LOGGER.debug("Libvirt validated through rc.d script")
-                return True
-
-            # Method 2: Process check
-            process_check = await self.execute_command("pgrep -f libvirtd")
-            if process_check.exit_status == 0:
-                # Method 3: Socket file check
-                sock_check = await self.execute_command("[ -S /var/run/libvirt/libvirt-sock ]")
-                if sock_check.exit_status == 0:
-                    _LOGGER.debug("Libvirt validated through process and socket checks")
-                    return True
-
-            _LOGGER.debug(
-                "Libvirt service checks failed - rc.d: %s, process: %s",
-                service_check.exit_status,
-                process_check.exit_status
-            )
-            return False
+            running = await self.capabilities.service_running("libvirt")
+            if not running:
+                _LOGGER.debug("Libvirt service checks failed")
+            return running
         except Exception as err:
             _LOGGER.debug("Error checking libvirt status: %s", str(err))
             return False
@@ -81,85 +108,13 @@ class VMOperationsMixin:
 
             # Collect VM information in a single command
             try:
-                # Use a more robust command that properly handles VM names with spaces and special characters
-                # We use a unique delimiter (§§§) that's unlikely to appear in VM names or XML data
-                cmd = (
-                    "if [ -x /etc/rc.d/rc.libvirt ] && /etc/rc.d/rc.libvirt status | grep -q 'is currently running'; then "
-                    "  virsh list --all --name | while IFS= read -r vm; do "
-                    "    if [ -n \"$vm\" ] && [ \"$vm\" != \" \" ]; then "
-                    "      state=$(virsh domstate \"$vm\" 2>/dev/null || echo 'unknown'); "
-                    "      info=$(virsh dominfo \"$vm\" 2>/dev/null); "
-                    "      cpus=$(echo \"$info\" | grep 'CPU(s)' | awk '{print $2}' | head -1); "
-                    "      mem=$(echo \"$info\" | grep 'Max memory' | sed 's/Max memory://g' | xargs | head -1); "
-                    "      xml=$(virsh dumpxml \"$vm\" 2>/dev/null | grep -A5 \"<os>\" | tr '\\n' ' '); "
-                    "      echo \"$vm§§§$state§§§$cpus§§§$mem§§§$xml\"; "
-                    "    fi; "
-                    "  done; "
-                    "else "
-                    "  echo 'libvirt_not_running'; "
-                    "fi"
-                )
-
-                result = await self.execute_command(cmd)
-
-                if result.exit_status != 0 or result.stdout.strip() == 'libvirt_not_running':
+                result = await self.execute_command(self._build_vm_list_command())
+
+                if result.exit_status != 0:
                     _LOGGER.debug("No VMs found or libvirt not running")
                     return []
 
-                vms = []
-                for line in result.stdout.splitlines():
-                    if not line.strip() or '§§§' not in line:
-                        continue
-
-                    try:
-                        # Split on our unique delimiter
-                        parts = line.split('§§§')
-                        if len(parts) >= 5:
-                            vm_name = parts[0].strip()
-                            status = VMState.parse(parts[1].strip())
-                            cpus = parts[2].strip() or '0'
-                            memory = parts[3].strip() or '0'
-                            xml_data = parts[4].strip()
-
-                            # Skip empty VM names (shouldn't happen but be safe)
-                            if not vm_name:
-                                _LOGGER.debug("Skipping VM with empty name")
-                                continue
-
-                            _LOGGER.debug("Processing VM: '%s' with status: '%s'", vm_name, status)
-
-                            # Determine OS type from XML data
-                            os_type = 'unknown'
-                            xml_lower = xml_data.lower()
-                            if 'windows' in xml_lower or 'win' in xml_lower:
-                                os_type = 'windows'
-                            elif 'linux' in xml_lower:
-                                os_type = 'linux'
-                            else:
-                                # Fallback to name-based detection
-                                name_lower = vm_name.lower()
-                                name_clean = name_lower.replace('-', ' ').replace('_', ' ')
-                                if any(term in name_clean for term in ['windows', 'win']):
-                                    os_type = 'windows'
-                                elif any(term in name_clean for term in [
-                                    'ubuntu', 'linux', 'debian', 'centos',
-                                    'fedora', 'rhel', 'suse', 'arch'
-                                ]):
-                                    os_type = 'linux'
-
-                            vms.append({
-                                "name": vm_name,
-                                "status": status,
-                                "os_type": os_type,
-                                "cpus": cpus,
-                                "memory": memory
-                            })
-                    except Exception as vm_err:
-                        _LOGGER.debug("Error processing VM line '%s': %s", line, str(vm_err))
-                        continue
-
-                _LOGGER.debug("Successfully processed %d VMs", len(vms))
-                return vms
+                return self._parse_vm_list_output(result.stdout)
 
             except Exception as virsh_err:
                 _LOGGER.debug("Error running batched VM command: %s", str(virsh_err))
@@ -170,10 +125,105 @@ class VMOperationsMixin:
             _LOGGER.debug("VM system appears to be disabled: %s", str(err))
             return []
 
+    def _build_vm_list_command(self) -> str:
+        """Build a command listing all VMs with state, CPUs, memory and OS info.
+
+        One `virsh domstats` call covers every domain. OS details are read
+        from the domain XML files, and only for files whose mtime, size or
+        inode changed since they were last classified.
+        """
+        known = " ".join(key for key, _ in self._vm_os_types.values())
+        return (
+            "if [ -x /etc/rc.d/rc.libvirt ] && /etc/rc.d/rc.libvirt status | grep -q 'is currently running'; then "
+            f"  {VIRSH_DOMSTATS_COMMAND}; "
+            f"  known=' {known} '; "
+            f"  for f in {VM_XML_DIR}/*.xml; do "
+            "    [ -f \"$f\" ] || continue; "
+            "    key=$(stat -c '%Y-%s-%i' \"$f\"); "
+            f"    echo \"{VM_XML_MARKER} $key $f\"; "
+            "    case \"$known\" in *\" $key \"*) ;; "
+            "      *) grep -e '<vmtemplate' -e '<os>' -A5 \"$f\" | tr '\\n' ' '; echo;; "
+            "    esac; "
+            "  done; "
+            "else "
+            "  echo 'libvirt_not_running'; "
+            "fi"
+        )
+
+    def _parse_vm_list_output(self, output: str) -> List[Dict[str, Any]]:
+        """Parse the output of the batched VM list command."""
+        if output.strip() == 'libvirt_not_running':
+            _LOGGER.debug("No VMs found or libvirt not running")
+            return []
+
+        # Domain stats come first, then one marker line per XML file
+        stats_lines: List[str] = []
+        xml_files: Dict[str, Tuple[str, str]] = {}
+        current: Optional[str] = None
+        for line in output.splitlines():
+            if line.startswith(f"{VM_XML_MARKER} "):
+                parts = line.split(" ", 2)
+                if len(parts) < 3:
+                    current = None
+                    continue
+                current = posixpath.basename(parts[2])
+                if current.endswith(".xml"):
+                    current = current[:-4]
+                xml_files[current] = (parts[1], "")
+            elif current is None:
+                stats_lines.append(line)
+            elif line.strip():
+                key, text = xml_files[current]
+                xml_files[current] = (key, f"{text} {line}")
+
+        # Reuse the classification of unchanged files
+        os_types: Dict[str, Tuple[str, str]] = {}
+        for vm_name, (key, text) in xml_files.items():
+            cached = self._vm_os_types.get(vm_name)
+            if not text and cached is not None and cached[0] == key:
+                os_types[vm_name] = cached
+            else:
+                os_types[vm_name] = (key, _classify_vm_os(text, vm_name))
+        self._vm_os_types = os_types
+
+        vms = []
+        for vm_name, stats in parse_domstats("\n".join(stats_lines)).items():
+            try:
+                status = VMState.parse(domain_state(stats))
+                _LOGGER.debug("Processing VM: '%s' with status: '%s'", vm_name, status)
+
+                if vm_name in os_types:
+                    os_type = os_types[vm_name][1]
+                else:
+                    os_type = _classify_vm_os("", vm_name)
+
+                max_memory = stats.get("balloon.maximum")
+                vms.append({
+                    "name": vm_name,
+                    "status": status,
+                    "os_type": os_type,
+                    "cpus": stats.get("vcpu.current") or stats.get("vcpu.maximum") or '0',
+                    "memory": f"{max_memory} KiB" if max_memory else '0'
+                })
+            except Exception as vm_err:
+                _LOGGER.debug("Error processing VM '%s': %s", vm_name, str(vm_err))
+                continue
+
+        _LOGGER.debug("Successfully processed %d VMs", len(vms))
+        return vms
+
+    def _build_vm_stats_command(self) -> str:
+        """Build the command sampling the counters of running VMs."""
+        return VIRSH_ACTIVE_STATS_COMMAND
+
+    def _parse_vm_stats_output(self, output: str) -> Dict[str, Dict[str, Any]]:
+        """Turn a domstats sample of running VMs into per-VM metrics."""
+        return self._vm_stats.update(parse_domstats(output))
+
     async def _get_vms_original(self) -> List[Dict[str, Any]]:
         """Original implementation of VM information collection as fallback."""
         try:
-            result = await self.execute_command("virsh list --all --name")
+            result = await self.execute_command("virsh list --all --name", coalesce=True)
             if result.exit_status != 0:
                 _LOGGER.debug("No VMs found")
                 return []
@@ -215,29 +265,8 @@ class VMOperationsMixin:
                 f'virsh dumpxml {escaped_name} | grep -A5 "<os>"'
             )
 
-            if xml_result.exit_status == 0:
-                xml_output = xml_result.stdout.lower()
-                if 'windows' in xml_output or 'win' in xml_output:
-                    return 'windows'
-                if 'linux' in xml_output:
-                    return 'linux'
-
-            # Check VM name patterns
-            name_lower = vm_name.lower()
-            name_clean = name_lower.replace('-', ' ').replace('_', ' ')
-
-            # Check for Windows indicators
-            if any(term in name_clean for term in ['windows', 'win']):
-                return 'windows'
-
-            # Check for Linux indicators
-            if any(term in name_clean for term in [
-                'ubuntu', 'linux', 'debian', 'centos',
-                'fedora', 'rhel', 'suse', 'arch'
-            ]):
-                return 'linux'
-
-            return 'unknown'
+            xml_output = xml_result.stdout if xml_result.exit_status == 0 else ""
+            return _classify_vm_os(xml_output, vm_name)
 
         except Exception as err:
             _LOGGER.debug(
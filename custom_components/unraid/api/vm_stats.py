@@ -0,0 +1,206 @@
+"""Per-VM statistics from `virsh domstats` counters."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# All domains, running or not, with what the VM list needs
+VIRSH_DOMSTATS_COMMAND = (
+    "virsh domstats --raw --list-active --list-inactive --state --vcpu --balloon"
+)
+
+# Running domains only, with the counters the per-VM sensors use. Skipped
+# without a libvirt socket so a stopped VM service costs no virsh call.
+VIRSH_ACTIVE_STATS_COMMAND = (
+    "[ -S /var/run/libvirt/libvirt-sock ] && "
+    "virsh domstats --raw --list-active --state --cpu-total --balloon --vcpu --interface --block"
+)
+
+# virDomainState values reported as state.state
+VIRSH_DOMAIN_STATES = {
+    0: "no state",
+    1: "running",
+    2: "idle",
+    3: "paused",
+    4: "in shutdown",
+    5: "shut off",
+    6: "crashed",
+    7: "pmsuspended",
+}
+
+
+def parse_domstats(output: str) -> Dict[str, Dict[str, str]]:
+    """Parse `virsh domstats` output into {domain: {field: value}}."""
+    domains: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+
+    for line in output.splitlines():
+        if line.startswith("Domain: "):
+            name = line[len("Domain: "):].strip()
+            if len(name) >= 2 and name[0] == name[-1] == "'":
+                name = name[1:-1]
+            current = domains.setdefault(name, {}) if name else None
+        elif current is not None and line.startswith((" ", "\t")) and "=" in line:
+            key, _, value = line.strip().partition("=")
+            current[key] = value
+
+    return domains
+
+
+def _int(stats: Dict[str, str], key: str) -> Optional[int]:
+    """Return an integer field, or None if missing or malformed."""
+    try:
+        return int(stats[key])
+    except (KeyError, ValueError):
+        return None
+
+
+def _sum_indexed(stats: Dict[str, str], group: str, field: str) -> int:
+    """Sum a counter over the numbered devices of a group (block.0, block.1, ...)."""
+    total = 0
+    for index in range(_int(stats, f"{group}.count") or 0):
+        total += _int(stats, f"{group}.{index}.{field}") or 0
+    return total
+
+
+@dataclass(frozen=True)
+class VMCounters:
+    """Cumulative counters of one domain."""
+    cpu_time_ns: int
+    block_read_bytes: int
+    block_write_bytes: int
+    net_rx_bytes: int
+    net_tx_bytes: int
+
+    @classmethod
+    def from_stats(cls, stats: Dict[str, str]) -> VMCounters:
+        """Build counters from parsed domstats fields."""
+        return cls(
+            cpu_time_ns=_int(stats, "cpu.time") or 0,
+            block_read_bytes=_sum_indexed(stats, "block", "rd.bytes"),
+            block_write_bytes=_sum_indexed(stats, "block", "wr.bytes"),
+            net_rx_bytes=_sum_indexed(stats, "net", "rx.bytes"),
+            net_tx_bytes=_sum_indexed(stats, "net", "tx.bytes"),
+        )
+
+    def went_back(self, previous: VMCounters) -> bool:
+        """Check if any counter is lower than before, as after a VM restart."""
+        return (
+            self.cpu_time_ns < previous.cpu_time_ns
+            or self.block_read_bytes < previous.block_read_bytes
+            or self.block_write_bytes < previous.block_write_bytes
+            or self.net_rx_bytes < previous.net_rx_bytes
+            or self.net_tx_bytes < previous.net_tx_bytes
+        )
+
+
+def domain_state(stats: Dict[str, str]) -> str:
+    """Return the virsh domstate name of a domain."""
+    state = _int(stats, "state.state")
+    if state is None:
+        return "unknown"
+    return VIRSH_DOMAIN_STATES.get(state, "unknown")
+
+
+def domain_memory(stats: Dict[str, str]) -> Tuple[Optional[int], Optional[int]]:
+    """Return (allocated, used) memory in bytes.
+
+    Used memory is what the guest reports through the balloon driver when
+    available, otherwise the host memory resident for the VM.
+    """
+    current = _int(stats, "balloon.current")
+    available = _int(stats, "balloon.available")
+    unused = _int(stats, "balloon.unused")
+    rss = _int(stats, "balloon.rss")
+
+    allocated = current * 1024 if current is not None else None
+    if available is not None and unused is not None and available >= unused:
+        used: Optional[int] = (available - unused) * 1024
+    elif rss is not None:
+        used = rss * 1024
+    else:
+        used = None
+    return allocated, used
+
+
+class VMStatsTracker:
+    """Turns successive domstats samples into per-VM rates.
+
+    The previous sample is kept per running VM. The first sample of a VM, and
+    the first after its counters went back (it was restarted), have nothing
+    to compare with and report no rates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._previous: Dict[str, Tuple[float, VMCounters]] = {}
+
+    def reset(self) -> None:
+        """Forget previous samples."""
+        self._previous = {}
+
+    def update(
+        self,
+        domains: Dict[str, Dict[str, str]],
+        now: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Record a sample and return the metrics of each domain."""
+        if now is None:
+            now = time.monotonic()
+
+        metrics: Dict[str, Dict[str, Any]] = {}
+        previous = self._previous
+        self._previous = {}
+
+        for name, stats in domains.items():
+            allocated, used = domain_memory(stats)
+            result: Dict[str, Any] = {
+                "memory_allocated": allocated,
+                "memory_used": used,
+                "cpu_time": None,
+                "cpu_usage": None,
+                "disk_read_rate": None,
+                "disk_write_rate": None,
+                "network_rx_rate": None,
+                "network_tx_rate": None,
+            }
+            metrics[name] = result
+
+            if domain_state(stats) != "running":
+                continue
+
+            counters = VMCounters.from_stats(stats)
+            result["cpu_time"] = round(counters.cpu_time_ns / 1e9, 2)
+            self._previous[name] = (now, counters)
+
+            last = previous.get(name)
+            if last is None:
+                continue
+            elapsed = now - last[0]
+            if elapsed <= 0 or counters.went_back(last[1]):
+                _LOGGER.debug("Counters of VM '%s' restarted, skipping rates", name)
+                continue
+
+            delta_cpu = counters.cpu_time_ns - last[1].cpu_time_ns
+            vcpus = _int(stats, "vcpu.current") or 1
+            result["cpu_usage"] = round(
+                min(max(delta_cpu / (elapsed * 1e9 * vcpus) * 100, 0.0), 100.0), 2
+            )
+            result["disk_read_rate"] = round(
+                (counters.block_read_bytes - last[1].block_read_bytes) / elapsed, 2
+            )
+            result["disk_write_rate"] = round(
+                (counters.block_write_bytes - last[1].block_write_bytes) / elapsed, 2
+            )
+            result["network_rx_rate"] = round(
+                (counters.net_rx_bytes - last[1].net_rx_bytes) / elapsed, 2
+            )
+            result["network_tx_rate"] = round(
+                (counters.net_tx_bytes - last[1].net_tx_bytes) / elapsed, 2
+            )
+
+        return metrics
@@ -0,0 +1,503 @@
+"""Parser for the state of all ZFS pools, read with one batched command."""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .disk_io import block_device_name
+from .network_stats import counter_delta
+from .snapshot_operations import split_sections
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTION_ZPOOL_LIST = "ZPOOL_LIST"
+SECTION_ZPOOL_STATUS = "ZPOOL_STATUS"
+SECTION_ZPOOL_IOSTAT = "ZPOOL_IOSTAT"
+SECTION_ZFS_ARC = "ZFS_ARC"
+
+ZFS_ARC_STATS_FILE = "/proc/spl/kstat/zfs/arcstats"
+
+# Printed as the pool list when the ZFS tools are missing
+ZFS_NOT_INSTALLED = "zfs_not_installed"
+
+# -H/-p: tab separated, exact numbers; -P: full /dev paths for devices.
+# iostat without an interval reports averages since each pool was imported.
+ZFS_STATE_COMMAND = (
+    f"echo '==={SECTION_ZPOOL_LIST}==='; "
+    "if command -v zpool >/dev/null 2>&1; then "
+    "zpool list -Hp -o name,size,alloc,free,frag,cap,health 2>/dev/null; "
+    f"else echo '{ZFS_NOT_INSTALLED}'; fi; "
+    f"echo '==={SECTION_ZPOOL_STATUS}==='; zpool status -P 2>/dev/null; "
+    f"echo '==={SECTION_ZPOOL_IOSTAT}==='; zpool iostat -HpvP 2>/dev/null; "
+    f"echo '==={SECTION_ZFS_ARC}==='; cat {ZFS_ARC_STATS_FILE} 2>/dev/null; "
+    "true"
+)
+
+# Top-level rows of the config tree that group vdevs instead of being one
+VDEV_GROUPS = ("logs", "cache", "spares", "special", "dedup")
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40, "P": 1 << 50}
+_SIZE_PATTERN = re.compile(r'^([\d.]+)([BKMGTP]?)$')
+
+_SCAN_ACTIVE = re.compile(r'^(scrub|resilver) (in progress|paused) since (.+)$')
+_SCAN_SCRUB_DONE = re.compile(r'^scrub repaired (\S+) in (\S+(?: days? \S+)?) with (\d+) errors on (.+)$')
+_SCAN_RESILVER_DONE = re.compile(r'^resilvered (\S+) in (\S+(?: days? \S+)?) with (\d+) errors on (.+)$')
+_SCAN_CANCELED = re.compile(r'^(scrub|resilver) canceled on (.+)$')
+_ISSUED_RATE = re.compile(r'issued at (\S+)/s')
+_SCANNED_RATE = re.compile(r'scanned at (\S+)/s')
+_ISSUED_AMOUNT = re.compile(r'(\S+)(?: / \S+)? issued')
+_TOTAL_AMOUNT = re.compile(r'(?:/ (\S+) issued|(\S+) total)')
+_PERCENT_DONE = re.compile(r'([\d.]+)% done')
+_TIME_TO_GO = re.compile(r'(?:(\d+) days? )?(\d+):(\d+):(\d+) to go')
+_DATA_ERRORS = re.compile(r'^(\d+) data errors')
+
+
+def parse_zfs_size(value: Optional[str]) -> Optional[int]:
+    """Convert a zpool size ("1.21G", "945M", "0B" or exact bytes) to bytes."""
+    if not value or value == "-":
+        return None
+    match = _SIZE_PATTERN.match(value.strip())
+    if not match:
+        return None
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Convert a zpool counter to int ('-' means not applicable)."""
+    if value is None or value == "-":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        # Error counters are abbreviated ("1.2K") without -p
+        return parse_zfs_size(value)
+
+
+@dataclass
+class ZFSScan:
+    """Last or current scrub/resilver of a pool, from the `scan:` lines."""
+    function: Optional[str] = None
+    state: str = "none"
+    started: Optional[str] = None
+    finished: Optional[str] = None
+    percent_done: Optional[float] = None
+    rate: Optional[int] = None
+    issued: Optional[int] = None
+    total: Optional[int] = None
+    seconds_to_go: Optional[int] = None
+    repaired: Optional[int] = None
+    errors: Optional[int] = None
+
+    @property
+    def in_progress(self) -> bool:
+        """Check if a scrub or resilver is running."""
+        return self.state == "in_progress"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the scan as published in system_stats.zfs_pools."""
+        return {
+            "function": self.function,
+            "state": self.state,
+            "started": self.started,
+            "finished": self.finished,
+            "percent_done": self.percent_done,
+            "rate": self.rate,
+            "issued": self.issued,
+            "total": self.total,
+            "seconds_to_go": self.seconds_to_go,
+            "repaired": self.repaired,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class ZFSVdevIO:
+    """Average I/O of a pool or vdev since import, from `zpool iostat`."""
+    read_ops: float = 0.0
+    write_ops: float = 0.0
+    read_bandwidth: float = 0.0
+    write_bandwidth: float = 0.0
+
+
+@dataclass
+class ZFSDevice:
+    """Leaf device of a pool from the `zpool status` config tree."""
+    path: str
+    state: str = "UNKNOWN"
+    vdev: Optional[str] = None
+    group: str = "data"
+    read_errors: int = 0
+    write_errors: int = 0
+    checksum_errors: int = 0
+    io: Optional[ZFSVdevIO] = None
+
+
+@dataclass
+class ZFSPool:
+    """A pool with its capacity, health, devices and scan state."""
+    name: str
+    size: int = 0
+    allocated: int = 0
+    free: int = 0
+    fragmentation: Optional[int] = None
+    capacity: int = 0
+    health: str = "UNKNOWN"
+    read_errors: int = 0
+    write_errors: int = 0
+    checksum_errors: int = 0
+    data_errors: int = 0
+    scan: ZFSScan = field(default_factory=ZFSScan)
+    devices: List[ZFSDevice] = field(default_factory=list)
+    vdev_io: Dict[str, ZFSVdevIO] = field(default_factory=dict)
+    io: Optional[ZFSVdevIO] = None
+
+    @property
+    def device_paths(self) -> List[str]:
+        """Return the /dev paths of the pool's devices, data vdevs first."""
+        return [device.path for device in self.devices]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the pool as published in system_stats.zfs_pools."""
+        return {
+            "name": self.name,
+            "size": self.size,
+            "alloc": self.allocated,
+            "free": self.free,
+            "fragmentation": self.fragmentation,
+            "capacity": self.capacity,
+            "health": self.health,
+            "read_errors": self.read_errors,
+            "write_errors": self.write_errors,
+            "checksum_errors": self.checksum_errors,
+            "data_errors": self.data_errors,
+            "devices": self.device_paths,
+            "scan": self.scan.as_dict(),
+            "io": vars(self.io).copy() if self.io else None,
+        }
+
+
+@dataclass
+class ZFSState:
+    """All pools plus an index from device path to pool."""
+    pools: Dict[str, ZFSPool] = field(default_factory=dict)
+    arc: Dict[str, int] = field(default_factory=dict)
+    _pools_by_device: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _pools_by_disk: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the device index."""
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the device -> pool index after changing pools."""
+        self._pools_by_device = {
+            device.path: pool.name
+            for pool in self.pools.values()
+            for device in pool.devices
+        }
+        self._pools_by_disk = {
+            disk: pool
+            for path, pool in self._pools_by_device.items()
+            if (disk := block_device_name(path))
+        }
+
+    def has_pool(self, name: str) -> bool:
+        """Check if a pool with this name is imported."""
+        return name in self.pools
+
+    def pool_devices(self, name: str) -> List[str]:
+        """Return the device paths of a pool, empty if it isn't imported."""
+        pool = self.pools.get(name)
+        return pool.device_paths if pool else []
+
+    def pool_for_device(self, device_path: str) -> Optional[str]:
+        """Return the pool a device (/dev path, whole disk or partition) belongs to."""
+        if device_path in self._pools_by_device:
+            return self._pools_by_device[device_path]
+        disk = block_device_name(device_path)
+        return self._pools_by_disk.get(disk) if disk else None
+
+    @property
+    def devices(self) -> List[str]:
+        """Return the device paths of all pools."""
+        return list(self._pools_by_device)
+
+
+def parse_zpool_list(content: str) -> Dict[str, ZFSPool]:
+    """Parse `zpool list -Hp -o name,size,alloc,free,frag,cap,health`."""
+    pools: Dict[str, ZFSPool] = {}
+    for line in content.splitlines():
+        parts = line.split("\t")
+        if len(parts) < 7:
+            continue
+        name, size, alloc, free, frag, cap, health = parts[:7]
+        pools[name] = ZFSPool(
+            name=name,
+            size=parse_zfs_size(size) or 0,
+            allocated=parse_zfs_size(alloc) or 0,
+            free=parse_zfs_size(free) or 0,
+            fragmentation=_to_int(frag.rstrip("%")),
+            capacity=_to_int(cap.rstrip("%")) or 0,
+            health=health,
+        )
+    return pools
+
+
+def _parse_seconds_to_go(text: str) -> Optional[int]:
+    """Parse "[N days ]HH:MM:SS to go" into seconds."""
+    match = _TIME_TO_GO.search(text)
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(value or 0) for value in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def _parse_scan(lines: List[str]) -> ZFSScan:
+    """Parse the `scan:` line of a pool and its continuation lines."""
+    scan = ZFSScan()
+    if not lines:
+        return scan
+
+    head = lines[0]
+    if match := _SCAN_ACTIVE.match(head):
+        scan.function = match.group(1)
+        scan.state = "in_progress" if match.group(2) == "in progress" else "paused"
+        scan.started = match.group(3)
+    elif match := _SCAN_SCRUB_DONE.match(head):
+        scan.function, scan.state = "scrub", "finished"
+        scan.repaired = parse_zfs_size(match.group(1))
+        scan.errors = int(match.group(3))
+        scan.finished = match.group(4)
+    elif match := _SCAN_RESILVER_DONE.match(head):
+        scan.function, scan.state = "resilver", "finished"
+        scan.repaired = parse_zfs_size(match.group(1))
+        scan.errors = int(match.group(3))
+        scan.finished = match.group(4)
+    elif match := _SCAN_CANCELED.match(head):
+        scan.function, scan.state = match.group(1), "canceled"
+        scan.finished = match.group(2)
+
+    details = " ".join(lines[1:])
+    if match := _ISSUED_RATE.search(details) or _SCANNED_RATE.search(details):
+        scan.rate = parse_zfs_size(match.group(1))
+    if match := _ISSUED_AMOUNT.search(details):
+        scan.issued = parse_zfs_size(match.group(1))
+    if match := _TOTAL_AMOUNT.search(details):
+        scan.total = parse_zfs_size(match.group(1) or match.group(2))
+    if match := _PERCENT_DONE.search(details):
+        scan.percent_done = float(match.group(1))
+    if scan.in_progress:
+        scan.seconds_to_go = _parse_seconds_to_go(details)
+    if match := re.search(r'(\S+) (?:repaired|resilvered),', details):
+        scan.repaired = parse_zfs_size(match.group(1))
+    return scan
+
+
+def _parse_config(pool: ZFSPool, lines: List[str]) -> None:
+    """Parse the config tree of a pool into its error counters and devices."""
+    group = "data"
+    vdev: Optional[str] = None
+    seen_pool = False
+
+    for line in lines:
+        body = line.lstrip("\t")
+        stripped = body.strip()
+        if not stripped or stripped.startswith("NAME "):
+            continue
+        depth = (len(body) - len(body.lstrip(" "))) // 2
+        parts = stripped.split()
+        name = parts[0]
+
+        if depth == 0:
+            if not seen_pool:
+                seen_pool = True
+                if len(parts) >= 5:
+                    pool.read_errors = _to_int(parts[2]) or 0
+                    pool.write_errors = _to_int(parts[3]) or 0
+                    pool.checksum_errors = _to_int(parts[4]) or 0
+            elif name in VDEV_GROUPS:
+                group, vdev = name, None
+            continue
+
+        if depth == 1:
+            vdev = name
+        if not name.startswith("/dev/"):
+            continue
+
+        device = ZFSDevice(
+            path=name,
+            state=parts[1] if len(parts) > 1 else "UNKNOWN",
+            vdev=vdev,
+            group=group,
+        )
+        if len(parts) >= 5:
+            device.read_errors = _to_int(parts[2]) or 0
+            device.write_errors = _to_int(parts[3]) or 0
+            device.checksum_errors = _to_int(parts[4]) or 0
+        pool.devices.append(device)
+
+
+def parse_zpool_status(content: str, pools: Dict[str, ZFSPool]) -> None:
+    """Fill in scan state, error counters and devices from `zpool status -P`.
+
+    Pools missing from `zpool list` (it raced with an export) are added with
+    what the status output tells about them.
+    """
+    pool: Optional[ZFSPool] = None
+    block: Optional[str] = None
+    scan_lines: List[str] = []
+    config_lines: List[str] = []
+
+    def finish() -> None:
+        if pool is not None:
+            pool.scan = _parse_scan(scan_lines)
+            _parse_config(pool, config_lines)
+
+    for line in content.splitlines():
+        key, sep, value = line.strip().partition(": ") if not line.startswith("\t") else ("", "", "")
+        if not sep and line.strip() in ("config:", "errors:"):
+            key, sep, value = line.strip()[:-1], ":", ""
+
+        if sep and key == "pool":
+            finish()
+            name = value.strip()
+            pool = pools.setdefault(name, ZFSPool(name=name))
+            block, scan_lines, config_lines = None, [], []
+            continue
+        if pool is None:
+            continue
+
+        if sep and key in ("state", "status", "action", "see", "scan", "config", "errors", "remove"):
+            block = key
+            if key == "state" and pool.health == "UNKNOWN":
+                pool.health = value.strip()
+            elif key == "scan":
+                scan_lines.append(value.strip())
+            elif key == "errors" and (match := _DATA_ERRORS.match(value.strip())):
+                pool.data_errors = int(match.group(1))
+            continue
+
+        if block == "scan":
+            scan_lines.append(line.strip())
+        elif block == "config":
+            config_lines.append(line)
+
+    finish()
+
+
+def parse_zpool_iostat(content: str, pools: Dict[str, ZFSPool]) -> None:
+    """Attach the per-pool and per-vdev averages from `zpool iostat -HpvP`."""
+    pool: Optional[ZFSPool] = None
+    for line in content.splitlines():
+        parts = [part.strip() for part in line.split("\t")]
+        if len(parts) < 7:
+            continue
+        name = parts[0]
+        try:
+            io = ZFSVdevIO(
+                read_ops=float(parts[3]),
+                write_ops=float(parts[4]),
+                read_bandwidth=float(parts[5]),
+                write_bandwidth=float(parts[6]),
+            )
+        except ValueError:
+            # Group rows (logs, cache, ...) have no values
+            continue
+
+        if name in pools:
+            pool = pools[name]
+            pool.io = io
+        elif pool is not None:
+            pool.vdev_io[name] = io
+
+    for pool in pools.values():
+        for device in pool.devices:
+            device.io = pool.vdev_io.get(device.path)
+
+
+def parse_arcstats(content: str) -> Dict[str, int]:
+    """Parse /proc/spl/kstat/zfs/arcstats into {name: value}."""
+    stats: Dict[str, int] = {}
+    for line in content.splitlines():
+        parts = line.split()
+        if len(parts) != 3 or not parts[2].isdigit():
+            continue
+        stats[parts[0]] = int(parts[2])
+    return stats
+
+
+def parse_zfs_sections(sections: Dict[str, str]) -> Optional[ZFSState]:
+    """Parse the sections of ZFS_STATE_COMMAND, None when ZFS is not installed."""
+    pool_list = sections.get(SECTION_ZPOOL_LIST, "")
+    if SECTION_ZPOOL_LIST not in sections or pool_list.strip() == ZFS_NOT_INSTALLED:
+        return None
+
+    pools = parse_zpool_list(pool_list)
+    parse_zpool_status(sections.get(SECTION_ZPOOL_STATUS, ""), pools)
+    parse_zpool_iostat(sections.get(SECTION_ZPOOL_IOSTAT, ""), pools)
+    return ZFSState(pools=pools, arc=parse_arcstats(sections.get(SECTION_ZFS_ARC, "")))
+
+
+def parse_zfs_state(output: str) -> Optional[ZFSState]:
+    """Parse the output of ZFS_STATE_COMMAND."""
+    return parse_zfs_sections(split_sections(output))
+
+
+async def read_zfs_state(
+    execute_command: Callable[[str], Awaitable[Any]]
+) -> Optional[ZFSState]:
+    """Read all pools with one command.
+
+    Returns None when the ZFS tools are not installed.
+    """
+    try:
+        result = await execute_command(ZFS_STATE_COMMAND)
+        state = parse_zfs_state(result.stdout or "")
+        if state is not None:
+            _LOGGER.debug(
+                "Read ZFS state: %d pools, %d devices", len(state.pools), len(state.devices)
+            )
+        return state
+
+    except Exception as err:
+        _LOGGER.debug("Error reading ZFS state: %s", err)
+        return None
+
+
+class ARCStatsTracker:
+    """Turns successive arcstats samples into the ARC hit rate."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._last: Optional[Dict[str, int]] = None
+
+    def reset(self) -> None:
+        """Forget the previous sample."""
+        self._last = None
+
+    def update(self, arc: Dict[str, int]) -> Dict[str, Any]:
+        """Record a sample and return ARC sizes and hit rate.
+
+        The first sample gives the hit rate since boot; later ones give it
+        over the interval since the previous sample.
+        """
+        if not arc:
+            return {}
+
+        hits, misses = arc.get("hits", 0), arc.get("misses", 0)
+        if self._last is not None:
+            hit_delta = counter_delta(self._last.get("hits", 0), hits)
+            miss_delta = counter_delta(self._last.get("misses", 0), misses)
+            if hit_delta is not None and miss_delta is not None:
+                hits, misses = hit_delta, miss_delta
+        self._last = arc
+
+        lookups = hits + misses
+        return {
+            "size": arc.get("size"),
+            "target_size": arc.get("c"),
+            "max_size": arc.get("c_max"),
+            "hit_rate": round(hits / lookups * 100, 2) if lookups else None,
+        }
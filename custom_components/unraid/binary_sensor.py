@@ -23,7 +23,7 @@ _LOGGER = logging.getLogger(__name__)
 async def _get_parity_info(coordinator: UnraidDataUpdateCoordinator) -> Optional[Dict[str, Any]]:
     """Get parity disk information from mdcmd status."""
     try:
-        result = await coordinator.api.execute_command("mdcmd status")
+        result = await coordinator.api.execute_command("mdcmd status", coalesce=True)
         if result.exit_status != 0:
             return None
 
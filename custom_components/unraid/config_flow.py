@@ -40,6 +40,10 @@ from .const import (
     DISK_INTERVAL_OPTIONS,
     GENERAL_INTERVAL_OPTIONS,
     CONF_HAS_UPS,
+    CONF_PERSISTENT_SHELL,
+    DEFAULT_PERSISTENT_SHELL,
+    CONF_EVENT_UPDATES,
+    DEFAULT_EVENT_UPDATES,
     MIGRATION_VERSION,
 )
 from .unraid import UnraidAPI
@@ -345,6 +349,12 @@ class UnraidOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_HAS_UPS,
             config_entry.data.get(CONF_HAS_UPS, False)
         )
+        self._persistent_shell = config_entry.options.get(
+            CONF_PERSISTENT_SHELL, DEFAULT_PERSISTENT_SHELL
+        )
+        self._event_updates = config_entry.options.get(
+            CONF_EVENT_UPDATES, DEFAULT_EVENT_UPDATES
+        )
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -358,6 +368,8 @@ class UnraidOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_GENERAL_INTERVAL: user_input[CONF_GENERAL_INTERVAL],
                     CONF_DISK_INTERVAL: user_input[CONF_DISK_INTERVAL],
                     CONF_HAS_UPS: user_input[CONF_HAS_UPS],
+                    CONF_PERSISTENT_SHELL: user_input[CONF_PERSISTENT_SHELL],
+                    CONF_EVENT_UPDATES: user_input[CONF_EVENT_UPDATES],
                 },
             )
 
@@ -383,6 +395,14 @@ class UnraidOptionsFlowHandler(config_entries.OptionsFlow):
                 default=self._disk_interval
             ): vol.In(disk_interval_options),
             vol.Required(CONF_HAS_UPS, default=self._has_ups): bool,
+            vol.Required(
+                CONF_PERSISTENT_SHELL,
+                default=self._persistent_shell
+            ): bool,
+            vol.Required(
+                CONF_EVENT_UPDATES,
+                default=self._event_updates
+            ): bool,
         })
 
         return self.async_show_form(
@@ -31,6 +31,8 @@ MIN_DISK_INTERVAL_MINUTES = 5    # minutes
 MAX_DISK_INTERVAL_HOURS = 24     # hours
 DEFAULT_GENERAL_INTERVAL = 5     # minutes
 DEFAULT_DISK_INTERVAL = 60       # minutes (1 hour)
+DEFAULT_PERSISTENT_SHELL = False
+DEFAULT_EVENT_UPDATES = False
 
 # General update interval options in minutes
 GENERAL_INTERVAL_OPTIONS = [
@@ -66,10 +68,16 @@ UPDATE_FAILED_RETRY_DELAY: Final = 30  # seconds
 MAX_FAILED_UPDATE_COUNT: Final = 3
 MAX_UPDATE_METRICS_HISTORY: Final = 10
 
+# Event-driven updates
+EVENT_DEBOUNCE_SECONDS: Final = 2  # Wait for bursts of server events to settle
+EVENT_MIN_REFRESH_INTERVAL: Final = 10  # Minimum seconds between event-driven refreshes
+
 # Configuration and options
 CONF_GENERAL_INTERVAL = "general_interval"
 CONF_DISK_INTERVAL = "disk_interval"
 CONF_HAS_UPS = "has_ups"
+CONF_PERSISTENT_SHELL = "persistent_shell"
+CONF_EVENT_UPDATES = "event_updates"
 CONF_HOST = "host"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
@@ -81,6 +89,7 @@ PLATFORMS = [
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.BUTTON,
+    Platform.IMAGE,
 ]
 
 # Signals
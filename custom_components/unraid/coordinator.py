@@ -7,7 +7,9 @@ import hashlib
 import json
 import time
 import gc
-from typing import Any, Dict, Optional, List, Set, cast
+from functools import partial
+from collections.abc import Mapping
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Set, Tuple, cast
 
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
@@ -32,13 +34,36 @@ from .const import (
     DEFAULT_GENERAL_INTERVAL,
     DEFAULT_DISK_INTERVAL,
     CONF_HAS_UPS,
+    CONF_EVENT_UPDATES,
+    DEFAULT_EVENT_UPDATES,
+    EVENT_DEBOUNCE_SECONDS,
+    EVENT_MIN_REFRESH_INTERVAL,
 )
 from .unraid import UnraidAPI
-from .helpers import parse_speed_string
-from .api.disk_mapper import DiskMapper
+from .api.disk_io import disk_io_by_name
 from .api.cache_manager import CacheManager, CacheItemPriority
 from .api.sensor_priority import SensorPriorityManager, SensorPriority, SensorCategory
 from .api.logging_helper import LogManager
+from .api.event_watcher import (
+    RemoteEventWatcher,
+    UnraidEvent,
+    EVENT_SLICE_ARRAY,
+    EVENT_SLICE_DISKS,
+    EVENT_SLICE_DOCKER,
+    EVENT_SLICE_VMS,
+)
+from .api.gpu_sampler import IntelGPUSampler
+from .api.sync_progress import SYNC_POLL_INTERVAL
+from .host_facts import HostFactsStore, HOST_IDENTITY_COMMAND, parse_host_identity
+from .docker_icons import DockerIconCache
+from .parity_history import ParityHistory
+from .api.snapshot_operations import (
+    SECTION_PARITY_HISTORY,
+    SECTION_PARITY_LOG_STAT,
+    parity_history_command,
+    split_sections,
+)
+from .models import build_snapshot, diff_snapshots
 from .types import UnraidDataDict, SystemStatsDict, DockerContainerDict, VMDict, UserScriptDict
 
 _LOGGER = logging.getLogger(__name__)
@@ -95,9 +120,14 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
         self._disk_mapping: Dict[str, str] = {}
         self._previous_disk_mapping: Dict[str, str] = {}
         self._last_disk_config_hash: Optional[str] = None
+        # system_stats.disk_mapping, reused while the disk configuration hash holds
+        self._disk_mapping_entries: Dict[str, Dict[str, Any]] = {}
         self._last_valid_mapping: Optional[Dict[str, str]] = None
         self._mapping_error_count: int = 0
 
+        # Parsed parity check log, extended with newly appended lines only
+        self._parity_history = ParityHistory()
+
         # State management
         self._busy = False
         self._closed = False
@@ -160,10 +190,56 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             "smart_data": 300,     # 5 minutes - reduced from 30 min, but use specific keys above
         }
 
+        # Sections served stale while refreshed in the background, with how
+        # long past their TTL they stay servable
+        self._stale_ttls = {
+            "vms": 600,                # 10 minutes
+            "docker_containers": 600,  # 10 minutes
+            "user_scripts": 3600,      # 1 hour
+            "parity_schedule": 86400,  # 1 day
+        }
+        self._section_refreshers: Dict[str, Callable[[], Awaitable[Any]]] = {
+            "vms": partial(
+                self._async_refresh_section,
+                api._build_vm_list_command,
+                api._parse_vm_list_output,
+            ),
+            "docker_containers": api.list_docker_containers,
+            "user_scripts": partial(
+                self._async_refresh_section,
+                api._build_user_scripts_command,
+                api._parse_user_scripts_output,
+            ),
+            "parity_schedule": self._parse_parity_schedule,
+        }
+
         # Resource monitoring
         self._last_memory_check = dt_util.utcnow()
         self._memory_warning_emitted = False
 
+        # Event-driven updates (opt-in)
+        self._event_updates = entry.options.get(CONF_EVENT_UPDATES, DEFAULT_EVENT_UPDATES)
+        self._event_watcher: Optional[RemoteEventWatcher] = None
+        self._pending_event_slices: Set[str] = set()
+        self._event_refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._event_refresh_lock = asyncio.Lock()
+        self._last_event_refresh = 0.0
+
+        # Progress sampling between updates while a parity check or rebuild runs
+        self._sync_poll_handle: Optional[asyncio.TimerHandle] = None
+
+        # Static host facts persisted across restarts within a server boot
+        self._host_facts = HostFactsStore(hass, entry.entry_id)
+
+        # Container icons, fetched only when an image entity is displayed
+        self.docker_icons = DockerIconCache(hass, api, entry.entry_id)
+
+        # Intel GPU sampler, started once a device is detected
+        self._gpu_sampler: Optional[IntelGPUSampler] = None
+
+        # Snapshot keys that changed in the last published update (None: all)
+        self._changed_keys: Optional[Set[str]] = None
+
         # Initialize parent class
         super().__init__(
             hass,
@@ -204,6 +280,24 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
         next_update = self._last_disk_update + self._disk_update_interval
         return dt_util.utcnow() >= next_update
 
+    @callback
+    def has_changed(self, keys: Optional[Tuple[str, ...]]) -> bool:
+        """Check if any of the given snapshot keys changed in the last update.
+
+        Entities without declared keys (None) are always considered changed.
+        """
+        if keys is None or self._changed_keys is None:
+            return True
+        return any(key in self._changed_keys for key in keys)
+
+    def _build_published_snapshot(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the snapshot to publish and record which keys changed."""
+        snapshot = build_snapshot(data)
+        self._changed_keys = diff_snapshots(self.data, snapshot)
+        if self._changed_keys is not None:
+            _LOGGER.debug("Changed snapshot keys: %s", ", ".join(sorted(self._changed_keys)) or "none")
+        return snapshot
+
     @callback
     def async_get_last_disk_update(self) -> datetime | None:
         """Get the timestamp of the last successful disk update."""
@@ -217,8 +311,208 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
     async def async_stop(self) -> None:
         """Stop the coordinator and cleanup resources."""
         self._closed = True
+        if self._event_refresh_handle is not None:
+            self._event_refresh_handle.cancel()
+            self._event_refresh_handle = None
+        if self._sync_poll_handle is not None:
+            self._sync_poll_handle.cancel()
+            self._sync_poll_handle = None
+        # Each background component is released on its own so one failing
+        # stop can't leak the others (this also runs when setup fails)
+        watcher, self._event_watcher = self._event_watcher, None
+        sampler, self._gpu_sampler = self._gpu_sampler, None
+        for name, component in (("event watcher", watcher), ("GPU sampler", sampler)):
+            if component is None:
+                continue
+            try:
+                await component.stop()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error stopping %s: %s", name, err)
+        try:
+            await self._cache_manager.async_cancel_refreshes()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Error cancelling cache refreshes: %s", err)
+        try:
+            self._host_facts.update(self.api.export_host_facts())
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Error saving host facts: %s", err)
         await self.async_unload()
 
+    @callback
+    def async_start_event_watcher(self) -> None:
+        """Start streaming change notifications from the server if enabled."""
+        if not self._event_updates or self._event_watcher is not None:
+            return
+        self._event_watcher = RemoteEventWatcher(self.api, self._handle_remote_event)
+        self._event_watcher.start()
+
+    def _update_intel_gpu(self, system_stats: SystemStatsDict) -> None:
+        """Publish the latest Intel GPU sample window, starting the sampler if needed."""
+        device_info = system_stats.pop("intel_gpu_device", None)
+        if not device_info or self._closed:
+            return
+        if self._gpu_sampler is None:
+            self._gpu_sampler = IntelGPUSampler(self.api, device_info)
+        if not self._gpu_sampler.supported:
+            return
+        if not self._gpu_sampler.is_running:
+            self._gpu_sampler.start()
+        system_stats["intel_gpu"] = self._gpu_sampler.get_data()
+
+    @callback
+    def _handle_remote_event(self, event: UnraidEvent) -> None:
+        """Queue a refresh of the data slice affected by a server event."""
+        _LOGGER.debug(
+            "Server event: %s %s (%s)",
+            event.slice,
+            event.target or "",
+            event.source
+        )
+        self._pending_event_slices.add(event.slice)
+        self._schedule_event_refresh()
+
+    @callback
+    def _schedule_event_refresh(self) -> None:
+        """Schedule a debounced, rate-limited refresh of pending slices."""
+        if self._event_refresh_handle is not None or self._closed:
+            return
+        delay = max(
+            EVENT_DEBOUNCE_SECONDS,
+            self._last_event_refresh + EVENT_MIN_REFRESH_INTERVAL - time.monotonic()
+        )
+        self._event_refresh_handle = self.hass.loop.call_later(
+            delay, self._start_event_refresh
+        )
+
+    @callback
+    def _start_event_refresh(self) -> None:
+        """Start refreshing pending slices."""
+        self._event_refresh_handle = None
+        self.hass.async_create_task(self._async_refresh_event_slices())
+
+    async def _async_refresh_event_slices(self) -> None:
+        """Refresh only the data slices touched by server events."""
+        if not self.data or self._closed:
+            return
+
+        async with self._event_refresh_lock:
+            slices, self._pending_event_slices = self._pending_event_slices, set()
+            if not slices:
+                return
+            self._last_event_refresh = time.monotonic()
+            _LOGGER.debug("Refreshing after server events: %s", ", ".join(sorted(slices)))
+
+            data = cast(UnraidDataDict, dict(self.data))
+            system_stats = cast(SystemStatsDict, dict(data.get("system_stats", {})))
+
+            try:
+                async with self.api:
+                    if EVENT_SLICE_ARRAY in slices:
+                        result = await self.api.execute_command("mdcmd status", coalesce=True)
+                        if result.exit_status == 0:
+                            system_stats["array_state"] = self.api._build_array_state_stats(result.stdout)
+                            array_state = await self._get_array_state(result.stdout)
+                            if array_state:
+                                data["array_state"] = array_state
+
+                    if EVENT_SLICE_DISKS in slices:
+                        system_stats = await self._async_update_disk_data(system_stats)
+                        system_stats = await self._async_update_disk_mapping(system_stats)
+                        await self._update_disk_mappings(data)
+
+                    if EVENT_SLICE_DOCKER in slices:
+                        containers = await self.api.get_docker_containers()
+                        data["docker_containers"] = cast(List[DockerContainerDict], containers)
+                        self._cache_manager.set(
+                            self._get_cache_key("docker_containers"),
+                            containers,
+                            ttl=300,
+                            priority=CacheItemPriority.MEDIUM,
+                            stale_ttl=self._stale_ttls["docker_containers"],
+                            refresh=self._section_refreshers["docker_containers"]
+                        )
+                        for container in containers:
+                            self._sensor_manager.record_update(
+                                f"docker_{container.get('name', 'unknown')}",
+                                container.get("state")
+                            )
+
+                    if EVENT_SLICE_VMS in slices:
+                        vms = await self.api.get_vms()
+                        data["vms"] = cast(List[VMDict], vms)
+                        self._cache_manager.set(
+                            self._get_cache_key("vms"),
+                            vms,
+                            ttl=300,
+                            priority=CacheItemPriority.MEDIUM,
+                            stale_ttl=self._stale_ttls["vms"],
+                            refresh=self._section_refreshers["vms"]
+                        )
+                        for vm in vms:
+                            self._sensor_manager.record_update(
+                                f"vm_{vm.get('name', 'unknown')}",
+                                vm.get("state")
+                            )
+
+            except Exception as err:
+                _LOGGER.warning(
+                    "Error refreshing %s after server event: %s",
+                    ", ".join(sorted(slices)),
+                    err
+                )
+                return
+
+            data["system_stats"] = system_stats
+            self.async_set_updated_data(self._build_published_snapshot(data))
+
+        # Events that arrived while refreshing
+        if self._pending_event_slices:
+            self._schedule_event_refresh()
+
+    @callback
+    def _schedule_sync_poll(self) -> None:
+        """Sample sync progress before the next update while a sync is running."""
+        if self._sync_poll_handle is not None or self._closed or not self.api.sync_active:
+            return
+        self._sync_poll_handle = self.hass.loop.call_later(
+            SYNC_POLL_INTERVAL, self._start_sync_poll
+        )
+
+    @callback
+    def _start_sync_poll(self) -> None:
+        """Start sampling sync progress."""
+        self._sync_poll_handle = None
+        self.hass.async_create_task(self._async_poll_sync_progress())
+
+    async def _async_poll_sync_progress(self) -> None:
+        """Publish fresh sync progress from the resync counters alone."""
+        if not self.data or self._closed:
+            return
+
+        try:
+            async with self.api:
+                sync_progress = await self.api.sample_sync_progress()
+        except Exception as err:
+            _LOGGER.debug("Error sampling sync progress: %s", err)
+            self._schedule_sync_poll()
+            return
+
+        if sync_progress is None:
+            # Finished; a full update picks up the final state and the new log entry
+            _LOGGER.debug("Sync finished, refreshing")
+            await self.async_request_refresh()
+            return
+
+        data = cast(UnraidDataDict, dict(self.data))
+        array_state = dict(data.get("array_state") or {})
+        array_state["sync_progress"] = sync_progress
+        data["array_state"] = array_state
+
+        # Not async_set_updated_data: that would push back the regular update
+        self.data = self._build_published_snapshot(data)
+        self.async_update_listeners()
+        self._schedule_sync_poll()
+
     async def async_unload(self) -> None:
         """Unload the coordinator and cleanup all resources."""
         try:
@@ -244,7 +538,8 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             disk_config.append({
                 "name": disk.get("name"),
                 "mount_point": disk.get("mount_point"),
-                "device": disk.get("device")
+                "device": disk.get("device"),
+                "serial": disk.get("serial"),
             })
 
         config_str = json.dumps(disk_config, sort_keys=True)
@@ -279,25 +574,35 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
         return True
 
     async def _async_update_disk_mapping(self, system_stats: dict) -> dict:
-        """Update disk mapping data using the DiskMapper class."""
+        """Update disk mapping data, rebuilding it only when the disk configuration changed."""
         try:
             if "individual_disks" not in system_stats:
                 return system_stats
 
-            # Create a DiskMapper instance
-            disk_mapper = DiskMapper(self.api.execute_command)
-
-            # Convert system_stats disk data to the format expected by DiskMapper
-            disk_mapping = {}
-            for disk in system_stats.get("individual_disks", []):
-                name = disk.get("name", "")
-                if name:
-                    disk_mapping[name] = {
-                        "device": disk.get("device", ""),
-                        "serial": disk.get("serial", ""),
-                        "name": name
-                    }
-
+            disk_mapper = self.api.disk_mapper
+
+            config_hash = self._get_disk_config_hash(system_stats)
+            if config_hash != self._last_disk_config_hash:
+                disk_mapping = {}
+                for disk in system_stats.get("individual_disks", []):
+                    name = disk.get("name", "")
+                    if name:
+                        disk_mapping[name] = {
+                            "device": disk.get("device", ""),
+                            "serial": disk.get("serial", ""),
+                            "name": name
+                        }
+
+                new_mapping = {name: entry["device"] for name, entry in disk_mapping.items()}
+                if self._verify_disk_mapping(self._disk_mapping, new_mapping):
+                    self._last_valid_mapping = new_mapping
+                self._previous_disk_mapping = self._disk_mapping
+                self._disk_mapping = new_mapping
+                self._disk_mapping_entries = disk_mapping
+                self._last_disk_config_hash = config_hash
+                _LOGGER.debug("Disk configuration changed, rebuilt mapping for %d disks", len(disk_mapping))
+
+            disk_mapping = self._disk_mapping_entries
             system_stats["disk_mapping"] = disk_mapping
 
             # Add formatted disk info for each mapped disk
@@ -314,36 +619,16 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             return system_stats
 
     async def _update_disk_mappings(self, data: dict) -> None:
-        """Update disk mappings with comprehensive information using DiskMapper."""
+        """Publish disk mappings from the shared disk registry."""
         try:
-            # Create a DiskMapper instance
-            disk_mapper = DiskMapper(self.api.execute_command)
-
-            # Only update if we don't already have valid mappings
-            if not data.get("disk_mappings"):
-                # Get disk identifiers from DiskMapper
-                disk_identifiers = await disk_mapper.refresh_mappings()
-
-                # Convert DiskIdentifier objects to dictionaries for backward compatibility
-                mappings = {}
-                for disk_name, identifier in disk_identifiers.items():
-                    mappings[disk_name] = {
-                        "name": disk_name,
-                        "device": identifier.device or "",
-                        "serial": identifier.serial or "",
-                        "status": identifier.status,
-                        "filesystem": identifier.filesystem or "",
-                        "spindown_delay": identifier.spindown_delay
-                    }
-
-                if mappings:
-                    data["disk_mappings"] = mappings
-                    _LOGGER.debug(
-                        "Updated disk mappings for %d disks using DiskMapper",
-                        len(mappings)
-                    )
-                else:
-                    _LOGGER.debug("No disk mappings available from DiskMapper")
+            # The registry reads disks.ini only until it has been populated once
+            await self.api.disk_mapper.get_all_disks()
+            mappings = self.api.disk_mapper.as_mappings()
+
+            if mappings:
+                data["disk_mappings"] = mappings
+            else:
+                _LOGGER.debug("No disk mappings available from DiskMapper")
         except Exception as err:
             _LOGGER.warning("Error updating disk mappings: %s", err)
             # Don't let mapping errors affect other data
@@ -431,7 +716,12 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                 )
 
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from Unraid."""
+        """Fetch data from Unraid.
+
+        Everything needed for a tick is collected with a single snapshot command.
+        Sections whose sensors are not due are served from the cache and left out
+        of the remote script. Disk usage is only refreshed on the disk interval.
+        """
         try:
             # Check memory usage periodically - don't update if we're over limit
             await self._check_memory_usage()
@@ -444,170 +734,29 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                 cache_misses = 0
                 start_time = time.time()
 
-                # Get hostname from cache or fetch from Unraid server
-                hostname_key = self._get_cache_key("hostname")
-                hostname = self._cache_manager.get(hostname_key)
-
-                if hostname:
-                    data["hostname"] = hostname
-                    _LOGGER.debug("Using cached hostname: %s", hostname)
-                else:
-                    try:
-                        hostname = await self.api.get_hostname()
-                        if hostname:
-                            data["hostname"] = hostname
-                            # Cache the hostname
-                            self._cache_manager.set(
-                                hostname_key,
-                                hostname,
-                                ttl=86400,  # 24 hours - hostname rarely changes
-                                priority=CacheItemPriority.CRITICAL
-                            )
-                            _LOGGER.debug("Retrieved hostname from Unraid server: %s", hostname)
-                    except Exception as err:
-                        _LOGGER.debug("Error getting hostname from Unraid server: %s", err)
-
                 # Track what data is needed based on sensor priorities
                 # Check if self.async_contexts exists before calling len()
                 has_contexts = hasattr(self, 'async_contexts') and self.async_contexts is not None
                 critical_update = bool(self._update_requested_sensors) or (has_contexts and bool(self.async_contexts))
 
-                # Step 1: Update core system stats (Always run)
-                try:
-                    # Get base system stats first
-                    _LOGGER.debug("Fetching system stats...")
-
-                    # Try to get system stats from cache first
-                    system_stats_key = self._get_cache_key("system_stats")
-                    system_stats: Optional[SystemStatsDict] = None
-
-                    if critical_update:
-                        # Force update if specifically requested
-                        system_stats = await self.api.get_system_stats()
-                        cache_misses += 1
-
-                        # Cache the result for future use
-                        if system_stats:
-                            self._cache_manager.set(
-                                system_stats_key,
-                                system_stats,
-                                ttl=self._cache_ttls["system_stats"],
-                                priority=CacheItemPriority.HIGH
-                            )
-                    else:
-                        # Get from cache with fallback to API call
-                        system_stats = self._cache_manager.get(system_stats_key)
-
-                        if system_stats:
-                            cache_hits += 1
-                            _LOGGER.debug("Using cached system stats")
-                        else:
-                            system_stats = await self.api.get_system_stats()
-                            cache_misses += 1
-
-                            # Cache the result
-                            if system_stats:
-                                self._cache_manager.set(
-                                    system_stats_key,
-                                    system_stats,
-                                    ttl=self._cache_ttls["system_stats"],
-                                    priority=CacheItemPriority.HIGH
-                                )
-
-                    if system_stats:
-                        # Add CPU info with caching
-                        cpu_info_key = self._get_cache_key("cpu_info")
-
-                        # CPU info is volatile - cache for shorter period
-                        cpu_info = None
-                        if not critical_update:
-                            cpu_info = self._cache_manager.get(cpu_info_key)
-                            if cpu_info:
-                                cache_hits += 1
-
-                        if not cpu_info:
-                            cpu_info = {}
-                            # Get CPU info from system stats if needed
-                            system_stats_data = await self.api.get_system_stats()
-                            if system_stats_data and "cpu_info" in system_stats_data:
-                                cpu_info = system_stats_data.get("cpu_info", {})
-                            cache_misses += 1
-
-                            if cpu_info:
-                                self._cache_manager.set(
-                                    cpu_info_key,
-                                    cpu_info,
-                                    ttl=self._cache_ttls["cpu_info"],
-                                    priority=CacheItemPriority.HIGH
-                                )
-
-                        if cpu_info:
-                            system_stats.update(cpu_info)
-
-                        data["system_stats"] = system_stats
-                except (ConnectionError, TimeoutError, OSError, ValueError) as err:
-                    _LOGGER.error("Error getting system stats: %s", err)
-                    data["system_stats"] = {}
-
-                # Get array state and parity info - always critical
-                array_state_key = self._get_cache_key("array_state")
-                array_state = None
-
-                # Array state is critical - shorter cache or force update if needed
-                if critical_update:
-                    array_state = await self._get_array_state()
-                    cache_misses += 1
-
-                    # Cache for very short period (it's important)
-                    if array_state:
-                        self._cache_manager.set(
-                            array_state_key,
-                            array_state,
-                            ttl=30,  # 30 second cache for array state
-                            priority=CacheItemPriority.CRITICAL
-                        )
-                else:
-                    # Try cache first
-                    array_state = self._cache_manager.get(array_state_key)
-                    if array_state:
-                        cache_hits += 1
-                    else:
-                        array_state = await self._get_array_state()
-                        cache_misses += 1
-
-                        if array_state:
-                            self._cache_manager.set(
-                                array_state_key,
-                                array_state,
-                                ttl=30,
-                                priority=CacheItemPriority.CRITICAL
-                            )
-
-                if array_state:
-                    data["array_state"] = array_state
-
-                # Step 2: Get VMs, Docker Containers, and User Scripts - use priority-based updates
-                # Initialize default values in case they don't exist yet
-                vms = []
-                containers = []
-                scripts = []
-
-                # Only update these if they are due according to sensor priority
+                # Step 1: Decide which optional sections are due, using cached values otherwise
+                hostname_key = self._get_cache_key("hostname")
                 vm_key = self._get_cache_key("vms")
                 docker_key = self._get_cache_key("docker_containers")
                 scripts_key = self._get_cache_key("user_scripts")
+                ups_key = self._get_cache_key("ups_info")
+                parity_key = self._get_cache_key("parity_schedule")
 
-                # Check if any sensors related to these categories need updates
                 # Safely get VM and container IDs from existing data
                 vm_ids = []
                 container_ids = []
 
                 if hasattr(self, 'data') and self.data is not None:
                     if isinstance(self.data.get("vms"), list):
-                        vm_ids = [vm.get("name", "") for vm in self.data.get("vms", []) if isinstance(vm, dict)]
+                        vm_ids = [vm.get("name", "") for vm in self.data.get("vms", []) if isinstance(vm, Mapping)]
 
                     if isinstance(self.data.get("docker_containers"), list):
-                        container_ids = [c.get("name", "") for c in self.data.get("docker_containers", []) if isinstance(c, dict)]
+                        container_ids = [c.get("name", "") for c in self.data.get("docker_containers", []) if isinstance(c, Mapping)]
 
                 need_vm_update = critical_update or any(
                     self._sensor_manager.should_update(f"vm_{vm_id}")
@@ -620,269 +769,232 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                 )
 
                 need_scripts_update = critical_update or self._sensor_manager.should_update("user_scripts")
+                need_ups_update = critical_update or self._sensor_manager.should_update("ups_status")
+                need_parity_update = critical_update or self._sensor_manager.should_update("parity_schedule")
 
-                try:
-                    # Run these tasks concurrently if needed, otherwise use cache
-                    tasks = []
-
-                    # VM update task
-                    if need_vm_update:
-                        tasks.append(self.api.get_vms())
-                        cache_misses += 1
-                    else:
-                        vms = self._cache_manager.get(vm_key, [])
-                        if vms:
-                            cache_hits += 1
-                        else:
-                            tasks.append(self.api.get_vms())
-                            cache_misses += 1
-
-                    # Docker update task
-                    if need_docker_update:
-                        tasks.append(self.api.get_docker_containers())
-                        cache_misses += 1
-                    else:
-                        containers = self._cache_manager.get(docker_key, [])
-                        if containers:
-                            cache_hits += 1
-                        else:
-                            tasks.append(self.api.get_docker_containers())
-                            cache_misses += 1
-
-                    # Scripts update task
-                    if need_scripts_update:
-                        tasks.append(self.api.get_user_scripts())
+                # Due sections with a cached value are revalidated in the background
+                # and served stale meanwhile; only explicitly requested updates wait
+                requested_update = bool(self._update_requested_sensors)
+                vms = self._get_cached_section(vm_key, need_vm_update, requested_update, [])
+                containers = self._get_cached_section(docker_key, need_docker_update, requested_update, [])
+                scripts = self._get_cached_section(scripts_key, need_scripts_update, requested_update, [])
+                ups_info = None if need_ups_update or not self.has_ups else self._cache_manager.get(ups_key)
+                next_check = self._get_cached_section(parity_key, need_parity_update, requested_update)
+
+                # Step 2: Collect the snapshot in a single round-trip
+                snapshot = await self.api.collect_snapshot(
+                    include_vms=not vms,
+                    include_docker=not containers,
+                    include_user_scripts=not scripts,
+                    include_ups=self.has_ups and not ups_info,
+                    include_network=True,
+                    include_parity_schedule=not next_check,
+                    parity_history_position=self._parity_history.position,
+                )
+                if not snapshot:
+                    raise UpdateFailed("Snapshot collection returned no data")
+
+                for key, value in (
+                    ("vms", vms),
+                    ("docker_containers", containers),
+                    ("user_scripts", scripts),
+                    ("ups_info", ups_info),
+                    ("parity_cron", next_check),
+                ):
+                    if key in snapshot:
                         cache_misses += 1
-                    else:
-                        scripts = self._cache_manager.get(scripts_key, [])
-                        if scripts:
-                            cache_hits += 1
-                        else:
-                            tasks.append(self.api.get_user_scripts())
-                            cache_misses += 1
-
-                    # Run needed tasks concurrently
-                    if tasks:
-                        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                        # Process results based on which tasks were run
-                        task_index = 0
-
-                        # Process VM results if that task was run
-                        if need_vm_update or not self._cache_manager.get(vm_key):
-                            vms = results[task_index] if not isinstance(results[task_index], Exception) else []
-                            task_index += 1
-
-                            # Cache VM results
-                            if vms:
-                                self._cache_manager.set(
-                                    vm_key,
-                                    vms,
-                                    ttl=300,  # 5 minute cache for VMs
-                                    priority=CacheItemPriority.MEDIUM
-                                )
+                    elif value:
+                        cache_hits += 1
 
-                        # Process Docker results if that task was run
-                        if need_docker_update or not self._cache_manager.get(docker_key):
-                            containers = results[task_index] if not isinstance(results[task_index], Exception) else []
-                            task_index += 1
-
-                            # Cache Docker results
-                            if containers:
-                                self._cache_manager.set(
-                                    docker_key,
-                                    containers,
-                                    ttl=300,  # 5 minute cache for containers
-                                    priority=CacheItemPriority.MEDIUM
-                                )
+                # Hostname
+                hostname = snapshot.get("hostname") or self._cache_manager.get(hostname_key)
+                if hostname:
+                    data["hostname"] = hostname
+                    self._cache_manager.set(
+                        hostname_key,
+                        hostname,
+                        ttl=86400,  # 24 hours - hostname rarely changes
+                        priority=CacheItemPriority.CRITICAL
+                    )
 
-                        # Process Scripts results if that task was run
-                        if need_scripts_update or not self._cache_manager.get(scripts_key):
-                            scripts = results[task_index] if not isinstance(results[task_index], Exception) else []
-
-                            # Cache Scripts results
-                            if scripts:
-                                self._cache_manager.set(
-                                    scripts_key,
-                                    scripts,
-                                    ttl=600,  # 10 minute cache for scripts (rarely change)
-                                    priority=CacheItemPriority.LOW
-                                )
+                # Core system stats (always fresh)
+                system_stats = cast(SystemStatsDict, snapshot.get("system_stats") or {})
+                data["system_stats"] = system_stats
+                self._update_intel_gpu(system_stats)
 
-                    # Process results
-                    data["vms"] = cast(List[VMDict], vms)
-                    data["docker_containers"] = cast(List[DockerContainerDict], containers)
-                    data["user_scripts"] = cast(List[UserScriptDict], scripts)
+                # Array state and parity history - always critical
+                array_state = await self._get_array_state(
+                    snapshot.get("mdcmd_status", ""),
+                    snapshot.get("parity_history")
+                )
+                if array_state:
+                    data["array_state"] = array_state
 
-                    # Record sensor updates - ensure lists are iterable
-                    if isinstance(vms, list):
-                        for vm in vms:
-                            if isinstance(vm, dict):
-                                vm_id = vm.get("name", "unknown")
-                                self._sensor_manager.record_update(f"vm_{vm_id}", vm.get("state"))
+                # Step 3: VMs, Docker Containers, and User Scripts
+                if "vms" in snapshot:
+                    vms = snapshot["vms"]
+                    if vms:
+                        self._cache_manager.set(
+                            vm_key,
+                            vms,
+                            ttl=300,  # 5 minute cache for VMs
+                            priority=CacheItemPriority.MEDIUM,
+                            stale_ttl=self._stale_ttls["vms"],
+                            refresh=self._section_refreshers["vms"]
+                        )
 
-                    if isinstance(containers, list):
-                        for container in containers:
-                            if isinstance(container, dict):
-                                container_id = container.get("name", "unknown")
-                                self._sensor_manager.record_update(f"docker_{container_id}", container.get("state"))
-
-                    if isinstance(scripts, list):
-                        self._sensor_manager.record_update("user_scripts", len(scripts))
-
-                except (ConnectionError, TimeoutError, OSError, ValueError) as err:
-                    _LOGGER.error("Error getting VM/Docker/Scripts data: %s", err)
-                    data.update({
-                        "vms": self._cache_manager.get(vm_key, []),
-                        "docker_containers": self._cache_manager.get(docker_key, []),
-                        "user_scripts": self._cache_manager.get(scripts_key, [])
-                    })
-
-                # Step 3: Update disk-related data based on priority and schedule
-                if "system_stats" in data:
-                    # Check if disk update is due based on schedule or forced update
-                    disk_update_needed = (
-                        critical_update or
-                        self.disk_update_due or
-                        any(s.startswith("disk_") for s in self._update_requested_sensors)
-                    )
+                if "docker_containers" in snapshot:
+                    containers = snapshot["docker_containers"]
+                    if containers:
+                        self._cache_manager.set(
+                            docker_key,
+                            containers,
+                            ttl=300,  # 5 minute cache for containers
+                            priority=CacheItemPriority.MEDIUM,
+                            stale_ttl=self._stale_ttls["docker_containers"],
+                            refresh=self._section_refreshers["docker_containers"]
+                        )
 
-                    try:
-                        # Handle disk updates
-                        if disk_update_needed:
-                            _LOGGER.debug("Disk update needed, running full update")
-                            data["system_stats"] = await self._async_update_disk_data(
-                                data["system_stats"]
-                            )
-                        elif self.data and "system_stats" in self.data:
-                            # Reuse previous disk data
-                            data["system_stats"]["individual_disks"] = (
-                                self.data["system_stats"].get("individual_disks", [])
-                            )
-                            data["system_stats"]["array_usage"] = (
-                                self.data["system_stats"].get("array_usage", {})
-                            )
+                if "user_scripts" in snapshot:
+                    scripts = snapshot["user_scripts"]
+                    if scripts:
+                        self._cache_manager.set(
+                            scripts_key,
+                            scripts,
+                            ttl=600,  # 10 minute cache for scripts (rarely change)
+                            priority=CacheItemPriority.LOW,
+                            stale_ttl=self._stale_ttls["user_scripts"],
+                            refresh=self._section_refreshers["user_scripts"]
+                        )
 
-                        # Update disk mapping with cache
-                        if disk_update_needed or "disk_mapping" not in data["system_stats"]:
-                            # Force mapping update when needed
-                            data["system_stats"] = await self._async_update_disk_mapping(
-                                data["system_stats"]
-                            )
+                data["vms"] = cast(List[VMDict], vms)
+                data["vm_stats"] = snapshot.get("vm_stats", {})
+                data["docker_containers"] = cast(List[DockerContainerDict], containers)
+                data["user_scripts"] = cast(List[UserScriptDict], scripts)
+
+                # Record sensor updates - ensure lists are iterable
+                if isinstance(vms, list):
+                    for vm in vms:
+                        if isinstance(vm, Mapping):
+                            vm_id = vm.get("name", "unknown")
+                            self._sensor_manager.record_update(f"vm_{vm_id}", vm.get("state"))
+
+                if isinstance(containers, list):
+                    for container in containers:
+                        if isinstance(container, Mapping):
+                            container_id = container.get("name", "unknown")
+                            self._sensor_manager.record_update(f"docker_{container_id}", container.get("state"))
+
+                if isinstance(scripts, list):
+                    self._sensor_manager.record_update("user_scripts", len(scripts))
+
+                # Step 4: Update disk-related data based on priority and schedule
+                # Check if disk update is due based on schedule or forced update
+                disk_update_needed = (
+                    critical_update or
+                    self.disk_update_due or
+                    any(s.startswith("disk_") for s in self._update_requested_sensors)
+                )
 
-                        # Update network stats based on priority
-                        need_network_update = critical_update or any(
-                            self._sensor_manager.should_update(f"network_{iface}")
-                            for iface in self._previous_network_stats
-                        ) if self._previous_network_stats else True
-
-                        if need_network_update:
-                            await self._async_update_network_stats(data["system_stats"])
-
-                            # Record sensor updates
-                            network_stats = data["system_stats"].get("network_stats", {})
-                            if isinstance(network_stats, dict):
-                                for interface in network_stats:
-                                    stats = network_stats[interface]
-                                    if isinstance(stats, dict):
-                                        self._sensor_manager.record_update(
-                                            f"network_{interface}",
-                                            stats.get("rx_speed", 0)
-                                        )
-
-                    except Exception as err:
-                        _LOGGER.error("Error updating disk/network data: %s", err)
-
-                # Step 4: UPS data if enabled
-                if self.has_ups:
-                    ups_key = self._get_cache_key("ups_info")
-                    need_ups_update = critical_update or self._sensor_manager.should_update("ups_status")
-
-                    try:
-                        ups_info = None
-
-                        if need_ups_update:
-                            ups_info = await self.api.get_ups_info()
-                            cache_misses += 1
-
-                            # Cache UPS info
-                            if ups_info and isinstance(ups_info, dict):
-                                self._cache_manager.set(
-                                    ups_key,
-                                    ups_info,
-                                    ttl=120,  # 2 minute cache for UPS
-                                    priority=CacheItemPriority.HIGH
+                try:
+                    # Handle disk updates
+                    if disk_update_needed:
+                        _LOGGER.debug("Disk update needed, running full update")
+                        data["system_stats"] = await self._async_update_disk_data(
+                            data["system_stats"]
+                        )
+                    elif self.data and "system_stats" in self.data:
+                        # Reuse previous disk data
+                        previous_stats = self.data["system_stats"]
+                        data["system_stats"]["individual_disks"] = previous_stats.get("individual_disks", [])
+                        data["system_stats"]["array_usage"] = previous_stats.get("array_usage", {})
+                        if "zfs_pools" in previous_stats:
+                            data["system_stats"]["zfs_pools"] = previous_stats["zfs_pools"]
+
+                    # Update disk mapping from the current disk data
+                    data["system_stats"] = await self._async_update_disk_mapping(
+                        data["system_stats"]
+                    )
+                    await self._update_disk_mappings(data)
+
+                    # ZFS pools and ARC stats come with the snapshot
+                    zfs = snapshot.get("zfs") or {}
+                    if zfs:
+                        data["system_stats"]["zfs_pools"] = zfs["pools"]
+                        data["system_stats"]["zfs_arc"] = zfs["arc"]
+
+                    # Disk I/O rates come with the snapshot, keyed by device
+                    data["system_stats"]["disk_io"] = disk_io_by_name(
+                        data["system_stats"].get("individual_disks", []),
+                        snapshot.get("disk_io", {})
+                    )
+
+                    # Network stats come with the snapshot
+                    await self._async_update_network_stats(
+                        data["system_stats"],
+                        snapshot.get("network_stats", {})
+                    )
+
+                    # Record sensor updates
+                    network_stats = data["system_stats"].get("network_stats", {})
+                    if isinstance(network_stats, dict):
+                        for interface in network_stats:
+                            stats = network_stats[interface]
+                            if isinstance(stats, dict):
+                                self._sensor_manager.record_update(
+                                    f"network_{interface}",
+                                    stats.get("rx_speed", 0)
                                 )
 
-                                # Record sensor update
-                                status = ups_info.get("STATUS")
-                                if status is not None:
-                                    self._sensor_manager.record_update("ups_status", status)
-                        else:
-                            ups_info = self._cache_manager.get(ups_key)
-                            if ups_info:
-                                cache_hits += 1
-                            else:
-                                ups_info = await self.api.get_ups_info()
-                                cache_misses += 1
-
-                                if ups_info and isinstance(ups_info, dict):
-                                    self._cache_manager.set(
-                                        ups_key,
-                                        ups_info,
-                                        ttl=120,
-                                        priority=CacheItemPriority.HIGH
-                                    )
+                except Exception as err:
+                    _LOGGER.error("Error updating disk/network data: %s", err)
+
+                # Step 5: UPS data if enabled
+                if self.has_ups:
+                    if "ups_info" in snapshot:
+                        ups_info = snapshot["ups_info"]
 
+                        # Cache UPS info
                         if ups_info and isinstance(ups_info, dict):
-                            # Store UPS info in both locations for backward compatibility
-                            data["ups_info"] = ups_info
-                            _LOGGER.debug("UPS info fetched: %s", ups_info)
-
-                            # Also store in system_stats for the UPS sensors to access
-                            if "system_stats" in data and isinstance(data["system_stats"], dict):
-                                data["system_stats"]["ups_info"] = ups_info
-                                _LOGGER.debug("UPS info stored in system_stats")
-                    except (ConnectionError, TimeoutError, OSError, ValueError) as err:
-                        _LOGGER.error("Error getting UPS info: %s", err)
-
-                # Step 5: Add parity schedule parsing with caching
-                parity_key = self._get_cache_key("parity_schedule")
-                need_parity_update = critical_update or self._sensor_manager.should_update("parity_schedule")
+                            self._cache_manager.set(
+                                ups_key,
+                                ups_info,
+                                ttl=120,  # 2 minute cache for UPS
+                                priority=CacheItemPriority.HIGH
+                            )
 
-                try:
-                    next_check = None
+                            # Record sensor update
+                            status = ups_info.get("STATUS")
+                            if status is not None:
+                                self._sensor_manager.record_update("ups_status", status)
 
-                    if need_parity_update:
-                        next_check = await self._parse_parity_schedule()
-                        cache_misses += 1
+                    if ups_info and isinstance(ups_info, dict):
+                        # Store UPS info in both locations for backward compatibility
+                        data["ups_info"] = ups_info
+                        _LOGGER.debug("UPS info fetched: %s", ups_info)
+
+                        # Also store in system_stats for the UPS sensors to access
+                        data["system_stats"]["ups_info"] = ups_info
+                        _LOGGER.debug("UPS info stored in system_stats")
+
+                # Step 6: Parity schedule parsing with caching
+                try:
+                    if "parity_cron" in snapshot:
+                        next_check = await self._parse_parity_schedule(snapshot["parity_cron"])
 
                         if next_check:
                             self._cache_manager.set(
                                 parity_key,
                                 next_check,
                                 ttl=3600,  # 1 hour cache (rarely changes)
-                                priority=CacheItemPriority.LOW
+                                priority=CacheItemPriority.LOW,
+                                stale_ttl=self._stale_ttls["parity_schedule"],
+                                refresh=self._section_refreshers["parity_schedule"]
                             )
 
                             # Record sensor update
                             if isinstance(next_check, str):
                                 self._sensor_manager.record_update("parity_schedule", next_check)
-                    else:
-                        next_check = self._cache_manager.get(parity_key)
-                        if next_check:
-                            cache_hits += 1
-                        else:
-                            next_check = await self._parse_parity_schedule()
-                            cache_misses += 1
-
-                            if next_check:
-                                self._cache_manager.set(
-                                    parity_key,
-                                    next_check,
-                                    ttl=3600,
-                                    priority=CacheItemPriority.LOW
-                                )
 
                     if next_check and isinstance(next_check, str):
                         data["next_parity_check"] = next_check
@@ -904,7 +1016,8 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                     (cache_hits / max(1, cache_hits + cache_misses)) * 100
                 )
 
-                return data
+                # Convert to records and index them once, instead of in every entity
+                return self._build_published_snapshot(data)
 
         except Exception as err:
             _LOGGER.error("Error communicating with Unraid: %s", err)
@@ -954,17 +1067,23 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             # If psutil not available, silently continue
             pass
 
-    async def _parse_parity_schedule(self) -> Optional[str]:
-        """Parse the parity check schedule."""
+    async def _parse_parity_schedule(self, cron_output: Optional[str] = None) -> Optional[str]:
+        """Parse the parity check schedule.
+
+        Uses the cron file contents from the tick snapshot when provided.
+        """
         try:
-            result = await self.api.execute_command(
-                "cat /boot/config/plugins/dynamix/parity-check.cron"
-            )
+            if cron_output is None:
+                result = await self.api.execute_command(
+                    "cat /boot/config/plugins/dynamix/parity-check.cron", coalesce=True
+                )
+                if result and result.exit_status == 0:
+                    cron_output = result.stdout
             next_check = "Unknown"
 
-            if result and result.exit_status == 0:
+            if cron_output:
                 # Parse the cron entries
-                for line in result.stdout.splitlines():
+                for line in cron_output.splitlines():
                     if "mdcmd check" in line and not line.startswith('#'):
                         # Split the cron entry
                         parts = line.strip().split()
@@ -1018,7 +1137,7 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
 
                 if not disk_config:
                     # Try to read disk config
-                    result = await self.api.execute_command("cat /boot/config/disk.cfg")
+                    result = await self.api.execute_command("cat /boot/config/disk.cfg", coalesce=True)
                     if result and result.exit_status == 0:
                         disk_config = {}
                         for line in result.stdout.splitlines():
@@ -1050,6 +1169,34 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             _LOGGER.error("Error parsing parity schedule: %s", err)
             return "Unknown"
 
+    def _get_cached_section(
+        self,
+        key: str,
+        due: bool,
+        force: bool,
+        default: Any = None
+    ) -> Any:
+        """Return a cached snapshot section, revalidating it in the background when due.
+
+        The default is returned when the section has to be part of this tick's
+        snapshot: when forced or when nothing servable is cached.
+        """
+        if force:
+            return default
+        value = self._cache_manager.get(key, default)
+        if due and value:
+            self._cache_manager.revalidate(key)
+        return value
+
+    async def _async_refresh_section(
+        self,
+        build_command: Callable[[], str],
+        parse_output: Callable[[str], Any]
+    ) -> Any:
+        """Collect a single snapshot section for a background cache refresh."""
+        result = await self.api.execute_command(build_command())
+        return parse_output(result.stdout or "")
+
     def _get_cache_key(self, key_type: str, identifier: str = "") -> str:
         """Generate a standardized cache key."""
         if identifier:
@@ -1079,11 +1226,16 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
 
     async def _async_update_network_stats(
         self,
-        system_stats: dict[str, Any]
+        system_stats: dict[str, Any],
+        network_stats: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Update network statistics asynchronously."""
+        """Update network statistics asynchronously.
+
+        Uses the network stats from the tick snapshot when provided.
+        """
         try:
-            network_stats = await self.api.get_network_stats()
+            if network_stats is None:
+                network_stats = await self.api.get_network_stats()
 
             if network_stats:
                 # Store network stats in system_stats
@@ -1135,6 +1287,9 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             # Initialize base system monitoring first
             await self._async_update_data()
 
+            # Detection results from the first update hold until the server reboots
+            self._host_facts.update(self.api.export_host_facts())
+
             return True
 
         except Exception as err:
@@ -1142,12 +1297,19 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             raise ConfigEntryNotReady from err
 
     async def _warm_up_cache(self) -> None:
-        """Warm up the cache with initial data."""
+        """Warm up the cache with initial data.
+
+        Facts saved during the server's current boot are restored first, so the
+        hostname and disk mapping are only fetched when they are missing.
+        System stats, containers and VMs are not fetched here since the first
+        snapshot collects them in the same round-trip.
+        """
         _LOGGER.debug("Warming up cache with initial data")
         async with self.api:
+            facts = await self._async_restore_host_facts()
             try:
                 # Fetch hostname first (needed for entity IDs)
-                hostname = await self.api.get_hostname()
+                hostname = facts.get("hostname") or await self.api.get_hostname()
                 if hostname:
                     # Store hostname in a special cache entry
                     self._cache_manager.set(
@@ -1158,19 +1320,8 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                     )
                     _LOGGER.debug("Cache warmed up with hostname: %s", hostname)
 
-                # Fetch system stats (most critical)
-                system_stats = await self.api.get_system_stats()
-                if system_stats:
-                    self._cache_manager.set(
-                        self._get_cache_key("system_stats"),
-                        system_stats,
-                        ttl=self._cache_ttls["system_stats"],
-                        priority=CacheItemPriority.HIGH
-                    )
-                    _LOGGER.debug("Cache warmed up with system stats")
-
                 # Fetch disk mapping (rarely changes)
-                disk_mapping = await self.api.get_disk_mappings()
+                disk_mapping = facts.get("disk_mapping") or await self.api.get_disk_mappings()
                 if disk_mapping:
                     self._cache_manager.set(
                         self._get_cache_key("disk_mapping"),
@@ -1180,43 +1331,70 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
                     )
                     _LOGGER.debug("Cache warmed up with disk mapping")
 
-                # Fetch Docker info if available
-                if await self.api.check_docker_running():
-                    docker_info = await self.api.get_docker_containers()
-                    if docker_info:
-                        self._cache_manager.set(
-                            self._get_cache_key("docker_info"),
-                            docker_info,
-                            ttl=self._cache_ttls["docker_info"],
-                            priority=CacheItemPriority.MEDIUM
-                        )
-                        _LOGGER.debug("Cache warmed up with Docker info")
+                self._host_facts.update({
+                    # 'server' is the fallback when the hostname couldn't be read
+                    "hostname": hostname if hostname != "server" else None,
+                    "disk_mapping": disk_mapping,
+                })
             except Exception as err:
                 _LOGGER.warning("Error warming up cache: %s", err)
 
+    async def _async_restore_host_facts(self) -> Dict[str, Any]:
+        """Load stored host facts for the server's current boot and hydrate the API."""
+        try:
+            result = await self.api.execute_command(HOST_IDENTITY_COMMAND)
+        except Exception as err:
+            _LOGGER.debug("Could not identify the server boot: %s", err)
+            return {}
+
+        identity = parse_host_identity(self.api.host, result.stdout or "")
+        if identity is None:
+            return {}
+
+        facts = await self._host_facts.async_load(identity)
+        self.api.restore_host_facts(facts)
+        return facts
+
     async def async_update_ups_status(self, has_ups: bool) -> None:
         """Update the UPS status and trigger a refresh."""
         self.has_ups = has_ups
         await self.async_refresh()
 
-    async def _get_array_state(self) -> Optional[Dict[str, Any]]:
-        """Get array state information."""
+    async def _get_array_state(
+        self,
+        mdcmd_output: Optional[str] = None,
+        parity_history_output: Optional[Tuple[Optional[Tuple[int, int]], str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get array state information.
+
+        Uses the mdcmd and parity log output from the tick snapshot when provided.
+        """
         try:
-            result = await self.api.execute_command("mdcmd status")
-            if result.exit_status != 0:
-                return None
+            if mdcmd_output is None:
+                result = await self.api.execute_command("mdcmd status", coalesce=True)
+                if result.exit_status != 0:
+                    return None
+                mdcmd_output = result.stdout
 
             array_state = {}
-            for line in result.stdout.splitlines():
+            for line in mdcmd_output.splitlines():
                 if "=" not in line:
                     continue
                 key, value = line.split("=", 1)
                 array_state[key.strip()] = value.strip()
 
+            if not array_state:
+                return None
+
+            if sync_progress := self.api._update_sync_progress(array_state):
+                array_state["sync_progress"] = sync_progress
+            self._schedule_sync_poll()
+
             # Parse parity history
-            parity_history = await self._parse_parity_history()
+            parity_history = await self._parse_parity_history(parity_history_output)
             if parity_history:
                 array_state["parity_history"] = parity_history
+                array_state["parity_statistics"] = self._parity_history.statistics
 
             return array_state
 
@@ -1224,136 +1402,36 @@ class UnraidDataUpdateCoordinator(DataUpdateCoordinator[UnraidDataDict]):
             _LOGGER.error("Error getting array state: %s", err)
             return None
 
-    async def _parse_parity_history(self) -> Optional[Dict[str, Any]]:
-        """Parse parity check history from the log file."""
+    async def _parse_parity_history(
+        self,
+        history_output: Optional[Tuple[Optional[Tuple[int, int]], str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Update the parity history with newly logged checks and return the latest one.
+
+        history_output is the (position read from, inode and size, appended
+        lines) triple from the tick snapshot; without it only the unread part
+        of the log is fetched.
+        """
         try:
-            _LOGGER.debug("Attempting to read parity check history")
-            result = await self.api.execute_command(
-                "cat /boot/config/parity-checks.log"
-            )
-            if result.exit_status != 0:
-                _LOGGER.warning(
-                    "Failed to read parity history file: exit_code=%d, stderr='%s'",
-                    result.exit_status,
-                    result.stderr
+            if history_output is None:
+                position = self._parity_history.position
+                result = await self.api.execute_command(
+                    parity_history_command(position)
+                )
+                sections = split_sections(result.stdout or "")
+                history_output = (
+                    position,
+                    sections.get(SECTION_PARITY_LOG_STAT, ""),
+                    sections.get(SECTION_PARITY_HISTORY, ""),
                 )
-                return None
-
-            _LOGGER.debug("Raw parity history content: %s", result.stdout)
-
-            latest_check = None
-            for line in result.stdout.splitlines():
-                # Skip empty lines
-                if not line.strip():
-                    continue
-
-                # Format can vary:
-                # Old: YYYY MMM DD HH:MM:SS|Duration|Speed|Status|Errors
-                # New: YYYY MMM DD HH:MM:SS|Duration|Speed|Status|Errors|Type|Size|Duration|Step|Description
-                _LOGGER.debug("Processing parity history line: %s", line)
-
-                fields = line.strip().split("|")
-                # Minimum required fields: date, duration, speed, status
-                if len(fields) < 4:
-                    _LOGGER.warning("Invalid parity history line (insufficient fields): %s", line)
-                    continue
-
-                try:
-                    # Handle different space-separated date formats
-                    date_str = fields[0]
-                    _LOGGER.debug("Parsing date: %s", date_str)
-
-                    # Try different date formats
-                    date_formats = [
-                        "%Y %b %d %H:%M:%S",  # Full format with year
-                        "%b %d %H:%M:%S"     # Format without year
-                    ]
-
-                    check_date = None
-                    for date_format in date_formats:
-                        try:
-                            parsed_date = datetime.strptime(date_str, date_format)
-
-                            # If the format doesn't include year, assume current year
-                            if date_format == "%b %d %H:%M:%S":
-                                current_year = datetime.now().year
-                                parsed_date = parsed_date.replace(year=current_year)
-
-                                # Handle edge case: if date is in the future, use previous year
-                                if parsed_date > datetime.now():
-                                    parsed_date = parsed_date.replace(year=current_year-1)
-
-                            check_date = parsed_date
-                            break
-                        except ValueError:
-                            continue
-
-                    if check_date is None:
-                        # If all parsing attempts failed, raise an error to be caught by outer exception handler
-                        raise ValueError(f"Could not parse date: {date_str}")
-
-                    # Format duration from seconds to readable format
-                    try:
-                        duration_secs = int(fields[1])
-                        hours = duration_secs // 3600
-                        minutes = (duration_secs % 3600) // 60
-                        seconds = duration_secs % 60
-                        duration_str = f"{hours} hours, {minutes} minutes, {seconds} seconds"
-                    except ValueError:
-                        duration_str = "Unknown"
-                        _LOGGER.warning("Could not parse duration value: %s", fields[1])
-
-                    # Parse speed using helper function
-                    try:
-                        speed_bytes = parse_speed_string(fields[2].strip())
-                        speed_mb = round(speed_bytes / 1_000_000, 2)
-                    except ValueError as err:
-                        _LOGGER.warning("Could not parse speed value: %s - %s", fields[2], err)
-                        speed_mb = 0
-
-                    # Get error count (defaults to 0 if not present)
-                    try:
-                        errors = int(fields[4]) if len(fields) > 4 else 0
-                    except ValueError:
-                        errors = 0
-
-                    # Build check info with additional fields if available
-                    check_info = {
-                        "date": check_date.strftime("%Y-%m-%d %H:%M:%S"),
-                        "duration": duration_str,
-                        "speed": f"{speed_mb} MB/s",
-                        "status": "Success" if fields[3] == "0" else f"Failed ({fields[3]} errors)",
-                        "errors": errors,
-                        "type": fields[5] if len(fields) > 5 else "Unknown",
-                        "size": fields[6] if len(fields) > 6 else "Unknown"
-                    }
-
-                    # Add description if available (new format)
-                    if len(fields) > 9:
-                        check_info["description"] = fields[9]
-
-                    _LOGGER.debug("Processed check info: %s", check_info)
-
-                    # Skip invalid dates (like 1969) and update latest check
-                    if check_date.year < 2000:
-                        _LOGGER.warning("Skipping invalid date: %s", date_str)
-                        continue
-
-                    if not latest_check or check_date > datetime.strptime(latest_check["date"], "%Y-%m-%d %H:%M:%S"):
-                        latest_check = check_info
-                        _LOGGER.debug("Updated latest check info")
-
-                except (ValueError, IndexError) as err:
-                    _LOGGER.warning(
-                        "Error parsing parity history line '%s': %s",
-                        line,
-                        err,
-                        exc_info=True
-                    )
-                    continue
 
-            _LOGGER.debug("Final latest check info: %s", latest_check)
-            return latest_check
+            if self._parity_history.update(*history_output):
+                _LOGGER.debug(
+                    "Parity history now holds %d checks, latest: %s",
+                    len(self._parity_history.records),
+                    self._parity_history.latest_check
+                )
+            return self._parity_history.latest_check
 
         except Exception as err:
             _LOGGER.error(
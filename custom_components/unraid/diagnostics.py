@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data # type: ignore
@@ -64,7 +65,7 @@ async def async_get_config_entry_diagnostics(
     # Process disk data with formatted sizes
     processed_disks = []
     for disk in system_stats.get("individual_disks", []):
-        if not isinstance(disk, dict):
+        if not isinstance(disk, Mapping):
             continue
         processed_disks.append({
             "name": disk.get("name", "unknown"),
@@ -19,6 +19,7 @@ class UnraidArrayStatusBinarySensor(UnraidBinarySensorBase):
 
     def __init__(self, coordinator: UnraidDataUpdateCoordinator) -> None:
         """Initialize array status binary sensor."""
+        self._snapshot_keys = ("system_stats.array_state", "system_stats.array_status")
         description = UnraidBinarySensorEntityDescription(
             key="array_status",
             name="Array Status",
@@ -199,6 +200,13 @@ class UnraidArrayHealthSensor(UnraidBinarySensorBase):
 
     def __init__(self, coordinator: UnraidDataUpdateCoordinator) -> None:
         """Initialize array health binary sensor."""
+        self._snapshot_keys = (
+            "array_state",
+            "parity_info",
+            "system_stats.array_state",
+            "system_stats.array_status",
+            "system_stats.individual_disks",
+        )
         description = UnraidBinarySensorEntityDescription(
             key="array_health",
             name="Array Health",
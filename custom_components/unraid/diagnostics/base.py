@@ -14,10 +14,11 @@ from ..const import DOMAIN
 from .const import UnraidBinarySensorEntityDescription
 from ..entity_naming import EntityNaming
 from ..coordinator import UnraidDataUpdateCoordinator
+from ..helpers import SnapshotChangeMixin
 
 _LOGGER = logging.getLogger(__name__)
 
-class UnraidBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
+class UnraidBinarySensorBase(CoordinatorEntity, BinarySensorEntity, SnapshotChangeMixin):
     """Base class for Unraid binary sensors."""
 
     entity_description: UnraidBinarySensorEntityDescription
@@ -94,4 +95,5 @@ class UnraidBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        if self._should_write_state():
+            self.async_write_ha_state()
@@ -13,6 +13,7 @@ from .base import UnraidBinarySensorBase
 from .const import UnraidBinarySensorEntityDescription
 from ..const import SpinDownDelay
 from ..coordinator import UnraidDataUpdateCoordinator
+from ..models import disk_key, find_disk
 from ..helpers import (
     DiskDataHelperMixin,
     get_disk_identifiers,
@@ -36,6 +37,7 @@ class UnraidArrayDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
             raise ValueError(f"Not an array disk: {disk_name}")
 
         self._disk_name = disk_name
+        self._snapshot_keys = (disk_key(disk_name), "system_stats.disk_mapping")
         self._disk_num = get_disk_number(disk_name)
 
         if self._disk_num is None:
@@ -341,40 +343,40 @@ class UnraidArrayDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
     def is_on(self) -> bool | None:
         """Return true if there's a problem with the disk."""
         try:
-            for disk in self.coordinator.data["system_stats"]["individual_disks"]:
-                if disk["name"] == self._disk_name:
-                    # Update spin down delay if changed
-                    new_delay = SpinDownDelay(disk.get("spin_down_delay", SpinDownDelay.MINUTES_30))
-                    if new_delay != self._spin_down_delay:
-                        self._spin_down_delay = new_delay
-                        _LOGGER.debug(
-                            "Updated spin down delay for array disk %s to %s",
-                            self._disk_name,
-                            self._spin_down_delay.to_human_readable()
-                        )
+            disk = find_disk(self.coordinator.data, self._disk_name)
+            if disk is not None:
+                # Update spin down delay if changed
+                new_delay = SpinDownDelay(disk.get("spin_down_delay", SpinDownDelay.MINUTES_30))
+                if new_delay != self._spin_down_delay:
+                    self._spin_down_delay = new_delay
+                    _LOGGER.debug(
+                        "Updated spin down delay for array disk %s to %s",
+                        self._disk_name,
+                        self._spin_down_delay.to_human_readable()
+                    )
 
-                    # Get current state
-                    is_standby = disk.get("state", "unknown").lower() == "standby"
-                    if is_standby:
-                        return self._last_problem_state if self._last_problem_state is not None else False
-
-                    current_time = datetime.now(timezone.utc)
-                    should_check_smart = (
-                        self._smart_status is None  # First check
-                        or self._spin_down_delay == SpinDownDelay.NEVER  # Never spin down
-                        or (
-                            self._last_smart_check is not None
-                            and (
-                                current_time - self._last_smart_check
-                            ).total_seconds() >= self._spin_down_delay.to_seconds()
-                        )
+                # Get current state
+                is_standby = disk.get("state", "unknown").lower() == "standby"
+                if is_standby:
+                    return self._last_problem_state if self._last_problem_state is not None else False
+
+                current_time = datetime.now(timezone.utc)
+                should_check_smart = (
+                    self._smart_status is None  # First check
+                    or self._spin_down_delay == SpinDownDelay.NEVER  # Never spin down
+                    or (
+                        self._last_smart_check is not None
+                        and (
+                            current_time - self._last_smart_check
+                        ).total_seconds() >= self._spin_down_delay.to_seconds()
                     )
+                )
 
-                    if should_check_smart:
-                        self._last_smart_check = current_time
-                        return self._analyze_smart_status(disk)
+                if should_check_smart:
+                    self._last_smart_check = current_time
+                    return self._analyze_smart_status(disk)
 
-                    return self._last_problem_state if self._last_problem_state is not None else False
+                return self._last_problem_state if self._last_problem_state is not None else False
 
             return None
 
@@ -386,53 +388,53 @@ class UnraidArrayDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
     def extra_state_attributes(self) -> dict[str, StateType]:
         """Return additional state attributes."""
         try:
-            for disk in self.coordinator.data["system_stats"]["individual_disks"]:
-                if disk["name"] == self._disk_name:
-                    # Get current disk state
-                    is_standby = disk.get("state", "unknown").lower() == "standby"
-
-                    # Get storage attributes
-                    attrs = self._get_storage_attributes(
-                        total=disk.get("total", 0),
-                        used=disk.get("used", 0),
-                        free=disk.get("free", 0),
-                        mount_point=disk.get("mount_point"),
-                        device=self._device,
-                        is_standby=is_standby
-                    )
+            disk = find_disk(self.coordinator.data, self._disk_name)
+            if disk is not None:
+                # Get current disk state
+                is_standby = disk.get("state", "unknown").lower() == "standby"
+
+                # Get storage attributes
+                attrs = self._get_storage_attributes(
+                    total=disk.get("total", 0),
+                    used=disk.get("used", 0),
+                    free=disk.get("free", 0),
+                    mount_point=disk.get("mount_point"),
+                    device=self._device,
+                    is_standby=is_standby
+                )
 
-                    # Add disk serial
-                    disk_map = get_unraid_disk_mapping(
-                        {"system_stats": self.coordinator.data.get("system_stats", {})}
-                    )
-                    if serial := disk_map.get(self._disk_name, {}).get("serial"):
-                        attrs["disk_serial"] = serial
+                # Add disk serial
+                disk_map = get_unraid_disk_mapping(
+                    {"system_stats": self.coordinator.data.get("system_stats", {})}
+                )
+                if serial := disk_map.get(self._disk_name, {}).get("serial"):
+                    attrs["disk_serial"] = serial
 
-                    # Handle temperature
-                    temp = disk.get("temperature")
-                    if not is_standby and temp is not None:
-                        self._last_temperature = temp
+                # Handle temperature
+                temp = disk.get("temperature")
+                if not is_standby and temp is not None:
+                    self._last_temperature = temp
 
-                    attrs["Temperature"] = self._get_temperature_str(
-                        self._last_temperature if is_standby else temp,
-                        is_standby
-                    )
+                attrs["Temperature"] = self._get_temperature_str(
+                    self._last_temperature if is_standby else temp,
+                    is_standby
+                )
 
-                    # Add SMART status
-                    if smart_data := disk.get("smart_data", {}):
-                        attrs["SMART Status"] = (
-                            "Passed" if smart_data.get("smart_status", True)
-                            else "Failed"
-                        )
+                # Add SMART status
+                if smart_data := disk.get("smart_data", {}):
+                    attrs["SMART Status"] = (
+                        "Passed" if smart_data.get("smart_status", True)
+                        else "Failed"
+                    )
 
-                    # Add spin down delay
-                    attrs["Spin Down Delay"] = self._spin_down_delay.to_human_readable()
+                # Add spin down delay
+                attrs["Spin Down Delay"] = self._spin_down_delay.to_human_readable()
 
-                    # Add any problem details
-                    if self._problem_attributes:
-                        attrs["problem_details"] = self._problem_attributes
+                # Add any problem details
+                if self._problem_attributes:
+                    attrs["problem_details"] = self._problem_attributes
 
-                    return attrs
+                return attrs
 
             return {}
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass # type: ignore
@@ -408,7 +408,7 @@ class UnraidParityDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
                 device_path = self._parity_info.get("rdevName.0")
                 if device_path:
                     result = await self.coordinator.api.execute_command(
-                        f"lsblk -b -d -o SIZE /dev/{device_path} | tail -n1"
+                        f"lsblk -b -d -o SIZE /dev/{device_path} | tail -n1", coalesce=True
                     )
                     if result.exit_status == 0 and result.stdout.strip():
                         self._cached_size = int(result.stdout.strip())
@@ -559,6 +559,8 @@ class UnraidParityCheckSensor(UnraidBinarySensorBase):
             # Get last check details from history
             if history := array_state.get("parity_history"):
                 self._update_history_attributes(attrs, history)
+            if statistics := array_state.get("parity_statistics"):
+                self._update_statistics_attributes(attrs, statistics)
 
             _LOGGER.debug("Final attributes: %s", attrs)
             return attrs
@@ -573,6 +575,10 @@ class UnraidParityCheckSensor(UnraidBinarySensorBase):
 
     def _update_progress(self, attrs: Dict[str, Any], array_state: Dict[str, Any]) -> None:
         """Update progress information."""
+        if sync_progress := array_state.get("sync_progress"):
+            attrs["progress"] = sync_progress.get("progress", 0)
+            return
+
         if (pos := array_state.get("mdResyncPos")) and (
             size := array_state.get("mdResyncSize")
         ):
@@ -590,9 +596,21 @@ class UnraidParityCheckSensor(UnraidBinarySensorBase):
 
     def _update_speed(self, attrs: Dict[str, Any], array_state: Dict[str, Any]) -> None:
         """Update speed information."""
+        if sync_progress := array_state.get("sync_progress"):
+            if (speed := sync_progress.get("speed")) is not None:
+                # Decimal MB/s, as in the parity history and Unraid's UI
+                attrs["speed"] = f"{round(speed / 1_000_000, 2)} MB/s"
+            if (eta := sync_progress.get("eta")) is not None:
+                hours, remainder = divmod(eta, 3600)
+                attrs["time_remaining"] = f"{hours} hours, {remainder // 60} minutes"
+                attrs["estimated_completion"] = (
+                    dt_util.now() + timedelta(seconds=eta)
+                ).isoformat()
+            return
+
         if speed := array_state.get("mdResyncSpeed"):
             try:
-                speed_mb = round(float(speed) / (1024 * 1024), 2)
+                speed_mb = round(float(speed) / 1_000_000, 2)
                 attrs["speed"] = f"{speed_mb} MB/s"
                 _LOGGER.debug("Calculated speed: %s", attrs["speed"])
             except (ValueError, TypeError) as err:
@@ -640,6 +658,28 @@ class UnraidParityCheckSensor(UnraidBinarySensorBase):
                 exc_info=True
             )
 
+    def _update_statistics_attributes(self, attrs: Dict[str, Any], statistics: Dict[str, Any]) -> None:
+        """Add aggregates over the logged checks."""
+        if (average_duration := statistics.get("average_duration")) is not None:
+            hours, remainder = divmod(average_duration, 3600)
+            attrs["average_duration"] = f"{hours} hours, {remainder // 60} minutes"
+        if (average_speed := statistics.get("average_speed")) is not None:
+            attrs["average_speed"] = f"{average_speed} MB/s"
+        if (speed_trend := statistics.get("speed_trend")) is not None:
+            attrs["speed_trend"] = f"{speed_trend:+}%"
+        attrs["total_errors"] = statistics.get("total_errors", 0)
+        attrs["failed_checks"] = statistics.get("failed_checks", 0)
+        attrs["recent_checks"] = [
+            {
+                "date": check.get("date"),
+                "status": check.get("status"),
+                "duration": check.get("duration"),
+                "speed": check.get("speed"),
+                "errors": check.get("errors"),
+            }
+            for check in statistics.get("recent_checks", [])
+        ]
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
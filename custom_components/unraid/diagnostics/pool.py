@@ -13,6 +13,7 @@ from .base import UnraidBinarySensorBase
 from .const import UnraidBinarySensorEntityDescription
 from ..const import SpinDownDelay
 from ..coordinator import UnraidDataUpdateCoordinator
+from ..models import disk_key, find_disk
 from ..helpers import (
     DiskDataHelperMixin,
     get_disk_identifiers,
@@ -41,6 +42,7 @@ class UnraidPoolDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
             raise ValueError(f"Invalid pool name: {disk_name}")
 
         self._disk_name = disk_name
+        self._snapshot_keys = (disk_key(disk_name), "system_stats.disk_mapping")
 
         # Entity naming not used in this class
         # EntityNaming(
@@ -377,40 +379,40 @@ class UnraidPoolDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
     def is_on(self) -> bool | None:
         """Return true if there's a problem with the disk."""
         try:
-            for disk in self.coordinator.data["system_stats"]["individual_disks"]:
-                if disk["name"] == self._disk_name:
-                    # Update spin down delay if changed
-                    new_delay = SpinDownDelay(disk.get("spin_down_delay", SpinDownDelay.MINUTES_30))
-                    if new_delay != self._spin_down_delay:
-                        self._spin_down_delay = new_delay
-                        _LOGGER.debug(
-                            "Updated spin down delay for pool %s to %s",
-                            self._disk_name,
-                            self._spin_down_delay.to_human_readable()
-                        )
+            disk = find_disk(self.coordinator.data, self._disk_name)
+            if disk is not None:
+                # Update spin down delay if changed
+                new_delay = SpinDownDelay(disk.get("spin_down_delay", SpinDownDelay.MINUTES_30))
+                if new_delay != self._spin_down_delay:
+                    self._spin_down_delay = new_delay
+                    _LOGGER.debug(
+                        "Updated spin down delay for pool %s to %s",
+                        self._disk_name,
+                        self._spin_down_delay.to_human_readable()
+                    )
 
-                    # Get current state
-                    is_standby = disk.get("state", "unknown").lower() == "standby"
-                    if is_standby:
-                        return self._last_problem_state if self._last_problem_state is not None else False
-
-                    current_time = datetime.now(timezone.utc)
-                    should_check_smart = (
-                        self._smart_status is None  # First check
-                        or self._spin_down_delay == SpinDownDelay.NEVER  # Never spin down
-                        or (
-                            self._last_smart_check is not None
-                            and (
-                                current_time - self._last_smart_check
-                            ).total_seconds() >= self._spin_down_delay.to_seconds()
-                        )
+                # Get current state
+                is_standby = disk.get("state", "unknown").lower() == "standby"
+                if is_standby:
+                    return self._last_problem_state if self._last_problem_state is not None else False
+
+                current_time = datetime.now(timezone.utc)
+                should_check_smart = (
+                    self._smart_status is None  # First check
+                    or self._spin_down_delay == SpinDownDelay.NEVER  # Never spin down
+                    or (
+                        self._last_smart_check is not None
+                        and (
+                            current_time - self._last_smart_check
+                        ).total_seconds() >= self._spin_down_delay.to_seconds()
                     )
+                )
 
-                    if should_check_smart:
-                        self._last_smart_check = current_time
-                        return self._analyze_smart_status(disk)
+                if should_check_smart:
+                    self._last_smart_check = current_time
+                    return self._analyze_smart_status(disk)
 
-                    return self._last_problem_state if self._last_problem_state is not None else False
+                return self._last_problem_state if self._last_problem_state is not None else False
 
             return None
 
@@ -422,70 +424,70 @@ class UnraidPoolDiskSensor(UnraidBinarySensorBase, DiskDataHelperMixin):
     def extra_state_attributes(self) -> dict[str, StateType]:
         """Return additional state attributes."""
         try:
-            for disk in self.coordinator.data["system_stats"]["individual_disks"]:
-                if disk["name"] == self._disk_name:
-                    # Get current disk state
-                    is_standby = disk.get("state", "unknown").lower() == "standby"
-
-                    # Get storage attributes
-                    attrs = self._get_storage_attributes(
-                        total=disk.get("total", 0),
-                        used=disk.get("used", 0),
-                        free=disk.get("free", 0),
-                        mount_point=disk.get("mount_point"),
-                        device=self._device,
-                        is_standby=is_standby
-                    )
+            disk = find_disk(self.coordinator.data, self._disk_name)
+            if disk is not None:
+                # Get current disk state
+                is_standby = disk.get("state", "unknown").lower() == "standby"
+
+                # Get storage attributes
+                attrs = self._get_storage_attributes(
+                    total=disk.get("total", 0),
+                    used=disk.get("used", 0),
+                    free=disk.get("free", 0),
+                    mount_point=disk.get("mount_point"),
+                    device=self._device,
+                    is_standby=is_standby
+                )
 
-                    # Add disk serial
-                    disk_map = get_unraid_disk_mapping(
-                        {"system_stats": self.coordinator.data.get("system_stats", {})}
-                    )
-                    if serial := disk_map.get(self._disk_name, {}).get("serial"):
-                        attrs["disk_serial"] = serial
-
-                    # Handle temperature based on device type
-                    temp = disk.get("temperature")
-                    if self._is_nvme:
-                        # NVMe drives always show actual temperature from SMART data
-                        smart_data = disk.get("smart_data", {})
-                        nvme_temp = (
-                            smart_data.get("temperature")
-                            or temp
-                            or smart_data.get("nvme_temperature")
-                        )
-                        if not is_standby and nvme_temp is not None:
-                            self._last_temperature = nvme_temp
-                        temp = nvme_temp  # Use NVMe temp for display
-                    else:
-                        # SATA drives
-                        if not is_standby and temp is not None:
-                            self._last_temperature = temp
-
-                    attrs["Temperature"] = self._get_temperature_str(
-                        self._last_temperature if is_standby else temp,
-                        is_standby
+                # Add disk serial
+                disk_map = get_unraid_disk_mapping(
+                    {"system_stats": self.coordinator.data.get("system_stats", {})}
+                )
+                if serial := disk_map.get(self._disk_name, {}).get("serial"):
+                    attrs["disk_serial"] = serial
+
+                # Handle temperature based on device type
+                temp = disk.get("temperature")
+                if self._is_nvme:
+                    # NVMe drives always show actual temperature from SMART data
+                    smart_data = disk.get("smart_data", {})
+                    nvme_temp = (
+                        smart_data.get("temperature")
+                        or temp
+                        or smart_data.get("nvme_temperature")
                     )
+                    if not is_standby and nvme_temp is not None:
+                        self._last_temperature = nvme_temp
+                    temp = nvme_temp  # Use NVMe temp for display
+                else:
+                    # SATA drives
+                    if not is_standby and temp is not None:
+                        self._last_temperature = temp
 
-                    # Add SMART status
-                    if smart_data := disk.get("smart_data", {}):
-                        attrs["SMART Status"] = (
-                            "Passed" if smart_data.get("smart_status", True)
-                            else "Failed"
-                        )
+                attrs["Temperature"] = self._get_temperature_str(
+                    self._last_temperature if is_standby else temp,
+                    is_standby
+                )
+
+                # Add SMART status
+                if smart_data := disk.get("smart_data", {}):
+                    attrs["SMART Status"] = (
+                        "Passed" if smart_data.get("smart_status", True)
+                        else "Failed"
+                    )
 
-                    # Add spin down delay
-                    attrs["Spin Down Delay"] = self._spin_down_delay.to_human_readable()
+                # Add spin down delay
+                attrs["Spin Down Delay"] = self._spin_down_delay.to_human_readable()
 
-                    # Add any problem details
-                    if self._problem_attributes:
-                        attrs["Problem Details"] = self._problem_attributes
+                # Add any problem details
+                if self._problem_attributes:
+                    attrs["Problem Details"] = self._problem_attributes
 
-                    # Add pool type
-                    attrs["Pool Type"] = "Cache" if self._disk_name == "cache" else "Custom Pool"
-                    attrs["Device Type"] = "NVMe" if self._is_nvme else "SATA"
+                # Add pool type
+                attrs["Pool Type"] = "Cache" if self._disk_name == "cache" else "Custom Pool"
+                attrs["Device Type"] = "NVMe" if self._is_nvme else "SATA"
 
-                    return attrs
+                return attrs
 
             return {}
 
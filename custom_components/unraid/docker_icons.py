@@ -0,0 +1,219 @@
+"""Local cache of Docker container icons."""
+from __future__ import annotations
+
+import logging
+import asyncio
+import hashlib
+import os
+import shutil
+import time
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, Optional
+
+import aiofiles # type: ignore
+import aiofiles.os # type: ignore
+
+from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.helpers.storage import STORAGE_DIR, Store # type: ignore
+from homeassistant.util import dt as dt_util # type: ignore
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DOCKER_ICON_STORAGE_VERSION = 1
+
+# Seconds to batch manifest updates before writing the store
+DOCKER_ICON_SAVE_DELAY = 30
+
+# Seconds between checks of the server's icon versions
+DOCKER_ICON_INDEX_TTL = 600
+
+DOCKER_ICON_CONTENT_TYPE = "image/png"
+
+
+def docker_icon_directory(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the directory holding the icons of a config entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}_docker_icons", entry_id)
+
+
+class DockerIconCache:
+    """Container icons kept in the config directory and fetched on demand.
+
+    Icons are only transferred when an image entity is first shown or the
+    icon changed on the server, never as part of container polling. Files
+    are named by the SHA-256 of their content, so containers sharing an icon
+    share a file. A manifest maps each container to the version key of its
+    icon (modification time and size on the server) and the file holding it.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: Any, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._api = api
+        self._store = Store(
+            hass, DOCKER_ICON_STORAGE_VERSION, f"{DOMAIN}.docker_icons.{entry_id}"
+        )
+        self._directory = docker_icon_directory(hass, entry_id)
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._index_checked: Optional[float] = None
+
+    def claim_index_refresh(self) -> bool:
+        """Check if the server's icon versions are due a check, claiming it.
+
+        Returns True for only one caller per DOCKER_ICON_INDEX_TTL, which
+        should then call async_refresh_index.
+        """
+        if not self._loaded or not self._manifest:
+            return False
+        now = time.monotonic()
+        if self._index_checked is not None and now - self._index_checked < DOCKER_ICON_INDEX_TTL:
+            return False
+        self._index_checked = now
+        return True
+
+    def last_updated(self, container_name: str) -> Optional[datetime]:
+        """Return when the cached icon of a container last changed."""
+        entry = self._manifest.get(container_name)
+        if entry is None:
+            return None
+        return dt_util.parse_datetime(entry.get("updated", ""))
+
+    async def async_load(self) -> None:
+        """Load the manifest."""
+        if self._loaded:
+            return
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not load Docker icon manifest: %s", err)
+            stored = None
+        if isinstance(stored, dict) and isinstance(stored.get("icons"), dict):
+            self._manifest = {
+                name: entry for name, entry in stored["icons"].items()
+                if isinstance(entry, dict) and entry.get("sha256")
+            }
+        self._loaded = True
+
+    async def async_get_icon(self, container_name: str) -> Optional[bytes]:
+        """Return the icon of a container, fetching it if not cached or stale."""
+        await self.async_load()
+
+        entry = self._manifest.get(container_name)
+        if entry is not None and not entry.get("stale"):
+            data = await self._async_read(entry["sha256"])
+            if data is not None:
+                return data
+
+        async with self._lock:
+            try:
+                fetched = await self._api.get_docker_icon(container_name)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Error fetching icon for container '%s': %s", container_name, err)
+                fetched = None
+
+            if fetched is None:
+                # Keep serving the previous icon if there was one
+                if entry is not None:
+                    return await self._async_read(entry["sha256"])
+                return None
+
+            key, data = fetched
+            digest = hashlib.sha256(data).hexdigest()
+            await self._async_write(digest, data)
+
+            previous = self._manifest.get(container_name) or {}
+            updated = previous.get("updated")
+            if previous.get("sha256") != digest or not updated:
+                updated = dt_util.utcnow().isoformat()
+            self._manifest[container_name] = {
+                "key": key,
+                "sha256": digest,
+                "updated": updated,
+            }
+            self._store.async_delay_save(self._data_to_save, DOCKER_ICON_SAVE_DELAY)
+
+            if previous.get("sha256") and previous["sha256"] != digest:
+                await self._async_prune()
+
+            _LOGGER.debug("Cached icon for container '%s' (%d bytes)", container_name, len(data))
+            return data
+
+    async def async_refresh_index(self) -> bool:
+        """Check the server's icon versions and mark changed icons stale.
+
+        Only modification times and sizes are transferred. Returns True if
+        any cached icon changed.
+        """
+        await self.async_load()
+        self._index_checked = time.monotonic()
+
+        try:
+            index = await self._api.get_docker_icon_index()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Error checking Docker icon versions: %s", err)
+            return False
+
+        changed = False
+        for name, entry in self._manifest.items():
+            key = index.get(name)
+            if key is None or key == entry.get("key") or entry.get("stale"):
+                continue
+            entry["stale"] = True
+            entry["updated"] = dt_util.utcnow().isoformat()
+            changed = True
+
+        if changed:
+            self._store.async_delay_save(self._data_to_save, DOCKER_ICON_SAVE_DELAY)
+        return changed
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to write to the store."""
+        return {"icons": self._manifest}
+
+    def _path(self, digest: str) -> str:
+        """Return the file holding an icon."""
+        return os.path.join(self._directory, f"{digest}.png")
+
+    async def _async_read(self, digest: str) -> Optional[bytes]:
+        """Read a cached icon file."""
+        try:
+            async with aiofiles.open(self._path(digest), mode="rb") as file:
+                return await file.read()
+        except OSError:
+            return None
+
+    async def _async_write(self, digest: str, data: bytes) -> None:
+        """Write an icon file unless one with the same content exists."""
+        path = self._path(digest)
+        if await aiofiles.os.path.exists(path):
+            return
+        await aiofiles.os.makedirs(self._directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        async with aiofiles.open(temp_path, mode="wb") as file:
+            await file.write(data)
+        await aiofiles.os.replace(temp_path, path)
+
+    async def _async_prune(self) -> None:
+        """Delete icon files no container refers to."""
+        referenced = {f"{entry['sha256']}.png" for entry in self._manifest.values()}
+        try:
+            filenames = await aiofiles.os.listdir(self._directory)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename not in referenced:
+                try:
+                    await aiofiles.os.remove(os.path.join(self._directory, filename))
+                except OSError as err:
+                    _LOGGER.debug("Could not delete cached icon %s: %s", filename, err)
+
+    async def async_remove(self) -> None:
+        """Delete the manifest and all cached icons."""
+        await self._store.async_remove()
+        await self._hass.async_add_executor_job(
+            partial(shutil.rmtree, self._directory, ignore_errors=True)
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Tuple, Dict, Optional, Pattern, List, Any
 from homeassistant.util import dt as dt_util # type: ignore
@@ -276,8 +277,8 @@ def get_disk_number(disk_name: str) -> Optional[int]:
 def get_disk_identifiers(coordinator_data: dict, disk_name: str) -> Tuple[Optional[str], Optional[str]]:
     """Get device path and serial number for a disk with consistent fallbacks.
 
-    Note: This function should eventually be migrated to use the DiskMapper class
-    in api/disk_mapper.py, which provides more comprehensive disk mapping functionality.
+    disk_mappings is published by the coordinator from the API's shared
+    DiskMapper registry, so the first lookup is a dictionary read.
     """
     device = None
     serial = None
@@ -387,7 +388,7 @@ def is_solid_state_drive(disk_data: dict) -> bool:
     """Determine if a disk is a solid state drive (NVME or SSD)."""
     try:
         # Guard against None or invalid disk_data
-        if not disk_data or not isinstance(disk_data, dict):
+        if not disk_data or not isinstance(disk_data, Mapping):
             _LOGGER.debug("Invalid disk_data provided to is_solid_state_drive: %s", disk_data)
             return False
 
@@ -503,6 +504,22 @@ class DiskDataHelperMixin:
             return "N/A"
         return f"{temp_value}°C"
 
+class SnapshotChangeMixin:
+    """Skip state writes for coordinator entities whose data did not change."""
+
+    # Snapshot keys the entity state depends on, see models.diff_snapshots.
+    # None writes state on every coordinator update.
+    _snapshot_keys: Optional[Tuple[str, ...]] = None
+    _last_written_available: Optional[bool] = None
+
+    def _should_write_state(self) -> bool:
+        """Check if the last coordinator update affects this entity."""
+        available = self.coordinator.last_update_success
+        if available != self._last_written_available:
+            self._last_written_available = available
+            return True
+        return self.coordinator.has_changed(self._snapshot_keys)
+
 class SpeedUnit(Enum):
     """Speed units with their multipliers."""
     BYTES = (1, "B")
@@ -0,0 +1,129 @@
+"""Persistent store of static Unraid host facts."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.helpers.storage import Store # type: ignore
+
+from .const import DOMAIN
+from .api.snapshot_operations import split_sections
+
+_LOGGER = logging.getLogger(__name__)
+
+HOST_FACTS_STORAGE_VERSION = 1
+
+# Seconds to batch fact updates before writing the store
+HOST_FACTS_SAVE_DELAY = 30
+
+# Facts that depend on the disk layout, dropped when disk.cfg changes
+DISK_FACTS = ("disk_mapping", "usb_devices")
+
+# Identifies the current boot and disk configuration in one round trip
+HOST_IDENTITY_COMMAND = (
+    "echo '===BOOT_ID==='; cat /proc/sys/kernel/random/boot_id; "
+    "echo '===DISK_CFG==='; md5sum /boot/config/disk.cfg 2>/dev/null | cut -d' ' -f1"
+)
+
+
+@dataclass(frozen=True)
+class HostIdentity:
+    """The host, boot and disk configuration facts are valid for."""
+    host: str
+    boot_id: str
+    disk_config: str
+
+
+def parse_host_identity(host: str, output: str) -> Optional[HostIdentity]:
+    """Parse the output of HOST_IDENTITY_COMMAND."""
+    sections = split_sections(output)
+    boot_id = sections.get("BOOT_ID", "").strip()
+    if not boot_id:
+        return None
+    return HostIdentity(
+        host=host,
+        boot_id=boot_id,
+        disk_config=sections.get("DISK_CFG", "").strip(),
+    )
+
+
+class HostFactsStore:
+    """Facts about an Unraid host that only change when it reboots.
+
+    Hostname, disk mapping, USB detection results and fan hardware presence
+    are saved with the host's boot id. They are restored on the next start
+    while the server is still in the same boot, so setup doesn't have to probe
+    for them again. Disk related facts are also dropped when disk.cfg changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store = Store(
+            hass, HOST_FACTS_STORAGE_VERSION, f"{DOMAIN}.host_facts.{entry_id}"
+        )
+        self._identity: Optional[HostIdentity] = None
+        self._facts: Dict[str, Any] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Check if the store was loaded for an identified host."""
+        return self._identity is not None
+
+    async def async_load(self, identity: HostIdentity) -> Dict[str, Any]:
+        """Load the facts still valid for identity."""
+        self._identity = identity
+        self._facts = {}
+
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not load stored host facts: %s", err)
+            return {}
+
+        if not isinstance(stored, dict) or not isinstance(stored.get("facts"), dict):
+            return {}
+
+        if stored.get("host") != identity.host or stored.get("boot_id") != identity.boot_id:
+            _LOGGER.debug("Server rebooted since host facts were saved, discarding them")
+            return {}
+
+        facts = dict(stored["facts"])
+        if stored.get("disk_config") != identity.disk_config:
+            _LOGGER.debug("Disk configuration changed, discarding stored disk facts")
+            for key in DISK_FACTS:
+                facts.pop(key, None)
+
+        self._facts = facts
+        _LOGGER.debug("Restored host facts: %s", ", ".join(sorted(facts)) or "none")
+        return dict(facts)
+
+    def update(self, facts: Dict[str, Any]) -> None:
+        """Record facts and schedule a save if anything changed."""
+        if self._identity is None:
+            return
+
+        changed = False
+        for key, value in facts.items():
+            if value in (None, {}, []) or self._facts.get(key) == value:
+                continue
+            self._facts[key] = value
+            changed = True
+
+        if changed:
+            self._store.async_delay_save(self._data_to_save, HOST_FACTS_SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to write to the store."""
+        assert self._identity is not None
+        return {
+            "host": self._identity.host,
+            "boot_id": self._identity.boot_id,
+            "disk_config": self._identity.disk_config,
+            "facts": self._facts,
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the stored facts."""
+        await self._store.async_remove()
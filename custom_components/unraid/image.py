@@ -0,0 +1,107 @@
+"""Image platform for Unraid."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from homeassistant.components.image import ImageEntity # type: ignore
+from homeassistant.config_entries import ConfigEntry # type: ignore
+from homeassistant.core import HomeAssistant, callback # type: ignore
+from homeassistant.helpers.entity_platform import AddEntitiesCallback # type: ignore
+from homeassistant.helpers.update_coordinator import CoordinatorEntity # type: ignore
+from homeassistant.util import dt as dt_util # type: ignore
+
+from .const import DOMAIN
+from .coordinator import UnraidDataUpdateCoordinator
+from .docker_icons import DOCKER_ICON_CONTENT_TYPE
+from .entity_naming import EntityNaming
+from .models import find_container
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UnraidDockerIconImage(CoordinatorEntity, ImageEntity):
+    """Icon of a Docker container, loaded when first displayed."""
+
+    _attr_content_type = DOCKER_ICON_CONTENT_TYPE
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: UnraidDataUpdateCoordinator,
+        container_name: str
+    ) -> None:
+        """Initialize the image."""
+        super().__init__(coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._container_name = container_name
+        self._icons = coordinator.docker_icons
+
+        naming = EntityNaming(
+            domain=DOMAIN,
+            hostname=coordinator.hostname,
+            component="docker"
+        )
+        self._attr_unique_id = naming.get_entity_id(f"docker_{container_name}_icon")
+        self._attr_name = f"{container_name} Icon"
+        self._attr_entity_registry_enabled_default = False
+        self._attr_image_last_updated = self._icons.last_updated(container_name) or dt_util.utcnow()
+
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"{coordinator.entry.entry_id}_docker")},
+            "name": f"Unraid Docker ({naming.clean_hostname()})",
+            "manufacturer": "Docker",
+            "model": "Container Engine",
+            "via_device": (DOMAIN, coordinator.entry.entry_id),
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return if the container still exists."""
+        return (
+            super().available
+            and find_container(self.coordinator.data, self._container_name) is not None
+        )
+
+    async def async_image(self) -> bytes | None:
+        """Return the icon, fetching it from the server only if not cached."""
+        image = await self._icons.async_get_icon(self._container_name)
+        self._sync_last_updated()
+        return image
+
+    def _sync_last_updated(self) -> bool:
+        """Follow the cache's change time for this icon."""
+        updated: datetime | None = self._icons.last_updated(self._container_name)
+        if updated is None or updated == self._attr_image_last_updated:
+            return False
+        self._attr_image_last_updated = updated
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up icon changes, checking the server at most every few minutes."""
+        if self._icons.claim_index_refresh():
+            self.hass.async_create_task(self._icons.async_refresh_index())
+        self._sync_last_updated()
+        super()._handle_coordinator_update()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Unraid images based on a config entry."""
+    coordinator: UnraidDataUpdateCoordinator = entry.runtime_data
+
+    containers = coordinator.data.get("docker_containers") or []
+    if not containers:
+        _LOGGER.debug("No Docker containers found for icon images")
+        return
+
+    await coordinator.docker_icons.async_load()
+    async_add_entities(
+        UnraidDockerIconImage(coordinator, container["name"])
+        for container in containers
+        if container.get("name")
+    )
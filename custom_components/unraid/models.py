@@ -0,0 +1,410 @@
+"""Snapshot data model for Unraid coordinator data."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RecordMapping(MutableMapping):
+    """Dict-style access to record fields.
+
+    Entities were written against plain dicts, so records keep supporting
+    ``record["name"]``, ``record.get("state")``, ``"serial" in record`` and
+    item assignment. Keys the record has no field for live in ``extra``,
+    which is only allocated when needed.
+    Declared fields holding None are treated as absent, matching collectors
+    that leave optional keys out.
+    """
+
+    __slots__ = ()
+
+    # Dict key -> attribute name, for sources whose keys aren't valid identifiers
+    _KEY_MAP: ClassVar[Dict[str, str]] = {}
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+
+    extra: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_dict(cls, source: Mapping) -> RecordMapping:
+        """Build a record from a collector dict."""
+        if isinstance(source, cls):
+            return source
+        record = cls()
+        for key, value in source.items():
+            record[key] = value
+        return record
+
+    def _attr_name(self, key: str) -> Optional[str]:
+        attr = self._KEY_MAP.get(key, key)
+        return attr if attr in self._FIELD_NAMES else None
+
+    def _key_for(self, attr: str) -> str:
+        for key, mapped in self._KEY_MAP.items():
+            if mapped == attr:
+                return key
+        return attr
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._attr_name(key)
+        if attr is not None:
+            return getattr(self, attr)
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        attr = self._attr_name(key)
+        if attr is not None:
+            setattr(self, attr, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        attr = self._attr_name(key)
+        if attr is not None:
+            setattr(self, attr, None)
+        elif self.extra is None:
+            raise KeyError(key)
+        else:
+            del self.extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it is absent or None."""
+        attr = self._attr_name(key)
+        if attr is not None:
+            value = getattr(self, attr)
+        elif self.extra is not None:
+            value = self.extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __iter__(self) -> Iterator[str]:
+        for attr in self._FIELD_NAMES:
+            if getattr(self, attr) is not None:
+                yield self._key_for(attr)
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        attr = self._attr_name(key)
+        if attr is not None:
+            return getattr(self, attr) is not None
+        return self.extra is not None and key in self.extra
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a plain dict copy, like dict.copy()."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+def _record(cls):
+    """Make a slotted dataclass record and register its field names."""
+    cls = dataclass(slots=True, eq=False, repr=False)(cls)
+    cls._FIELD_NAMES = tuple(f.name for f in fields(cls) if f.name != "extra")
+    return cls
+
+
+@_record
+class DiskRecord(RecordMapping):
+    """Disk or pool entry from system_stats.individual_disks."""
+    name: Optional[str] = None
+    mount_point: Optional[str] = None
+    device: Optional[str] = None
+    state: Optional[str] = None
+    total: Optional[int] = None
+    used: Optional[int] = None
+    free: Optional[int] = None
+    percentage: Optional[float] = None
+    temperature: Optional[int] = None
+    smart_status: Optional[str] = None
+    smart_data: Optional[Dict[str, Any]] = None
+    serial: Optional[str] = None
+    filesystem: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@_record
+class ContainerRecord(RecordMapping):
+    """Docker container entry from docker_containers."""
+    name: Optional[str] = None
+    id: Optional[str] = None
+    state: Optional[str] = None
+    status: Optional[str] = None
+    image: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@_record
+class VMRecord(RecordMapping):
+    """Virtual machine entry from vms."""
+    name: Optional[str] = None
+    status: Optional[str] = None
+    os_type: Optional[str] = None
+    cpus: Optional[Any] = None
+    memory: Optional[Any] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@_record
+class InterfaceRecord(RecordMapping):
+    """Network interface entry from system_stats.network_stats."""
+    rx_bytes: Optional[int] = None
+    tx_bytes: Optional[int] = None
+    rx_speed: Optional[float] = None
+    tx_speed: Optional[float] = None
+    rx_peak: Optional[float] = None
+    tx_peak: Optional[float] = None
+    connected: Optional[bool] = None
+    speed: Optional[str] = None
+    duplex: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@_record
+class UPSRecord(RecordMapping):
+    """UPS status from ups_info (apcaccess keys)."""
+    _KEY_MAP: ClassVar[Dict[str, str]] = {
+        "STATUS": "status",
+        "BCHARGE": "battery_charge",
+        "LOADPCT": "load_percent",
+        "TIMELEFT": "time_left",
+        "NOMPOWER": "nominal_power",
+        "MODEL": "model",
+    }
+
+    status: Optional[str] = None
+    battery_charge: Optional[str] = None
+    load_percent: Optional[str] = None
+    time_left: Optional[str] = None
+    nominal_power: Optional[str] = None
+    model: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class SnapshotIndex:
+    """Lookups into a snapshot by name, device and serial."""
+    disks_by_name: Dict[str, DiskRecord] = field(default_factory=dict)
+    disks_by_device: Dict[str, DiskRecord] = field(default_factory=dict)
+    disks_by_serial: Dict[str, DiskRecord] = field(default_factory=dict)
+    containers_by_name: Dict[str, ContainerRecord] = field(default_factory=dict)
+    vms_by_name: Dict[str, VMRecord] = field(default_factory=dict)
+
+
+class UnraidSnapshot(dict):
+    """Coordinator data with records and indexes built once per update."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.index = SnapshotIndex()
+
+
+def _to_records(items: Any, record_cls: type) -> Any:
+    """Convert a list of collector dicts to records, leaving other values alone."""
+    if not isinstance(items, list):
+        return items
+    return [
+        record_cls.from_dict(item) if isinstance(item, Mapping) else item
+        for item in items
+    ]
+
+
+def build_snapshot(data: Mapping) -> UnraidSnapshot:
+    """Convert coordinator data into records and build lookup indexes."""
+    snapshot = UnraidSnapshot(data)
+    index = snapshot.index
+
+    system_stats = snapshot.get("system_stats")
+    if isinstance(system_stats, Mapping):
+        system_stats = dict(system_stats)
+        snapshot["system_stats"] = system_stats
+
+        disks = _to_records(system_stats.get("individual_disks"), DiskRecord)
+        if isinstance(disks, list):
+            system_stats["individual_disks"] = disks
+            for disk in disks:
+                if not isinstance(disk, DiskRecord):
+                    continue
+                if disk.name:
+                    index.disks_by_name.setdefault(disk.name, disk)
+                if disk.device:
+                    index.disks_by_device.setdefault(disk.device, disk)
+                if disk.serial:
+                    index.disks_by_serial.setdefault(disk.serial, disk)
+
+        network_stats = system_stats.get("network_stats")
+        if isinstance(network_stats, Mapping):
+            system_stats["network_stats"] = {
+                name: InterfaceRecord.from_dict(stats) if isinstance(stats, Mapping) else stats
+                for name, stats in network_stats.items()
+            }
+
+        if isinstance(system_stats.get("ups_info"), Mapping):
+            system_stats["ups_info"] = UPSRecord.from_dict(system_stats["ups_info"])
+
+    if isinstance(snapshot.get("ups_info"), Mapping):
+        snapshot["ups_info"] = UPSRecord.from_dict(snapshot["ups_info"])
+
+    containers = _to_records(snapshot.get("docker_containers"), ContainerRecord)
+    if isinstance(containers, list):
+        snapshot["docker_containers"] = containers
+        for container in containers:
+            if isinstance(container, ContainerRecord) and container.name:
+                index.containers_by_name.setdefault(container.name, container)
+
+    vms = _to_records(snapshot.get("vms"), VMRecord)
+    if isinstance(vms, list):
+        snapshot["vms"] = vms
+        for vm in vms:
+            if isinstance(vm, VMRecord) and vm.name:
+                index.vms_by_name.setdefault(vm.name, vm)
+
+    return snapshot
+
+
+def _get_index(data: Any) -> Optional[SnapshotIndex]:
+    return data.index if isinstance(data, UnraidSnapshot) else None
+
+
+def find_disk(data: Any, name: str) -> Optional[Mapping]:
+    """Find a disk entry by name."""
+    if (index := _get_index(data)) is not None:
+        return index.disks_by_name.get(name)
+    disks: List[Mapping] = (data or {}).get("system_stats", {}).get("individual_disks", [])
+    return next((disk for disk in disks if disk.get("name") == name), None)
+
+
+def find_container(data: Any, name: str) -> Optional[Mapping]:
+    """Find a Docker container entry by name."""
+    if (index := _get_index(data)) is not None:
+        return index.containers_by_name.get(name)
+    containers: List[Mapping] = (data or {}).get("docker_containers", [])
+    return next((c for c in containers if c.get("name") == name), None)
+
+
+def find_vm(data: Any, name: str) -> Optional[Mapping]:
+    """Find a VM entry by name."""
+    if (index := _get_index(data)) is not None:
+        return index.vms_by_name.get(name)
+    vms: List[Mapping] = (data or {}).get("vms", [])
+    return next((vm for vm in vms if vm.get("name") == name), None)
+
+
+def disk_key(name: str) -> str:
+    """Return the change key for a disk entry."""
+    return f"disk:{name}"
+
+
+def container_key(name: str) -> str:
+    """Return the change key for a Docker container entry."""
+    return f"container:{name}"
+
+
+def disk_io_key(name: str) -> str:
+    """Return the change key for the I/O rates of a disk."""
+    return f"disk_io:{name}"
+
+
+def vm_key(name: str) -> str:
+    """Return the change key for a VM entry."""
+    return f"vm:{name}"
+
+
+def vm_stats_key(name: str) -> str:
+    """Return the change key for the metrics of a running VM."""
+    return f"vm_stats:{name}"
+
+
+def interface_key(name: str) -> str:
+    """Return the change key for a network interface entry."""
+    return f"interface:{name}"
+
+
+def _diff_named_list(
+    old: Any, new: Any, make_key, group_key: str, changed: Set[str]
+) -> None:
+    """Add keys for entries of a list of named entries that were added, removed or changed."""
+    def by_name(items: Any) -> Dict[str, Any]:
+        if not isinstance(items, list):
+            return {}
+        return {
+            item.get("name"): item
+            for item in items
+            if isinstance(item, Mapping) and item.get("name")
+        }
+
+    old_items, new_items = by_name(old), by_name(new)
+    for name in old_items.keys() | new_items.keys():
+        if old_items.get(name) != new_items.get(name):
+            changed.add(make_key(name))
+            changed.add(group_key)
+
+
+def _diff_named_mapping(
+    old: Any, new: Any, make_key, group_key: str, changed: Set[str]
+) -> None:
+    """Add keys for entries of a name -> entry mapping that were added, removed or changed."""
+    old = old if isinstance(old, Mapping) else {}
+    new = new if isinstance(new, Mapping) else {}
+    for name in old.keys() | new.keys():
+        if old.get(name) != new.get(name):
+            changed.add(make_key(name))
+            changed.add(group_key)
+
+
+def diff_snapshots(old: Optional[Mapping], new: Mapping) -> Optional[Set[str]]:
+    """Return the change keys that differ between two snapshots.
+
+    Top-level values use their key ("array_state"), system stats use
+    "system_stats.<key>", and per-item entries use disk_key(), disk_io_key(),
+    container_key(), vm_key(), vm_stats_key() and interface_key() in addition
+    to their list's key. Returns None when there is nothing to compare against, meaning
+    everything changed.
+    """
+    if not old:
+        return None
+
+    changed: Set[str] = set()
+
+    for key in old.keys() | new.keys():
+        old_value, new_value = old.get(key), new.get(key)
+        if key == "docker_containers":
+            _diff_named_list(old_value, new_value, container_key, key, changed)
+        elif key == "vms":
+            _diff_named_list(old_value, new_value, vm_key, key, changed)
+        elif key == "vm_stats":
+            _diff_named_mapping(old_value, new_value, vm_stats_key, key, changed)
+        elif key == "system_stats":
+            old_stats = old_value if isinstance(old_value, Mapping) else {}
+            new_stats = new_value if isinstance(new_value, Mapping) else {}
+            for stats_key in old_stats.keys() | new_stats.keys():
+                group_key = f"system_stats.{stats_key}"
+                old_stat, new_stat = old_stats.get(stats_key), new_stats.get(stats_key)
+                if stats_key == "individual_disks":
+                    _diff_named_list(old_stat, new_stat, disk_key, group_key, changed)
+                elif stats_key == "disk_io":
+                    _diff_named_mapping(old_stat, new_stat, disk_io_key, group_key, changed)
+                elif stats_key == "network_stats":
+                    _diff_named_mapping(old_stat, new_stat, interface_key, group_key, changed)
+                elif old_stat != new_stat:
+                    changed.add(group_key)
+        elif old_value != new_value:
+            changed.add(key)
+
+    return changed
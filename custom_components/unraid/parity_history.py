@@ -0,0 +1,257 @@
+"""Incremental reader of the Unraid parity check log."""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .helpers import parse_speed_string
+
+_LOGGER = logging.getLogger(__name__)
+
+# Checks kept in memory; the log grows by one line per check
+PARITY_HISTORY_MAX_RECORDS = 100
+
+# Checks listed in the statistics
+PARITY_RECENT_CHECKS = 5
+
+PARITY_HISTORY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass(frozen=True)
+class ParityCheckRecord:
+    """One line of parity-checks.log.
+
+    Old: YYYY MMM DD HH:MM:SS|Duration|Speed|Status|Errors
+    New: YYYY MMM DD HH:MM:SS|Duration|Speed|Status|Errors|Type|Size|Duration|Step|Description
+    """
+    date: datetime
+    duration: Optional[int]
+    speed: float
+    exit_code: str
+    errors: int = 0
+    check_type: Optional[str] = None
+    size: Optional[str] = None
+    description: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether the check ran to completion."""
+        return self.exit_code == "0"
+
+    @property
+    def speed_mb(self) -> float:
+        """Return the average speed in MB/s."""
+        return round(self.speed / 1_000_000, 2)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the check as published in array_state.parity_history."""
+        if self.duration is not None:
+            hours, remainder = divmod(self.duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            duration = f"{hours} hours, {minutes} minutes, {seconds} seconds"
+        else:
+            duration = "Unknown"
+
+        check_info = {
+            "date": self.date.strftime(PARITY_HISTORY_DATE_FORMAT),
+            "duration": duration,
+            "speed": f"{self.speed_mb} MB/s",
+            "status": "Success" if self.succeeded else f"Failed ({self.exit_code} errors)",
+            "errors": self.errors,
+            "type": self.check_type or "Unknown",
+            "size": self.size or "Unknown",
+        }
+        if self.description is not None:
+            check_info["description"] = self.description
+        return check_info
+
+
+def parse_parity_history_line(line: str, now: Optional[datetime] = None) -> Optional[ParityCheckRecord]:
+    """Parse one log line, None when it isn't a usable check."""
+    fields = line.strip().split("|")
+    # Minimum required fields: date, duration, speed, status
+    if len(fields) < 4:
+        if line.strip():
+            _LOGGER.warning("Invalid parity history line (insufficient fields): %s", line)
+        return None
+
+    date_str = fields[0].strip()
+    try:
+        if date_str[:4].isdigit():
+            check_date = datetime.strptime(date_str, "%Y %b %d %H:%M:%S")
+        else:
+            # Old releases left out the year; use the latest year not in the future
+            now = now or datetime.now()
+            check_date = datetime.strptime(f"{now.year} {date_str}", "%Y %b %d %H:%M:%S")
+            if check_date > now:
+                check_date = check_date.replace(year=now.year - 1)
+    except ValueError:
+        _LOGGER.warning("Could not parse parity history date: %s", date_str)
+        return None
+
+    # Skip invalid dates (like 1969)
+    if check_date.year < 2000:
+        _LOGGER.debug("Skipping invalid parity history date: %s", date_str)
+        return None
+
+    try:
+        duration: Optional[int] = int(fields[1])
+    except ValueError:
+        duration = None
+        _LOGGER.warning("Could not parse duration value: %s", fields[1])
+
+    try:
+        speed = parse_speed_string(fields[2].strip())
+    except ValueError as err:
+        _LOGGER.warning("Could not parse speed value: %s - %s", fields[2], err)
+        speed = 0.0
+
+    try:
+        errors = int(fields[4]) if len(fields) > 4 else 0
+    except ValueError:
+        errors = 0
+
+    return ParityCheckRecord(
+        date=check_date,
+        duration=duration,
+        speed=speed,
+        exit_code=fields[3].strip(),
+        errors=errors,
+        check_type=fields[5] if len(fields) > 5 else None,
+        size=fields[6] if len(fields) > 6 else None,
+        description=fields[9] if len(fields) > 9 else None,
+    )
+
+
+class ParityHistory:
+    """Parsed parity check history, fed with what was appended to the log.
+
+    The reader remembers the inode and size of the log it has consumed. Each
+    read asks for the bytes past that position only (see
+    parity_history_command), so a log without new checks costs nothing to
+    transfer or parse. A replaced or truncated log is read again in full.
+
+    Reads can overlap (the polling tick and an event-driven array refresh),
+    so each one is applied only if it started from the current position.
+    """
+
+    def __init__(self, max_records: int = PARITY_HISTORY_MAX_RECORDS) -> None:
+        """Initialize an empty history."""
+        self._records: Deque[ParityCheckRecord] = deque(maxlen=max_records)
+        self._position: Optional[Tuple[int, int]] = None
+        self._latest: Optional[Dict[str, Any]] = None
+        self._statistics: Dict[str, Any] = {}
+
+    @property
+    def position(self) -> Optional[Tuple[int, int]]:
+        """Return the (inode, size) of the consumed log."""
+        return self._position
+
+    @property
+    def latest_check(self) -> Optional[Dict[str, Any]]:
+        """Return the most recent check."""
+        return self._latest
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Return aggregates over the kept history."""
+        return self._statistics
+
+    @property
+    def records(self) -> List[ParityCheckRecord]:
+        """Return the kept checks, oldest first."""
+        return list(self._records)
+
+    def reset(self) -> None:
+        """Forget the history so the next read fetches the whole log."""
+        self._records.clear()
+        self._position = None
+        self._latest = None
+        self._statistics = {}
+
+    def update(
+        self,
+        base: Optional[Tuple[int, int]],
+        stat_output: str,
+        content: str
+    ) -> bool:
+        """Consume the output of parity_history_command built for position base.
+
+        Output read from a position that has moved on since is discarded; the
+        read that moved it already consumed these lines, and the next read
+        continues from there. Returns True when the history changed.
+        """
+        if base != self._position:
+            _LOGGER.debug(
+                "Discarding parity history read from %s, already at %s",
+                base,
+                self._position
+            )
+            return False
+
+        try:
+            inode, size = (int(value) for value in stat_output.split())
+        except ValueError:
+            # No log (yet); a history we had is gone with it
+            if self._position is None:
+                return False
+            self.reset()
+            return True
+
+        if self._position == (inode, size):
+            return False
+
+        appended = (
+            self._position is not None
+            and self._position[0] == inode
+            and size >= self._position[1]
+        )
+        if not appended:
+            _LOGGER.debug("Reading the whole parity history (inode %d, %d bytes)", inode, size)
+            self._records.clear()
+
+        now = datetime.now()
+        for line in content.splitlines():
+            if record := parse_parity_history_line(line, now):
+                self._records.append(record)
+
+        self._position = (inode, size)
+        self._refresh()
+        return True
+
+    def _refresh(self) -> None:
+        """Recompute the latest check and the statistics."""
+        records = list(self._records)
+        if not records:
+            self._latest = None
+            self._statistics = {}
+            return
+
+        latest = max(records, key=lambda record: record.date)
+        self._latest = latest.as_dict()
+
+        completed = [record for record in records if record.succeeded]
+        durations = [record.duration for record in completed if record.duration]
+        speeds = [record.speed_mb for record in completed if record.speed > 0]
+
+        # Latest completed check against the average of the ones before it
+        speed_trend = None
+        if len(speeds) >= 2:
+            previous = sum(speeds[:-1]) / len(speeds[:-1])
+            if previous:
+                speed_trend = round((speeds[-1] - previous) / previous * 100, 1)
+
+        self._statistics = {
+            "checks": len(records),
+            "failed_checks": len(records) - len(completed),
+            "average_duration": round(sum(durations) / len(durations)) if durations else None,
+            "average_speed": round(sum(speeds) / len(speeds), 2) if speeds else None,
+            "speed_trend": speed_trend,
+            "total_errors": sum(record.errors for record in records),
+            "recent_checks": [
+                record.as_dict() for record in reversed(records[-PARITY_RECENT_CHECKS:])
+            ],
+        }
@@ -19,6 +19,7 @@ from homeassistant.helpers.entity import DeviceInfo # type: ignore
 from ..const import DOMAIN
 from .const import UnraidSensorEntityDescription
 from ..entity_naming import EntityNaming
+from ..helpers import SnapshotChangeMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,7 +106,9 @@ class ValueValidationMixin:
             )
             return None
 
-class UnraidSensorBase(CoordinatorEntity, SensorEntity, SensorUpdateMixin, ValueValidationMixin):
+class UnraidSensorBase(
+    CoordinatorEntity, SensorEntity, SensorUpdateMixin, ValueValidationMixin, SnapshotChangeMixin
+):
     """Base class for Unraid sensors."""
 
     entity_description: UnraidSensorEntityDescription
@@ -190,6 +193,8 @@ class UnraidSensorBase(CoordinatorEntity, SensorEntity, SensorUpdateMixin, Value
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self._should_write_state():
+            return
         self._last_update = datetime.now(timezone.utc)
         self.async_write_ha_state()
 
@@ -0,0 +1,105 @@
+"""Disk I/O sensors for Unraid."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from homeassistant.components.sensor import ( # type: ignore
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.const import ( # type: ignore
+    PERCENTAGE,
+    UnitOfDataRate,
+)
+import homeassistant.util.dt as dt_util
+
+from .base import UnraidSensorBase
+from .const import UnraidSensorEntityDescription
+from ..models import disk_io_key
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DiskIOMetric:
+    """A per-disk value from system_stats.disk_io."""
+    key: str
+    name: str
+    icon: str
+    unit: Optional[str] = None
+    device_class: Optional[SensorDeviceClass] = None
+    precision: Optional[int] = 1
+    enabled_default: bool = True
+    # IOPS value shown as an attribute of the rate sensors
+    iops_key: Optional[str] = None
+
+
+DISK_IO_METRICS = (
+    DiskIOMetric(
+        "read_rate", "Read", "mdi:harddisk",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        iops_key="read_iops",
+    ),
+    DiskIOMetric(
+        "write_rate", "Write", "mdi:harddisk",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        iops_key="write_iops",
+    ),
+    DiskIOMetric("utilization", "Utilization", "mdi:gauge", PERCENTAGE),
+    DiskIOMetric(
+        "idle_since", "Idle Since", "mdi:sleep",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        precision=None,
+        enabled_default=False,
+    ),
+)
+
+
+class UnraidDiskIOSensor(UnraidSensorBase):
+    """I/O of an array or pool disk, computed from /proc/diskstats deltas."""
+
+    def __init__(self, coordinator, disk_name: str, metric: DiskIOMetric) -> None:
+        """Initialize the sensor."""
+        self._disk_name = disk_name
+        self._metric = metric
+        self._snapshot_keys = (disk_io_key(disk_name),)
+
+        is_timestamp = metric.device_class == SensorDeviceClass.TIMESTAMP
+        description = UnraidSensorEntityDescription(
+            key=f"disk_{disk_name}_io_{metric.key}",
+            name=f"{disk_name.capitalize()} {metric.name}",
+            icon=metric.icon,
+            native_unit_of_measurement=metric.unit,
+            device_class=metric.device_class,
+            state_class=None if is_timestamp else SensorStateClass.MEASUREMENT,
+            suggested_display_precision=metric.precision,
+            value_fn=self._get_value,
+        )
+        super().__init__(coordinator, description)
+        self._attr_entity_registry_enabled_default = metric.enabled_default
+
+    def _get_stats(self, data: dict) -> Optional[dict]:
+        """Return the I/O rates of this disk."""
+        return (data.get("system_stats", {}).get("disk_io") or {}).get(self._disk_name)
+
+    def _get_value(self, data: dict) -> Any:
+        """Return the metric value, None until a second sample gives a rate."""
+        stats = self._get_stats(data)
+        if stats is None:
+            return None
+        value = stats.get(self._metric.key)
+        if self._metric.device_class == SensorDeviceClass.TIMESTAMP:
+            # Unknown while the disk is busy
+            return dt_util.parse_datetime(value) if value else None
+        return value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the disk name and operations per second."""
+        attrs: dict[str, Any] = {"disk_name": self._disk_name}
+        stats = self._get_stats(self.coordinator.data)
+        if stats is not None and self._metric.iops_key:
+            attrs["iops"] = stats.get(self._metric.iops_key)
+        return attrs
@@ -19,8 +19,6 @@ from .const import (
     EXCLUDED_INTERFACES,
 )
 
-from  ..api.network_operations import NetworkRateSmoothingMixin
-
 _LOGGER = logging.getLogger(__name__)
 
 @dataclass
@@ -36,8 +34,12 @@ NETWORK_UNITS = [
     NetworkSpeedUnit(1000000000, "Gbit/s"),
 ]
 
-class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
-    """Network interface sensor for Unraid."""
+class UnraidNetworkSensor(UnraidSensorBase):
+    """Network interface sensor for Unraid.
+
+    Rates are smoothed per interface by the API's network stats tracker;
+    the sensor only picks a display unit.
+    """
 
     def __init__(
         self,
@@ -50,8 +52,6 @@ class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
         self._direction = direction
         self._unit = NetworkSpeedUnit(1, "bit/s")  # Start with lowest unit
 
-
-
         description = UnraidSensorEntityDescription(
             key=f"network_{interface}_{direction}",
             name=f"{interface} {direction.capitalize()}",
@@ -63,17 +63,7 @@ class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
             available_fn=self._is_interface_available,
         )
 
-        # Initialize both parent classes properly
-        UnraidSensorBase.__init__(self, coordinator, description)
-        NetworkRateSmoothingMixin.__init__(self)
-
-        _LOGGER.debug(
-            "UnraidNetworkSensor initialized for %s %s. Has smoothing methods: rx=%s, tx=%s",
-            interface,
-            direction,
-            hasattr(self, 'calculate_rx_rate'),
-            hasattr(self, 'calculate_tx_rate')
-        )
+        super().__init__(coordinator, description)
 
     def _get_unit(self, bits_per_sec: float) -> NetworkSpeedUnit:
         """Get the most appropriate unit for a network speed."""
@@ -101,7 +91,7 @@ class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
         return NETWORK_UNITS[0]
 
     def _get_network_rate(self, data: dict) -> float | None:
-        """Calculate current network rate with smoothing."""
+        """Return the smoothed network rate in the current display unit."""
         try:
             network_stats = data.get("system_stats", {}).get("network_stats", {})
             if self._interface not in network_stats:
@@ -113,27 +103,14 @@ class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
                 return 0.0
 
             stats = network_stats[self._interface]
-            current_bytes = (
-                stats.get("rx_bytes", 0)
-                if self._direction == "inbound"
-                else stats.get("tx_bytes", 0)
-            )
-
-            _LOGGER.debug(
-                "%s %s: Processing bytes=%d",
-                self._interface,
-                self._direction,
-                current_bytes
-            )
-
             rate = (
-                self.calculate_rx_rate(current_bytes)
+                stats.get("rx_speed")
                 if self._direction == "inbound"
-                else self.calculate_tx_rate(current_bytes)
-            )
+                else stats.get("tx_speed")
+            ) or 0.0
 
             _LOGGER.debug(
-                "%s %s: Raw rate=%.2f bits/s",
+                "%s %s: Smoothed rate=%.2f bits/s",
                 self._interface,
                 self._direction,
                 rate
@@ -252,6 +229,12 @@ class UnraidNetworkSensor(UnraidSensorBase, NetworkRateSmoothingMixin):
             else:
                 attrs["duplex_mode"] = "Unknown"
 
+            # Add the peak rate over the recent sample window
+            peak = stats.get("rx_peak" if self._direction == "inbound" else "tx_peak")
+            if peak:
+                unit = self._get_unit(peak)
+                attrs["peak_rate"] = f"{peak / unit.multiplier:.2f} {unit.symbol}"
+
             # Add total bytes transferred with formatting
             if self._direction == "inbound":
                 total_bytes = stats.get("rx_bytes", 0)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import List, Any
 
 from homeassistant.helpers.entity import Entity
@@ -55,11 +56,13 @@ def register_storage_sensors() -> None:
         UnraidDiskSensor,
         UnraidPoolSensor,
     )
+    from .disk_io import UnraidDiskIOSensor
 
     # Register sensor types
     SensorFactory.register_sensor_type("array", UnraidArraySensor)
     SensorFactory.register_sensor_type("disk", UnraidDiskSensor)
     SensorFactory.register_sensor_type("pool", UnraidPoolSensor)
+    SensorFactory.register_sensor_type("disk_io", UnraidDiskIOSensor)
 
     # Register creator functions
     SensorFactory.register_sensor_creator(
@@ -67,6 +70,11 @@ def register_storage_sensors() -> None:
         create_storage_sensors,
         group="storage"
     )
+    SensorFactory.register_sensor_creator(
+        "disk_io_sensors",
+        create_disk_io_sensors,
+        group="storage"
+    )
 
 
 def register_network_sensors() -> None:
@@ -84,6 +92,37 @@ def register_network_sensors() -> None:
     )
 
 
+def register_vm_sensors() -> None:
+    """Register VM sensors with the factory."""
+    from .vm import UnraidVMSensor
+
+    # Register sensor types
+    SensorFactory.register_sensor_type("vm", UnraidVMSensor)
+
+    # Register creator functions
+    SensorFactory.register_sensor_creator(
+        "vm_sensors",
+        create_vm_sensors,
+        group="vm"
+    )
+
+
+def register_zfs_sensors() -> None:
+    """Register ZFS sensors with the factory."""
+    from .zfs import UnraidZFSARCHitRateSensor, UnraidZFSScrubRateSensor
+
+    # Register sensor types
+    SensorFactory.register_sensor_type("zfs_arc_hit_rate", UnraidZFSARCHitRateSensor)
+    SensorFactory.register_sensor_type("zfs_scrub_rate", UnraidZFSScrubRateSensor)
+
+    # Register creator functions
+    SensorFactory.register_sensor_creator(
+        "zfs_sensors",
+        create_zfs_sensors,
+        group="storage"
+    )
+
+
 def register_ups_sensors() -> None:
     """Register UPS sensors with the factory.
 
@@ -203,7 +242,7 @@ def create_storage_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) ->
 
         # First pass - categorize disks
         for disk in disk_data:
-            if not isinstance(disk, dict):
+            if not isinstance(disk, Mapping):
                 continue
 
             disk_name = disk.get("name", "")
@@ -288,6 +327,29 @@ def create_storage_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) ->
     return entities
 
 
+def create_disk_io_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) -> List[Entity]:
+    """Create I/O sensors for array and pool disks."""
+    from .disk_io import UnraidDiskIOSensor, DISK_IO_METRICS
+    from .storage import get_disk_number, get_pool_info
+
+    entities = []
+
+    system_stats = coordinator.data.get("system_stats", {})
+    pool_names = set(get_pool_info(system_stats))
+
+    for disk in system_stats.get("individual_disks", []):
+        if not isinstance(disk, Mapping) or not (disk_name := disk.get("name")):
+            continue
+        # Array disks and pools only; other mounts under /mnt have no block device of their own
+        if get_disk_number(disk_name) is None and disk_name not in pool_names:
+            continue
+        for metric in DISK_IO_METRICS:
+            entities.append(UnraidDiskIOSensor(coordinator, disk_name, metric))
+        _LOGGER.debug("Added I/O sensors for disk: %s", disk_name)
+
+    return entities
+
+
 def create_network_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) -> List[Entity]:
     """Create network sensors."""
     from .network import UnraidNetworkSensor, VALID_INTERFACE_PATTERN, EXCLUDED_INTERFACES
@@ -320,6 +382,39 @@ def create_network_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) ->
     return entities
 
 
+def create_vm_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) -> List[Entity]:
+    """Create metric sensors for each VM."""
+    from .vm import UnraidVMSensor, VM_METRICS
+
+    entities = []
+
+    for vm in coordinator.data.get("vms", []):
+        if not isinstance(vm, Mapping) or not (vm_name := vm.get("name")):
+            continue
+        for metric in VM_METRICS:
+            entities.append(UnraidVMSensor(coordinator, vm_name, metric))
+        _LOGGER.debug("Added metric sensors for VM: %s", vm_name)
+
+    return entities
+
+
+def create_zfs_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) -> List[Entity]:
+    """Create the ARC hit rate sensor and a scrub rate sensor per pool."""
+    from .zfs import UnraidZFSARCHitRateSensor, UnraidZFSScrubRateSensor
+
+    entities = []
+
+    system_stats = coordinator.data.get("system_stats", {})
+    if system_stats.get("zfs_arc"):
+        entities.append(UnraidZFSARCHitRateSensor(coordinator))
+
+    for pool_name in system_stats.get("zfs_pools") or {}:
+        entities.append(UnraidZFSScrubRateSensor(coordinator, pool_name))
+        _LOGGER.debug("Added scrub rate sensor for ZFS pool: %s", pool_name)
+
+    return entities
+
+
 def create_ups_sensors(coordinator: UnraidDataUpdateCoordinator, _: Any) -> List[Entity]:
     """Create UPS sensors.
 
@@ -377,4 +472,6 @@ def register_all_sensors() -> None:
     register_system_sensors()
     register_storage_sensors()
     register_network_sensors()
+    register_vm_sensors()
+    register_zfs_sensors()
     register_ups_sensors()
@@ -14,6 +14,7 @@ import homeassistant.util.dt as dt_util
 from .base import UnraidSensorBase
 from .const import UnraidSensorEntityDescription
 from ..coordinator import UnraidDataUpdateCoordinator
+from ..models import disk_key, find_disk
 from ..helpers import (
     DiskDataHelperMixin,
     format_bytes,
@@ -68,6 +69,7 @@ class UnraidDiskSensor(UnraidSensorBase, DiskDataHelperMixin):
         """Initialize the sensor."""
         self._disk_name = disk_name
         self._disk_number = get_disk_number(disk_name)
+        self._snapshot_keys = (disk_key(disk_name), "disk_mappings", "system_stats.disk_mapping")
         self._last_value: Optional[float] = None
         self._last_temperature: Optional[int] = None
 
@@ -108,29 +110,29 @@ class UnraidDiskSensor(UnraidSensorBase, DiskDataHelperMixin):
         """Get the disk usage percentage."""
         try:
             # Get disk info from individual_disks array
-            for disk in data.get("system_stats", {}).get("individual_disks", []):
-                if disk.get("name") == self._disk_name:
-                    is_standby = disk.get("state") == "standby"
-
-                    # Calculate percentage from total and used
-                    if "total" in disk and "used" in disk:
-                        percentage = self._calculate_usage_percentage(
-                            disk["total"],
-                            disk["used"]
-                        )
-                        if percentage is not None:
-                            self._last_value = percentage
-
-                    # Fallback to percentage field if available
-                    elif "percentage" in disk:
-                        percentage = float(disk["percentage"])
+            disk = find_disk(data, self._disk_name)
+            if disk is not None:
+                is_standby = disk.get("state") == "standby"
+
+                # Calculate percentage from total and used
+                if "total" in disk and "used" in disk:
+                    percentage = self._calculate_usage_percentage(
+                        disk["total"],
+                        disk["used"]
+                    )
+                    if percentage is not None:
                         self._last_value = percentage
 
-                    # For standby state, return last known value
-                    if is_standby:
-                        return self._last_value if self._last_value is not None else 0.0
+                # Fallback to percentage field if available
+                elif "percentage" in disk:
+                    percentage = float(disk["percentage"])
+                    self._last_value = percentage
+
+                # For standby state, return last known value
+                if is_standby:
+                    return self._last_value if self._last_value is not None else 0.0
 
-                    return self._last_value
+                return self._last_value
 
             return None
 
@@ -146,53 +148,53 @@ class UnraidDiskSensor(UnraidSensorBase, DiskDataHelperMixin):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         try:
-            for disk in self.coordinator.data.get("system_stats", {}).get("individual_disks", []):
-                if disk.get("name") == self._disk_name:
-                    # Get device and serial using helper
-                    device, serial = get_disk_identifiers(self.coordinator.data, self._disk_name)
-
-                    is_standby = disk.get("state") == "standby"
-
-                    # Base attributes using DiskDataHelperMixin method
-                    attrs = self._get_storage_attributes(
-                        total=disk.get("total", 0),
-                        used=disk.get("used", 0),
-                        free=disk.get("free", 0),
-                        mount_point=disk.get("mount_point"),
-                        device=device,
-                        is_standby=is_standby
-                    )
+            disk = find_disk(self.coordinator.data, self._disk_name)
+            if disk is not None:
+                # Get device and serial using helper
+                device, serial = get_disk_identifiers(self.coordinator.data, self._disk_name)
+
+                is_standby = disk.get("state") == "standby"
+
+                # Base attributes using DiskDataHelperMixin method
+                attrs = self._get_storage_attributes(
+                    total=disk.get("total", 0),
+                    used=disk.get("used", 0),
+                    free=disk.get("free", 0),
+                    mount_point=disk.get("mount_point"),
+                    device=device,
+                    is_standby=is_standby
+                )
 
-                    # Add device and serial information
-                    attrs.update({
-                        "Device": device or "Unknown",
-                        "Disk Serial": serial or "Unknown",
-                        "Power State": "Standby" if is_standby else "Active",
-                    })
-
-                    # Handle temperature using helper method
-                    temp = disk.get("temperature")
-                    if not is_standby and temp is not None:
-                        self._last_temperature = temp
-
-                    attrs["Temperature"] = self._get_temperature_str(
-                        self._last_temperature if is_standby else temp,
-                        is_standby
-                    )
+                # Add device and serial information
+                attrs.update({
+                    "Device": device or "Unknown",
+                    "Disk Serial": serial or "Unknown",
+                    "Power State": "Standby" if is_standby else "Active",
+                })
+
+                # Handle temperature using helper method
+                temp = disk.get("temperature")
+                if not is_standby and temp is not None:
+                    self._last_temperature = temp
+
+                attrs["Temperature"] = self._get_temperature_str(
+                    self._last_temperature if is_standby else temp,
+                    is_standby
+                )
 
-                    # Add current usage with standby handling
-                    attrs["Current Usage"] = (
-                        "N/A (Standby)" if is_standby
-                        else f"{self._get_disk_usage(self.coordinator.data):.1f}%"
-                    )
+                # Add current usage with standby handling
+                attrs["Current Usage"] = (
+                    "N/A (Standby)" if is_standby
+                    else f"{self._get_disk_usage(self.coordinator.data):.1f}%"
+                )
 
-                    # Add additional disk information
-                    if "health" in disk:
-                        attrs["Health Status"] = disk["health"]
-                    if "spin_down_delay" in disk:
-                        attrs["Spin Down Delay"] = disk["spin_down_delay"]
+                # Add additional disk information
+                if "health" in disk:
+                    attrs["Health Status"] = disk["health"]
+                if "spin_down_delay" in disk:
+                    attrs["Spin Down Delay"] = disk["spin_down_delay"]
 
-                    return attrs
+                return attrs
 
             return {}
 
@@ -237,7 +239,7 @@ class UnraidArraySensor(UnraidSensorBase, DiskDataHelperMixin):
 
     def __init__(self, coordinator) -> None:
         """Initialize the sensor."""
-
+        self._snapshot_keys = ("system_stats.array_usage", "system_stats.array_state")
 
         description = UnraidSensorEntityDescription(
             key="array_usage",
@@ -342,6 +344,9 @@ class UnraidPoolSensor(UnraidSensorBase, DiskDataHelperMixin):
         # Set initial values first
         self._pool_name = pool_name
         self._last_value: Optional[float] = None
+        self._snapshot_keys = (
+            "system_stats.individual_disks", "disk_mappings", "system_stats.disk_mapping"
+        )
         self._last_temperature: Optional[int] = None
 
         # Get device and serial using the helper BEFORE using them in get_pool_icon
@@ -391,12 +396,12 @@ class UnraidPoolSensor(UnraidSensorBase, DiskDataHelperMixin):
         """Get usage percentage for the pool or SSD."""
         try:
             # First check individual disks for direct device
-            for disk in data.get("system_stats", {}).get("individual_disks", []):
-                if disk.get("name") == self._pool_name:
-                    return self._calculate_usage_percentage(
-                        disk.get("total", 0),
-                        disk.get("used", 0)
-                    )
+            disk = find_disk(data, self._pool_name)
+            if disk is not None:
+                return self._calculate_usage_percentage(
+                    disk.get("total", 0),
+                    disk.get("used", 0)
+                )
 
             # Fallback to pool data
             pool_info = get_pool_info(data.get("system_stats", {}))
@@ -418,42 +423,42 @@ class UnraidPoolSensor(UnraidSensorBase, DiskDataHelperMixin):
         """Return additional state attributes."""
         try:
             # First try to get individual disk data
-            for disk in self.coordinator.data.get("system_stats", {}).get("individual_disks", []):
-                if disk.get("name") == self._pool_name:
-                    device, serial = get_disk_identifiers(
-                        self.coordinator.data,
-                        self._pool_name
-                    )
+            disk = find_disk(self.coordinator.data, self._pool_name)
+            if disk is not None:
+                device, serial = get_disk_identifiers(
+                    self.coordinator.data,
+                    self._pool_name
+                )
 
-                    is_standby = disk.get("state") == "standby"
+                is_standby = disk.get("state") == "standby"
 
-                    attrs = self._get_storage_attributes(
-                        total=disk.get("total", 0),
-                        used=disk.get("used", 0),
-                        free=disk.get("free", 0),
-                        mount_point=disk.get("mount_point"),
-                        device=device,
-                        is_standby=is_standby
-                    )
+                attrs = self._get_storage_attributes(
+                    total=disk.get("total", 0),
+                    used=disk.get("used", 0),
+                    free=disk.get("free", 0),
+                    mount_point=disk.get("mount_point"),
+                    device=device,
+                    is_standby=is_standby
+                )
 
-                    attrs.update({
-                        "Device": device or "Unknown",
-                        "Disk Serial": serial or "Unknown",
-                        "Power State": "Standby" if is_standby else "Active",
-                        "Filesystem": disk.get("filesystem", "Unknown"),
-                    })
-
-                    # Handle temperature
-                    temp = disk.get("temperature")
-                    if not is_standby and temp is not None:
-                        self._last_temperature = temp
-
-                    attrs["Temperature"] = self._get_temperature_str(
-                        self._last_temperature if is_standby else temp,
-                        is_standby
-                    )
+                attrs.update({
+                    "Device": device or "Unknown",
+                    "Disk Serial": serial or "Unknown",
+                    "Power State": "Standby" if is_standby else "Active",
+                    "Filesystem": disk.get("filesystem", "Unknown"),
+                })
+
+                # Handle temperature
+                temp = disk.get("temperature")
+                if not is_standby and temp is not None:
+                    self._last_temperature = temp
+
+                attrs["Temperature"] = self._get_temperature_str(
+                    self._last_temperature if is_standby else temp,
+                    is_standby
+                )
 
-                    return attrs
+                return attrs
 
             # Fallback to pool data
             pool_info = get_pool_info(self.coordinator.data.get("system_stats", {}))
@@ -119,6 +119,18 @@ class UnraidCPUUsageSensor(UnraidSensorBase):
             if load_15m := load_data.get("load_15m"):
                 attributes["CPU Load (15m)"] = f"{load_15m:.2f}"
 
+        # Add usage breakdown from /proc/stat deltas
+        for key, label in (
+            ("cpu_iowait", "io_wait"),
+            ("cpu_steal", "steal"),
+            ("cpu_irq", "irq"),
+        ):
+            if (value := data.get(key)) is not None:
+                attributes[label] = f"{value:.1f}%"
+
+        for core, usage in (data.get("cpu_core_usage") or {}).items():
+            attributes[f"core_{core}_usage"] = f"{usage:.1f}%"
+
         return attributes
 
 class UnraidRAMUsageSensor(UnraidSensorBase):
@@ -695,6 +707,10 @@ class UnraidIntelGPUSensor(UnraidSensorBase):
                             clean_name = clean_name[:-1]
                         attrs[f"{clean_name} Engine"] = f"{engine_usage}%"
 
+            # Number of samples averaged by the background sampler
+            if (sample_count := gpu_data.get("sample_count")) is not None:
+                attrs["Samples"] = sample_count
+
             return attrs
 
         except Exception as err:
@@ -0,0 +1,118 @@
+"""Virtual machine sensors for Unraid."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from homeassistant.components.sensor import ( # type: ignore
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.const import ( # type: ignore
+    PERCENTAGE,
+    UnitOfDataRate,
+    UnitOfInformation,
+)
+
+from .base import UnraidSensorBase
+from .const import UnraidSensorEntityDescription
+from ..models import vm_stats_key
+from ..utils import normalize_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VMMetric:
+    """A per-VM value from coordinator vm_stats."""
+    key: str
+    name: str
+    icon: str
+    unit: Optional[str] = None
+    device_class: Optional[SensorDeviceClass] = None
+    precision: int = 1
+    enabled_default: bool = True
+
+
+VM_METRICS = (
+    VMMetric("cpu_usage", "CPU Usage", "mdi:cpu-64-bit", PERCENTAGE),
+    VMMetric(
+        "memory_used", "Memory Used", "mdi:memory",
+        UnitOfInformation.BYTES, SensorDeviceClass.DATA_SIZE,
+    ),
+    VMMetric(
+        "disk_read_rate", "Disk Read", "mdi:harddisk",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        enabled_default=False,
+    ),
+    VMMetric(
+        "disk_write_rate", "Disk Write", "mdi:harddisk",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        enabled_default=False,
+    ),
+    VMMetric(
+        "network_rx_rate", "Network Inbound", "mdi:arrow-down",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        enabled_default=False,
+    ),
+    VMMetric(
+        "network_tx_rate", "Network Outbound", "mdi:arrow-up",
+        UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE,
+        enabled_default=False,
+    ),
+)
+
+
+class UnraidVMSensor(UnraidSensorBase):
+    """Metric of a running VM, computed from libvirt counter deltas."""
+
+    def __init__(self, coordinator, vm_name: str, metric: VMMetric) -> None:
+        """Initialize the sensor."""
+        self._vm_name = vm_name
+        self._metric = metric
+        self._snapshot_keys = (vm_stats_key(vm_name),)
+
+        safe_name = normalize_name(vm_name)
+        if safe_name and safe_name[0].isdigit():
+            safe_name = f"vm_{safe_name}"
+
+        description = UnraidSensorEntityDescription(
+            key=f"vm_{safe_name}_{metric.key}",
+            name=f"{vm_name} {metric.name}",
+            icon=metric.icon,
+            native_unit_of_measurement=metric.unit,
+            device_class=metric.device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=metric.precision,
+            value_fn=self._get_value,
+            available_fn=self._is_vm_running,
+        )
+        super().__init__(coordinator, description)
+        self._attr_entity_registry_enabled_default = metric.enabled_default
+
+    def _get_stats(self, data: dict) -> Optional[dict]:
+        """Return the metrics of this VM, if it is running."""
+        return (data.get("vm_stats") or {}).get(self._vm_name)
+
+    def _get_value(self, data: dict) -> Any:
+        """Return the metric value, None until a second sample gives a rate."""
+        stats = self._get_stats(data)
+        return stats.get(self._metric.key) if stats is not None else None
+
+    def _is_vm_running(self, data: dict) -> bool:
+        """Check if the VM was running in the last sample."""
+        return self._get_stats(data) is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the VM name and its totals."""
+        attrs: dict[str, Any] = {"vm_name": self._vm_name}
+        stats = self._get_stats(self.coordinator.data)
+        if stats is None:
+            return attrs
+        if self._metric.key == "cpu_usage" and stats.get("cpu_time") is not None:
+            attrs["cpu_time_seconds"] = stats["cpu_time"]
+        elif self._metric.key == "memory_used" and stats.get("memory_allocated") is not None:
+            attrs["memory_allocated"] = stats["memory_allocated"]
+        return attrs
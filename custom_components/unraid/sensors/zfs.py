@@ -0,0 +1,102 @@
+"""ZFS sensors for Unraid."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from homeassistant.components.sensor import ( # type: ignore
+    SensorDeviceClass,
+    SensorStateClass,
+)
+from homeassistant.const import ( # type: ignore
+    PERCENTAGE,
+    UnitOfDataRate,
+)
+
+from .base import UnraidSensorBase
+from .const import UnraidSensorEntityDescription
+from ..utils import normalize_name
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UnraidZFSARCHitRateSensor(UnraidSensorBase):
+    """Share of ARC lookups served from memory since the previous update."""
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        self._snapshot_keys = ("system_stats.zfs_arc",)
+        description = UnraidSensorEntityDescription(
+            key="zfs_arc_hit_rate",
+            name="ZFS ARC Hit Rate",
+            icon="mdi:memory",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            value_fn=lambda data: self._get_arc(data).get("hit_rate"),
+            available_fn=lambda data: bool(self._get_arc(data)),
+        )
+        super().__init__(coordinator, description)
+
+    @staticmethod
+    def _get_arc(data: dict) -> dict:
+        """Return the ARC stats."""
+        return data.get("system_stats", {}).get("zfs_arc") or {}
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the ARC sizes."""
+        arc = self._get_arc(self.coordinator.data)
+        return {
+            "size": arc.get("size"),
+            "target_size": arc.get("target_size"),
+            "max_size": arc.get("max_size"),
+        }
+
+
+class UnraidZFSScrubRateSensor(UnraidSensorBase):
+    """Rate of the running scrub or resilver of a pool, 0 when none is running."""
+
+    def __init__(self, coordinator, pool_name: str) -> None:
+        """Initialize the sensor."""
+        self._pool_name = pool_name
+        self._snapshot_keys = ("system_stats.zfs_pools",)
+        description = UnraidSensorEntityDescription(
+            key=f"zfs_{normalize_name(pool_name)}_scrub_rate",
+            name=f"ZFS {pool_name} Scrub Rate",
+            icon="mdi:database-search",
+            native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+            device_class=SensorDeviceClass.DATA_RATE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            value_fn=self._get_rate,
+            available_fn=lambda data: self._get_scan(data) is not None,
+        )
+        super().__init__(coordinator, description)
+
+    def _get_scan(self, data: dict) -> Optional[dict]:
+        """Return the scan state of this pool, None if it isn't imported."""
+        pool = (data.get("system_stats", {}).get("zfs_pools") or {}).get(self._pool_name)
+        return pool.get("scan") if pool else None
+
+    def _get_rate(self, data: dict) -> Optional[int]:
+        """Return the issue rate while a scan is running."""
+        scan = self._get_scan(data)
+        if scan is None:
+            return None
+        return (scan.get("rate") or 0) if scan.get("state") == "in_progress" else 0
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return progress and the outcome of the last scan."""
+        scan = self._get_scan(self.coordinator.data) or {}
+        return {
+            "pool_name": self._pool_name,
+            "function": scan.get("function"),
+            "state": scan.get("state"),
+            "percent_done": scan.get("percent_done"),
+            "seconds_to_go": scan.get("seconds_to_go"),
+            "repaired": scan.get("repaired"),
+            "errors": scan.get("errors"),
+            "last_finished": scan.get("finished"),
+        }
@@ -17,6 +17,8 @@ from .const import (
 
 from .entity_naming import EntityNaming
 from .coordinator import UnraidDataUpdateCoordinator
+from .helpers import SnapshotChangeMixin
+from .models import container_key, find_container, find_vm, vm_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +29,7 @@ class UnraidSwitchEntityDescription(SwitchEntityDescription):
     turn_on_fn: Callable[[Any], None] = field(default=lambda x: None)
     turn_off_fn: Callable[[Any], None] = field(default=lambda x: None)
 
-class UnraidSwitchEntity(CoordinatorEntity, SwitchEntity):
+class UnraidSwitchEntity(CoordinatorEntity, SwitchEntity, SnapshotChangeMixin):
     """Base entity for Unraid switches."""
 
     entity_description: UnraidSwitchEntityDescription
@@ -87,7 +89,8 @@ class UnraidSwitchEntity(CoordinatorEntity, SwitchEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        if self._should_write_state():
+            self.async_write_ha_state()
 
 class UnraidDockerContainerSwitch(UnraidSwitchEntity):
     """Representation of an Unraid Docker container switch."""
@@ -99,6 +102,7 @@ class UnraidDockerContainerSwitch(UnraidSwitchEntity):
     ) -> None:
         """Initialize the Docker container switch."""
         self._container_name = container_name
+        self._snapshot_keys = (container_key(container_name),)
         super().__init__(
             coordinator,
             UnraidSwitchEntityDescription(
@@ -111,21 +115,21 @@ class UnraidDockerContainerSwitch(UnraidSwitchEntity):
 
     def _get_container_state(self, data: dict) -> bool:
         """Get container state."""
-        for container in data["docker_containers"]:
-            if container["name"] == self._container_name:
-                return container["state"] == "running"
+        container = find_container(data, self._container_name)
+        if container is not None:
+            return container["state"] == "running"
         return False
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the state attributes."""
-        for container in self.coordinator.data["docker_containers"]:
-            if container["name"] == self._container_name:
-                return {
-                    "container_id": container["id"],
-                    "status": container["status"],
-                    "image": container["image"]
-                }
+        container = find_container(self.coordinator.data, self._container_name)
+        if container is not None:
+            return {
+                "container_id": container["id"],
+                "status": container["status"],
+                "image": container["image"]
+            }
         return {}
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -148,6 +152,7 @@ class UnraidVMSwitch(UnraidSwitchEntity):
     ) -> None:
         """Initialize the VM switch."""
         self._vm_name = vm_name
+        self._snapshot_keys = (vm_key(vm_name),)
         self._last_known_state = None
 
         # Create a safe entity ID from VM name with collision detection
@@ -238,30 +243,28 @@ class UnraidVMSwitch(UnraidSwitchEntity):
 
     def _get_os_type_info(self, vm_name: str, coordinator) -> None:
         """Get OS type for specific model info."""
-        for vm in coordinator.data.get("vms", []):
-            if vm["name"] == vm_name and "os_type" in vm:
-                self._attr_device_info["model"] = f"{vm['os_type'].capitalize()} Virtual Machine"
-                break
+        vm = find_vm(coordinator.data, vm_name)
+        if vm is not None and "os_type" in vm:
+            self._attr_device_info["model"] = f"{vm['os_type'].capitalize()} Virtual Machine"
 
     def _get_vm_state(self, data: dict) -> bool:
         """Get VM state."""
-        for vm in data.get("vms", []):
-            if vm["name"] == self._vm_name:
-                state = vm["status"].lower()
-                self._last_known_state = state
-                return state == "running"
+        vm = find_vm(data, self._vm_name)
+        if vm is not None:
+            state = vm["status"].lower()
+            self._last_known_state = state
+            return state == "running"
         return False
 
     @property
     def icon(self) -> str:
         """Return the icon based on OS type."""
-        for vm in self.coordinator.data.get("vms", []):
-            if vm["name"] == self._vm_name:
-                if vm.get("os_type") == "windows":
-                    return "mdi:microsoft-windows"
-                elif vm.get("os_type") == "linux":
-                    return "mdi:linux"
-                return "mdi:desktop-tower"
+        vm = find_vm(self.coordinator.data, self._vm_name)
+        if vm is not None:
+            if vm.get("os_type") == "windows":
+                return "mdi:microsoft-windows"
+            elif vm.get("os_type") == "linux":
+                return "mdi:linux"
         return "mdi:desktop-tower"
 
     @property
@@ -271,7 +274,7 @@ class UnraidVMSwitch(UnraidSwitchEntity):
             return False
 
         vms_enabled = "vms" in self.coordinator.data and isinstance(self.coordinator.data["vms"], list)
-        return vms_enabled and any(vm["name"] == self._vm_name for vm in self.coordinator.data.get("vms", []))
+        return vms_enabled and find_vm(self.coordinator.data, self._vm_name) is not None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -281,13 +284,12 @@ class UnraidVMSwitch(UnraidSwitchEntity):
             "os_type": "unknown",
         }
 
-        for vm in self.coordinator.data.get("vms", []):
-            if vm["name"] == self._vm_name:
-                attrs.update({
-                    "status": vm.get("status", "unknown"),
-                    "os_type": vm.get("os_type", "unknown"),
-                })
-                break
+        vm = find_vm(self.coordinator.data, self._vm_name)
+        if vm is not None:
+            attrs.update({
+                "status": vm.get("status", "unknown"),
+                "os_type": vm.get("os_type", "unknown"),
+            })
 
         return attrs
 
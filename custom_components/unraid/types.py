@@ -14,6 +14,9 @@ class SystemStatsDict(TypedDict, total=False):
     cache_usage: Dict[str, Any]
     individual_disks: List[Dict[str, Any]]
     network_stats: Dict[str, Dict[str, Any]]
+    disk_io: Dict[str, Dict[str, Any]]
+    zfs_pools: Dict[str, Dict[str, Any]]
+    zfs_arc: Dict[str, Any]
     ups_info: Dict[str, Any]
     load_average: List[float]
     cpu_model: str
@@ -105,6 +108,7 @@ class UnraidDataDict(TypedDict, total=False):
     system_stats: SystemStatsDict
     docker_containers: List[DockerContainerDict]
     vms: List[VMDict]
+    vm_stats: Dict[str, Dict[str, Any]]
     user_scripts: List[UserScriptDict]
     parity_info: ParityInfoDict
     smart_data: Dict[str, Dict[str, Any]]
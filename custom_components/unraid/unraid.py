@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import asyncssh # type: ignore
 
 from .api.connection_manager import ConnectionManager
+from .api.capabilities import CapabilityRegistry
 from .api.network_operations import NetworkOperationsMixin
 from .api.disk_operations import DiskOperationsMixin
 from .api.docker_operations import DockerOperationsMixin
@@ -14,6 +15,7 @@ from .api.vm_operations import VMOperationsMixin
 from .api.system_operations import SystemOperationsMixin
 from .api.ups_operations import UPSOperationsMixin
 from .api.userscript_operations import UserScriptOperationsMixin
+from .api.snapshot_operations import SnapshotOperationsMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,11 +26,19 @@ class UnraidAPI(
     VMOperationsMixin,
     SystemOperationsMixin,
     UPSOperationsMixin,
-    UserScriptOperationsMixin
+    UserScriptOperationsMixin,
+    SnapshotOperationsMixin
 ):
     """API client for interacting with Unraid servers."""
 
-    def __init__(self, host: str, username: str, password: str, port: int = 22) -> None:
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 22,
+        persistent_shell: bool = False
+    ) -> None:
         """Initialize the Unraid API client."""
 
         # Initialize Network Operations
@@ -52,12 +62,15 @@ class UnraidAPI(
         self.port = port
 
         # Use ConnectionManager instead of direct connection
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = ConnectionManager(persistent_shell=persistent_shell)
         self.connect_timeout = 30
         self.command_timeout = 60
         self._in_context = False
         self._setup_done = False
 
+        # Tools and services on the server, probed once per connection
+        self.capabilities = CapabilityRegistry(self.execute_command)
+
     async def ensure_connection(self) -> None:
         """Ensure that the connection manager is initialized."""
         if not self._setup_done:
@@ -69,12 +82,26 @@ class UnraidAPI(
             )
             self._setup_done = True
 
+    async def open_unix_connection(
+        self,
+        path: str
+    ) -> Tuple[asyncssh.SSHReader, asyncssh.SSHWriter]:
+        """Open a stream to a unix socket on the Unraid server."""
+        await self.ensure_connection()
+        return await self.connection_manager.open_unix_connection(path)
+
     async def execute_command(
         self,
         command: str,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        coalesce: bool = False
     ) -> asyncssh.SSHCompletedProcess:
-        """Execute a command on the Unraid server using the connection pool."""
+        """Execute a command on the Unraid server using the connection pool.
+
+        coalesce lets identical read-only commands share one execution; see
+        ConnectionManager.execute_command. Only the integration's own reads
+        should set it.
+        """
         await self.ensure_connection()
 
         if timeout is None:
@@ -83,7 +110,8 @@ class UnraidAPI(
         try:
             result = await self.connection_manager.execute_command(
                 command,
-                timeout=timeout
+                timeout=timeout,
+                coalesce=coalesce
             )
             return result
 
@@ -96,6 +124,22 @@ class UnraidAPI(
         if self._setup_done:
             await self.connection_manager.shutdown()
             self._setup_done = False
+            self.capabilities.invalidate()
+            self._docker_engine_retry_at = 0.0
+
+    def export_host_facts(self) -> Dict[str, Any]:
+        """Return detected facts about the host that hold until it reboots."""
+        facts = self.export_static_facts()
+        usb_devices = self._smart_manager.usb_detector.export_cache()
+        if usb_devices:
+            facts["usb_devices"] = usb_devices
+        return facts
+
+    def restore_host_facts(self, facts: Dict[str, Any]) -> None:
+        """Hydrate detection caches from facts saved by export_host_facts."""
+        self.restore_static_facts(facts)
+        if isinstance(facts.get("usb_devices"), dict):
+            self._smart_manager.usb_detector.restore_cache(facts["usb_devices"])
 
     async def ping(self) -> bool:
         """Check if the Unraid server is accessible via SSH."""
@@ -0,0 +1,914 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the Unraid integration.
+
+Starts a local SSH server impersonating an Unraid host and runs the
+integration's collection paths against it. The server replays command
+outputs recorded with unraid_collector.py and synthesizes everything else
+for a configurable number of disks, containers and VMs. Each benchmark
+reports SSH round trips per tick, wall time, allocations and peak RSS, so
+changes to the hot paths can be compared without a real server.
+
+Requirements:
+    asyncssh and homeassistant, both in requirements.txt. Importing the
+    integration package pulls in Home Assistant, so install them first:
+
+    scripts/setup                    # pip install -r requirements.txt
+
+Usage (from the repository root):
+    python scripts/benchmark.py                      # 4, 24 and 60 disk servers
+    python scripts/benchmark.py --disks 24 --latency 20 --iterations 20
+    python scripts/benchmark.py --fixture unraid_data_tower.json --disks 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import asyncssh
+    import homeassistant  # noqa: F401  # imported by the integration package
+except ImportError:
+    print("Required packages missing. Install with: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Make the integration importable when run from a checkout
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+_LOGGER = logging.getLogger("unraid_benchmark")
+
+BENCHMARK_USERNAME = "root"
+BENCHMARK_PASSWORD = "benchmark"
+DEFAULT_DISK_COUNTS = (4, 24, 60)
+BENCHMARKS = ("parsers", "snapshot", "disks", "network", "coordinator")
+
+# Shell used by the integration's persistent remote shell transport
+REMOTE_SHELL_COMMAND = "exec bash --noprofile --norc"
+
+_SECTION_MARKER = re.compile(r"echo '===([^'=]+)===';\s*")
+_BATCH_COMMAND = re.compile(
+    r"printf '%s\\n' '(?P<marker>__UNRAID_BATCH_[0-9a-f]+__:\d+):OUT'\n"
+    r"__err=\$\( \{ (?P<command>.*?)\n\} 2>&1 1>&3 \); __rc=\$\?",
+    re.DOTALL,
+)
+_SHELL_FRAME = re.compile(
+    r"IFS= read -r -d '' __cmd <<'(?P<token>__UNRAID_SHELL_[0-9a-f]+__)_CMD'\n"
+    r"(?P<command>.*?)\n(?P=token)_CMD\n"
+    r"[^\n]*\n[^\n]*\n[^\n]*\n",
+    re.DOTALL,
+)
+
+# Recorded collector output -> the section or command it answers
+FIXTURE_OUTPUTS = {
+    "MEMORY_INFO": ("system_stats", "memory_info_raw"),
+    "UPTIME": ("system_stats", "uptime_raw"),
+    "PARITY_HISTORY": ("parity_status", "parity_history_raw"),
+    "EMHTTP_VAR": ("array_status", "emhttp_status_raw"),
+    "EMHTTP_DISKS": ("array_status", "disk_assignments_raw"),
+    "EMHTTP_SHARES": ("emhttp_configs", "shares.ini"),
+    "EMHTTP_NETWORK": ("emhttp_configs", "network.ini"),
+    "UPS": ("ups_info", "apc_ups_data_raw"),
+    "cat /boot/config/disk.cfg": ("disk_info", "disk_mappings_raw"),
+}
+
+# Placeholder outputs the collector writes when a file is missing
+_FIXTURE_PLACEHOLDERS = ("No ", "File not found")
+
+# Sections also requested on their own as plain commands
+_COMMAND_SECTIONS = (
+    ("mdcmd status", "ARRAY_STATE"),
+    ("cat /var/local/emhttp/disks.ini", "EMHTTP_DISKS"),
+    ("cat /var/local/emhttp/var.ini", "EMHTTP_VAR"),
+    ("cat /boot/config/disk.cfg", "DISK_CFG"),
+    ("docker ps", "DOCKER"),
+    ("cat /proc/meminfo", "MEMORY_INFO"),
+    ("cat /proc/uptime", "UPTIME"),
+    ("grep '^cpu' /proc/stat", "CPU_STAT"),
+)
+
+
+def _device_names(count: int) -> List[str]:
+    """Return sdb, sdc, ... sdz, sdaa, ... like the kernel assigns them."""
+    names = []
+    index = 1
+    while len(names) < count:
+        suffix = ""
+        value = index
+        while True:
+            suffix = chr(ord("a") + value % 26) + suffix
+            value = value // 26 - 1
+            if value < 0:
+                break
+        names.append(f"sd{suffix}")
+        index += 1
+    return names
+
+
+class SyntheticUnraid:
+    """Generates command output for an Unraid server of a given size.
+
+    The array is sized from the total disk count: one parity disk (two from
+    nine disks up), one NVMe cache pool and data disks for the rest. Every
+    ``standby_every``-th data disk is spun down. Network counters advance on
+    every read so rate calculations see traffic.
+    """
+
+    def __init__(
+        self,
+        disks: int,
+        containers: int,
+        vms: int,
+        interfaces: int = 2,
+        standby_every: int = 3,
+        fixture: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the synthetic server."""
+        self.parity_count = 1 if disks <= 8 else 2
+        self.data_count = max(disks - self.parity_count - 1, 1)
+        self.containers = containers
+        self.vms = vms
+        self.interfaces = interfaces
+        self.standby_every = standby_every
+        self._overrides = self._load_fixture_outputs(fixture or {})
+        self._net_reads = 0
+        self._cpu_reads = 0
+        self._vm_reads = 0
+        self._disk_reads = 0
+
+        devices = _device_names(self.parity_count + self.data_count)
+        self.slots: List[Dict[str, Any]] = []
+        for index in range(self.parity_count):
+            name = "parity" if index == 0 else f"parity{index + 1}"
+            self.slots.append(self._slot(name, devices[index], index, spundown=False))
+        for index in range(1, self.data_count + 1):
+            spundown = standby_every > 0 and index % standby_every == 0
+            device = devices[self.parity_count + index - 1]
+            self.slots.append(self._slot(f"disk{index}", device, index, spundown))
+        self.slots.append({
+            "name": "cache", "device": "nvme0n1", "serial": "Samsung_SSD_980_PRO_1TB_S5GXNF0R000001",
+            "md": None, "spundown": False, "rotational": False, "size_kib": 976762584,
+            "temp": 41, "fs": "btrfs",
+        })
+
+        self._sections: Dict[str, Callable[[], str]] = {
+            "HOSTNAME": lambda: "tower\n",
+            "ARRAY_STATE": self.mdcmd_status,
+            "CPU_STAT": self.proc_stat,
+            "CPU_LOAD": lambda: "0.52 0.48 0.41 2/812 12345\n",
+            "CPU_INFO": lambda: "CORES:\n16\nMODEL:\nIntel(R) Core(TM) i7-12700K\nARCH:\nx86_64\n",
+            "MEMORY_INFO": self.meminfo,
+            "MEMORY_VM": lambda: f"{self.vms * 4194304}\n",
+            "MEMORY_DOCKER": lambda: f"{self.containers * 180.5:.1f}\n",
+            "MEMORY_ZFS": lambda: "0\n",
+            "UPTIME": lambda: "1234567.89 9876543.21\n",
+            "TEMPERATURE": self.sensors,
+            "THERMAL_ZONES": lambda: "acpitz\t27800\nx86_pkg_temp\t45000\n",
+            "BOOT_USAGE": lambda: "31248384 1163264 30085120\n",
+            "CACHE_POOLS": self.cache_pools,
+            "LOG_USAGE": lambda: "131072 2048 129024 2%\n",
+            "DOCKER_VDISK": lambda: "52428800 20971520 31457280\n",
+            "INTEL_GPU_DEVICE": lambda: "",
+            "PARITY_LOG_STAT": self.parity_log_stat,
+            "PARITY_HISTORY": self.parity_history,
+            "PARITY_CRON": lambda: "# Generated parity check schedule:\n0 3 1 * * /usr/local/sbin/mdcmd check NOCORRECT &> /dev/null || :\n",
+            "VMS": self.vm_list,
+            "VM_STATS": self.vm_stats,
+            "DOCKER": self.docker_ps,
+            "USER_SCRIPTS": lambda: "backup|Nightly backup|Copies appdata\nmover|Run mover|\n",
+            "UPS": self.apcaccess,
+            "NET_DEV": self.net_dev,
+            "NET_SYS": self.net_sys,
+            "EMHTTP_DISKS": self.disks_ini,
+            "EMHTTP_VAR": self.var_ini,
+            "EMHTTP_SHARES": self.shares_ini,
+            "EMHTTP_NETWORK": self.network_ini,
+            "EMHTTP_DEVS": lambda: "",
+            "DISK_CFG": self.disk_cfg,
+            "DISK_USAGE": self.disk_usage,
+            "MOUNT_INFO": self.mount_info,
+            "DISK_SERIALS": self.disk_serials,
+            "BLOCK_DEVICES": self.block_devices,
+            "DISKSTATS": self.diskstats,
+            "ZPOOL_LIST": lambda: "zfs_not_installed\n",
+            "ZPOOL_STATUS": lambda: "",
+            "ZPOOL_IOSTAT": lambda: "",
+            "ZFS_ARC": lambda: "",
+        }
+
+    @staticmethod
+    def _slot(name: str, device: str, index: int, spundown: bool) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "device": device,
+            "serial": f"WDC_WD120EFBX-68B0EN0_D7G{index:05d}",
+            "md": None if name.startswith("parity") else int(name[4:]),
+            "spundown": spundown,
+            "rotational": True,
+            "size_kib": 11718885324,
+            "temp": None if spundown else 30 + index % 9,
+            "fs": None if name.startswith("parity") else "xfs",
+        }
+
+    @staticmethod
+    def _load_fixture_outputs(fixture: Dict[str, Any]) -> Dict[str, str]:
+        """Pick the recorded outputs this server can replay from collector JSON."""
+        overrides = {}
+        for key, (group, field) in FIXTURE_OUTPUTS.items():
+            value = fixture.get(group, {}).get(field)
+            if isinstance(value, str) and value.strip() and not value.startswith(_FIXTURE_PLACEHOLDERS):
+                overrides[key] = value if value.endswith("\n") else f"{value}\n"
+        return overrides
+
+    @property
+    def data_slots(self) -> List[Dict[str, Any]]:
+        """Slots holding a filesystem (data disks and the cache pool)."""
+        return [slot for slot in self.slots if slot["fs"]]
+
+    def section(self, name: str) -> Optional[str]:
+        """Return the output for a named section, if it is known."""
+        if name in self._overrides:
+            return self._overrides[name]
+        if name.startswith("SMART "):
+            return self.smart(name[len("SMART "):].strip())
+        generator = self._sections.get(name)
+        return generator() if generator else None
+
+    def command(self, command: str) -> Tuple[str, int]:
+        """Return (stdout, exit_status) for a plain command."""
+        stripped = command.strip()
+        if stripped in self._overrides:
+            return self._overrides[stripped], 0
+        for prefix, section in _COMMAND_SECTIONS:
+            if stripped.startswith(prefix):
+                return self.section(section) or "", 0
+        if stripped.startswith("df -k /mnt/user"):
+            return "117187500000 58593750000 58593750000\n", 0
+        if stripped.startswith(("smartctl", "hdparm")):
+            return "", 2
+        if stripped.startswith("echo"):
+            return "\n", 0
+        return "", 0
+
+    def mdcmd_status(self) -> str:
+        lines = [
+            "sbName=/boot/config/super.dat",
+            "sbVersion=2.9.17",
+            "sbSynced=1680000000",
+            "sbSyncErrs=0",
+            "mdState=STARTED",
+            f"mdNumDisks={len(self.slots) - 1}",
+            "mdNumDisabled=0",
+            "mdNumInvalid=0",
+            "mdNumMissing=0",
+            "mdResync=0",
+            "mdResyncAction=check P",
+            "mdResyncPos=0",
+            "mdResyncCorr=0",
+        ]
+        for index, slot in enumerate(slot for slot in self.slots if slot["name"] != "cache"):
+            number = 0 if slot["md"] is None else slot["md"]
+            if slot["name"] == "parity2":
+                number = 29
+            lines += [
+                f"diskName.{number}={'' if slot['md'] is None else f'md{number}'}",
+                f"diskSize.{number}={slot['size_kib']}",
+                f"diskState.{number}=7",
+                f"diskId.{number}={slot['serial']}",
+                f"rdevStatus.{number}=DISK_OK",
+                f"rdevName.{number}={slot['device']}",
+                f"rdevReads.{number}={index * 1000}",
+                f"rdevWrites.{number}={index * 500}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def proc_stat(self) -> str:
+        self._cpu_reads += 1
+        step = self._cpu_reads * 100
+        lines = [f"cpu  {step * 16 * 12} 0 {step * 16 * 3} {step * 16 * 84} {step * 16} 0 {step * 16} 0 0 0"]
+        lines += [
+            f"cpu{core} {step * (5 + core)} 0 {step * 3} {step * (91 - core)} {step} 0 {step} 0 0 0"
+            for core in range(16)
+        ]
+        return "\n".join(lines) + "\n"
+
+    def meminfo(self) -> str:
+        return (
+            "MemTotal:       65779944 kB\n"
+            "MemFree:        12345678 kB\n"
+            "MemAvailable:   40123456 kB\n"
+            "Buffers:          123456 kB\n"
+            "Cached:         25000000 kB\n"
+            "SwapTotal:             0 kB\n"
+            "SwapFree:              0 kB\n"
+        )
+
+    def sensors(self) -> str:
+        return (
+            "coretemp-isa-0000\nAdapter: ISA adapter\n"
+            "Package id 0:  +45.0°C  (high = +80.0°C, crit = +100.0°C)\n"
+            "Core 0:        +42.0°C  (high = +80.0°C, crit = +100.0°C)\n\n"
+            "nct6798-isa-0290\nAdapter: ISA adapter\n"
+            "fan1:          820 RPM  (min =    0 RPM)\n"
+            "fan2:         1140 RPM  (min =    0 RPM)\n"
+        )
+
+    def cache_pools(self) -> str:
+        return "cache:976762584:312564027:664198557:/dev/nvme0n1p1:btrfs\n"
+
+    def parity_log_stat(self) -> str:
+        # Fixed inode and size, so after the first read the log counts as unchanged
+        return f"1 {len((self.section('PARITY_HISTORY') or '').encode())}\n"
+
+    def parity_history(self) -> str:
+        return "".join(
+            f"2025 {month} 1 03:00:00|86400|138.9 MB/s|0|0|check P|23437770752\n"
+            for month in ("Jan", "Feb", "Mar", "Apr", "May", "Jun")
+        )
+
+    def vm_list(self) -> str:
+        domains = "".join(
+            f"Domain: 'vm{index}'\n"
+            f"  state.state={1 if index % 2 else 5}\n"
+            "  vcpu.current=4\n  vcpu.maximum=4\n"
+            "  balloon.current=8388608\n  balloon.maximum=8388608\n\n"
+            for index in range(1, self.vms + 1)
+        )
+        xml = "<os> <type arch='x86_64' machine='pc-q35-7.2'>hvm</type> </os>"
+        return domains + "".join(
+            f"@@VMXML 1700000000-4096-{index} /etc/libvirt/qemu/vm{index}.xml\n{xml}\n"
+            for index in range(1, self.vms + 1)
+        )
+
+    def vm_stats(self) -> str:
+        self._vm_reads += 1
+        step = self._vm_reads
+        return "".join(
+            f"Domain: 'vm{index}'\n"
+            f"  state.state=1\n  cpu.time={step * 2_000_000_000 * index}\n"
+            "  vcpu.current=4\n  balloon.current=8388608\n"
+            "  balloon.available=8000000\n  balloon.unused=4000000\n"
+            f"  block.count=1\n  block.0.rd.bytes={step * 1048576}\n  block.0.wr.bytes={step * 524288}\n"
+            f"  net.count=1\n  net.0.rx.bytes={step * 262144}\n  net.0.tx.bytes={step * 131072}\n\n"
+            for index in range(1, self.vms + 1, 2)
+        )
+
+    def docker_ps(self) -> str:
+        return "".join(
+            f"{index:012x}|container{index}|"
+            f"{'Up 3 hours' if index % 4 else 'Exited (0) 2 days ago'}|"
+            f"linuxserver/app{index}:latest\n"
+            for index in range(1, self.containers + 1)
+        )
+
+    def apcaccess(self) -> str:
+        return (
+            "STATUS   : ONLINE\nBCHARGE  : 100.0 Percent\nLOADPCT  : 18.0 Percent\n"
+            "TIMELEFT : 45.0 Minutes\nNOMPOWER : 900 Watts\nMODEL    : Back-UPS XS 1500G\n"
+        )
+
+    def _interface_names(self) -> List[str]:
+        return [f"eth{index}" for index in range(self.interfaces)] + ["br0"]
+
+    def net_dev(self) -> str:
+        self._net_reads += 1
+        step = self._net_reads * 1_250_000
+        lines = [
+            "Inter-|   Receive                                                |  Transmit",
+            " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed",
+            "    lo: 123456 1000 0 0 0 0 0 0 123456 1000 0 0 0 0 0 0",
+        ]
+        lines += [
+            f"  {name}: {10_000_000_000 + step * (index + 1)} 9000000 0 0 0 0 0 1200 "
+            f"{5_000_000_000 + step // 2} 7000000 0 0 0 0 0 0"
+            for index, name in enumerate(self._interface_names())
+        ]
+        return "\n".join(lines) + "\n"
+
+    def net_sys(self) -> str:
+        return "".join(
+            f"/sys/class/net/{name}/speed:1000\n"
+            f"/sys/class/net/{name}/duplex:full\n"
+            f"/sys/class/net/{name}/carrier:1\n"
+            f"/sys/class/net/{name}/mtu:1500\n"
+            f"/sys/class/net/{name}/operstate:up\n"
+            f"/sys/class/net/{name}/address:02:42:ac:11:00:{index:02x}\n"
+            for index, name in enumerate(self._interface_names())
+        )
+
+    def disks_ini(self) -> str:
+        lines = []
+        for slot in self.slots:
+            lines += [
+                f'["{slot["name"]}"]',
+                f'name="{slot["name"]}"',
+                f'device="{slot["device"]}"',
+                f'id="{slot["serial"]}"',
+                'status="DISK_OK"',
+                f'type="{"Parity" if slot["md"] is None and slot["name"] != "cache" else "Data" if slot["md"] else "Cache"}"',
+                f'temp="{"*" if slot["temp"] is None else slot["temp"]}"',
+                f'spundown="{1 if slot["spundown"] else 0}"',
+                f'rotational="{1 if slot["rotational"] else 0}"',
+                f'transport="{"nvme" if slot["device"].startswith("nvme") else "ata"}"',
+                f'fsType="{slot["fs"] or ""}"',
+                f'size="{slot["size_kib"]}"',
+                'numErrors="0"',
+            ]
+        return "\n".join(lines) + "\n"
+
+    def var_ini(self) -> str:
+        return (
+            'version="7.1.4"\nNAME="tower"\nmdState="STARTED"\nfsState="Started"\n'
+            f'mdNumDisks="{len(self.slots) - 1}"\nmdNumDisabled="0"\nmdNumInvalid="0"\n'
+            'mdNumMissing="0"\nsbSynced="1680000000"\nsbSyncErrs="0"\n'
+            'mdResyncAction="check P"\nmdResyncPos="0"\nmdResyncSize="11718885324"\n'
+        )
+
+    def shares_ini(self) -> str:
+        return "".join(
+            f'["{name}"]\nname="{name}"\ncomment=""\nfree="1000000000"\nused="500000000"\n'
+            f'useCache="prefer"\ncachePool="cache"\n'
+            for name in ("appdata", "domains", "isos", "media", "system")
+        )
+
+    def network_ini(self) -> str:
+        return "".join(
+            f'["eth{index}"]\nBONDING="no"\nBRIDGING="yes"\nUSE_DHCP="yes"\n'
+            f'IPADDR:0="192.168.1.{10 + index}"\nNETMASK:0="255.255.255.0"\nMTU="1500"\n'
+            for index in range(self.interfaces)
+        )
+
+    def disk_cfg(self) -> str:
+        lines = ['startArray="yes"', 'spindownDelay="1"']
+        for slot in self.slots:
+            if slot["md"] is not None:
+                lines.append(f'diskId.{slot["md"]}="{slot["serial"]}"')
+        return "\n".join(lines) + "\n"
+
+    def disk_usage(self) -> str:
+        lines = []
+        for slot in self.data_slots:
+            total = slot["size_kib"] * 1024
+            used = total * (30 + (slot["md"] or 0) % 60) // 100
+            lines.append(f"/mnt/{slot['name']} {total} {used} {total - used}")
+        total = sum(slot["size_kib"] * 1024 for slot in self.data_slots if slot["md"])
+        lines.append(f"/mnt/user {total} {total // 2} {total - total // 2}")
+        return "\n".join(lines) + "\n"
+
+    def mount_info(self) -> str:
+        lines = []
+        for slot in self.data_slots:
+            if slot["md"]:
+                lines.append(f"/dev/md{slot['md']}p1 /mnt/{slot['name']} {slot['fs']}")
+            else:
+                lines.append(f"/dev/{slot['device']}p1 /mnt/{slot['name']} {slot['fs']}")
+        lines.append("shfs /mnt/user fuse.shfs")
+        return "\n".join(lines) + "\n"
+
+    def disk_serials(self) -> str:
+        return "".join(f"{slot['device']} {slot['serial']}\n" for slot in self.slots)
+
+    def block_devices(self) -> str:
+        return "".join(
+            f"{slot['device']} {'nvme' if slot['device'].startswith('nvme') else 'sata'} disk "
+            f"{'1T' if slot['device'].startswith('nvme') else '12T'} Model ATA\n"
+            for slot in self.slots
+        )
+
+    def diskstats(self) -> str:
+        self._disk_reads += 1
+        lines = []
+        for index, slot in enumerate(self.slots):
+            # Spun down disks see no I/O, so their counters stay put
+            step = 0 if slot["spundown"] else self._disk_reads
+            reads, writes = 50000 + step * 120, 20000 + step * 40
+            counters = (
+                f"{reads} 300 {reads * 256} {reads * 4} {writes} 150 {writes * 128} {writes * 8} "
+                f"0 {100000 + step * 900} {300000 + step * 2700} 0 0 0 0 0 0"
+            )
+            lines.append(f" {8 if slot['device'].startswith('sd') else 259} {index * 16} {slot['device']} {counters}")
+            partition = f"{slot['device']}p1" if slot["device"].startswith("nvme") else f"{slot['device']}1"
+            lines.append(f" {8 if slot['device'].startswith('sd') else 259} {index * 16 + 1} {partition} {counters}")
+        return "\n".join(lines) + "\n"
+
+    def smart(self, device_path: str) -> str:
+        device = device_path.replace("/dev/", "")
+        slot = next((slot for slot in self.slots if slot["device"] == device), None)
+        if slot is None:
+            return "SMART_EXIT=2\n"
+        if slot["spundown"]:
+            return "SMART_EXIT=standby\n"
+        if device.startswith("nvme"):
+            payload = {
+                "critical_warning": 0,
+                "temperature": 273 + slot["temp"],
+                "percent_used": 3,
+                "power_on_hours": 8123,
+            }
+        else:
+            payload = {
+                "smart_status": {"passed": True},
+                "temperature": {"current": slot["temp"]},
+                "power_on_time": {"hours": 21000},
+                "ata_smart_attributes": {"table": [
+                    {"id": 5, "name": "Reallocated_Sector_Ct", "value": 100, "raw": {"value": 0}},
+                    {"id": 194, "name": "Temperature_Celsius", "value": 64, "raw": {"value": slot["temp"]}},
+                    {"id": 197, "name": "Current_Pending_Sector", "value": 100, "raw": {"value": 0}},
+                ]},
+            }
+        return f"{json.dumps(payload)}\nSMART_EXIT=0\n"
+
+
+def replay(server: SyntheticUnraid, command: str) -> Tuple[str, int]:
+    """Produce the output a real server would for a (possibly batched) command."""
+    batched = list(_BATCH_COMMAND.finditer(command))
+    if batched:
+        parts = []
+        for match in batched:
+            marker = match.group("marker")
+            stdout, exit_status = replay(server, match.group("command"))
+            parts.append(f"{marker}:OUT\n{stdout}\n{marker}:ERR:{exit_status}\n\n{marker}:END\n")
+        return "".join(parts), 0
+
+    markers = list(_SECTION_MARKER.finditer(command))
+    if not markers:
+        return server.command(command)
+
+    parts = []
+    for index, marker in enumerate(markers):
+        name = marker.group(1)
+        end = markers[index + 1].start() if index + 1 < len(markers) else len(command)
+        output = server.section(name)
+        if output is None:
+            output, _ = server.command(command[marker.end():end].strip().rstrip(";"))
+        parts.append(f"==={name}===\n{output}")
+    return "".join(parts), 0
+
+
+class _Counters:
+    """Round trips and connections seen by the server, shared across processes."""
+
+    def __init__(self) -> None:
+        self.round_trips = multiprocessing.Value("i", 0)
+        self.connections = multiprocessing.Value("i", 0)
+
+    def snapshot(self) -> Tuple[int, int]:
+        return self.round_trips.value, self.connections.value
+
+
+def _run_server(
+    options: Dict[str, Any],
+    counters: _Counters,
+    ready: Any,
+) -> None:
+    """Run the fake server in a child process until terminated."""
+    fixture = None
+    if options["fixture"]:
+        with open(options["fixture"]) as f:
+            fixture = json.load(f)
+    server = SyntheticUnraid(
+        disks=options["disks"],
+        containers=options["containers"],
+        vms=options["vms"],
+        fixture=fixture,
+    )
+    latency = options["latency"] / 1000
+
+    class _Server(asyncssh.SSHServer):
+        def connection_made(self, _conn):
+            with counters.connections.get_lock():
+                counters.connections.value += 1
+
+        def begin_auth(self, _username):
+            return True
+
+        def password_auth_supported(self):
+            return True
+
+        def validate_password(self, _username, password):
+            return password == BENCHMARK_PASSWORD
+
+    def count_round_trip() -> None:
+        with counters.round_trips.get_lock():
+            counters.round_trips.value += 1
+
+    async def run_shell(process) -> None:
+        buffer = ""
+        while True:
+            match = _SHELL_FRAME.search(buffer)
+            if match is None:
+                chunk = await process.stdin.read(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                continue
+            buffer = buffer[match.end():]
+            count_round_trip()
+            await asyncio.sleep(latency)
+            stdout, exit_status = replay(server, match.group("command"))
+            token = match.group("token")
+            process.stdout.write(f"{stdout}\n{token}:{exit_status}\n")
+            process.stderr.write(f"\n{token}\n")
+        process.exit(0)
+
+    async def handle(process) -> None:
+        command = process.command or ""
+        if command == REMOTE_SHELL_COMMAND:
+            await run_shell(process)
+            return
+        count_round_trip()
+        await asyncio.sleep(latency)
+        stdout, exit_status = replay(server, command)
+        process.stdout.write(stdout)
+        process.exit(exit_status)
+
+    async def serve() -> None:
+        listener = await asyncssh.create_server(
+            _Server,
+            "127.0.0.1",
+            0,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            process_factory=handle,
+        )
+        ready.send(listener.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+class FakeUnraidServer:
+    """Context manager running the fake server in a separate process.
+
+    Keeping the server out of the benchmarked process means allocations and
+    RSS only reflect the integration.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        """Initialize the server options."""
+        self.options = options
+        self.counters = _Counters()
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "FakeUnraidServer":
+        parent, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_run_server, args=(self.options, self.counters, child), daemon=True
+        )
+        self._process.start()
+        if not parent.poll(30):
+            self._process.terminate()
+            raise RuntimeError("Fake Unraid server did not start")
+        self.port = parent.recv()
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+
+def _peak_rss_mib() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _measure(
+    name: str,
+    run: Callable[[], Any],
+    counters: Optional[_Counters],
+    iterations: int,
+) -> Dict[str, Any]:
+    """Time a coroutine factory and record round trips and allocations."""
+    def round_trips() -> int:
+        return counters.snapshot()[0] if counters else 0
+
+    start = round_trips()
+    await run()
+    cold_round_trips = round_trips() - start
+
+    timings = []
+    start = round_trips()
+    for _ in range(iterations):
+        began = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - began)
+    warm_round_trips = (round_trips() - start) / iterations
+
+    # Separate pass so tracing overhead doesn't skew the timings
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    await run()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": name,
+        "cold_round_trips": cold_round_trips,
+        "round_trips_per_tick": round(warm_round_trips, 2),
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(sorted(timings)[max(int(len(timings) * 0.95) - 1, 0)] * 1000, 2),
+        "alloc_peak_kib": round((peak - before) / 1024, 1),
+        "alloc_retained_kib": round((after - before) / 1024, 1),
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+    }
+
+
+def _parser_benchmark(api: Any, server: SyntheticUnraid) -> Callable[[], Any]:
+    """Parse a full snapshot, disk and emhttp payload without any SSH traffic."""
+    from custom_components.unraid.api.emhttp_state import EMHTTP_STATE_COMMAND, parse_emhttp_state
+    from custom_components.unraid.api.snapshot_operations import split_sections
+    from custom_components.unraid.models import build_snapshot
+
+    snapshot_output, _ = replay(server, api._build_snapshot_command(include_ups=True))
+    emhttp_output, _ = replay(server, EMHTTP_STATE_COMMAND)
+
+    async def run() -> None:
+        sections = split_sections(snapshot_output)
+        data = {
+            "system_stats": api._parse_system_stats_sections(sections),
+            "vms": api._parse_vm_list_output(sections.get("VMS", "")),
+            "docker_containers": api._parse_docker_list_output(sections.get("DOCKER", "")),
+            "ups_info": api._parse_ups_info_output(sections.get("UPS", "")),
+        }
+        data["system_stats"]["individual_disks"] = [
+            {"name": disk.name, "device": disk.device, "serial": disk.serial, "state": disk.status}
+            for disk in parse_emhttp_state(emhttp_output).disks.values()
+        ]
+        build_snapshot(data)
+
+    return run
+
+
+def _make_coordinator(api: Any, disks: int) -> Optional[Any]:
+    """Create a coordinator bound to the API, or None without Home Assistant."""
+    try:
+        from homeassistant.core import HomeAssistant  # type: ignore
+        from custom_components.unraid.coordinator import UnraidDataUpdateCoordinator
+    except ImportError:
+        return None
+
+    class _Entry:
+        entry_id = f"benchmark_{disks}"
+        title = "Benchmark"
+        data = {"host": "127.0.0.1", "hostname": "tower"}
+        options: Dict[str, Any] = {}
+
+    hass = HomeAssistant(os.path.join(REPO_ROOT, "config"))
+    return UnraidDataUpdateCoordinator(hass, api, _Entry())
+
+
+def _make_target(name: str, api: Any, server: SyntheticUnraid, disks: int) -> Optional[Callable[[], Any]]:
+    """Return the coroutine factory for a benchmark, or None if it can't run."""
+    if name == "parsers":
+        return _parser_benchmark(api, server)
+    if name == "snapshot":
+        return lambda: api.collect_snapshot(include_ups=True)
+    if name == "disks":
+        return api.collect_disk_info
+    if name == "network":
+        async def run() -> Any:
+            # Real ticks are further apart than the API's one second network cache
+            api._last_network_update = None
+            return await api.get_network_stats()
+        return run
+
+    coordinator = _make_coordinator(api, disks)
+    if coordinator is None:
+        _LOGGER.warning("Home Assistant is not installed, skipping the coordinator benchmark")
+        return None
+    return coordinator._async_update_data
+
+
+async def run_benchmarks(
+    args: argparse.Namespace,
+    disks: int,
+    fixture: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Run the selected benchmarks against a fake server with the given disk count.
+
+    Each benchmark gets its own API client, so its first run starts from cold
+    caches and a new connection pool.
+    """
+    from custom_components.unraid.unraid import UnraidAPI
+
+    options = {
+        "disks": disks,
+        "containers": args.containers,
+        "vms": args.vms,
+        "latency": args.latency,
+        "fixture": args.fixture,
+    }
+    local = SyntheticUnraid(disks, args.containers, args.vms, fixture=fixture)
+
+    results = []
+    with FakeUnraidServer(**options) as fake:
+        for name in args.benchmarks:
+            api = UnraidAPI(
+                "127.0.0.1",
+                BENCHMARK_USERNAME,
+                BENCHMARK_PASSWORD,
+                fake.port,
+                persistent_shell=args.persistent_shell,
+            )
+            try:
+                target = _make_target(name, api, local, disks)
+                if target is None:
+                    continue
+                counters = None if name == "parsers" else fake.counters
+                _, connections_before = fake.counters.snapshot()
+                result = await _measure(name, target, counters, args.iterations)
+                result["disks"] = disks
+                result["connections"] = fake.counters.snapshot()[1] - connections_before
+                results.append(result)
+            finally:
+                await api.disconnect()
+
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    columns = (
+        ("disks", "disks"),
+        ("benchmark", "benchmark"),
+        ("cold_round_trips", "cold RT"),
+        ("round_trips_per_tick", "RT/tick"),
+        ("connections", "conns"),
+        ("median_ms", "median ms"),
+        ("p95_ms", "p95 ms"),
+        ("alloc_peak_kib", "alloc peak KiB"),
+        ("alloc_retained_kib", "retained KiB"),
+        ("peak_rss_mib", "peak RSS MiB"),
+    )
+    widths = [
+        max(len(title), *(len(str(result[key])) for result in results))
+        for key, title in columns
+    ]
+    print("  ".join(title.rjust(width) for (_, title), width in zip(columns, widths, strict=True)))
+    for result in results:
+        print("  ".join(str(result[key]).rjust(width) for (key, _), width in zip(columns, widths, strict=True)))
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark the Unraid integration against a fake server")
+    parser.add_argument("--disks", type=int, action="append",
+                        help="Total disk count of the synthetic server (repeatable, default: 4, 24 and 60)")
+    parser.add_argument("--containers", type=int, default=30, help="Number of Docker containers")
+    parser.add_argument("--vms", type=int, default=4, help="Number of VMs")
+    parser.add_argument("--latency", type=float, default=5.0, help="Per-command server latency in ms")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed runs per benchmark")
+    parser.add_argument("--fixture", help="JSON file written by unraid_collector.py to replay")
+    parser.add_argument("--persistent-shell", action="store_true",
+                        help="Run commands through the persistent remote shell")
+    parser.add_argument("--benchmark", dest="benchmarks", action="append", choices=BENCHMARKS,
+                        help="Benchmark to run (repeatable, default: all)")
+    parser.add_argument("--json", dest="json_output", help="Also write the results to this JSON file")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    args.benchmarks = args.benchmarks or list(BENCHMARKS)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    fixture = None
+    if args.fixture:
+        with open(args.fixture) as f:
+            fixture = json.load(f)
+
+    results = []
+    for disks in args.disks or DEFAULT_DISK_COUNTS:
+        results += asyncio.run(run_benchmarks(args, disks, fixture))
+
+    _print_table(results)
+
+    if args.json_output:
+        with open(args.json_output, "w") as f:
+            json.dump({
+                "time": datetime.now().isoformat(),
+                "options": {
+                    key: value for key, value in vars(args).items() if key != "json_output"
+                },
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()